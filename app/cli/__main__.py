@@ -0,0 +1,121 @@
+"""Dispatch ``python -m app.cli <command>`` to one CLI module, imported on demand.
+
+The command table below is static so ``python -m app.cli --help`` lists every
+command without importing any of them, and running a command imports only its
+own module. ``python -m app.cli doctor`` therefore never loads FastAPI,
+pydantic, or the other generators. Each module stays runnable on its own as
+``python -m app.cli.<module>``.
+"""
+
+from __future__ import annotations
+
+import importlib
+import sys
+
+USAGE = "usage: python -m app.cli <command> [args ...]"
+
+# (command, summary) pairs; the module is ``app.cli.<command with - as _>``.
+# Summaries are the first line of each module docstring, checked by tests.
+COMMANDS = (
+    ("analytical-framing-audit", "Audit generated handoff artifacts for analytical framing risks."),
+    ("artifact-catalog", "Build or query an indexed SQLite catalog of a diagnostic artifact manifest."),
+    ("artifact-gap-report", "Audit generated diagnostic bundles for missing, empty, or suspicious artifacts."),
+    ("artifact-manifest", "Generate a machine-readable manifest for diagnostic artifact bundles."),
+    ("artifact-provenance-ledger", "Generate a provenance ledger for local diagnostic artifact bundles."),
+    ("artifact-scan", "Scan an artifact directory once and write its manifest, gap report, and provenance ledger."),
+    ("artifact-store", "Keep diagnostic artifact bundles in a content-addressed store shared across runs."),
+    ("automation-plan", "Generate a safe additive automation plan from diagnostic artifacts and goals."),
+    ("bundle", "Build the CI diagnostics bundle in a single Python interpreter."),
+    ("bundle-archive", "Export a diagnostic artifact bundle as one compressed, deduplicated archive."),
+    ("bundle-diff", "Compare two diagnostic artifact bundles by their manifest entries."),
+    ("configure", "CLI to set up configuration values in a .env file."),
+    ("decision-log", "Export an offline analytical decision log for reviewer handoffs."),
+    ("doctor", "Preflight diagnostics for the troop prediction project."),
+    ("evidence-checklist", "Generate a deterministic evidence checklist for analytical release handoffs."),
+    ("export-api-examples", "Export synthetic API response examples for dashboard and client builders."),
+    ("export-dashboard-mockup", "Export a static dashboard mockup backed by synthetic API examples."),
+    ("export-html-previews", "Generate lightweight SVG previews for static HTML diagnostic artifacts."),
+    ("export-openapi", "Export the FastAPI OpenAPI schema for CI artifacts and integrators."),
+    ("handoff-closeout-summary", "Export a concise offline closeout summary for analytical handoff bundles."),
+    ("handoff-gap-report-review", "Review handoff release bundle targets against an offline artifact gap report."),
+    ("handoff-integrity-report", "Validate cross-artifact consistency for generated diagnostic handoffs."),
+    ("handoff-readiness-scorecard", "Generate an offline handoff readiness scorecard for diagnostic bundles."),
+    ("handoff-validation-receipt", "Generate a privacy-safe validation receipt for analytical handoff bundles."),
+    ("help-export", "Export every CLI's --help text into the diagnostic artifact bundle."),
+    ("impact-index", "Select the tests and CLI smoke steps that a git diff affects, using a recorded test-impact index."),
+    ("implementation-acceptance-checklist", "Generate reviewer acceptance gates for one additive maintenance increment."),
+    ("implementation-acceptance-handoff", "Persist completed implementation acceptance evidence for reviewer handoff."),
+    ("import-budget", "Measure cold app.cli import times with -X importtime and gate them on a budget."),
+    ("next-increment-candidates", "Generate offline candidate recipes for the next cohesive repository increment."),
+    ("operator-digest", "Generate a concise operator-facing digest from CI diagnostics artifacts."),
+    ("operator-exception-register", "Export an offline operator exception register for generated diagnostics."),
+    ("operator-next-steps", "Generate a ranked operator action plan from local diagnostic artifacts."),
+    ("operator-readiness", "Generate an operator-facing readiness brief from local diagnostic artifacts."),
+    ("operator-runbook-index", "Generate an operator-facing runbook index for safe local workflows."),
+    ("operator-session-plan", "Generate a ranked operator session plan from local diagnostic artifacts."),
+    ("operator-status-board", "Generate an operator-facing status board from diagnostic bundle artifacts."),
+    ("pipeline-benchmarks", "Benchmark diagnostics builders on synthetic artifact directories of increasing size."),
+    ("provenance-validation-matrix", "Build a provenance validation matrix for analytical handoff bundles."),
+    ("quickstart", "Guided first-run automation for local project setup."),
+    ("release-bundle-index", "Generate a self-contained HTML index for release diagnostic bundles."),
+    ("release-health", "Generate a compact release health report for the project."),
+    ("release-notes", "Generate reviewer-friendly release notes from diagnostic artifacts."),
+    ("reviewer-handoff", "Generate reviewer handoff notes from diagnostic bundle artifacts."),
+    ("run-continuity-brief", "Generate an offline run-continuity brief for recurring repository maintenance."),
+    ("synthetic-data-fixtures", "Export safe synthetic data fixtures for local demos and integration tests."),
+    ("triage-summary", "Generate a concise CI triage summary from local diagnostic artifacts."),
+    ("uncertainty-review-packet", "Generate a privacy-safe uncertainty review packet from diagnostics."),
+    ("workflow-gate-summary", "Summarize deterministic workflow gates for reviewer handoff."),
+)
+
+
+def module_name(command: str) -> str:
+    """Return the ``app.cli`` module that implements ``command``."""
+
+    return "app.cli." + command.replace("-", "_")
+
+
+def render_help() -> str:
+    """Return the command listing from the static table, without importing any command."""
+
+    width = max(len(command) for command, _ in COMMANDS) + 2
+    lines = [
+        USAGE,
+        "",
+        "Run one diagnostics or setup command; only that command's module is imported.",
+        "Use `python -m app.cli <command> --help` for command options.",
+        "",
+        "commands:",
+    ]
+    lines.extend(f"  {command:<{width}}{summary}" for command, summary in COMMANDS)
+    return "\n".join(lines) + "\n"
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the requested command and return its exit status."""
+
+    args = sys.argv[1:] if argv is None else list(argv)
+    if not args or args[0] in {"-h", "--help"}:
+        sys.stdout.write(render_help())
+        return 0 if args else 2
+    command = args[0].replace("_", "-")
+    if command not in dict(COMMANDS):
+        import difflib
+
+        matches = difflib.get_close_matches(command, [name for name, _ in COMMANDS], n=1)
+        hint = f" Did you mean `{matches[0]}`?" if matches else ""
+        print(f"{USAGE}\nUnknown command `{args[0]}`.{hint} Run `python -m app.cli --help` for the list.", file=sys.stderr)
+        return 2
+    module = importlib.import_module(module_name(command))
+    # Keep argparse's prog identical to ``python -m app.cli.<module>``.
+    program = sys.argv[0] if sys.argv else ""
+    sys.argv[0:1] = [str(module.__file__)]
+    try:
+        status = module.main(args[1:])
+    finally:
+        sys.argv[0] = program
+    return status if isinstance(status, int) else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -5,21 +5,47 @@ artifacts. It helps reviewers find overconfident wording, missing analytical
 scope language, and operationally framed phrases before a bundle is shared. It
 never runs collection, prediction, training, database, deployment, or network
 workflows.
+
+Each file is scanned in one pass: the artifact directory is walked once with
+``os.scandir`` and filtered by include pattern, files are decoded in bounded
+chunks rather than loaded whole, and every line is matched once against a
+single alternation of the ``RISK_RULES`` patterns. With ``--jobs`` above one,
+files are grouped into batches of roughly ``SCAN_BATCH_BYTES`` (a large file is
+its own batch) and scanned in a process pool; findings keep sorted path order.
+
+Findings are cached per file in ``analytical-framing-audit-cache.json``, keyed
+by content SHA-256 and a fingerprint of the rule set, so editing
+``RISK_RULES``, ``REQUIRED_SCOPE_TERMS``, or the recommendations discards the
+whole cache. Digests are reused from ``artifact-manifest.json`` when a file's
+size matches and it was last modified before the manifest was written, so an
+unchanged file contributes cached findings without being opened; other files
+are hashed first and only scanned on a cache miss.
 """
 
 from __future__ import annotations
 
 import argparse
+import codecs
+import hashlib
+import io
 import json
+import os
 import re
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from pathlib import Path
-from typing import Any, Dict, Iterable, List, Mapping, Sequence
+from functools import partial
+from pathlib import Path, PurePosixPath
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Sequence, Tuple
+
+from app.cli.artifact_manifest import BOOKKEEPING_NAMES, DEFAULT_CATALOG_NAME, FRAMING_AUDIT_CACHE_NAME
+from app.cli.artifact_manifest import DEFAULT_JSON_NAME as MANIFEST_JSON_NAME
 
 DEFAULT_ARTIFACT_DIR = Path("ci_artifacts")
 DEFAULT_MARKDOWN_NAME = "analytical-framing-audit.md"
 DEFAULT_JSON_NAME = "analytical-framing-audit.json"
+DEFAULT_CACHE_NAME = FRAMING_AUDIT_CACHE_NAME
+# Bump when scanning code changes findings without touching the rule constants.
+FINDINGS_CACHE_VERSION = 1
 
 SAFE_SCOPE = (
     "Offline diagnostic text audit for lawful defensive analysis handoffs. It "
@@ -32,7 +58,9 @@ DEFAULT_INCLUDE_PATTERNS = ("*.md", "*.txt", "*.json")
 SKIP_FILENAMES = {
     DEFAULT_MARKDOWN_NAME,
     DEFAULT_JSON_NAME,
-    "artifact-manifest.json",
+    DEFAULT_CACHE_NAME,
+    DEFAULT_CATALOG_NAME,
+    MANIFEST_JSON_NAME,
     "pip-freeze.txt",
 }
 
@@ -45,6 +73,8 @@ REQUIRED_SCOPE_TERMS = (
     "safe",
 )
 
+# Patterns are searched across whole blocks before each candidate line is
+# rechecked, so they must match within one line: no anchors or lookarounds.
 RISK_RULES: tuple[tuple[str, str, str], ...] = (
     (
         "certainty_language",
@@ -68,6 +98,47 @@ RISK_RULES: tuple[tuple[str, str, str], ...] = (
     ),
 )
 
+RECOMMENDATIONS = {
+    "certainty_language": "Use estimate-oriented wording and include uncertainty or validation limits.",
+    "operational_framing": "Reframe as defensive analytical review; avoid operational direction or targeting language.",
+    "authority_overclaim": "State data provenance and validation status without implying official or live truth.",
+    "missing_uncertainty_caveat": "Pair predictive terms with uncertainty, assumptions, or synthetic-data caveats.",
+}
+
+# Scope terms whose presence anywhere in a file suppresses missing_uncertainty_caveat.
+UNCERTAINTY_TERMS = ("uncertainty", "estimate")
+# Bytes read and decoded at a time; lines are split from these chunks, never from the whole file.
+READ_CHUNK_BYTES = 1 << 16
+# Approximate bytes of input per process-pool task when --jobs is above one.
+SCAN_BATCH_BYTES = 4 << 20
+# Every boundary ``str.splitlines`` recognises, so chunked reads split identically.
+_LINE_BREAKS = frozenset("\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029")
+_RULE_PATTERNS = {rule: re.compile(pattern, re.IGNORECASE) for rule, _, pattern in RISK_RULES}
+
+
+def _combined_pattern(rules: Sequence[tuple[str, str, str]]) -> str:
+    """Join rule patterns into one alternation of named groups.
+
+    When every pattern is wrapped in the same ``\\b(?:...)\\b``, the wrapper is
+    hoisted out of the alternation; the regex engine then checks the word
+    boundary once per position instead of once per rule.
+    """
+
+    prefix, suffix = r"\b(?:", r")\b"
+    inner = [pattern[len(prefix) : -len(suffix)] for _, _, pattern in rules]
+    try:
+        hoistable = all(pattern.startswith(prefix) and pattern.endswith(suffix) for _, _, pattern in rules) and all(
+            re.compile(body) for body in inner
+        )
+    except re.error:
+        hoistable = False
+    if hoistable:
+        return prefix + "|".join(f"(?P<{rule}>{body})" for (rule, _, _), body in zip(rules, inner)) + suffix
+    return "|".join(f"(?P<{rule}>{pattern})" for rule, _, pattern in rules)
+
+
+_ALL_RULES = re.compile(_combined_pattern(RISK_RULES), re.IGNORECASE)
+
 
 @dataclass(frozen=True)
 class Finding:
@@ -91,23 +162,93 @@ class Finding:
         }
 
 
-def _load_text(path: Path) -> str:
-    try:
-        return path.read_text(encoding="utf-8", errors="replace")
-    except OSError:
-        return ""
-
-
-def _iter_candidate_files(artifact_dir: Path, include_patterns: Sequence[str]) -> Iterable[Path]:
-    seen: set[Path] = set()
+def _iter_blocks(path: Path, digest: Any = None) -> Iterator[Tuple[str, int]]:
+    """Yield ``(text, line_count)`` blocks of whole lines, decoding one chunk at a time.
+
+    The lines are exactly those of ``path.read_text().splitlines()``; within a
+    block they are rejoined with newlines whichever boundary ended them. The raw
+    bytes are fed to ``digest`` when given, so scanning also hashes the file.
+    """
+
+    # The same decoder stack TextIOWrapper uses for universal-newline text mode.
+    decoder = io.IncrementalNewlineDecoder(codecs.getincrementaldecoder("utf-8")(errors="replace"), translate=True)
+    with path.open("rb") as handle:
+        carry = ""
+        while True:
+            data = handle.read(READ_CHUNK_BYTES)
+            if digest is not None:
+                digest.update(data)
+            chunk = decoder.decode(data, final=not data)
+            if chunk:
+                lines = (carry + chunk).splitlines()
+                # Universal newlines already folded "\r\n", so no boundary straddles two chunks.
+                carry = "" if chunk[-1] in _LINE_BREAKS else lines.pop()
+                if lines:
+                    yield "\n".join(lines), len(lines)
+            if not data:
+                break
+        if carry:
+            yield carry, 1
+
+
+def _name_filter(include_patterns: Sequence[str]) -> Any:
+    """Return a ``(relative_path, name) -> bool`` test equivalent to ``Path.rglob`` over the patterns.
+
+    Plain ``*.suffix`` patterns become one ``str.endswith`` check; anything else
+    is matched from the right like ``rglob`` does.
+    """
+
+    suffixes: List[str] = []
+    globs: List[str] = []
     for pattern in include_patterns:
-        for path in artifact_dir.rglob(pattern):
-            if path in seen or not path.is_file() or path.name in SKIP_FILENAMES:
-                continue
-            if any(part.startswith(".") for part in path.relative_to(artifact_dir).parts):
-                continue
-            seen.add(path)
-            yield path
+        while pattern.startswith("**/"):
+            pattern = pattern[3:]
+        if pattern.startswith("*.") and not any(char in pattern[1:] for char in "*?[/"):
+            suffixes.append(pattern[1:])
+        else:
+            globs.append(pattern)
+    suffix_tuple = tuple(suffixes)
+
+    def matches(relative_path: str, name: str) -> bool:
+        if suffix_tuple and name.endswith(suffix_tuple):
+            return True
+        return any(PurePosixPath(relative_path).match(pattern) for pattern in globs)
+
+    return matches
+
+
+def _iter_candidate_files(artifact_dir: Path, include_patterns: Sequence[str]) -> List[Tuple[str, int, int]]:
+    """Walk ``artifact_dir`` once and return sorted ``(relative_path, size, mtime_ns)`` tuples to scan.
+
+    Hidden files and directories, ``SKIP_FILENAMES``, and symlinked directories
+    are skipped, matching the previous per-pattern ``rglob`` walk. Like the
+    artifact manifest, root-level ``BOOKKEEPING_NAMES`` (caches and bundle
+    state) are skipped too.
+    """
+
+    matches = _name_filter(include_patterns)
+    found: List[Tuple[str, int, int]] = []
+    pending: List[Tuple[str, Path]] = [("", artifact_dir)]
+    while pending:
+        prefix, directory = pending.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.name.startswith(".") or (not prefix and entry.name in BOOKKEEPING_NAMES):
+                        continue
+                    relative_path = prefix + entry.name
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append((relative_path + "/", directory / entry.name))
+                        elif entry.name not in SKIP_FILENAMES and matches(relative_path, entry.name) and entry.is_file():
+                            stat = entry.stat()
+                            found.append((relative_path, stat.st_size, stat.st_mtime_ns))
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+    found.sort()
+    return found
 
 
 def _line_excerpt(line: str, limit: int = 180) -> str:
@@ -118,43 +259,152 @@ def _line_excerpt(line: str, limit: int = 180) -> str:
 
 
 def _recommendation(rule: str) -> str:
-    recommendations = {
-        "certainty_language": "Use estimate-oriented wording and include uncertainty or validation limits.",
-        "operational_framing": "Reframe as defensive analytical review; avoid operational direction or targeting language.",
-        "authority_overclaim": "State data provenance and validation status without implying official or live truth.",
-        "missing_uncertainty_caveat": "Pair predictive terms with uncertainty, assumptions, or synthetic-data caveats.",
-    }
-    return recommendations.get(rule, "Review wording for safe analytical framing.")
+    return RECOMMENDATIONS.get(rule, "Review wording for safe analytical framing.")
+
+
+def ruleset_version() -> str:
+    """Return a fingerprint of everything that decides a file's findings."""
+
+    payload = [FINDINGS_CACHE_VERSION, RISK_RULES, REQUIRED_SCOPE_TERMS, UNCERTAINTY_TERMS, RECOMMENDATIONS]
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()[:16]
+
+
+class FindingsCache:
+    """Persistent per-file findings keyed by content SHA-256 for one rule-set version.
+
+    Entries omit the path, so renamed or duplicated files share one entry. A
+    cache written under another ``ruleset_version()`` is ignored on load.
+    """
+
+    def __init__(self, path: Path, entries: Dict[str, List[Dict[str, Any]]] | None = None) -> None:
+        self.path = path
+        self.entries = entries or {}
+        self.seen: Dict[str, List[Dict[str, Any]]] = {}
+        self.hits = 0
+
+    @classmethod
+    def load(cls, path: Path) -> "FindingsCache":
+        """Load ``path``, starting empty when it is missing, unreadable, or from another rule set."""
+
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, json.JSONDecodeError, OSError):
+            return cls(path)
+        if not isinstance(payload, dict) or payload.get("ruleset") != ruleset_version():
+            return cls(path)
+        entries = payload.get("entries")
+        return cls(path, entries if isinstance(entries, dict) else {})
+
+    def lookup(self, digest: str, rel_path: str) -> List[Finding] | None:
+        """Return the cached findings for content ``digest`` reported at ``rel_path``, else ``None``."""
+
+        entry = self.entries.get(digest)
+        if not isinstance(entry, list):
+            return None
+        try:
+            findings = [Finding(path=rel_path, **fields) for fields in entry]
+        except TypeError:
+            return None
+        self.hits += 1
+        self.seen[digest] = entry
+        return findings
+
+    def remember(self, digest: str, findings: Sequence[Finding]) -> None:
+        """Record the findings scanned for content ``digest``."""
+
+        self.seen[digest] = [
+            {key: value for key, value in finding.as_dict().items() if key != "path"} for finding in findings
+        ]
+
+    def save(self) -> None:
+        """Write entries for the contents seen in the latest audit, dropping the rest."""
+
+        payload = {"ruleset": ruleset_version(), "entries": self.seen}
+        temporary = self.path.with_name(f".{self.path.name}.tmp")
+        temporary.write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+        os.replace(temporary, self.path)
+
+
+def load_findings_cache(artifact_dir: Path = DEFAULT_ARTIFACT_DIR) -> FindingsCache:
+    """Load the findings cache stored in ``artifact_dir``."""
 
+    return FindingsCache.load(artifact_dir / DEFAULT_CACHE_NAME)
 
-def _scope_term_hits(text: str) -> Dict[str, bool]:
-    lowered = text.lower()
-    return {term: term in lowered for term in REQUIRED_SCOPE_TERMS}
 
+def _manifest_digests(manifest_path: Path) -> Dict[str, Tuple[int, str, int]]:
+    """Map manifest paths to ``(size, sha256, manifest mtime_ns)``; empty when the manifest is unusable."""
+
+    try:
+        written_ns = manifest_path.stat().st_mtime_ns
+        entries = json.loads(manifest_path.read_text(encoding="utf-8")).get("files", [])
+    except (OSError, json.JSONDecodeError, AttributeError):
+        return {}
+    digests: Dict[str, Tuple[int, str, int]] = {}
+    for entry in entries if isinstance(entries, list) else []:
+        if isinstance(entry, dict) and isinstance(entry.get("sha256"), str) and isinstance(entry.get("size_bytes"), int):
+            digests[str(entry.get("path"))] = (entry["size_bytes"], entry["sha256"], written_ns)
+    return digests
+
+
+def _line_findings(line: str, line_number: int, rel_path: str) -> Iterator[Finding]:
+    hits = {match.lastgroup for match in _ALL_RULES.finditer(line)}
+    if not hits:
+        return
+    for rule, severity, _ in RISK_RULES:
+        # finditer reports non-overlapping matches only, so a rule whose match
+        # overlaps another rule's is confirmed with its own pattern.
+        if rule in hits or _RULE_PATTERNS[rule].search(line):
+            yield Finding(
+                severity=severity,
+                rule=rule,
+                path=rel_path,
+                line=line_number,
+                excerpt=_line_excerpt(line),
+                recommendation=_recommendation(rule),
+            )
+
+
+def _block_findings(block: str, first_line: int, rel_path: str) -> Iterator[Finding]:
+    """Search a block once and rescan only the lines where some rule matched."""
+
+    line_number = first_line
+    counted = 0
+    match = _ALL_RULES.search(block)
+    while match is not None:
+        start = block.rfind("\n", 0, match.start()) + 1
+        end = block.find("\n", match.start())
+        end = len(block) if end < 0 else end
+        line_number += block.count("\n", counted, start)
+        counted = start
+        yield from _line_findings(block[start:end], line_number, rel_path)
+        match = _ALL_RULES.search(block, end + 1)
+
+
+def _scan_file(artifact_dir: Path, rel_path: str) -> Tuple[List[Finding], str | None]:
+    """Scan one file in a single pass, returning its findings and SHA-256.
+
+    An unreadable file yields no findings and no digest.
+    """
 
-def _scan_file(path: Path, artifact_dir: Path) -> List[Finding]:
     findings: List[Finding] = []
-    text = _load_text(path)
-    rel_path = path.relative_to(artifact_dir).as_posix()
-    scope_hits = _scope_term_hits(text)
-    has_uncertainty_language = scope_hits["uncertainty"] or scope_hits["estimate"]
-
-    for line_number, line in enumerate(text.splitlines(), start=1):
-        for rule, severity, pattern in RISK_RULES:
-            if rule == "missing_uncertainty_caveat" and has_uncertainty_language:
-                continue
-            if re.search(pattern, line, flags=re.IGNORECASE):
-                findings.append(
-                    Finding(
-                        severity=severity,
-                        rule=rule,
-                        path=rel_path,
-                        line=line_number,
-                        excerpt=_line_excerpt(line),
-                        recommendation=_recommendation(rule),
-                    )
-                )
-    if not any(scope_hits.values()) and text.strip():
+    has_uncertainty_language = has_scope_term = has_text = False
+    first_line = 1
+    digest = hashlib.sha256()
+    try:
+        for block, line_count in _iter_blocks(artifact_dir / rel_path, digest):
+            if not has_scope_term or not has_uncertainty_language:
+                lowered = block.lower()
+                has_uncertainty_language = has_uncertainty_language or any(term in lowered for term in UNCERTAINTY_TERMS)
+                has_scope_term = has_scope_term or any(term in lowered for term in REQUIRED_SCOPE_TERMS)
+            has_text = has_text or (block != "" and not block.isspace())
+            findings.extend(_block_findings(block, first_line, rel_path))
+            first_line += line_count
+    except OSError:
+        return [], None
+    if has_uncertainty_language:
+        # The caveat rule depends on the whole file, so it is settled after the last block.
+        findings = [finding for finding in findings if finding.rule != "missing_uncertainty_caveat"]
+    if not has_scope_term and has_text:
         findings.append(
             Finding(
                 severity="info",
@@ -165,7 +415,37 @@ def _scan_file(path: Path, artifact_dir: Path) -> List[Finding]:
                 recommendation="Add analytical, uncertainty, synthetic, estimate, or not-operational scope language where appropriate.",
             )
         )
-    return findings
+    return findings, digest.hexdigest()
+
+
+def _scan_batch(artifact_dir: Path, rel_paths: Sequence[str]) -> List[Tuple[List[Finding], str | None]]:
+    return [_scan_file(artifact_dir, rel_path) for rel_path in rel_paths]
+
+
+def _batches(files: Sequence[Tuple[str, int, int]]) -> List[List[str]]:
+    batches: List[List[str]] = []
+    current: List[str] = []
+    current_bytes = 0
+    for rel_path, size, _ in files:
+        current.append(rel_path)
+        current_bytes += size
+        if current_bytes >= SCAN_BATCH_BYTES:
+            batches.append(current)
+            current, current_bytes = [], 0
+    if current:
+        batches.append(current)
+    return batches
+
+
+def _digest_or_empty(path: Path) -> str:
+    digest = hashlib.sha256()
+    try:
+        with path.open("rb") as handle:
+            for data in iter(lambda: handle.read(READ_CHUNK_BYTES), b""):
+                digest.update(data)
+    except OSError:
+        return ""
+    return digest.hexdigest()
 
 
 def _severity_counts(findings: Sequence[Finding]) -> Dict[str, int]:
@@ -179,14 +459,51 @@ def build_analytical_framing_audit(
     artifact_dir: Path = DEFAULT_ARTIFACT_DIR,
     generated_at: datetime | None = None,
     include_patterns: Sequence[str] = DEFAULT_INCLUDE_PATTERNS,
+    jobs: int = 1,
+    cache: FindingsCache | None = None,
+    manifest_path: Path | None = None,
 ) -> Dict[str, Any]:
-    """Build a deterministic offline audit of generated artifact language."""
+    """Build a deterministic offline audit of generated artifact language.
+
+    ``jobs`` above one scans batches of files in that many worker processes;
+    the report is identical either way. With ``cache``, files whose digest is
+    known from ``manifest_path`` (default ``<artifact_dir>/artifact-manifest.json``)
+    or a quick hash reuse cached findings; call ``cache.save()`` afterwards to
+    persist them.
+    """
 
     generated_at = generated_at or datetime.now(timezone.utc).replace(microsecond=0)
-    files = sorted(_iter_candidate_files(artifact_dir, include_patterns), key=lambda item: item.as_posix())
-    findings: List[Finding] = []
-    for path in files:
-        findings.extend(_scan_file(path, artifact_dir))
+    files = _iter_candidate_files(artifact_dir, include_patterns)
+    by_path: Dict[str, List[Finding]] = {}
+    to_scan = files
+    if cache is not None:
+        known = _manifest_digests(manifest_path or artifact_dir / MANIFEST_JSON_NAME)
+        to_scan = []
+        for item in files:
+            rel_path, size, mtime_ns = item
+            manifest_size, digest, written_ns = known.get(rel_path, (-1, "", 0))
+            if manifest_size != size or mtime_ns >= written_ns:
+                # Hashing is far cheaper than scanning, but pointless before the cache has entries.
+                digest = _digest_or_empty(artifact_dir / rel_path) if cache.entries else ""
+            cached = cache.lookup(digest, rel_path) if digest else None
+            if cached is None:
+                to_scan.append(item)
+            else:
+                by_path[rel_path] = cached
+    batches = _batches(to_scan)
+    if jobs > 1 and len(batches) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=min(jobs, len(batches))) as pool:
+            results = pool.map(partial(_scan_batch, artifact_dir), batches)
+            scanned = [result for batch_results in results for result in batch_results]
+    else:
+        scanned = [result for batch in batches for result in _scan_batch(artifact_dir, batch)]
+    for (rel_path, _, _), (file_findings, digest) in zip(to_scan, scanned):
+        by_path[rel_path] = file_findings
+        if cache is not None and digest is not None:
+            cache.remember(digest, file_findings)
+    findings = [finding for rel_path, _, _ in files for finding in by_path[rel_path]]
 
     counts = _severity_counts(findings)
     status = "needs_review" if counts.get("warn", 0) else "ready"
@@ -200,7 +517,7 @@ def build_analytical_framing_audit(
         "status": status,
         "next_action": next_action,
         "artifact_dir": artifact_dir.as_posix(),
-        "scanned_files": [path.relative_to(artifact_dir).as_posix() for path in files],
+        "scanned_files": [rel_path for rel_path, _, _ in files],
         "scanned_file_count": len(files),
         "include_patterns": list(include_patterns),
         "severity_counts": counts,
@@ -270,6 +587,13 @@ def write_outputs(report: Mapping[str, Any], markdown_path: Path | None, json_pa
         json_path.write_text(json.dumps(report, indent=2, sort_keys=True) + "\n", encoding="utf-8")
 
 
+def _positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError("must be at least 1")
+    return number
+
+
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description="Audit generated diagnostics for safe analytical framing and uncertainty language."
@@ -287,17 +611,44 @@ def build_parser() -> argparse.ArgumentParser:
         default=None,
         help="Glob pattern to scan. Can be repeated. Defaults to Markdown, text, and JSON artifacts.",
     )
+    parser.add_argument(
+        "--manifest-path",
+        type=Path,
+        default=None,
+        help=f"Artifact manifest whose SHA-256 digests identify unchanged files. Default: <artifact-dir>/{MANIFEST_JSON_NAME}",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"Rescan every file instead of reusing findings from <artifact-dir>/{DEFAULT_CACHE_NAME}.",
+    )
     parser.add_argument("--markdown-path", type=Path, default=None, help="Markdown output path.")
     parser.add_argument("--json-path", type=Path, default=None, help="JSON output path.")
     parser.add_argument("--no-markdown", action="store_true", help="Skip Markdown output.")
     parser.add_argument("--no-json", action="store_true", help="Skip JSON output.")
+    parser.add_argument(
+        "--jobs",
+        type=_positive_int,
+        default=os.cpu_count() or 1,
+        help="Worker processes scanning batches of files; 1 scans in this process. Default: CPU count",
+    )
     return parser
 
 
 def main(argv: Sequence[str] | None = None) -> int:
     args = build_parser().parse_args(argv)
     include_patterns = tuple(args.include_patterns or DEFAULT_INCLUDE_PATTERNS)
-    report = build_analytical_framing_audit(args.artifact_dir, include_patterns=include_patterns)
+    cache = None if args.no_cache else load_findings_cache(args.artifact_dir)
+    report = build_analytical_framing_audit(
+        args.artifact_dir,
+        include_patterns=include_patterns,
+        jobs=args.jobs,
+        cache=cache,
+        manifest_path=args.manifest_path,
+    )
+    if cache is not None and args.artifact_dir.is_dir():
+        cache.save()
+        print(f"Reused cached findings for {cache.hits} of {report['scanned_file_count']} scanned files")
     markdown_path = None if args.no_markdown else (args.markdown_path or args.artifact_dir / DEFAULT_MARKDOWN_NAME)
     json_path = None if args.no_json else (args.json_path or args.artifact_dir / DEFAULT_JSON_NAME)
     write_outputs(report, markdown_path, json_path)
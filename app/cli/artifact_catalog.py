@@ -0,0 +1,273 @@
+"""Build or query an indexed SQLite catalog of a diagnostic artifact manifest.
+
+``artifact-catalog.sqlite`` holds one row per manifest entry, keyed by path,
+with its size, SHA-256 digest, provenance category, and whether the bundle
+expects it, plus the manifest's ``missing_expected`` list and summary fields.
+Consumers can look up single paths or run ad-hoc SQL over a large bundle
+without loading the whole manifest JSON. The catalog records the size and
+``mtime_ns`` of the manifest it was built from; :func:`open_catalog` ignores a
+catalog once that manifest has been rewritten.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sqlite3
+import sys
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Sequence, Tuple
+
+from app.cli import artifact_provenance_ledger
+from app.cli.artifact_manifest import DEFAULT_ARTIFACT_DIR, DEFAULT_CATALOG_NAME, DEFAULT_JSON_NAME, EXPECTED_ARTIFACTS
+
+CATALOG_SCHEMA_VERSION = 1
+ENTRY_COLUMNS = ("path", "size_bytes", "sha256", "description", "category", "operational_claim", "expected")
+SUMMARY_FIELDS = ("generated_at", "artifact_dir", "file_count", "total_size_bytes")
+
+_SCHEMA = """
+CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT NOT NULL) WITHOUT ROWID;
+CREATE TABLE artifacts (
+    path TEXT PRIMARY KEY,
+    size_bytes INTEGER NOT NULL,
+    sha256 TEXT,
+    description TEXT NOT NULL,
+    category TEXT NOT NULL,
+    operational_claim INTEGER NOT NULL,
+    expected INTEGER NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE missing_expected (path TEXT PRIMARY KEY, description TEXT NOT NULL) WITHOUT ROWID;
+CREATE INDEX artifacts_sha256 ON artifacts (sha256);
+CREATE INDEX artifacts_category ON artifacts (category);
+"""
+
+
+def _manifest_stamp(manifest_path: Path | None) -> Dict[str, str]:
+    try:
+        stat = manifest_path.stat() if manifest_path is not None else None
+    except OSError:
+        stat = None
+    if stat is None:
+        return {}
+    return {"manifest_size": str(stat.st_size), "manifest_mtime_ns": str(stat.st_mtime_ns)}
+
+
+def _entry_rows(ledger: Mapping[str, Any]) -> Iterable[Tuple[Any, ...]]:
+    for entry in ledger.get("entries", []):
+        path = str(entry["path"])
+        yield (
+            path,
+            int(entry.get("size_bytes") or 0),
+            entry.get("sha256"),
+            str(entry.get("description", "")),
+            str(entry["category"]),
+            int(bool(entry["operational_claim"])),
+            int(path in EXPECTED_ARTIFACTS),
+        )
+
+
+def write_catalog(
+    manifest: Mapping[str, Any],
+    path: Path,
+    *,
+    manifest_path: Path | None = None,
+    ledger: Mapping[str, Any] | None = None,
+) -> None:
+    """Write the catalog for ``manifest`` to ``path``, replacing any previous catalog atomically.
+
+    ``manifest_path`` is the published manifest JSON the catalog indexes; pass
+    it after writing that file so :func:`open_catalog` can detect a newer
+    manifest. ``ledger`` reuses an already built provenance ledger.
+    """
+
+    if ledger is None:
+        artifact_dir = Path(str(manifest.get("artifact_dir", DEFAULT_ARTIFACT_DIR)))
+        ledger = artifact_provenance_ledger.ledger_from_manifest(
+            manifest, artifact_dir, manifest_path or artifact_dir / DEFAULT_JSON_NAME
+        )
+    meta = {"schema_version": str(CATALOG_SCHEMA_VERSION), **_manifest_stamp(manifest_path)}
+    meta.update((field, json.dumps(manifest.get(field))) for field in SUMMARY_FIELDS)
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary = path.with_name(f".{path.name}.tmp")
+    temporary.unlink(missing_ok=True)
+    connection = sqlite3.connect(temporary)
+    try:
+        with connection:
+            connection.executescript(_SCHEMA)
+            connection.executemany("INSERT INTO meta VALUES (?, ?)", sorted(meta.items()))
+            connection.executemany(
+                f"INSERT INTO artifacts VALUES ({', '.join('?' for _ in ENTRY_COLUMNS)})",
+                _entry_rows(ledger),
+            )
+            connection.executemany(
+                "INSERT OR IGNORE INTO missing_expected VALUES (?, ?)",
+                ((str(name), EXPECTED_ARTIFACTS.get(str(name), "")) for name in manifest.get("missing_expected", [])),
+            )
+    finally:
+        connection.close()
+    os.replace(temporary, path)
+
+
+class ArtifactCatalog:
+    """Read-only queries over an ``artifact-catalog.sqlite`` file."""
+
+    def __init__(self, connection: sqlite3.Connection) -> None:
+        self.connection = connection
+        self.connection.row_factory = sqlite3.Row
+
+    @classmethod
+    def open(cls, path: Path) -> "ArtifactCatalog":
+        """Open ``path`` read-only; raises ``sqlite3.Error`` when it is not a catalog."""
+
+        connection = sqlite3.connect(f"{path.resolve().as_uri()}?mode=ro", uri=True)
+        return cls(connection)
+
+    def __enter__(self) -> "ArtifactCatalog":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the underlying connection."""
+
+        self.connection.close()
+
+    def meta(self) -> Dict[str, str]:
+        """Return the raw ``meta`` table."""
+
+        return {row["key"]: row["value"] for row in self.connection.execute("SELECT key, value FROM meta")}
+
+    def summary(self) -> Dict[str, Any]:
+        """Return the manifest summary fields the catalog was built from."""
+
+        meta = self.meta()
+        return {field: json.loads(meta[field]) for field in SUMMARY_FIELDS if field in meta}
+
+    def entry(self, path: str) -> Dict[str, Any] | None:
+        """Return the entry for ``path`` through the primary key index, or ``None``."""
+
+        row = self.connection.execute("SELECT * FROM artifacts WHERE path = ?", (path,)).fetchone()
+        return _entry(row) if row is not None else None
+
+    def __contains__(self, path: object) -> bool:
+        return self.connection.execute("SELECT 1 FROM artifacts WHERE path = ?", (path,)).fetchone() is not None
+
+    def entries(self, *, category: str | None = None, prefix: str | None = None) -> List[Dict[str, Any]]:
+        """Return entries in path order, optionally limited to one category or path prefix."""
+
+        clauses: List[str] = []
+        params: List[Any] = []
+        if category is not None:
+            clauses.append("category = ?")
+            params.append(category)
+        if prefix is not None:
+            # Half-open range on the primary key instead of LIKE, which would scan.
+            clauses.append("path >= ? AND path < ?")
+            params += [prefix, prefix + "\U0010ffff"]
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        return [_entry(row) for row in self.connection.execute(f"SELECT * FROM artifacts{where} ORDER BY path", params)]
+
+    def paths_with_digest(self, sha256: str) -> List[str]:
+        """Return every path whose content has digest ``sha256``."""
+
+        rows = self.connection.execute("SELECT path FROM artifacts WHERE sha256 = ? ORDER BY path", (sha256,))
+        return [row["path"] for row in rows]
+
+    def missing_expected(self) -> List[str]:
+        """Return expected artifacts the manifest reported missing."""
+
+        return [row["path"] for row in self.connection.execute("SELECT path FROM missing_expected ORDER BY path")]
+
+    def query(self, sql: str, parameters: Sequence[Any] = ()) -> List[Dict[str, Any]]:
+        """Run a read-only SQL query and return rows as dictionaries."""
+
+        return [dict(row) for row in self.connection.execute(sql, parameters)]
+
+
+def _entry(row: sqlite3.Row) -> Dict[str, Any]:
+    entry = dict(row)
+    entry["operational_claim"] = bool(entry["operational_claim"])
+    entry["expected"] = bool(entry["expected"])
+    return entry
+
+
+def open_catalog(
+    artifact_dir: Path = DEFAULT_ARTIFACT_DIR,
+    *,
+    catalog_path: Path | None = None,
+    manifest_path: Path | None = None,
+) -> ArtifactCatalog | None:
+    """Return the catalog for ``artifact_dir``, or ``None`` when it is missing, unreadable, or stale.
+
+    A catalog is stale when the manifest JSON it recorded has since changed
+    size or ``mtime_ns``; callers then fall back to the manifest itself.
+    """
+
+    path = catalog_path or artifact_dir / DEFAULT_CATALOG_NAME
+    if not path.is_file():
+        return None
+    try:
+        catalog = ArtifactCatalog.open(path)
+        meta = catalog.meta()
+    except sqlite3.Error:
+        return None
+    stamp = _manifest_stamp(manifest_path or artifact_dir / DEFAULT_JSON_NAME)
+    if meta.get("schema_version") != str(CATALOG_SCHEMA_VERSION) or any(meta.get(key) != value for key, value in stamp.items()):
+        catalog.close()
+        return None
+    return catalog
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Create the command-line parser."""
+
+    parser = argparse.ArgumentParser(
+        description="Build an indexed SQLite catalog from an artifact manifest, or query an existing catalog."
+    )
+    parser.add_argument("--artifact-dir", type=Path, default=DEFAULT_ARTIFACT_DIR, help=f"Directory containing generated artifacts. Default: {DEFAULT_ARTIFACT_DIR}")
+    parser.add_argument("--manifest-path", type=Path, default=None, help=f"Manifest JSON to index. Default: <artifact-dir>/{DEFAULT_JSON_NAME}")
+    parser.add_argument("--catalog-path", type=Path, default=None, help=f"Catalog path. Default: <artifact-dir>/{DEFAULT_CATALOG_NAME}")
+    parser.add_argument(
+        "--query",
+        default=None,
+        metavar="SQL",
+        help="Run a read-only SQL query against the existing catalog and print one JSON object per row instead of building it.",
+    )
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """CLI entry point."""
+
+    args = build_parser().parse_args(argv)
+    catalog_path = args.catalog_path or args.artifact_dir / DEFAULT_CATALOG_NAME
+    manifest_path = args.manifest_path or args.artifact_dir / DEFAULT_JSON_NAME
+    if args.query is not None:
+        catalog = open_catalog(args.artifact_dir, catalog_path=catalog_path, manifest_path=manifest_path)
+        if catalog is None:
+            print(f"No current catalog at {catalog_path}; rebuild it without --query.", file=sys.stderr)
+            return 1
+        with catalog:
+            try:
+                rows = catalog.query(args.query)
+            except sqlite3.Error as error:
+                print(f"Catalog query failed: {error}", file=sys.stderr)
+                return 1
+        for row in rows:
+            print(json.dumps(row, sort_keys=True))
+        return 0
+    try:
+        manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+    except (FileNotFoundError, json.JSONDecodeError) as error:
+        print(f"Cannot read manifest {manifest_path}: {error}", file=sys.stderr)
+        return 1
+    write_catalog(manifest, catalog_path, manifest_path=manifest_path)
+    print(f"Wrote artifact catalog to {catalog_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,84 @@
+"""Share parsed diagnostic artifacts between handoff and operator builders.
+
+Builders accept an optional ``ArtifactContext``. Without one they use the
+context installed by :func:`shared_context`, which ``python -m app.cli.bundle``
+installs for a whole run, or a private context, so standalone CLIs behave as
+before. Documents are memoized by absolute path and parsed again whenever the
+file's ``mtime_ns``, size, or inode changes. Parsed documents are shared
+between builders and must be treated as read-only.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, Tuple
+
+
+class ArtifactContext:
+    """Lazily parse and memoize JSON artifacts keyed by path and file metadata."""
+
+    def __init__(self) -> None:
+        self._documents: Dict[str, Tuple[Tuple[int, int, int], Any]] = {}
+        self.parses = 0
+
+    def load_json(self, path: Path) -> Any:
+        """Return the parsed document at ``path``, parsing each file version once.
+
+        Raises the same ``OSError`` and ``json.JSONDecodeError`` exceptions as
+        ``json.loads(path.read_text())`` so callers keep their fallbacks.
+        """
+
+        key = os.path.abspath(path)
+        stat = os.stat(key)
+        version = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+        cached = self._documents.get(key)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        document = json.loads(Path(key).read_text(encoding="utf-8"))
+        self.parses += 1
+        self._documents[key] = (version, document)
+        return document
+
+    def forget(self, paths: Iterable[Path]) -> None:
+        """Drop memoized documents at or below ``paths`` after they were rewritten.
+
+        Metadata alone can miss a same-size rewrite within one filesystem
+        timestamp tick, so writers that share a context call this explicitly.
+        """
+
+        prefixes = [os.path.abspath(path) for path in paths]
+        for key in list(self._documents):
+            if any(key == prefix or key.startswith(prefix + os.sep) for prefix in prefixes):
+                del self._documents[key]
+
+    def clear(self) -> None:
+        """Drop every memoized document."""
+
+        self._documents.clear()
+
+
+_SHARED: ArtifactContext | None = None
+
+
+def resolve_context(context: ArtifactContext | None = None) -> ArtifactContext:
+    """Return ``context``, else the installed shared context, else a new private one."""
+
+    if context is not None:
+        return context
+    return _SHARED if _SHARED is not None else ArtifactContext()
+
+
+@contextlib.contextmanager
+def shared_context(context: ArtifactContext | None = None) -> Iterator[ArtifactContext]:
+    """Install ``context`` (or a new one) for builders called without an explicit context."""
+
+    global _SHARED
+    previous = _SHARED
+    _SHARED = context if context is not None else ArtifactContext()
+    try:
+        yield _SHARED
+    finally:
+        _SHARED = previous
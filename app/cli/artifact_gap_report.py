@@ -6,8 +6,9 @@ import argparse
 import json
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Mapping
+from typing import Any, Dict, Iterable, List, Mapping, Sequence
 
+from app.cli.artifact_context import ArtifactContext, resolve_context
 from app.cli.artifact_manifest import DEFAULT_ARTIFACT_DIR, EXPECTED_ARTIFACTS
 
 DEFAULT_JSON_NAME = "artifact-gap-report.json"
@@ -49,7 +50,7 @@ MIN_SIZE_BYTES: Dict[str, int] = {
 }
 
 
-def _load_manifest(path: Path) -> Dict[str, Any]:
+def _load_manifest(path: Path, context: ArtifactContext | None = None) -> Dict[str, Any]:
     if not path.exists():
         return {
             "missing_manifest": True,
@@ -57,7 +58,7 @@ def _load_manifest(path: Path) -> Dict[str, Any]:
             "files": [],
             "missing_expected": sorted(EXPECTED_ARTIFACTS),
         }
-    return json.loads(path.read_text(encoding="utf-8"))
+    return resolve_context(context).load_json(path)
 
 
 def _entries_by_path(manifest: Mapping[str, Any]) -> Dict[str, Mapping[str, Any]]:
@@ -71,11 +72,17 @@ def _entries_by_path(manifest: Mapping[str, Any]) -> Dict[str, Mapping[str, Any]
 def build_gap_report(
     artifact_dir: Path = DEFAULT_ARTIFACT_DIR,
     manifest_path: Path | None = None,
+    context: ArtifactContext | None = None,
 ) -> Dict[str, Any]:
     """Build an operator-friendly report from an artifact manifest."""
 
     manifest_file = manifest_path or artifact_dir / "artifact-manifest.json"
-    manifest = _load_manifest(manifest_file)
+    return gap_report_from_manifest(_load_manifest(manifest_file, context), artifact_dir, manifest_file)
+
+
+def gap_report_from_manifest(manifest: Mapping[str, Any], artifact_dir: Path, manifest_file: Path) -> Dict[str, Any]:
+    """Build the gap report view of an already loaded or freshly scanned manifest."""
+
     entries = _entries_by_path(manifest)
 
     expected_paths = sorted(set(EXPECTED_ARTIFACTS) | set(MIN_SIZE_BYTES))
@@ -224,10 +231,10 @@ def build_parser() -> argparse.ArgumentParser:
     return parser
 
 
-def main() -> int:
+def main(argv: Sequence[str] | None = None) -> int:
     """CLI entry point."""
 
-    args = build_parser().parse_args()
+    args = build_parser().parse_args(argv)
     report = build_gap_report(args.artifact_dir, args.manifest_path)
     json_path = args.json_path or args.artifact_dir / DEFAULT_JSON_NAME
     markdown_path = args.markdown_path or args.artifact_dir / DEFAULT_MARKDOWN_NAME
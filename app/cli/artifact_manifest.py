@@ -1,17 +1,52 @@
-"""Generate a machine-readable manifest for diagnostic artifact bundles."""
+"""Generate a machine-readable manifest for diagnostic artifact bundles.
+
+SHA-256 digests are reused from ``artifact-manifest-hashes.json`` while a
+file's size, ``mtime_ns``, and inode are unchanged, so repeated manifest passes
+over a large bundle only hash new or modified files. The directory is walked
+once with ``os.scandir`` and the remaining files are hashed by a bounded thread
+pool (``--jobs``); entries are always emitted in sorted path order.
+
+``--stream`` writes entries as they are hashed instead of building the whole
+``files`` list: entries go to an anonymous spool file while the summary is
+accumulated, then the JSON, optional JSON Lines sidecar, and Markdown table are
+copied from the spool line by line. The output bytes match the default mode.
+
+The ``merkle`` field holds per-directory digests built while entries stream
+past (see ``app.cli.artifact_merkle``); ``--verify-directory`` rehashes one
+subdirectory and checks it against its digest without reading the rest.
+"""
 
 from __future__ import annotations
 
 import argparse
 import hashlib
 import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import ExitStack
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Iterable, List
+from typing import IO, Any, Callable, Deque, Dict, Iterable, Iterator, List, NamedTuple, Sequence, Tuple
+
+from app.cli.artifact_merkle import ROOT_DIRECTORY, MerkleBuilder, manifest_merkle, merkle_tree, path_sort_key
 
 DEFAULT_ARTIFACT_DIR = Path("ci_artifacts")
 DEFAULT_JSON_NAME = "artifact-manifest.json"
 DEFAULT_MARKDOWN_NAME = "artifact-manifest.md"
+DEFAULT_JSONL_NAME = "artifact-manifest.jsonl"
+DEFAULT_CATALOG_NAME = "artifact-catalog.sqlite"
+DEFAULT_HASH_CACHE_NAME = "artifact-manifest-hashes.json"
+HASH_CACHE_VERSION = 1
+DEFAULT_VERIFY_SAMPLE_SIZE = 16
+# Same bound ThreadPoolExecutor uses for I/O-heavy work.
+DEFAULT_JOBS = min(32, (os.cpu_count() or 1) + 4)
+# Hash futures kept in flight per worker; bounds memory on very large bundles.
+HASH_WINDOW_PER_JOB = 4
 
 _EXPECTED_ARTIFACT_ROWS = [
     ("python-version.txt", "Python interpreter version used by diagnostics."),
@@ -91,11 +126,31 @@ _EXPECTED_ARTIFACT_ROWS = [
     ("export-dashboard-mockup-help.txt", "Current dashboard mockup export CLI options."),
     ("release-bundle-index-help.txt", "Current release bundle index CLI options."),
     ("artifact-manifest-help.txt", "Current artifact manifest CLI options."),
+    ("artifact-scan-help.txt", "Current fused artifact scan CLI options."),
+    ("artifact-catalog-help.txt", "Current SQLite artifact catalog CLI options."),
+    ("bundle-diff-help.txt", "Current bundle diff CLI options."),
+    ("bundle-archive-help.txt", "Current bundle archive exporter CLI options."),
+    ("artifact-store-help.txt", "Current content-addressed artifact store CLI options."),
     ("export-html-previews-help.txt", "Current HTML preview export CLI options."),
+    ("import-budget-help.txt", "Current CLI import budget CLI options."),
     ("summary.txt", "Plain-language bundle index for humans."),
 ]
 EXPECTED_ARTIFACTS: Dict[str, str] = dict(_EXPECTED_ARTIFACT_ROWS)
-GENERATED_MANIFEST_NAMES = {DEFAULT_JSON_NAME, DEFAULT_MARKDOWN_NAME}
+GENERATED_MANIFEST_NAMES = {DEFAULT_JSON_NAME, DEFAULT_MARKDOWN_NAME, DEFAULT_JSONL_NAME, DEFAULT_CATALOG_NAME}
+BUNDLE_STATE_NAME = "bundle-state.json"
+# Where older bundles kept cached step outputs; the bundle cache now lives in
+# its own directory, but artifact directories built before still hold one.
+BUNDLE_CACHE_DIR_NAME = "bundle-cache"
+FRAMING_AUDIT_CACHE_NAME = "analytical-framing-audit-cache.json"
+DOCTOR_CACHE_NAME = "doctor-cache.json"
+# Cache and state files at the artifact directory root, not diagnostics.
+BOOKKEEPING_NAMES = {
+    DEFAULT_HASH_CACHE_NAME,
+    BUNDLE_STATE_NAME,
+    BUNDLE_CACHE_DIR_NAME,
+    FRAMING_AUDIT_CACHE_NAME,
+    DOCTOR_CACHE_NAME,
+}
 
 
 def _sha256(path: Path) -> str:
@@ -106,41 +161,312 @@ def _sha256(path: Path) -> str:
     return digest.hexdigest()
 
 
-def _file_entry(path: Path, artifact_dir: Path) -> Dict[str, Any]:
-    stat = path.stat()
-    relative_path = path.relative_to(artifact_dir).as_posix()
-    return {
-        "path": relative_path,
-        "size_bytes": stat.st_size,
-        "sha256": _sha256(path),
-        "description": EXPECTED_ARTIFACTS.get(relative_path, "Generated diagnostic artifact."),
-    }
+class FileStat(NamedTuple):
+    """The ``os.stat_result`` fields the manifest keeps per file, without the other boxed values."""
+
+    st_size: int
+    st_mtime_ns: int
+    st_ino: int
+
+
+def _stat_key(stat: FileStat | os.stat_result) -> Dict[str, int]:
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "inode": stat.st_ino}
+
+
+class HashCache:
+    """Persistent SHA-256 digests keyed by relative path, size, ``mtime_ns``, and inode.
+
+    Like git's index, an entry is only trusted when the file was modified
+    before the cache itself was last written. Files touched in the same
+    filesystem timestamp tick as a cache write are rehashed, so coarse mtime
+    granularity cannot hide a same-size rewrite.
+    """
+
+    def __init__(self, path: Path, entries: Dict[str, Dict[str, Any]] | None = None, written_ns: int = 0) -> None:
+        self.path = path
+        self.entries = entries or {}
+        self.written_ns = written_ns
+        self.seen: Dict[str, Dict[str, Any]] = {}
+        self.hits: List[Tuple[str, Path]] = []
+
+    @classmethod
+    def load(cls, path: Path) -> "HashCache":
+        """Load ``path``, starting empty when it is missing, unreadable, or from another version."""
+
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+            written_ns = path.stat().st_mtime_ns
+        except (FileNotFoundError, json.JSONDecodeError, OSError):
+            return cls(path)
+        if not isinstance(payload, dict) or payload.get("version") != HASH_CACHE_VERSION:
+            return cls(path)
+        entries = payload.get("entries")
+        return cls(path, entries if isinstance(entries, dict) else {}, written_ns)
+
+    def lookup(self, path: Path, relative_path: str, stat: FileStat | os.stat_result) -> str | None:
+        """Return the cached digest for ``path`` when its metadata is unchanged, else ``None``."""
+
+        entry = self.entries.get(relative_path)
+        if (
+            isinstance(entry, dict)
+            and all(entry.get(field) == value for field, value in _stat_key(stat).items())
+            and stat.st_mtime_ns < self.written_ns
+            and isinstance(entry.get("sha256"), str)
+        ):
+            self.hits.append((relative_path, path))
+            return str(entry["sha256"])
+        return None
+
+    def remember(self, relative_path: str, stat: FileStat | os.stat_result, digest: str) -> None:
+        """Record ``digest`` for the file scanned at ``relative_path``."""
+
+        self.seen[relative_path] = {**_stat_key(stat), "sha256": digest}
+
+    def verify(self, sample_size: int = DEFAULT_VERIFY_SAMPLE_SIZE) -> List[str]:
+        """Rehash up to ``sample_size`` cache hits and return paths whose digest was stale."""
+
+        sample = random.sample(self.hits, min(sample_size, len(self.hits)))
+        return sorted(
+            relative_path
+            for relative_path, path in sample
+            if _sha256(path) != self.seen[relative_path]["sha256"]
+        )
+
+    def clear(self) -> None:
+        """Forget every entry so the next scan rehashes all files."""
+
+        self.entries = {}
+        self.seen = {}
+        self.hits = []
+
+    def save(self) -> None:
+        """Write entries for the files seen in the latest scan, dropping deleted paths."""
+
+        payload = {"version": HASH_CACHE_VERSION, "entries": self.seen}
+        temporary = self.path.with_name(f".{self.path.name}.tmp")
+        temporary.write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+        os.replace(temporary, self.path)
+
 
+def _scan_files(artifact_dir: Path, subdirectory: str = "") -> Tuple[List[Tuple[str, FileStat]], List[Dict[str, str]]]:
+    """Walk ``artifact_dir`` once with ``os.scandir``, keeping each file's size, ``mtime_ns``, and inode.
 
-def build_manifest(artifact_dir: Path = DEFAULT_ARTIFACT_DIR) -> Dict[str, Any]:
-    """Build a deterministic manifest for files in ``artifact_dir``."""
+    Symlinked directories are not descended into, matching ``Path.rglob``.
+    Files are returned as ``(relative_path, stat)`` pairs sorted by path
+    components, so ordering matches sorted ``Path`` objects regardless of
+    directory listing order; paths are kept as plain strings to keep the index
+    small on very large bundles. ``subdirectory`` limits the walk to one
+    relative directory while keeping paths relative to ``artifact_dir``.
+    """
 
+    found: List[Tuple[str, FileStat]] = []
+    scan_warnings: List[Dict[str, str]] = []
+    start = artifact_dir / subdirectory if subdirectory else artifact_dir
+    pending: List[Tuple[str, Path]] = [(f"{subdirectory}/" if subdirectory else "", start)]
+    while pending:
+        prefix, directory = pending.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if not prefix and entry.name in BOOKKEEPING_NAMES:
+                        continue
+                    relative_path = prefix + entry.name
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append((relative_path + "/", directory / entry.name))
+                        elif entry.is_file() and entry.name not in GENERATED_MANIFEST_NAMES:
+                            stat = entry.stat()
+                            found.append((relative_path, FileStat(stat.st_size, stat.st_mtime_ns, stat.st_ino)))
+                    except OSError as exc:
+                        scan_warnings.append({"path": (directory / entry.name).as_posix(), "error": exc.__class__.__name__})
+        except OSError as exc:
+            if directory != start:
+                scan_warnings.append({"path": directory.as_posix(), "error": exc.__class__.__name__})
+    found.sort(key=lambda item: path_sort_key(item[0]))
+    return found, scan_warnings
+
+
+def _hash_or_error(path: Path) -> str | OSError:
+    try:
+        return _sha256(path)
+    except OSError as exc:
+        return exc
+
+
+def load_hash_cache(artifact_dir: Path = DEFAULT_ARTIFACT_DIR) -> HashCache:
+    """Return the persistent hash cache stored beside the default manifest in ``artifact_dir``."""
+
+    return HashCache.load(artifact_dir / DEFAULT_HASH_CACHE_NAME)
+
+
+def _resolve(digest: "str | Future[str | OSError]") -> str | OSError:
+    return digest.result() if isinstance(digest, Future) else digest
+
+
+def _digests(
+    artifact_dir: Path,
+    found: Sequence[Tuple[str, FileStat]],
+    hash_cache: HashCache | None,
+    jobs: int,
+) -> Iterator[str | OSError]:
+    """Yield each found file's digest in order, hashing cache misses ``jobs`` at a time.
+
+    At most ``jobs * HASH_WINDOW_PER_JOB`` digests are pending at once, so
+    memory does not grow with the number of files waiting to be hashed.
+    """
+
+    window: Deque["str | Future[str | OSError]"] = deque()
+    with ExitStack() as stack:
+        pool: ThreadPoolExecutor | None = None
+        for relative_path, stat in found:
+            path = artifact_dir / relative_path
+            digest = None if hash_cache is None else hash_cache.lookup(path, relative_path, stat)
+            if digest is not None:
+                window.append(digest)
+            elif jobs > 1:
+                if pool is None:
+                    pool = stack.enter_context(ThreadPoolExecutor(max_workers=jobs))
+                window.append(pool.submit(_hash_or_error, path))
+            else:
+                window.append(_hash_or_error(path))
+            if len(window) >= jobs * HASH_WINDOW_PER_JOB:
+                yield _resolve(window.popleft())
+        while window:
+            yield _resolve(window.popleft())
+
+
+def iter_manifest_entries(
+    artifact_dir: Path = DEFAULT_ARTIFACT_DIR,
+    hash_cache: HashCache | None = None,
+    jobs: int = DEFAULT_JOBS,
+    scan_warnings: List[Dict[str, str]] | None = None,
+) -> Iterator[Dict[str, Any]]:
+    """Yield manifest entries for ``artifact_dir`` in sorted path order as they are hashed.
+
+    Unreadable paths are appended to ``scan_warnings`` instead of being yielded.
+    """
+
+    warnings: List[Dict[str, str]] = [] if scan_warnings is None else scan_warnings
+    found, found_warnings = _scan_files(artifact_dir) if artifact_dir.exists() else ([], [])
+    warnings.extend(found_warnings)
+    for (relative_path, stat), digest in zip(found, _digests(artifact_dir, found, hash_cache, jobs)):
+        if isinstance(digest, OSError):
+            warnings.append({"path": (artifact_dir / relative_path).as_posix(), "error": digest.__class__.__name__})
+            continue
+        if hash_cache is not None:
+            hash_cache.remember(relative_path, stat, digest)
+        yield {
+            "path": relative_path,
+            "size_bytes": stat.st_size,
+            "sha256": digest,
+            "description": EXPECTED_ARTIFACTS.get(relative_path, "Generated diagnostic artifact."),
+        }
+
+
+class _ManifestSummary:
+    """Running totals for a manifest whose entries are not kept in memory."""
+
+    def __init__(self, artifact_dir: Path) -> None:
+        self.generated_at = datetime.now(timezone.utc).replace(microsecond=0).isoformat()
+        self.artifact_dir = artifact_dir
+        self.file_count = 0
+        self.total_size_bytes = 0
+        self.present_expected: set[str] = set()
+        self.scan_warnings: List[Dict[str, str]] = []
+        self.merkle = MerkleBuilder()
+
+    def add(self, entry: Dict[str, Any]) -> None:
+        self.file_count += 1
+        self.total_size_bytes += int(entry["size_bytes"])
+        self.merkle.add(entry["path"], entry["size_bytes"], entry["sha256"])
+        if entry["path"] in EXPECTED_ARTIFACTS:
+            self.present_expected.add(entry["path"])
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return every manifest field except ``files``."""
+
+        self.scan_warnings.sort(key=lambda warning: warning["path"])
+        return {
+            "generated_at": self.generated_at,
+            "artifact_dir": self.artifact_dir.as_posix(),
+            "file_count": self.file_count,
+            "total_size_bytes": self.total_size_bytes,
+            "merkle": self.merkle.finish(),
+            "missing_expected": sorted(name for name in EXPECTED_ARTIFACTS if name not in self.present_expected),
+            "scan_warnings": self.scan_warnings,
+        }
+
+
+def build_manifest(
+    artifact_dir: Path = DEFAULT_ARTIFACT_DIR,
+    hash_cache: HashCache | None = None,
+    jobs: int = DEFAULT_JOBS,
+) -> Dict[str, Any]:
+    """Build a deterministic manifest for files in ``artifact_dir``.
+
+    Files whose digest is not reused from ``hash_cache`` are hashed by up to
+    ``jobs`` threads; ``hashlib`` releases the GIL while hashing large reads.
+    When ``hash_cache`` is given, call ``hash_cache.save()`` afterwards to
+    persist new entries.
+    """
+
+    summary = _ManifestSummary(artifact_dir)
     files: List[Dict[str, Any]] = []
+    for entry in iter_manifest_entries(artifact_dir, hash_cache, jobs, summary.scan_warnings):
+        summary.add(entry)
+        files.append(entry)
+    return {**summary.as_dict(), "files": files}
+
+
+def verify_directory(
+    artifact_dir: Path,
+    manifest: Dict[str, Any],
+    directory: str = ROOT_DIRECTORY,
+    jobs: int = DEFAULT_JOBS,
+) -> Dict[str, Any]:
+    """Rehash only the files under ``directory`` and compare them with the manifest's Merkle digest.
+
+    Files outside ``directory`` are neither listed nor read. The hash cache is
+    deliberately not used, so the check reads current file content.
+    """
+
+    directory = directory.strip("/") or ROOT_DIRECTORY
+    subdirectory = "" if directory == ROOT_DIRECTORY else directory
+    recorded = manifest_merkle(manifest)["directories"].get(directory, {})
     scan_warnings: List[Dict[str, str]] = []
-    if artifact_dir.exists():
-        for path in sorted(p for p in artifact_dir.rglob("*") if p.is_file()):
-            if path.name in GENERATED_MANIFEST_NAMES:
-                continue
-            try:
-                files.append(_file_entry(path, artifact_dir))
-            except (OSError, ValueError) as exc:
-                scan_warnings.append({"path": path.as_posix(), "error": exc.__class__.__name__})
-
-    present_paths = {entry["path"] for entry in files}
-    missing_expected = sorted(name for name in EXPECTED_ARTIFACTS if name not in present_paths)
+    found, found_warnings = _scan_files(artifact_dir, subdirectory) if artifact_dir.exists() else ([], [])
+    scan_warnings.extend(found_warnings)
+    current: Dict[str, Dict[str, Any]] = {}
+    for (relative_path, stat), digest in zip(found, _digests(artifact_dir, found, None, jobs)):
+        if isinstance(digest, OSError):
+            scan_warnings.append({"path": (artifact_dir / relative_path).as_posix(), "error": digest.__class__.__name__})
+            continue
+        current[relative_path] = {"path": relative_path, "size_bytes": stat.st_size, "sha256": digest}
+    actual = merkle_tree(current.values(), directory)["root"]
+    prefix = f"{subdirectory}/" if subdirectory else ""
+    listed = {
+        str(entry["path"]): entry
+        for entry in manifest.get("files", [])
+        if isinstance(entry, dict) and str(entry.get("path", "")).startswith(prefix)
+    }
+    mismatched = sorted(
+        (
+            path
+            for path in {*listed, *current}
+            if path not in listed
+            or path not in current
+            or (listed[path].get("sha256"), listed[path].get("size_bytes")) != (current[path]["sha256"], current[path]["size_bytes"])
+        ),
+        key=path_sort_key,
+    )
     return {
-        "generated_at": datetime.now(timezone.utc).replace(microsecond=0).isoformat(),
-        "artifact_dir": artifact_dir.as_posix(),
-        "file_count": len(files),
-        "total_size_bytes": sum(int(entry["size_bytes"]) for entry in files),
-        "missing_expected": missing_expected,
+        "directory": directory,
+        "expected_digest": recorded.get("digest"),
+        "actual_digest": actual,
+        "verified": recorded.get("digest") == actual,
+        "file_count": len(current),
+        "mismatched_paths": mismatched,
         "scan_warnings": scan_warnings,
-        "files": files,
     }
 
 
@@ -151,13 +477,16 @@ def write_json(manifest: Dict[str, Any], path: Path) -> None:
     path.write_text(json.dumps(manifest, indent=2, sort_keys=True) + "\n", encoding="utf-8")
 
 
-def _markdown_lines(manifest: Dict[str, Any]) -> Iterable[str]:
+def _markdown_header_lines(manifest: Dict[str, Any]) -> Iterable[str]:
     yield "# Diagnostic artifact manifest"
     yield ""
     yield f"Generated at: `{manifest['generated_at']}`"
     yield f"Artifact directory: `{manifest['artifact_dir']}`"
     yield f"Files indexed: {manifest['file_count']}"
     yield f"Total size: {manifest['total_size_bytes']} bytes"
+    merkle = manifest.get("merkle", {})
+    if merkle:
+        yield f"Merkle root: `{merkle['root']}`"
     yield ""
     if manifest["missing_expected"]:
         yield "## Missing expected files"
@@ -176,15 +505,29 @@ def _markdown_lines(manifest: Dict[str, Any]) -> Iterable[str]:
         for warning in scan_warnings:
             yield f"| `{warning['path']}` | {warning['error']} |"
         yield ""
+    subdirectories = [(path, node) for path, node in merkle.get("directories", {}).items() if path != ROOT_DIRECTORY]
+    if subdirectories:
+        yield "## Directory digests"
+        yield ""
+        yield "| Directory | Files | Size | Merkle digest |"
+        yield "| --- | ---: | ---: | --- |"
+        for path, node in subdirectories:
+            yield f"| `{path}/` | {node['file_count']} | {node['total_size_bytes']} | `{node['digest']}` |"
+        yield ""
     yield "## Files"
     yield ""
     yield "| Path | Size | SHA-256 | Description |"
     yield "| --- | ---: | --- | --- |"
+
+
+def _markdown_row(entry: Dict[str, Any]) -> str:
+    return f"| `{entry['path']}` | {entry['size_bytes']} | `{entry['sha256']}` | {entry['description']} |"
+
+
+def _markdown_lines(manifest: Dict[str, Any]) -> Iterable[str]:
+    yield from _markdown_header_lines(manifest)
     for entry in manifest["files"]:
-        yield (
-            f"| `{entry['path']}` | {entry['size_bytes']} | "
-            f"`{entry['sha256']}` | {entry['description']} |"
-        )
+        yield _markdown_row(entry)
 
 
 def write_markdown(manifest: Dict[str, Any], path: Path) -> None:
@@ -194,6 +537,151 @@ def write_markdown(manifest: Dict[str, Any], path: Path) -> None:
     path.write_text("\n".join(_markdown_lines(manifest)).rstrip() + "\n", encoding="utf-8")
 
 
+# Reused encoders; ``json.dumps`` with options builds a new encoder per call.
+_INDENTED_ENTRY = json.JSONEncoder(indent=2, sort_keys=True)
+_COMPACT_ENTRY = json.JSONEncoder(sort_keys=True)
+
+
+def _jsonl_header(summary: Dict[str, Any]) -> str:
+    return json.dumps({"record": "summary", **summary}, sort_keys=True) + "\n"
+
+
+def write_jsonl(manifest: Dict[str, Any], path: Path) -> None:
+    """Write a JSON Lines manifest: one summary record, then one line per file entry."""
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    summary = {key: value for key, value in manifest.items() if key != "files"}
+    with path.open("w", encoding="utf-8") as handle:
+        handle.write(_jsonl_header(summary))
+        for entry in manifest["files"]:
+            handle.write(_jsonl_entry(entry))
+
+
+# Rendered entries are buffered this many at a time before each spool write.
+SPOOL_CHUNK_ENTRIES = 512
+
+
+def _json_entry(entry: Dict[str, Any]) -> str:
+    # Every entry carries its leading separator; ``_finish_json`` drops the first.
+    return ",\n    " + _INDENTED_ENTRY.encode(entry).replace("\n", "\n    ")
+
+
+def _markdown_entry(entry: Dict[str, Any]) -> str:
+    return _markdown_row(entry) + "\n"
+
+
+def _jsonl_entry(entry: Dict[str, Any]) -> str:
+    return _COMPACT_ENTRY.encode(entry) + "\n"
+
+
+class _Spool:
+    """Anonymous temporary file receiving one output's rendered entries in chunks."""
+
+    def __init__(self, stack: ExitStack, render: Callable[[Dict[str, Any]], str]) -> None:
+        self.file: IO[str] = stack.enter_context(tempfile.TemporaryFile("w+", encoding="utf-8"))
+        self.render = render
+        self.pending: List[str] = []
+
+    def add(self, entry: Dict[str, Any]) -> None:
+        self.pending.append(self.render(entry))
+        if len(self.pending) >= SPOOL_CHUNK_ENTRIES:
+            self.flush()
+
+    def flush(self) -> None:
+        self.file.write("".join(self.pending))
+        self.pending.clear()
+
+
+def _write_json_member(handle: IO[str], key: str, value: Any, last: bool = False) -> None:
+    rendered = json.dumps(value, indent=2, sort_keys=True).replace("\n", "\n  ")
+    handle.write(f"  {json.dumps(key)}: {rendered}{'' if last else ','}\n")
+
+
+def _finish_json(summary: Dict[str, Any], files: IO[str], path: Path) -> None:
+    # Same bytes as ``write_json``: members in sorted key order, ``files`` copied from its spool.
+    keys = sorted([*summary, "files"])
+    with path.open("w", encoding="utf-8") as handle:
+        handle.write("{\n")
+        for index, key in enumerate(keys):
+            last = index == len(keys) - 1
+            if key != "files":
+                _write_json_member(handle, key, summary[key], last)
+            elif not summary["file_count"]:
+                _write_json_member(handle, key, [], last)
+            else:
+                handle.write('  "files": [\n')
+                files.seek(0)
+                files.read(len(",\n"))
+                shutil.copyfileobj(files, handle)
+                handle.write(f"\n  ]{'' if last else ','}\n")
+        handle.write("}\n")
+
+
+def _finish_markdown(summary: Dict[str, Any], rows: IO[str], path: Path) -> None:
+    header = "\n".join(_markdown_header_lines(summary))
+    with path.open("w", encoding="utf-8") as handle:
+        if not summary["file_count"]:
+            handle.write(header.rstrip() + "\n")
+            return
+        handle.write(header + "\n")
+        rows.seek(0)
+        shutil.copyfileobj(rows, handle)
+
+
+def _finish_jsonl(summary: Dict[str, Any], lines: IO[str], path: Path) -> None:
+    with path.open("w", encoding="utf-8") as handle:
+        handle.write(_jsonl_header(summary))
+        lines.seek(0)
+        shutil.copyfileobj(lines, handle)
+
+
+def stream_manifest(
+    artifact_dir: Path = DEFAULT_ARTIFACT_DIR,
+    json_path: Path | None = None,
+    markdown_path: Path | None = None,
+    jsonl_path: Path | None = None,
+    hash_cache: HashCache | None = None,
+    jobs: int = DEFAULT_JOBS,
+) -> Dict[str, Any]:
+    """Write the requested manifest outputs without holding every entry in memory.
+
+    Each entry is rendered as soon as it is hashed into an anonymous temporary
+    spool per output. The summary fields that precede the file table are only
+    known at the end, so each output is then assembled from its header and a
+    straight copy of its spool. Only the sorted path index from the directory
+    walk grows with the bundle. Returns every manifest field except ``files``.
+    """
+
+    summary = _ManifestSummary(artifact_dir)
+    with ExitStack() as stack:
+        spools = [
+            (path, _Spool(stack, render), finish)
+            for path, render, finish in (
+                (json_path, _json_entry, _finish_json),
+                (markdown_path, _markdown_entry, _finish_markdown),
+                (jsonl_path, _jsonl_entry, _finish_jsonl),
+            )
+            if path is not None
+        ]
+        for entry in iter_manifest_entries(artifact_dir, hash_cache, jobs, summary.scan_warnings):
+            for _, spool, _ in spools:
+                spool.add(entry)
+            summary.add(entry)
+        fields = summary.as_dict()
+        for path, spool, finish in spools:
+            spool.flush()
+            path.parent.mkdir(parents=True, exist_ok=True)
+            finish(fields, spool.file, path)
+    return fields
+
+
+def _positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError("must be at least 1")
+    return number
+
+
 def build_parser() -> argparse.ArgumentParser:
     """Create the command-line parser."""
 
@@ -203,23 +691,127 @@ def build_parser() -> argparse.ArgumentParser:
     parser.add_argument("--markdown-path", type=Path, default=None, help="Path for Markdown output. Default: <artifact-dir>/artifact-manifest.md")
     parser.add_argument("--no-json", action="store_true", help="Skip JSON output.")
     parser.add_argument("--no-markdown", action="store_true", help="Skip Markdown output.")
+    parser.add_argument(
+        "--jsonl",
+        action="store_true",
+        help=f"Also write a JSON Lines manifest (summary record, then one line per file) to <artifact-dir>/{DEFAULT_JSONL_NAME}.",
+    )
+    parser.add_argument("--jsonl-path", type=Path, default=None, help="Path for the JSON Lines manifest; implies --jsonl.")
+    parser.add_argument(
+        "--catalog",
+        action="store_true",
+        help=f"Also write an indexed SQLite catalog of the manifest to <artifact-dir>/{DEFAULT_CATALOG_NAME}.",
+    )
+    parser.add_argument("--catalog-path", type=Path, default=None, help="Path for the SQLite catalog; implies --catalog.")
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Write entries incrementally through a temporary spool instead of building the file list in memory.",
+    )
+    parser.add_argument(
+        "--no-hash-cache",
+        action="store_true",
+        help=f"Rehash every file instead of reusing <artifact-dir>/{DEFAULT_HASH_CACHE_NAME}.",
+    )
+    parser.add_argument(
+        "--verify-cache",
+        type=int,
+        nargs="?",
+        const=DEFAULT_VERIFY_SAMPLE_SIZE,
+        default=0,
+        metavar="SAMPLE",
+        help=f"Rehash a random sample of cached digests (default {DEFAULT_VERIFY_SAMPLE_SIZE}) and rebuild without the cache if any are stale.",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=_positive_int,
+        default=DEFAULT_JOBS,
+        help="Number of threads hashing files concurrently. Default: CPU count + 4, at most 32.",
+    )
+    parser.add_argument(
+        "--verify-directory",
+        action="append",
+        default=[],
+        metavar="DIR",
+        help="Instead of writing a manifest, rehash only DIR (relative to --artifact-dir; . for all) and check it against the Merkle digest in the existing JSON manifest. Repeatable.",
+    )
     return parser
 
 
-def main() -> int:
+def _verify_directories(args: argparse.Namespace, json_path: Path) -> int:
+    try:
+        manifest = json.loads(json_path.read_text(encoding="utf-8"))
+    except (FileNotFoundError, json.JSONDecodeError) as exc:
+        print(f"Cannot read manifest {json_path}: {exc}", file=sys.stderr)
+        return 1
+    status = 0
+    for directory in args.verify_directory:
+        result = verify_directory(args.artifact_dir, manifest, directory, args.jobs)
+        if result["verified"]:
+            print(f"Verified {result['directory']}: {result['file_count']} files match Merkle digest {result['actual_digest']}")
+            continue
+        status = 1
+        if result["expected_digest"] is None:
+            print(f"{result['directory']}: not a directory with files in {json_path}", file=sys.stderr)
+        else:
+            changed = ", ".join(result["mismatched_paths"]) or "directory structure"
+            print(f"{result['directory']}: Merkle digest mismatch; changed: {changed}", file=sys.stderr)
+    return status
+
+
+def main(argv: Sequence[str] | None = None) -> int:
     """CLI entry point."""
 
-    args = build_parser().parse_args()
-    manifest = build_manifest(args.artifact_dir)
-    json_path = args.json_path or args.artifact_dir / DEFAULT_JSON_NAME
-    markdown_path = args.markdown_path or args.artifact_dir / DEFAULT_MARKDOWN_NAME
-    if not args.no_json:
-        write_json(manifest, json_path)
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    json_path = None if args.no_json else args.json_path or args.artifact_dir / DEFAULT_JSON_NAME
+    markdown_path = None if args.no_markdown else args.markdown_path or args.artifact_dir / DEFAULT_MARKDOWN_NAME
+    jsonl_path = args.jsonl_path or (args.artifact_dir / DEFAULT_JSONL_NAME if args.jsonl else None)
+    catalog_path = args.catalog_path or (args.artifact_dir / DEFAULT_CATALOG_NAME if args.catalog else None)
+    if args.verify_directory:
+        return _verify_directories(args, args.json_path or args.artifact_dir / DEFAULT_JSON_NAME)
+    if catalog_path is not None and args.stream and json_path is None:
+        parser.error("--catalog with --stream indexes the written JSON manifest; drop --no-json.")
+    hash_cache = None if args.no_hash_cache else load_hash_cache(args.artifact_dir)
+
+    def generate() -> Dict[str, Any] | None:
+        if args.stream:
+            stream_manifest(args.artifact_dir, json_path, markdown_path, jsonl_path, hash_cache, args.jobs)
+            return None
+        return build_manifest(args.artifact_dir, hash_cache, args.jobs)
+
+    manifest = generate()
+    if hash_cache is not None and args.verify_cache > 0:
+        stale = hash_cache.verify(args.verify_cache)
+        if stale:
+            print(f"Hash cache had stale digests for {', '.join(stale)}; rehashing every file.", file=sys.stderr)
+            hash_cache.clear()
+            manifest = generate()
+    if hash_cache is not None and args.artifact_dir.is_dir():
+        hash_cache.save()
+    if manifest is not None:
+        if json_path is not None:
+            write_json(manifest, json_path)
+        if markdown_path is not None:
+            write_markdown(manifest, markdown_path)
+        if jsonl_path is not None:
+            write_jsonl(manifest, jsonl_path)
+    if catalog_path is not None:
+        # Imported here because artifact_catalog imports this module.
+        from app.cli.artifact_catalog import write_catalog
+
+        if manifest is None:
+            manifest = json.loads(json_path.read_text(encoding="utf-8"))
+        write_catalog(manifest, catalog_path, manifest_path=json_path)
+    if json_path is not None:
         print(f"Wrote artifact manifest JSON to {json_path}")
-    if not args.no_markdown:
-        write_markdown(manifest, markdown_path)
+    if markdown_path is not None:
         print(f"Wrote artifact manifest Markdown to {markdown_path}")
-    if args.no_json and args.no_markdown:
+    if jsonl_path is not None:
+        print(f"Wrote artifact manifest JSON Lines to {jsonl_path}")
+    if catalog_path is not None:
+        print(f"Wrote artifact catalog to {catalog_path}")
+    if json_path is None and markdown_path is None and jsonl_path is None and catalog_path is None:
         print("No outputs requested; remove --no-json or --no-markdown to write manifest files.")
     return 0
 
@@ -0,0 +1,169 @@
+"""Merkle digests over the directory tree of an artifact manifest.
+
+Every directory that holds at least one file gets a node digest: the SHA-256 of
+one record per child, in manifest order (path components compared in turn, as
+``artifact_manifest`` sorts them). A file child contributes
+``file\\0<name>\\0<size>\\0<sha256>\\0`` and a subdirectory child contributes
+``dir\\0<name>\\0<file count>\\0<total size>\\0<digest>\\0``. Filenames cannot
+contain NUL, so the records are unambiguous. The root directory is ``.`` and
+its digest identifies the whole bundle.
+
+Two trees with equal digests for a directory hold identical files below it, so
+comparisons can skip that subtree, and a reviewer can verify one subdirectory
+by hashing only the files inside it.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from typing import Any, Dict, Iterable, List, Mapping, Tuple
+
+MERKLE_ALGORITHM = "sha256-merkle-v1"
+ROOT_DIRECTORY = "."
+
+
+def path_sort_key(path: str) -> str:
+    """Return the key that orders paths like component tuples, matching manifest order."""
+
+    # NUL sorts below every filename character.
+    return path.replace("/", "\0")
+
+
+class _OpenDirectory:
+    __slots__ = ("path", "name", "hasher", "file_count", "total_size_bytes")
+
+    def __init__(self, path: str, name: str) -> None:
+        self.path = path
+        self.name = name
+        self.hasher = hashlib.sha256()
+        self.file_count = 0
+        self.total_size_bytes = 0
+
+
+class MerkleBuilder:
+    """Build directory digests incrementally from files added in manifest order.
+
+    Only the chain of currently open directories is kept, so entries can be
+    streamed. Files below one directory are contiguous in manifest order, which
+    lets each directory be closed as soon as a path outside it arrives.
+    """
+
+    def __init__(self) -> None:
+        self._open: List[_OpenDirectory] = [_OpenDirectory(ROOT_DIRECTORY, "")]
+        self._last_key: str | None = None
+        self.directories: Dict[str, Dict[str, Any]] = {}
+
+    def add(self, path: str, size_bytes: int, sha256: str) -> None:
+        """Add one file; raises ``ValueError`` when paths arrive out of manifest order."""
+
+        key = path_sort_key(path)
+        if self._last_key is not None and key <= self._last_key:
+            raise ValueError(f"Merkle entries must be added in manifest order; got {path!r} after another path.")
+        self._last_key = key
+        *parents, name = path.split("/")
+        depth = 0
+        while depth < len(parents) and depth + 1 < len(self._open) and self._open[depth + 1].name == parents[depth]:
+            depth += 1
+        self._close_to(depth + 1)
+        for part in parents[depth:]:
+            parent = self._open[-1]
+            child_path = part if parent.path == ROOT_DIRECTORY else f"{parent.path}/{part}"
+            self._open.append(_OpenDirectory(child_path, part))
+        current = self._open[-1]
+        current.hasher.update(f"file\0{name}\0{int(size_bytes)}\0{sha256}\0".encode("utf-8"))
+        current.file_count += 1
+        current.total_size_bytes += int(size_bytes)
+
+    def _close_to(self, depth: int) -> None:
+        while len(self._open) > max(depth, 1):
+            closed = self._open.pop()
+            node = self._record(closed)
+            parent = self._open[-1]
+            parent.hasher.update(
+                f"dir\0{closed.name}\0{node['file_count']}\0{node['total_size_bytes']}\0{node['digest']}\0".encode("utf-8")
+            )
+            parent.file_count += closed.file_count
+            parent.total_size_bytes += closed.total_size_bytes
+
+    def _record(self, directory: _OpenDirectory) -> Dict[str, Any]:
+        node = {
+            "digest": directory.hasher.hexdigest(),
+            "file_count": directory.file_count,
+            "total_size_bytes": directory.total_size_bytes,
+        }
+        self.directories[directory.path] = node
+        return node
+
+    def finish(self) -> Dict[str, Any]:
+        """Close every open directory and return the tree; call once, after the last file."""
+
+        self._close_to(1)
+        root = self._record(self._open[0])
+        return {
+            "algorithm": MERKLE_ALGORITHM,
+            "root": root["digest"],
+            "directories": {path: self.directories[path] for path in sorted(self.directories, key=path_sort_key)},
+        }
+
+
+def merkle_tree(entries: Iterable[Mapping[str, Any]], prefix: str = "") -> Dict[str, Any]:
+    """Return the Merkle tree of manifest ``entries``, optionally only those under directory ``prefix``.
+
+    With a ``prefix``, paths are taken relative to it, so the returned root
+    digest equals that directory's digest in the full tree.
+    """
+
+    start = f"{prefix.rstrip('/')}/" if prefix and prefix != ROOT_DIRECTORY else ""
+    files: List[Tuple[str, int, str]] = [
+        (str(entry["path"])[len(start):], int(entry.get("size_bytes") or 0), str(entry.get("sha256", "")))
+        for entry in entries
+        if str(entry.get("path", "")).startswith(start) and entry.get("path")
+    ]
+    files.sort(key=lambda item: path_sort_key(item[0]))
+    builder = MerkleBuilder()
+    for path, size_bytes, sha256 in files:
+        builder.add(path, size_bytes, sha256)
+    return builder.finish()
+
+
+def manifest_merkle(manifest: Mapping[str, Any]) -> Dict[str, Any]:
+    """Return the manifest's recorded Merkle tree, computing it from ``files`` for older manifests."""
+
+    recorded = manifest.get("merkle")
+    if isinstance(recorded, Mapping) and recorded.get("algorithm") == MERKLE_ALGORITHM:
+        return dict(recorded)
+    files = manifest.get("files", [])
+    return merkle_tree(entry for entry in files if isinstance(entry, Mapping)) if isinstance(files, list) else merkle_tree([])
+
+
+def _children(directories: Iterable[str]) -> Dict[str, List[str]]:
+    children: Dict[str, List[str]] = {}
+    for path in directories:
+        if path != ROOT_DIRECTORY:
+            parent = path.rpartition("/")[0] or ROOT_DIRECTORY
+            children.setdefault(parent, []).append(path)
+    return children
+
+
+def changed_directories(base: Mapping[str, Any], head: Mapping[str, Any]) -> List[str]:
+    """Return directories whose digest differs, descending only below directories that differ.
+
+    Identical subtrees are never visited, so the work grows with the number of
+    changed directories rather than the size of the bundle. A directory present
+    on only one side counts as changed.
+    """
+
+    base_directories: Mapping[str, Any] = base.get("directories", {})
+    head_directories: Mapping[str, Any] = head.get("directories", {})
+    children = _children({*base_directories, *head_directories})
+    changed: List[str] = []
+    pending = [ROOT_DIRECTORY]
+    while pending:
+        path = pending.pop()
+        before = base_directories.get(path, {}).get("digest")
+        after = head_directories.get(path, {}).get("digest")
+        if before == after and before is not None:
+            continue
+        changed.append(path)
+        pending.extend(children.get(path, []))
+    return sorted(changed, key=path_sort_key)
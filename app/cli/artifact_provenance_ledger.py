@@ -11,8 +11,9 @@ import argparse
 import json
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Mapping
+from typing import Any, Dict, Iterable, List, Mapping, Sequence
 
+from app.cli.artifact_context import ArtifactContext, resolve_context
 from app.cli.artifact_manifest import DEFAULT_ARTIFACT_DIR
 
 DEFAULT_MARKDOWN_NAME = "artifact-provenance-ledger.md"
@@ -122,9 +123,9 @@ NON_OPERATIONAL_CATEGORIES = {
 }
 
 
-def _load_json(path: Path) -> Dict[str, Any] | None:
+def _load_json(path: Path, context: ArtifactContext | None = None) -> Dict[str, Any] | None:
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
+        return resolve_context(context).load_json(path)
     except (FileNotFoundError, json.JSONDecodeError, OSError):
         return None
 
@@ -152,11 +153,21 @@ def build_provenance_ledger(
     artifact_dir: Path = DEFAULT_ARTIFACT_DIR,
     *,
     manifest_path: Path | None = None,
+    context: ArtifactContext | None = None,
 ) -> Dict[str, Any]:
     """Build a machine-readable provenance ledger from an artifact manifest."""
 
     resolved_manifest_path = manifest_path or artifact_dir / "artifact-manifest.json"
-    manifest = _load_json(resolved_manifest_path)
+    return ledger_from_manifest(_load_json(resolved_manifest_path, context), artifact_dir, resolved_manifest_path)
+
+
+def ledger_from_manifest(
+    manifest: Mapping[str, Any] | None,
+    artifact_dir: Path,
+    resolved_manifest_path: Path,
+) -> Dict[str, Any]:
+    """Build the provenance ledger view of an already loaded or freshly scanned manifest."""
+
     entries: List[Dict[str, Any]] = []
     category_counts: Dict[str, int] = {}
     non_operational: List[str] = []
@@ -302,8 +313,8 @@ def build_parser() -> argparse.ArgumentParser:
     return parser
 
 
-def main() -> int:
-    args = build_parser().parse_args()
+def main(argv: Sequence[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
     ledger = build_provenance_ledger(args.artifact_dir, manifest_path=args.manifest_path)
     markdown_path = args.markdown_path or args.artifact_dir / DEFAULT_MARKDOWN_NAME
     json_path = args.json_path or args.artifact_dir / DEFAULT_JSON_NAME
@@ -0,0 +1,184 @@
+"""Scan an artifact directory once and write its manifest, gap report, and provenance ledger.
+
+``artifact_manifest``, ``artifact_gap_report``, and ``artifact_provenance_ledger``
+used to run in lockstep: the manifest walked and hashed the directory, then the
+other two re-read the manifest it had just written. This command walks the
+directory and hashes each file once, reusing ``artifact-manifest-hashes.json``,
+keeps the manifest in memory as an :class:`ArtifactScan`, and renders the gap
+report and provenance ledger as views over it. The three standalone commands
+remain views over the same builders, so their outputs are identical to a fused
+run apart from ``generated_at``.
+"""
+
+from __future__ import annotations
+
+import argparse
+from dataclasses import dataclass
+from functools import cached_property
+from pathlib import Path
+from typing import Any, Dict, List, Sequence
+
+from app.cli import artifact_catalog, artifact_gap_report, artifact_manifest, artifact_provenance_ledger
+from app.cli.artifact_manifest import DEFAULT_ARTIFACT_DIR, DEFAULT_JOBS, HashCache, load_hash_cache
+
+
+@dataclass(frozen=True)
+class ArtifactScan:
+    """One walk of an artifact directory and the reports derived from it.
+
+    ``manifest_path`` is where the manifest is (or will be) published; the gap
+    report and ledger record it as their source. Each view is built once.
+    """
+
+    artifact_dir: Path
+    manifest: Dict[str, Any]
+    manifest_path: Path
+
+    @cached_property
+    def gap_report(self) -> Dict[str, Any]:
+        """Return the missing, empty, and undersized artifact view."""
+
+        return artifact_gap_report.gap_report_from_manifest(self.manifest, self.artifact_dir, self.manifest_path)
+
+    @cached_property
+    def provenance_ledger(self) -> Dict[str, Any]:
+        """Return the provenance classification view."""
+
+        return artifact_provenance_ledger.ledger_from_manifest(self.manifest, self.artifact_dir, self.manifest_path)
+
+
+def scan_artifacts(
+    artifact_dir: Path = DEFAULT_ARTIFACT_DIR,
+    hash_cache: HashCache | None = None,
+    jobs: int = DEFAULT_JOBS,
+    manifest_path: Path | None = None,
+) -> ArtifactScan:
+    """Walk ``artifact_dir`` once, hashing each file at most once, and return the in-memory model."""
+
+    manifest = artifact_manifest.build_manifest(artifact_dir, hash_cache, jobs)
+    return ArtifactScan(artifact_dir, manifest, manifest_path or artifact_dir / artifact_manifest.DEFAULT_JSON_NAME)
+
+
+def write_outputs(
+    scan: ArtifactScan,
+    manifest_markdown_path: Path | None,
+    ledger_json_path: Path | None,
+    ledger_markdown_path: Path | None,
+    gap_json_path: Path | None,
+    gap_markdown_path: Path | None,
+    catalog_path: Path | None = None,
+) -> List[Path]:
+    """Write the manifest to ``scan.manifest_path`` plus each requested view and return the written paths.
+
+    The views are built before anything is written, so none of them indexes
+    another output of the same scan. The SQLite catalog reuses the provenance
+    ledger view for its categories.
+    """
+
+    ledger = scan.provenance_ledger if ledger_json_path or ledger_markdown_path or catalog_path else None
+    gap_report = scan.gap_report if gap_json_path or gap_markdown_path else None
+    written = [scan.manifest_path]
+    artifact_manifest.write_json(scan.manifest, scan.manifest_path)
+    if catalog_path is not None:
+        artifact_catalog.write_catalog(scan.manifest, catalog_path, manifest_path=scan.manifest_path, ledger=ledger)
+        written.append(catalog_path)
+    if manifest_markdown_path is not None:
+        artifact_manifest.write_markdown(scan.manifest, manifest_markdown_path)
+        written.append(manifest_markdown_path)
+    if ledger is not None:
+        if ledger_json_path is not None:
+            artifact_provenance_ledger.write_json(ledger, ledger_json_path)
+            written.append(ledger_json_path)
+        if ledger_markdown_path is not None:
+            artifact_provenance_ledger.write_markdown(artifact_provenance_ledger.render_markdown(ledger), ledger_markdown_path)
+            written.append(ledger_markdown_path)
+    if gap_report is not None:
+        if gap_json_path is not None:
+            artifact_gap_report.write_json(gap_report, gap_json_path)
+            written.append(gap_json_path)
+        if gap_markdown_path is not None:
+            artifact_gap_report.write_markdown(gap_report, gap_markdown_path)
+            written.append(gap_markdown_path)
+    return written
+
+
+def _default(path: Path | None, artifact_dir: Path, name: str, skip: bool) -> Path | None:
+    if skip:
+        return None
+    return path or artifact_dir / name
+
+
+def _positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError("must be at least 1")
+    return number
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Create the command-line parser."""
+
+    parser = argparse.ArgumentParser(
+        description="Scan an artifact directory once and write its manifest, gap report, and provenance ledger."
+    )
+    parser.add_argument("--artifact-dir", type=Path, default=DEFAULT_ARTIFACT_DIR, help=f"Directory containing generated artifacts. Default: {DEFAULT_ARTIFACT_DIR}")
+    parser.add_argument("--manifest-json-path", type=Path, default=None, help="Manifest JSON output. Default: <artifact-dir>/artifact-manifest.json")
+    parser.add_argument("--manifest-markdown-path", type=Path, default=None, help="Manifest Markdown output. Default: <artifact-dir>/artifact-manifest.md")
+    parser.add_argument("--ledger-json-path", type=Path, default=None, help="Provenance ledger JSON output. Default: <artifact-dir>/artifact-provenance-ledger.json")
+    parser.add_argument("--ledger-markdown-path", type=Path, default=None, help="Provenance ledger Markdown output. Default: <artifact-dir>/artifact-provenance-ledger.md")
+    parser.add_argument("--gap-json-path", type=Path, default=None, help="Gap report JSON output. Default: <artifact-dir>/artifact-gap-report.json")
+    parser.add_argument("--gap-markdown-path", type=Path, default=None, help="Gap report Markdown output. Default: <artifact-dir>/artifact-gap-report.md")
+    parser.add_argument(
+        "--catalog",
+        action="store_true",
+        help=f"Also write an indexed SQLite catalog of the manifest to <artifact-dir>/{artifact_manifest.DEFAULT_CATALOG_NAME}.",
+    )
+    parser.add_argument("--catalog-path", type=Path, default=None, help="Path for the SQLite catalog; implies --catalog.")
+    parser.add_argument("--no-provenance-ledger", action="store_true", help="Skip the provenance ledger outputs.")
+    parser.add_argument("--no-gap-report", action="store_true", help="Skip the gap report outputs.")
+    parser.add_argument(
+        "--no-hash-cache",
+        action="store_true",
+        help=f"Rehash every file instead of reusing <artifact-dir>/{artifact_manifest.DEFAULT_HASH_CACHE_NAME}.",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=_positive_int,
+        default=DEFAULT_JOBS,
+        help="Number of threads hashing files concurrently. Default: CPU count + 4, at most 32.",
+    )
+    parser.add_argument(
+        "--fail-on-gap",
+        action="store_true",
+        help="Exit with status 1 when the gap report finds missing or empty expected artifacts.",
+    )
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """CLI entry point."""
+
+    args = build_parser().parse_args(argv)
+    artifact_dir = args.artifact_dir
+    hash_cache = None if args.no_hash_cache else load_hash_cache(artifact_dir)
+    scan = scan_artifacts(artifact_dir, hash_cache, args.jobs, args.manifest_json_path)
+    if hash_cache is not None and artifact_dir.is_dir():
+        hash_cache.save()
+    written = write_outputs(
+        scan,
+        args.manifest_markdown_path or artifact_dir / artifact_manifest.DEFAULT_MARKDOWN_NAME,
+        _default(args.ledger_json_path, artifact_dir, artifact_provenance_ledger.DEFAULT_JSON_NAME, args.no_provenance_ledger),
+        _default(args.ledger_markdown_path, artifact_dir, artifact_provenance_ledger.DEFAULT_MARKDOWN_NAME, args.no_provenance_ledger),
+        _default(args.gap_json_path, artifact_dir, artifact_gap_report.DEFAULT_JSON_NAME, args.no_gap_report),
+        _default(args.gap_markdown_path, artifact_dir, artifact_gap_report.DEFAULT_MARKDOWN_NAME, args.no_gap_report),
+        args.catalog_path or (artifact_dir / artifact_manifest.DEFAULT_CATALOG_NAME if args.catalog else None),
+    )
+    for path in written:
+        print(f"Wrote {path}")
+    if args.fail_on_gap and scan.gap_report["severity"] == "fail":
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
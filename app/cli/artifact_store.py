@@ -0,0 +1,475 @@
+"""Keep diagnostic artifact bundles in a content-addressed store shared across runs.
+
+The store holds one object per SHA-256 digest under ``objects/<aa>/<digest>``
+and one retained manifest per bundle under ``manifests/<name>.json``. Adding a
+bundle places only digests the store does not already hold; checking a bundle
+out materializes its files from the objects, so identical artifacts across
+dozens of retained bundles occupy disk once.
+
+Files are placed with a reflink (copy-on-write clone) where the filesystem
+supports it, else a plain copy; ``--link-mode`` pins one. Hardlinks are only
+made on request, for a checkout, because an in-place write to a hardlinked
+file would change the stored object: a live artifact is never hardlinked into
+the store, and ``--replace`` swaps a bundle's files for reflinks only. Objects
+are made read-only, new objects are rehashed after placement so a file that
+changed since the scan is not stored under a stale digest, and a checkout
+rehashes every object it reads.
+
+``--gc`` deletes objects that no retained manifest references. A bundle's
+manifest is published only after all of its objects are in place, so a
+checkout never sees a partial bundle; run ``--gc`` while no add is running.
+"""
+
+from __future__ import annotations
+
+import argparse
+import errno
+import json
+import os
+import re
+import shutil
+import sys
+from pathlib import Path, PurePosixPath
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Sequence, Set
+
+from app.cli.artifact_manifest import DEFAULT_ARTIFACT_DIR, DEFAULT_JOBS, DEFAULT_JSON_NAME as MANIFEST_JSON_NAME
+from app.cli.artifact_manifest import build_manifest, load_hash_cache, write_json
+from app.cli.bundle_cache import file_digest
+
+DEFAULT_STORE_DIR = Path(".artifact-store")
+OBJECTS_DIR_NAME = "objects"
+MANIFESTS_DIR_NAME = "manifests"
+PENDING_SUFFIX = ".pending.json"
+LINK_MODES = ("auto", "reflink", "hardlink", "copy")
+# Linux FICLONE ioctl: clone a whole file's extents (btrfs, XFS, bcachefs, ...).
+FICLONE = 0x40049409
+# Errors meaning a placement method is unavailable here rather than that the file is bad.
+_UNSUPPORTED_ERRNOS = {errno.EOPNOTSUPP, errno.ENOTTY, errno.EINVAL, errno.EXDEV, errno.EPERM, errno.ENOSYS, errno.EMLINK}
+_BUNDLE_NAME = re.compile(r"[A-Za-z0-9][A-Za-z0-9._-]*")
+_DIGEST = re.compile(r"[0-9a-f]{64}")
+
+
+class StoreError(ValueError):
+    """Raised when a bundle cannot be added to or checked out of the store."""
+
+
+def _reflink(source: Path, target: Path) -> None:
+    import fcntl
+
+    with source.open("rb") as src, target.open("xb") as dst:
+        try:
+            fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+        except OSError:
+            dst.close()
+            target.unlink()
+            raise
+
+
+def _hardlink(source: Path, target: Path) -> None:
+    os.link(source, target)
+
+
+def _copy(source: Path, target: Path) -> None:
+    shutil.copyfile(source, target)
+
+
+_PLACERS: Dict[str, Callable[[Path, Path], None]] = {"reflink": _reflink, "hardlink": _hardlink, "copy": _copy}
+
+
+class _Placer:
+    """Place files with the first link mode that works, remembering modes the filesystem rejects.
+
+    ``auto`` never hardlinks; a pinned ``hardlink`` is honored only with
+    ``allow_hardlink`` and otherwise falls back to a copy.
+    """
+
+    def __init__(self, link_mode: str, allow_hardlink: bool = False) -> None:
+        if link_mode not in LINK_MODES:
+            raise StoreError(f"Unknown link mode {link_mode!r}; choose one of {', '.join(LINK_MODES)}.")
+        order = ["reflink", "copy"] if link_mode == "auto" else [link_mode]
+        self.order = [mode for mode in order if allow_hardlink or mode != "hardlink"] or ["copy"]
+        self.counts: Dict[str, int] = {}
+
+    def place(self, source: Path, target: Path) -> None:
+        """Create ``target`` (which must not exist) with the content of ``source``."""
+
+        for mode in list(self.order):
+            try:
+                _PLACERS[mode](source, target)
+            except (OSError, ImportError) as exc:
+                last = mode == self.order[-1]
+                if last or (isinstance(exc, OSError) and exc.errno not in _UNSUPPORTED_ERRNOS):
+                    raise
+                if not isinstance(exc, OSError) or exc.errno != errno.EMLINK:
+                    self.order.remove(mode)
+                continue
+            self.counts[mode] = self.counts.get(mode, 0) + 1
+            return
+
+
+def _validate_name(name: str) -> str:
+    if not _BUNDLE_NAME.fullmatch(name) or f"{name}.json".endswith(PENDING_SUFFIX):
+        raise StoreError(f"Invalid bundle name {name!r}; use letters, digits, '.', '_', and '-'.")
+    return name
+
+
+def _relative_parts(path: str) -> tuple[str, ...]:
+    relative = PurePosixPath(path)
+    if relative.is_absolute() or not relative.parts or ".." in relative.parts:
+        raise StoreError(f"Refusing to place unsafe manifest path {path!r}.")
+    return relative.parts
+
+
+def _temporary_sibling(path: Path) -> Path:
+    return path.with_name(f".{path.name}.{os.getpid()}.tmp")
+
+
+class ArtifactStore:
+    """A content-addressed object store plus the manifests of the bundles it retains."""
+
+    def __init__(self, root: Path = DEFAULT_STORE_DIR) -> None:
+        self.root = root
+        self.objects_dir = root / OBJECTS_DIR_NAME
+        self.manifests_dir = root / MANIFESTS_DIR_NAME
+
+    def object_path(self, sha256: str) -> Path:
+        """Return where the object with digest ``sha256`` is stored."""
+
+        return self.objects_dir / sha256[:2] / sha256
+
+    def manifest_path(self, name: str) -> Path:
+        """Return where the retained manifest for bundle ``name`` is stored."""
+
+        return self.manifests_dir / f"{_validate_name(name)}.json"
+
+    def names(self) -> List[str]:
+        """Return the retained bundle names, sorted."""
+
+        if not self.manifests_dir.is_dir():
+            return []
+        return sorted(
+            path.name[: -len(".json")]
+            for path in self.manifests_dir.iterdir()
+            if path.name.endswith(".json") and not path.name.endswith(PENDING_SUFFIX) and not path.name.startswith(".")
+        )
+
+    def manifest(self, name: str) -> Dict[str, Any]:
+        """Return the retained manifest for bundle ``name``."""
+
+        try:
+            return json.loads(self.manifest_path(name).read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            raise StoreError(f"No bundle named {name!r} in {self.root}.") from None
+
+    def add(
+        self,
+        artifact_dir: Path,
+        name: str,
+        *,
+        link_mode: str = "auto",
+        replace: bool = False,
+        jobs: int = DEFAULT_JOBS,
+        manifest: Dict[str, Any] | None = None,
+    ) -> Dict[str, Any]:
+        """Store ``artifact_dir`` as bundle ``name`` and return placement totals.
+
+        Digests come from ``manifest`` or a scan that reuses the directory's
+        hash cache. With ``replace``, each bundle file is then atomically
+        swapped for a reflink of its object, deduplicating the directory in
+        place; on filesystems without reflinks the files are left as they are.
+        """
+
+        final_path = self.manifest_path(name)
+        if manifest is None:
+            hash_cache = load_hash_cache(artifact_dir)
+            manifest = build_manifest(artifact_dir, hash_cache, jobs)
+            if artifact_dir.is_dir():
+                hash_cache.save()
+        entries = manifest.get("files", [])
+        for entry in entries:
+            _relative_parts(str(entry["path"]))
+        self.manifests_dir.mkdir(parents=True, exist_ok=True)
+        pending_path = final_path.with_name(f"{name}{PENDING_SUFFIX}")
+        write_json(manifest, pending_path)
+
+        try:
+            summary = self._place_bundle(artifact_dir, entries, link_mode, replace)
+        except BaseException:
+            pending_path.unlink(missing_ok=True)
+            raise
+        os.replace(pending_path, final_path)
+        return {"name": name, "file_count": len(entries), **summary}
+
+    def _place_bundle(self, artifact_dir: Path, entries: Sequence[Mapping[str, Any]], link_mode: str, replace: bool) -> Dict[str, Any]:
+        ingest = _Placer(link_mode)
+        new_objects = new_bytes = reused_bytes = 0
+        placed: Set[str] = set()
+        for entry in entries:
+            sha256 = str(entry["sha256"])
+            target = self.object_path(sha256)
+            if sha256 in placed or target.exists():
+                reused_bytes += int(entry["size_bytes"])
+                continue
+            target.parent.mkdir(parents=True, exist_ok=True)
+            temporary = _temporary_sibling(target)
+            temporary.unlink(missing_ok=True)
+            try:
+                ingest.place(artifact_dir / entry["path"], temporary)
+                if file_digest(temporary) != sha256:
+                    raise StoreError(f"{artifact_dir / entry['path']} changed after it was scanned; rerun the add.")
+                temporary.chmod(0o444)
+                os.replace(temporary, target)
+            finally:
+                temporary.unlink(missing_ok=True)
+            placed.add(sha256)
+            new_objects += 1
+            new_bytes += int(entry["size_bytes"])
+
+        replaced = 0
+        reflink_unsupported = False
+        if replace:
+            for entry in entries:
+                path = artifact_dir / entry["path"]
+                temporary = _temporary_sibling(path)
+                temporary.unlink(missing_ok=True)
+                try:
+                    _PLACERS["reflink"](self.object_path(str(entry["sha256"])), temporary)
+                    shutil.copymode(path, temporary)
+                    os.replace(temporary, path)
+                except (OSError, ImportError) as exc:
+                    if isinstance(exc, OSError) and exc.errno not in _UNSUPPORTED_ERRNOS:
+                        raise
+                    reflink_unsupported = True
+                    break
+                finally:
+                    temporary.unlink(missing_ok=True)
+                replaced += 1
+        return {
+            "new_objects": new_objects,
+            "new_bytes": new_bytes,
+            "reused_bytes": reused_bytes,
+            "replaced_files": replaced,
+            "reflink_unsupported": reflink_unsupported,
+            "link_modes": ingest.counts,
+        }
+
+    def checkout(self, name: str, destination: Path, *, link_mode: str = "auto") -> Dict[str, Any]:
+        """Materialize bundle ``name`` into the new or empty directory ``destination``.
+
+        Every object is rehashed before it is placed, so a corrupted object
+        fails the checkout. Files are reflinked or copied unless ``link_mode``
+        is ``hardlink``, which shares the read-only objects themselves.
+        """
+
+        manifest = self.manifest(name)
+        if destination.exists() and any(destination.iterdir()):
+            raise StoreError(f"Checkout destination {destination} is not empty.")
+        placer = _Placer(link_mode, allow_hardlink=True)
+        entries = manifest.get("files", [])
+        verified: Set[str] = set()
+        for entry in entries:
+            sha256 = str(entry["sha256"])
+            source = self.object_path(sha256)
+            if not source.is_file():
+                raise StoreError(f"Object for {entry['path']} is missing from {self.root}; was it collected?")
+            if sha256 not in verified:
+                if file_digest(source) != sha256:
+                    raise StoreError(f"Object for {entry['path']} in {self.root} does not match its digest; the store is corrupt.")
+                verified.add(sha256)
+            target = destination.joinpath(*_relative_parts(str(entry["path"])))
+            target.parent.mkdir(parents=True, exist_ok=True)
+            placer.place(source, target)
+        write_json(manifest, destination / MANIFEST_JSON_NAME)
+        return {"name": name, "destination": destination.as_posix(), "file_count": len(entries), "link_modes": placer.counts}
+
+    def drop(self, name: str) -> None:
+        """Stop retaining bundle ``name``; run :meth:`gc` to reclaim its objects."""
+
+        try:
+            self.manifest_path(name).unlink()
+        except FileNotFoundError:
+            raise StoreError(f"No bundle named {name!r} in {self.root}.") from None
+
+    def _referenced(self) -> Set[str]:
+        referenced: Set[str] = set()
+        if not self.manifests_dir.is_dir():
+            return referenced
+        for path in self.manifests_dir.glob("*.json"):
+            manifest = json.loads(path.read_text(encoding="utf-8"))
+            referenced.update(str(entry["sha256"]) for entry in manifest.get("files", []))
+        return referenced
+
+    def _objects(self) -> Iterable[Path]:
+        if not self.objects_dir.is_dir():
+            return
+        for shard in sorted(self.objects_dir.iterdir()):
+            if shard.is_dir():
+                yield from sorted(path for path in shard.iterdir() if _DIGEST.fullmatch(path.name))
+
+    def gc(self, dry_run: bool = False) -> Dict[str, Any]:
+        """Delete objects that no retained or pending manifest references and return the totals."""
+
+        referenced = self._referenced()
+        removed = removed_bytes = kept = kept_bytes = 0
+        for path in self._objects():
+            size = path.stat().st_size
+            if path.name in referenced:
+                kept += 1
+                kept_bytes += size
+                continue
+            if not dry_run:
+                path.unlink()
+            removed += 1
+            removed_bytes += size
+        return {
+            "removed_objects": removed,
+            "removed_bytes": removed_bytes,
+            "kept_objects": kept,
+            "kept_bytes": kept_bytes,
+            "dry_run": dry_run,
+        }
+
+    def usage(self) -> Dict[str, Any]:
+        """Return per-bundle sizes and how much disk the shared objects save."""
+
+        bundles = []
+        for name in self.names():
+            manifest = self.manifest(name)
+            bundles.append(
+                {
+                    "name": name,
+                    "generated_at": manifest.get("generated_at"),
+                    "file_count": len(manifest.get("files", [])),
+                    "total_size_bytes": sum(int(entry["size_bytes"]) for entry in manifest.get("files", [])),
+                }
+            )
+        objects = list(self._objects())
+        stored = sum(path.stat().st_size for path in objects)
+        logical = sum(bundle["total_size_bytes"] for bundle in bundles)
+        return {
+            "bundles": bundles,
+            "object_count": len(objects),
+            "stored_bytes": stored,
+            "logical_bytes": logical,
+            "saved_bytes": logical - stored,
+        }
+
+
+def _positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError("must be at least 1")
+    return number
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Create the command-line parser."""
+
+    parser = argparse.ArgumentParser(description="Keep diagnostic artifact bundles in a content-addressed store shared across runs.")
+    parser.add_argument("--store", type=Path, default=DEFAULT_STORE_DIR, help=f"Store directory. Default: {DEFAULT_STORE_DIR}")
+    parser.add_argument(
+        "--artifact-dir",
+        type=Path,
+        default=DEFAULT_ARTIFACT_DIR,
+        help=f"Bundle to add with --add. Default: {DEFAULT_ARTIFACT_DIR}",
+    )
+    parser.add_argument(
+        "--add",
+        nargs="?",
+        const="",
+        default=None,
+        metavar="NAME",
+        help="Add --artifact-dir to the store as bundle NAME (default: the directory name), replacing a bundle of that name.",
+    )
+    parser.add_argument(
+        "--replace",
+        action="store_true",
+        help="With --add, swap the bundle's files for reflinks of the stored objects to deduplicate it in place (no-op without reflink support).",
+    )
+    parser.add_argument("--checkout", metavar="NAME", default=None, help="Materialize bundle NAME into --destination.")
+    parser.add_argument("--destination", type=Path, default=None, help="New or empty directory for --checkout.")
+    parser.add_argument("--drop", action="append", default=[], metavar="NAME", help="Stop retaining bundle NAME. Repeatable.")
+    parser.add_argument("--gc", action="store_true", help="Delete objects that no retained manifest references.")
+    parser.add_argument("--dry-run", action="store_true", help="With --gc, report what would be deleted without deleting it.")
+    parser.add_argument("--list", action="store_true", help="List retained bundles and the disk the store saves.")
+    parser.add_argument(
+        "--link-mode",
+        choices=LINK_MODES,
+        default="auto",
+        help=(
+            "How files are placed: reflink, copy, auto (reflink where supported, else copy), or hardlink "
+            "(checkouts only; they share the read-only objects). Default: auto"
+        ),
+    )
+    parser.add_argument(
+        "--jobs",
+        type=_positive_int,
+        default=DEFAULT_JOBS,
+        help="Number of threads hashing files while scanning for --add. Default: CPU count + 4, at most 32.",
+    )
+    return parser
+
+
+def _print_usage(store: ArtifactStore) -> None:
+    usage = store.usage()
+    for bundle in usage["bundles"]:
+        print(f"{bundle['name']}: {bundle['file_count']} files, {bundle['total_size_bytes']} bytes, generated {bundle['generated_at']}")
+    print(
+        f"Artifact store {store.root}: {len(usage['bundles'])} bundles, {usage['object_count']} objects, "
+        f"{usage['stored_bytes']} bytes stored for {usage['logical_bytes']} bytes retained ({usage['saved_bytes']} saved)."
+    )
+
+
+def _summarize_modes(counts: Mapping[str, int]) -> str:
+    return ", ".join(f"{count} {mode}" for mode, count in sorted(counts.items())) or "none placed"
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """CLI entry point."""
+
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if not (args.add is not None or args.checkout or args.drop or args.gc or args.list):
+        parser.error("choose at least one of --add, --checkout, --drop, --gc, or --list.")
+    if args.checkout and args.destination is None:
+        parser.error("--checkout needs --destination.")
+    store = ArtifactStore(args.store)
+    try:
+        if args.add is not None:
+            name = args.add or args.artifact_dir.resolve().name
+            summary = store.add(args.artifact_dir, name, link_mode=args.link_mode, replace=args.replace, jobs=args.jobs)
+            print(
+                f"Added {summary['name']}: {summary['file_count']} files, {summary['new_objects']} new objects "
+                f"({summary['new_bytes']} bytes placed, {summary['reused_bytes']} bytes already stored; "
+                f"{_summarize_modes(summary['link_modes'])})."
+            )
+            if args.replace and summary["reflink_unsupported"]:
+                print(
+                    f"Replaced {summary['replaced_files']} files in {args.artifact_dir}; this filesystem does not "
+                    "support reflinks, so the rest were left in place."
+                )
+            elif args.replace:
+                print(f"Replaced {summary['replaced_files']} files in {args.artifact_dir} with reflinks of stored objects.")
+        if args.checkout:
+            summary = store.checkout(args.checkout, args.destination, link_mode=args.link_mode)
+            print(f"Checked out {summary['name']} to {summary['destination']}: {summary['file_count']} files ({_summarize_modes(summary['link_modes'])}).")
+        for name in args.drop:
+            store.drop(name)
+            print(f"Dropped {name}; run --gc to reclaim its objects.")
+        if args.gc:
+            summary = store.gc(dry_run=args.dry_run)
+            verb = "Would remove" if args.dry_run else "Removed"
+            print(
+                f"{verb} {summary['removed_objects']} unreferenced objects ({summary['removed_bytes']} bytes); "
+                f"kept {summary['kept_objects']} ({summary['kept_bytes']} bytes)."
+            )
+        if args.list:
+            _print_usage(store)
+    except (OSError, StoreError) as exc:
+        print(f"Artifact store error: {exc}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
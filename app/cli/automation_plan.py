@@ -16,6 +16,8 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Mapping, Sequence
 
+from app.cli.artifact_context import ArtifactContext, resolve_context
+
 DEFAULT_ARTIFACT_DIR = Path("ci_artifacts")
 DEFAULT_GOALS_PATH = Path("goals.md")
 DEFAULT_MARKDOWN_NAME = "automation-plan.md"
@@ -61,9 +63,9 @@ class Goal:
     text: str
 
 
-def _load_json(path: Path, fallback: Any) -> Any:
+def _load_json(path: Path, fallback: Any, context: ArtifactContext | None = None) -> Any:
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
+        return resolve_context(context).load_json(path)
     except (FileNotFoundError, json.JSONDecodeError, OSError):
         return fallback
 
@@ -324,9 +326,10 @@ def build_parser() -> argparse.ArgumentParser:
 def main(argv: Sequence[str] | None = None) -> int:
     args = build_parser().parse_args(argv)
     artifact_dir = args.artifact_dir
-    triage = _load_json(args.triage_json or artifact_dir / "triage-summary.json", {})
-    manifest = _load_json(args.manifest_json or artifact_dir / "artifact-manifest.json", {})
-    handoff = _load_json(args.handoff_json or artifact_dir / "reviewer-handoff.json", {})
+    context = resolve_context()
+    triage = _load_json(args.triage_json or artifact_dir / "triage-summary.json", {}, context)
+    manifest = _load_json(args.manifest_json or artifact_dir / "artifact-manifest.json", {}, context)
+    handoff = _load_json(args.handoff_json or artifact_dir / "reviewer-handoff.json", {}, context)
     goals = load_goals(args.goals_path)
     plan = build_automation_plan(goals, triage, manifest, handoff)
 
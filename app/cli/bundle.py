@@ -0,0 +1,1050 @@
+"""Build the CI diagnostics bundle in a single Python interpreter.
+
+``scripts/ci_report.sh`` used to launch one interpreter per generator, paying
+startup, ``app.config`` parsing, and module imports roughly a hundred times per
+bundle. This engine runs the same steps in-process by importing each
+generator's ``main`` entry point, which composes its ``build_*``/``write_*``
+helpers, so outputs stay byte-identical to the serial shell pipeline.
+
+Each step declares the artifacts it reads and writes. The planner inserts a
+fused manifest and provenance ledger refresh (``app.cli.artifact_scan``, one
+directory walk per refresh) only where a step needs an up-to-date index and
+the directory changed since the last refresh, then groups steps into
+dependency levels whose members run concurrently. Steps whose inputs are
+unchanged since the previous run are skipped; see ``app.cli.bundle_cache``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import concurrent.futures
+import contextlib
+import importlib
+import importlib.util
+import io
+import os
+import shlex
+import subprocess
+import sys
+from dataclasses import dataclass, replace
+from pathlib import Path
+from types import ModuleType
+from typing import Callable, Dict, FrozenSet, Iterator, List, Sequence, Tuple
+
+from app.cli.artifact_context import ArtifactContext, shared_context
+from app.cli.artifact_manifest import DOCTOR_CACHE_NAME
+from app.cli.bundle_cache import ANY_ARTIFACT, DEFAULT_CACHE_DIR, BundleCache
+from app.cli.doctor import RECOMMENDED_ENV_VARS
+from app.cli.help_export import HELP_COLUMNS, HELP_EXPORTS, write_help
+
+DEFAULT_ARTIFACT_DIR = Path("ci_artifacts")
+ARTIFACT_DIR_TOKEN = "{artifact_dir}"
+REPOSITORY_ROOT = Path(__file__).resolve().parents[2]
+
+# argparse wraps help at the terminal width; redirected subprocesses fall back to 80.
+REDIRECTED_HELP_COLUMNS = str(HELP_COLUMNS)
+
+SUMMARY_TEXT = """MilitaryNNTroopPrediction CI diagnostic artifact bundle
+
+Files:
+- python-version.txt: Python interpreter version used by CI.
+- pip-version.txt: pip version used by CI.
+- pip-freeze.txt: installed package versions for reproducibility.
+- doctor-minimal.json: machine-readable core setup diagnostics.
+- release health/release notes/reviewer handoff/operator digest/operator readiness/operator status board/operator session plan/operator runbook index/operator next steps/uncertainty review packet/handoff integrity report/evidence checklist/implementation acceptance checklist/implementation acceptance handoff/decision log/operator exception register/handoff validation receipt/workflow gate summary/provenance validation matrix/automation plan artifacts: generated local readiness, review, uncertainty, command-map, cross-artifact integrity, baseline evidence, implementation gate evidence, completed acceptance handoff, analytical decision, prioritized exception queue, final receipt, hosted gate map, provenance gate matrix, and next-run guidance.
+- next-increment-candidates.md/json and run-decision-record.json: offline roadmap/changelog candidate recipes plus selected-run merge evidence, validation, blocker, rollback, and follow-up fields for non-duplicative automation handoff.
+- implementation-acceptance-checklist.md/json and implementation-acceptance-handoff.md/json: offline acceptance gates plus completed-evidence handoff readiness summary for reviewer merge evidence.
+- handoff-gap-report-review.md/json: offline release bundle target cross-check against artifact gap-report missing and suspicious evidence for reviewer navigation.
+- reviewer-handoff-validation.txt/json: reviewer handoff contract validation results.
+- triage-summary.md/json: CI failure triage summary with narrow rerun targets.
+- artifact-gap-report.md/json: diagnostic bundle completeness and suspicious-artifact report.
+- artifact-provenance-ledger.md/json: diagnostic bundle provenance labels for generated, synthetic, preview, and review artifacts.
+- provenance-validation-matrix.md/json: cross-artifact matrix tying provenance labels to required handoff validation signals.
+- workflow-gate-summary.md/json: required hosted workflow gate map with local reproduction commands and merge-blocker meaning.
+- decision-log.md/json/summary.txt: analytical ready/blocked/needs-review decision log and copyable one-line status summary compiled from handoff diagnostics.
+- operator-exception-register.md/json/txt: prioritized blocker, warning, missing-artifact, and review-item queue compiled from handoff diagnostics.
+- openapi.json/openapi-summary.md: API contract exports.
+- api-response-examples.json/md: synthetic API response examples.
+- dashboard-mockup.html: self-contained static dashboard preview.
+- synthetic-fixtures/*: safe JSONL/CSV fixture records for local demos and client tests.
+- release-bundle-index.html/html-previews.md/previews/*.svg: dependency-free artifact landing page and static previews.
+- import-budget.md/json (with --with-import-budget, or from make import-budget): cold import time of every app.cli module against the benchmarks/import_budget.json budgets.
+- artifact-catalog.sqlite (with --with-catalog, or from make artifact-catalog): indexed SQLite copy of the final artifact manifest.
+- artifact-manifest.json/md: machine-readable and human-readable artifact manifests with sizes and SHA-256 hashes.
+- *-help.txt: current CLI help output for supported operator and artifact commands.
+"""
+
+
+@dataclass(frozen=True)
+class BundleStep:
+    """One bundle step, the artifacts it touches, and where its standard output goes.
+
+    ``kind`` is ``module`` for ``python -m`` generators, ``help`` for their
+    ``--help`` exports, ``script`` for repository scripts, ``pip`` for pip subcommands, ``interpreter`` for ``python --version``,
+    and ``summary`` for the static ``summary.txt`` index.
+
+    ``reads`` and ``writes`` name artifacts relative to the artifact directory;
+    ``*`` means the step scans or may rewrite the whole directory, which is also
+    the default so undeclared steps run strictly in order and are never skipped.
+    ``sources`` are repository-relative glob patterns the step reads outside the
+    artifact directory. ``fresh_manifest`` asks the planner to refresh the
+    manifest and provenance ledger first so they index every artifact written
+    by earlier steps. ``env_vars`` names environment variables whose values the
+    step's output depends on.
+    """
+
+    kind: str
+    target: str = ""
+    args: Tuple[str, ...] = ()
+    stdout_name: str | None = None
+    reads: Tuple[str, ...] = (ANY_ARTIFACT,)
+    writes: Tuple[str, ...] = (ANY_ARTIFACT,)
+    sources: Tuple[str, ...] = ()
+    fresh_manifest: bool = False
+    env_vars: Tuple[str, ...] = ()
+
+    def argv(self, artifact_dir: Path) -> List[str]:
+        """Return arguments with the artifact directory placeholder resolved."""
+
+        return [arg.replace(ARTIFACT_DIR_TOKEN, artifact_dir.as_posix()) for arg in self.args]
+
+    @property
+    def outputs(self) -> FrozenSet[str]:
+        """Return declared writes plus the captured standard output artifact."""
+
+        names = set(self.writes)
+        if self.stdout_name:
+            names.add(self.stdout_name)
+        return frozenset(names)
+
+
+def _module(
+    name: str,
+    *args: str,
+    stdout: str | None = None,
+    reads: Sequence[str] = (ANY_ARTIFACT,),
+    writes: Sequence[str] = (),
+    sources: Sequence[str] = (),
+    fresh_manifest: bool = False,
+    env_vars: Sequence[str] = (),
+) -> BundleStep:
+    return BundleStep(
+        "module",
+        f"app.cli.{name}",
+        tuple(args),
+        stdout,
+        tuple(reads),
+        tuple(writes),
+        tuple(sources),
+        fresh_manifest,
+        tuple(env_vars),
+    )
+
+
+def _help(name: str, output: str) -> BundleStep:
+    return BundleStep("help", f"app.cli.{name}", ("--help",), output, reads=(), writes=())
+
+
+def _captured(kind: str, *args: str, stdout: str) -> BundleStep:
+    return BundleStep(kind, args=tuple(args), stdout_name=stdout, reads=(), writes=())
+
+
+def _artifact(name: str) -> str:
+    return f"{ARTIFACT_DIR_TOKEN}/{name}"
+
+
+def _report(
+    name: str,
+    stem: str,
+    *extra: str,
+    reads: Sequence[str],
+    sources: Sequence[str] = (),
+    fresh_manifest: bool = False,
+) -> BundleStep:
+    """Return the common ``--artifact-dir``/Markdown/JSON generator invocation.
+
+    ``reads`` lists every artifact the generator opens or checks for, including
+    the presence checks it falls back to when the manifest lacks an entry.
+    ``tests/test_bundle.py`` records the real lookups and keeps them in step.
+    """
+
+    writes = [f"{stem}.md", f"{stem}.json"]
+    writes.extend(arg[len(ARTIFACT_DIR_TOKEN) + 1 :] for arg in extra if arg.startswith(ARTIFACT_DIR_TOKEN + "/"))
+    return _module(
+        name,
+        "--artifact-dir",
+        ARTIFACT_DIR_TOKEN,
+        "--markdown-path",
+        _artifact(f"{stem}.md"),
+        "--json-path",
+        _artifact(f"{stem}.json"),
+        *extra,
+        reads=reads,
+        writes=writes,
+        sources=sources,
+        fresh_manifest=fresh_manifest,
+    )
+
+
+def _artifact_scan(*, gap_report: bool = False, catalog: bool = False) -> BundleStep:
+    """Return one fused manifest and provenance ledger pass with an optional gap report and catalog."""
+
+    outputs = [
+        ("--manifest-json-path", "artifact-manifest.json"),
+        ("--manifest-markdown-path", "artifact-manifest.md"),
+        ("--ledger-json-path", "artifact-provenance-ledger.json"),
+        ("--ledger-markdown-path", "artifact-provenance-ledger.md"),
+    ]
+    if gap_report:
+        outputs += [
+            ("--gap-json-path", "artifact-gap-report.json"),
+            ("--gap-markdown-path", "artifact-gap-report.md"),
+        ]
+    if catalog:
+        outputs.append(("--catalog-path", "artifact-catalog.sqlite"))
+    args = ["--artifact-dir", ARTIFACT_DIR_TOKEN]
+    for flag, name in outputs:
+        args += [flag, _artifact(name)]
+    if not gap_report:
+        args.append("--no-gap-report")
+    return _module("artifact_scan", *args, writes=[name for _, name in outputs])
+
+
+MANIFEST_REFRESH: Tuple[BundleStep, ...] = (_artifact_scan(),)
+# No bundle step reads the catalog, so only the final refresh writes it, and
+# only with --with-catalog.
+CATALOG_REFRESH: Tuple[BundleStep, ...] = (_artifact_scan(catalog=True),)
+
+RUNBOOK_SOURCES = ("README.md", "CONTRIBUTING.md", "docs/*.md")
+
+_MANIFEST = "artifact-manifest.json"
+_LEDGER = "artifact-provenance-ledger.json"
+_HEALTH = ("release-health.json", "release-health.md")
+_TRIAGE = ("triage-summary.json", "triage-summary.md")
+_HANDOFF = ("reviewer-handoff.json", "reviewer-handoff.md")
+
+_OPERATOR_REFRESH: Tuple[BundleStep, ...] = (
+    _report(
+        "operator_digest",
+        "operator-digest",
+        reads=(_MANIFEST, *_HEALTH, *_TRIAGE, "reviewer-handoff.json"),
+    ),
+    _report(
+        "operator_status_board",
+        "operator-status-board",
+        reads=(
+            _MANIFEST,
+            "artifact-manifest.md",
+            "artifact-gap-report.json",
+            "artifact-gap-report.md",
+            "automation-plan.json",
+            "automation-plan.md",
+            "dashboard-mockup.html",
+            "operator-readiness.json",
+            "operator-readiness.md",
+            "release-bundle-index.html",
+            *_HEALTH,
+            *_HANDOFF,
+            *_TRIAGE,
+        ),
+    ),
+    _report(
+        "operator_session_plan",
+        "operator-session-plan",
+        reads=("release-notes.json", "reviewer-handoff.json", "triage-summary.json"),
+    ),
+    _report(
+        "operator_runbook_index",
+        "operator-runbook-index",
+        reads=(
+            "artifact-gap-report.md",
+            "artifact-manifest.md",
+            "artifact-provenance-ledger.md",
+            "automation-plan.md",
+            "operator-session-plan.md",
+            "operator-status-board.md",
+            "release-bundle-index.html",
+            "reviewer-handoff.md",
+            "triage-summary.md",
+        ),
+        sources=RUNBOOK_SOURCES,
+    ),
+    _report(
+        "operator_next_steps",
+        "operator-next-steps",
+        reads=(_MANIFEST, "release-health.json", "triage-summary.json"),
+    ),
+    _report(
+        "uncertainty_review_packet",
+        "uncertainty-review-packet",
+        reads=(_MANIFEST, "operator-next-steps.json", "release-health.json"),
+    ),
+    _report(
+        "handoff_integrity_report",
+        "handoff-integrity-report",
+        reads=(
+            _MANIFEST,
+            "operator-next-steps.json",
+            "release-health.json",
+            "reviewer-handoff.json",
+            "uncertainty-review-packet.json",
+        ),
+    ),
+    _report(
+        "evidence_checklist",
+        "evidence-checklist",
+        reads=(
+            _MANIFEST,
+            _LEDGER,
+            "handoff-integrity-report.json",
+            "reviewer-handoff.json",
+            "triage-summary.json",
+            "uncertainty-review-packet.json",
+        ),
+    ),
+)
+
+# Starts one interpreter per CLI module, so it only runs with --with-import-budget.
+IMPORT_BUDGET_STEP = _module(
+    "import_budget",
+    "--markdown-path",
+    _artifact("import-budget.md"),
+    "--json-path",
+    _artifact("import-budget.json"),
+    "--repeat",
+    "1",
+    reads=(),
+    writes=("import-budget.md", "import-budget.json"),
+    sources=("app/**/*.py", "benchmarks/import_budget.json"),
+)
+
+BUNDLE_STEPS: Tuple[BundleStep, ...] = (
+    _captured("interpreter", "--version", stdout="python-version.txt"),
+    _captured("pip", "--version", stdout="pip-version.txt"),
+    _captured("pip", "freeze", stdout="pip-freeze.txt"),
+    _module(
+        "doctor",
+        "--skip-optional",
+        "--skip-mongo",
+        "--skip-env-files",
+        "--json",
+        "--cache",
+        "--cache-path",
+        _artifact(DOCTOR_CACHE_NAME),
+        stdout="doctor-minimal.json",
+        reads=(),
+        writes=(DOCTOR_CACHE_NAME,),
+        sources=(".env",),
+        env_vars=RECOMMENDED_ENV_VARS,
+    ),
+    # Reuses the doctor step's static checks from the cache in the artifact
+    # directory, so it runs after the doctor step, and adds its own results.
+    _module(
+        "release_health",
+        "--markdown-path",
+        _artifact("release-health.md"),
+        "--json-path",
+        _artifact("release-health.json"),
+        "--cache-path",
+        _artifact(DOCTOR_CACHE_NAME),
+        reads=(DOCTOR_CACHE_NAME,),
+        writes=("release-health.md", "release-health.json", DOCTOR_CACHE_NAME),
+        sources=(".env", ".env.example"),
+        env_vars=RECOMMENDED_ENV_VARS,
+    ),
+    _module(
+        "export_openapi",
+        "--json-path",
+        _artifact("openapi.json"),
+        "--markdown-path",
+        _artifact("openapi-summary.md"),
+        reads=(),
+        writes=("openapi.json", "openapi-summary.md"),
+    ),
+    _module(
+        "export_api_examples",
+        "--json-path",
+        _artifact("api-response-examples.json"),
+        "--markdown-path",
+        _artifact("api-response-examples.md"),
+        reads=(),
+        writes=("api-response-examples.json", "api-response-examples.md"),
+    ),
+    _module(
+        "export_dashboard_mockup",
+        "--html-path",
+        _artifact("dashboard-mockup.html"),
+        reads=(),
+        writes=("dashboard-mockup.html",),
+    ),
+    _module(
+        "synthetic_data_fixtures",
+        "--output-dir",
+        _artifact("synthetic-fixtures"),
+        "--json",
+        stdout="synthetic-fixtures-summary.json",
+        reads=(),
+        writes=("synthetic-fixtures/",),
+    ),
+    _module(
+        "next_increment_candidates",
+        "--markdown-path",
+        _artifact("next-increment-candidates.md"),
+        "--json-path",
+        _artifact("next-increment-candidates.json"),
+        "--decision-record-path",
+        _artifact("run-decision-record.json"),
+        reads=(),
+        writes=("next-increment-candidates.md", "next-increment-candidates.json", "run-decision-record.json"),
+        sources=("CHANGELOG.md", "goals.md"),
+    ),
+    _module(
+        "implementation_acceptance_checklist",
+        "--decision-record-path",
+        _artifact("run-decision-record.json"),
+        "--markdown-path",
+        _artifact("implementation-acceptance-checklist.md"),
+        "--json-path",
+        _artifact("implementation-acceptance-checklist.json"),
+        reads=("run-decision-record.json",),
+        writes=("implementation-acceptance-checklist.md", "implementation-acceptance-checklist.json"),
+    ),
+    _module(
+        "implementation_acceptance_handoff",
+        "--checklist-json",
+        _artifact("implementation-acceptance-checklist.json"),
+        "--markdown-path",
+        _artifact("implementation-acceptance-handoff.md"),
+        "--json-path",
+        _artifact("implementation-acceptance-handoff.json"),
+        reads=("implementation-acceptance-checklist.json",),
+        writes=("implementation-acceptance-handoff.md", "implementation-acceptance-handoff.json"),
+    ),
+    *(_help(name, output) for name, output in HELP_EXPORTS),
+    _captured("summary", stdout="summary.txt"),
+    # Builds its own manifest of the whole directory, so it keeps the ``*`` read.
+    _module(
+        "release_bundle_index",
+        "--artifact-dir",
+        ARTIFACT_DIR_TOKEN,
+        "--html-path",
+        _artifact("release-bundle-index.html"),
+        writes=("release-bundle-index.html",),
+    ),
+    _module(
+        "export_html_previews",
+        "--artifact-dir",
+        ARTIFACT_DIR_TOKEN,
+        "--markdown-path",
+        _artifact("html-previews.md"),
+        reads=("dashboard-mockup.html", "release-bundle-index.html"),
+        writes=("html-previews.md", "previews/"),
+    ),
+    _module(
+        "release_notes",
+        "--health-json",
+        _artifact("release-health.json"),
+        "--manifest-json",
+        _artifact("artifact-manifest.json"),
+        "--markdown-path",
+        _artifact("release-notes.md"),
+        "--json-path",
+        _artifact("release-notes.json"),
+        reads=("release-health.json", "artifact-manifest.json"),
+        writes=("release-notes.md", "release-notes.json"),
+        fresh_manifest=True,
+    ),
+    _module(
+        "triage_summary",
+        "--artifact-dir",
+        ARTIFACT_DIR_TOKEN,
+        "--health-json",
+        _artifact("release-health.json"),
+        "--manifest-json",
+        _artifact("artifact-manifest.json"),
+        "--markdown-path",
+        _artifact("triage-summary.md"),
+        "--json-path",
+        _artifact("triage-summary.json"),
+        reads=("release-health.json", _MANIFEST),
+        writes=("triage-summary.md", "triage-summary.json"),
+    ),
+    _report(
+        "reviewer_handoff",
+        "reviewer-handoff",
+        reads=(
+            _MANIFEST,
+            "artifact-manifest.md",
+            "api-response-examples.md",
+            "dashboard-mockup.html",
+            "openapi-summary.md",
+            "release-bundle-index.html",
+            "release-notes.md",
+            *_HEALTH,
+            *_TRIAGE,
+        ),
+    ),
+    _OPERATOR_REFRESH[0],
+    _report(
+        "operator_readiness",
+        "operator-readiness",
+        reads=(_MANIFEST, "artifact-manifest.md", *_HEALTH, *_HANDOFF, *_TRIAGE),
+    ),
+    _report(
+        "automation_plan",
+        "automation-plan",
+        reads=(_MANIFEST, "reviewer-handoff.json", "triage-summary.json"),
+        sources=("goals.md",),
+    ),
+    *_OPERATOR_REFRESH[1:],
+    BundleStep(
+        "script",
+        "scripts/validate_reviewer_handoff.py",
+        (_artifact("reviewer-handoff.json"),),
+        "reviewer-handoff-validation.txt",
+        reads=("reviewer-handoff.json",),
+        writes=(),
+    ),
+    BundleStep(
+        "script",
+        "scripts/validate_reviewer_handoff.py",
+        (_artifact("reviewer-handoff.json"), "--json"),
+        "reviewer-handoff-validation.json",
+        reads=("reviewer-handoff.json",),
+        writes=(),
+    ),
+    # Refreshes the manifest and ledger itself, so it needs no planned refresh.
+    _artifact_scan(gap_report=True),
+    *_OPERATOR_REFRESH,
+    _module(
+        "implementation_acceptance_handoff",
+        "--checklist-json",
+        _artifact("implementation-acceptance-checklist.json"),
+        "--decision-record-json",
+        _artifact("run-decision-record.json"),
+        "--artifact-manifest-json",
+        _artifact("artifact-manifest.json"),
+        "--markdown-path",
+        _artifact("implementation-acceptance-handoff.md"),
+        "--json-path",
+        _artifact("implementation-acceptance-handoff.json"),
+        reads=("implementation-acceptance-checklist.json", "run-decision-record.json", "artifact-manifest.json"),
+        writes=("implementation-acceptance-handoff.md", "implementation-acceptance-handoff.json"),
+    ),
+    _module(
+        "handoff_gap_report_review",
+        "--handoff-json",
+        _artifact("implementation-acceptance-handoff.json"),
+        "--artifact-gap-report-json",
+        _artifact("artifact-gap-report.json"),
+        "--markdown-path",
+        _artifact("handoff-gap-report-review.md"),
+        "--json-path",
+        _artifact("handoff-gap-report-review.json"),
+        reads=("implementation-acceptance-handoff.json", "artifact-gap-report.json"),
+        writes=("handoff-gap-report-review.md", "handoff-gap-report-review.json"),
+    ),
+    _report(
+        "handoff_validation_receipt",
+        "handoff-validation-receipt",
+        reads=(
+            _MANIFEST,
+            _LEDGER,
+            "evidence-checklist.json",
+            "handoff-integrity-report.json",
+            "reviewer-handoff.json",
+            "triage-summary.json",
+            "uncertainty-review-packet.json",
+        ),
+        fresh_manifest=True,
+    ),
+    _module(
+        "workflow_gate_summary",
+        "--artifact-dir",
+        ARTIFACT_DIR_TOKEN,
+        "--markdown-path",
+        _artifact("workflow-gate-summary.md"),
+        "--json-path",
+        _artifact("workflow-gate-summary.json"),
+        reads=(),
+        writes=("workflow-gate-summary.md", "workflow-gate-summary.json"),
+        sources=(".github/workflows/*.yml",),
+    ),
+    _report(
+        "provenance_validation_matrix",
+        "provenance-validation-matrix",
+        reads=(_MANIFEST, _LEDGER, "evidence-checklist.json", "handoff-validation-receipt.json"),
+        fresh_manifest=True,
+    ),
+    _report(
+        "decision_log",
+        "decision-log",
+        "--summary-path",
+        _artifact("decision-log-summary.txt"),
+        reads=(
+            _MANIFEST,
+            "evidence-checklist.json",
+            "handoff-integrity-report.json",
+            "handoff-readiness-scorecard.json",
+            "handoff-validation-receipt.json",
+            "provenance-validation-matrix.json",
+            "uncertainty-review-packet.json",
+        ),
+    ),
+    _report(
+        "operator_exception_register",
+        "operator-exception-register",
+        "--text-path",
+        _artifact("operator-exception-register.txt"),
+        reads=(
+            _MANIFEST,
+            "decision-log.json",
+            "evidence-checklist.json",
+            "handoff-closeout-summary.json",
+            "handoff-integrity-report.json",
+            "handoff-readiness-scorecard.json",
+            "handoff-validation-receipt.json",
+            "provenance-validation-matrix.json",
+        ),
+    ),
+)
+
+
+def _touches(names: FrozenSet[str], others: FrozenSet[str]) -> bool:
+    if not names or not others:
+        return False
+    return ANY_ARTIFACT in names or ANY_ARTIFACT in others or not names.isdisjoint(others)
+
+
+def plan_steps(steps: Sequence[BundleStep] = BUNDLE_STEPS) -> Tuple[BundleStep, ...]:
+    """Return ``steps`` with manifest refreshes inserted only where they are needed.
+
+    A refresh runs before a ``fresh_manifest`` step that reads the manifest or
+    ledger when any artifact was written since the previous refresh, and once
+    more at the end so the published manifest indexes the final bundle. Refresh
+    outputs do not count as changes, so the ledger from one refresh is indexed
+    by the next.
+    """
+
+    refreshed = frozenset(name for refresh in MANIFEST_REFRESH for name in refresh.outputs)
+    planned: List[BundleStep] = []
+    changed = False
+    for step in steps:
+        if step.fresh_manifest and changed and _touches(frozenset(step.reads), refreshed):
+            planned.extend(MANIFEST_REFRESH)
+            changed = False
+        planned.append(step)
+        changed = changed or bool(step.outputs)
+    if changed:
+        planned.extend(MANIFEST_REFRESH)
+    return tuple(planned)
+
+
+BUNDLE_PLAN: Tuple[BundleStep, ...] = plan_steps()
+
+
+def bundle_plan(with_import_budget: bool = False, with_catalog: bool = False) -> Tuple[BundleStep, ...]:
+    """Return the planned bundle with the optional import budget step and SQLite catalog.
+
+    The import budget step runs before the help exports; the catalog is
+    written by the final manifest refresh.
+    """
+
+    planned = BUNDLE_PLAN
+    if with_import_budget:
+        first_help = next(index for index, step in enumerate(BUNDLE_STEPS) if step.kind == "help")
+        planned = plan_steps((*BUNDLE_STEPS[:first_help], IMPORT_BUDGET_STEP, *BUNDLE_STEPS[first_help:]))
+    if with_catalog and planned[-len(MANIFEST_REFRESH) :] == MANIFEST_REFRESH:
+        planned = (*planned[: -len(MANIFEST_REFRESH)], *CATALOG_REFRESH)
+    return planned
+
+
+def _conflicts(earlier: BundleStep, later: BundleStep) -> bool:
+    """Return whether ``later`` must wait for ``earlier`` to keep serial results."""
+
+    earlier_reads, later_reads = frozenset(earlier.reads), frozenset(later.reads)
+    return (
+        _touches(earlier.outputs, later_reads)
+        or _touches(earlier_reads, later.outputs)
+        or _touches(earlier.outputs, later.outputs)
+    )
+
+
+def schedule_indices(steps: Sequence[BundleStep] = BUNDLE_PLAN) -> List[List[int]]:
+    """Group planned step positions into levels that can each run concurrently.
+
+    A step lands one level after the latest earlier step it conflicts with
+    (read-after-write, write-after-read, or write-after-write), so running the
+    levels in order reproduces the serial outputs exactly.
+    """
+
+    levels: List[List[int]] = []
+    placed: List[int] = []
+    for index, step in enumerate(steps):
+        level = 0
+        for earlier_index in range(index):
+            if placed[earlier_index] >= level and _conflicts(steps[earlier_index], step):
+                level = placed[earlier_index] + 1
+        placed.append(level)
+        if level == len(levels):
+            levels.append([])
+        levels[level].append(index)
+    return levels
+
+
+def schedule(steps: Sequence[BundleStep] = BUNDLE_PLAN) -> List[List[BundleStep]]:
+    """Return the planned steps grouped by :func:`schedule_indices`."""
+
+    return [[steps[index] for index in level] for level in schedule_indices(steps)]
+
+
+def _shell_argument(arg: str) -> str:
+    if ARTIFACT_DIR_TOKEN in arg:
+        return '"' + arg.replace(ARTIFACT_DIR_TOKEN, "${ARTIFACT_DIR}") + '"'
+    return shlex.quote(arg)
+
+
+def render_shell_command(step: BundleStep) -> str:
+    """Return the equivalent serial shell command for ``step``."""
+
+    if step.kind == "summary":
+        return (
+            f'cat > "${{ARTIFACT_DIR}}/{step.stdout_name}" <<\'SUMMARY\'\n'
+            f"{SUMMARY_TEXT}SUMMARY"
+        )
+    if step.kind == "interpreter":
+        words = ['"${PYTHON_BIN}"']
+    elif step.kind == "pip":
+        words = ['"${PYTHON_BIN}"', "-m", "pip"]
+    elif step.kind == "script":
+        words = ['"${PYTHON_BIN}"', step.target]
+    else:
+        words = ['"${PYTHON_BIN}"', "-m", step.target]
+    words.extend(_shell_argument(arg) for arg in step.args)
+    if step.stdout_name:
+        words.extend([">", f'"${{ARTIFACT_DIR}}/{step.stdout_name}"'])
+    return " ".join(words)
+
+
+def render_shell_script(steps: Sequence[BundleStep] = BUNDLE_PLAN) -> str:
+    """Return the serial shell equivalent of the bundle pipeline for narrow reruns."""
+
+    return "\n".join(render_shell_command(step) for step in steps) + "\n"
+
+
+def render_schedule(levels: Sequence[Sequence[BundleStep]]) -> str:
+    """Return the dependency levels as commented groups of shell commands."""
+
+    lines: List[str] = []
+    for number, level in enumerate(levels, start=1):
+        lines.append(f"# level {number}: {len(level)} step(s)")
+        lines.extend(render_shell_command(step).splitlines()[0] for step in level)
+    return "\n".join(lines) + "\n"
+
+
+def _exit_status(code: object) -> int:
+    if code is None:
+        return 0
+    if isinstance(code, int):
+        return code
+    print(code, file=sys.stderr)
+    return 1
+
+
+@contextlib.contextmanager
+def _program_name(path: str) -> Iterator[None]:
+    """Match ``sys.argv[0]`` to the launched file so argparse ``prog`` is unchanged."""
+
+    previous = sys.argv[0] if sys.argv else ""
+    if sys.argv:
+        sys.argv[0] = path
+    else:
+        sys.argv.append(path)
+    try:
+        yield
+    finally:
+        sys.argv[0] = previous
+
+
+@contextlib.contextmanager
+def _redirected_columns() -> Iterator[None]:
+    if "COLUMNS" in os.environ:
+        yield
+        return
+    os.environ["COLUMNS"] = REDIRECTED_HELP_COLUMNS
+    try:
+        yield
+    finally:
+        os.environ.pop("COLUMNS", None)
+
+
+def _load_script(relative_path: str) -> ModuleType:
+    path = REPOSITORY_ROOT / relative_path
+    spec = importlib.util.spec_from_file_location(f"_bundle_{path.stem}", path)
+    if spec is None or spec.loader is None:
+        raise ImportError(f"cannot load bundle script {relative_path}")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _entry_point(step: BundleStep, scripts: Dict[str, ModuleType]) -> Tuple[Callable[..., int], str]:
+    if step.kind == "script":
+        if step.target not in scripts:
+            scripts[step.target] = _load_script(step.target)
+        return scripts[step.target].main, step.target
+    module = importlib.import_module(step.target)
+    return module.main, str(module.__file__)
+
+
+def _call_main(entry: Callable[..., int], argv: List[str], program: str) -> int:
+    with _program_name(program):
+        try:
+            return _exit_status(entry(argv))
+        except SystemExit as exc:
+            return _exit_status(exc.code)
+
+
+def run_step(step: BundleStep, artifact_dir: Path, scripts: Dict[str, ModuleType] | None = None) -> int:
+    """Run one bundle step in-process and return its exit status."""
+
+    argv = step.argv(artifact_dir)
+    output_path = artifact_dir / step.stdout_name if step.stdout_name else None
+
+    if step.kind == "summary":
+        assert output_path is not None
+        output_path.write_text(SUMMARY_TEXT, encoding="utf-8")
+        return 0
+    if step.kind == "pip":
+        assert output_path is not None
+        with output_path.open("wb") as handle:
+            return subprocess.run([sys.executable, "-m", "pip", *argv], stdout=handle, check=False).returncode
+    if step.kind == "interpreter":
+        assert output_path is not None
+        output_path.write_text(f"Python {sys.version.split()[0]}\n", encoding="utf-8")
+        return 0
+
+    if step.kind == "help":
+        assert output_path is not None
+        write_help(step.target.rpartition(".")[2], output_path)
+        return 0
+
+    entry, program = _entry_point(step, {} if scripts is None else scripts)
+    if output_path is None:
+        return _call_main(entry, argv, program)
+
+    buffer = io.StringIO()
+    with _redirected_columns(), contextlib.redirect_stdout(buffer):
+        status = _call_main(entry, argv, program)
+    output_path.write_text(buffer.getvalue(), encoding="utf-8")
+    return status
+
+
+_WORKER_SCRIPTS: Dict[str, ModuleType] = {}
+
+
+def _run_worker_step(step: BundleStep, artifact_dir: Path) -> int:
+    # Long-lived workers miss the parent's invalidations, so each step parses afresh.
+    try:
+        with shared_context():
+            return run_step(step, artifact_dir, _WORKER_SCRIPTS)
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+
+
+def _preload(steps: Sequence[BundleStep]) -> None:
+    """Import generator modules once so forked workers inherit them."""
+
+    for step in steps:
+        if step.kind in {"module", "help"}:
+            importlib.import_module(step.target)
+
+
+def _run_level(
+    level: Sequence[BundleStep],
+    artifact_dir: Path,
+    scripts: Dict[str, ModuleType],
+    pool: concurrent.futures.Executor | None,
+) -> List[int]:
+    if pool is None or len(level) == 1:
+        return [run_step(step, artifact_dir, scripts) for step in level]
+    sys.stdout.flush()
+    sys.stderr.flush()
+    futures = [pool.submit(_run_worker_step, step, artifact_dir) for step in level]
+    return [future.result() for future in futures]
+
+
+def _forget_outputs(context: ArtifactContext, steps: Sequence[BundleStep], artifact_dir: Path) -> None:
+    outputs = {name for step in steps for name in step.outputs}
+    if ANY_ARTIFACT in outputs:
+        context.clear()
+    else:
+        context.forget(artifact_dir / name for name in outputs)
+
+
+def _command_line(step: BundleStep) -> str:
+    return render_shell_command(step).splitlines()[0]
+
+
+def _fresh_doctor(step: BundleStep) -> BundleStep:
+    """Return ``step`` with ``--fresh`` added when it runs the setup doctor."""
+
+    if step.kind == "module" and step.target == "app.cli.doctor":
+        return replace(step, args=(*step.args, "--fresh"))
+    return step
+
+
+def run_bundle(
+    artifact_dir: Path = DEFAULT_ARTIFACT_DIR,
+    steps: Sequence[BundleStep] = BUNDLE_PLAN,
+    jobs: int = 1,
+    force: bool = False,
+    explain: bool = False,
+    cache_dir: Path = DEFAULT_CACHE_DIR,
+) -> int:
+    """Run ``steps`` level by level with up to ``jobs`` worker processes.
+
+    Steps whose fingerprint matches ``bundle-state.json`` in ``cache_dir`` are
+    skipped unless ``force`` is set; ``explain`` prints why each step ran or
+    was skipped.
+    ``force`` also makes the doctor step re-run its checks rather than reuse
+    the doctor result cache, which later steps such as release health then
+    reuse.
+    Levels run in order and the bundle stops after the first level with a
+    failing step; other steps in that level may already have finished.
+    Generators in this process share one ``ArtifactContext``, so each JSON
+    artifact is parsed once until a later step rewrites it.
+    """
+
+    artifact_dir.mkdir(parents=True, exist_ok=True)
+    scripts: Dict[str, ModuleType] = {}
+    commands = [_command_line(step) for step in steps]
+    cache = BundleCache(artifact_dir, steps, commands, force=force, cache_dir=cache_dir)
+    if force:
+        steps = [_fresh_doctor(step) for step in steps]
+    levels = schedule_indices(steps)
+    skipped = 0
+    with contextlib.ExitStack() as stack:
+        context = stack.enter_context(shared_context())
+        pool: concurrent.futures.Executor | None = None
+        if jobs > 1 and any(len(level) > 1 for level in levels):
+            _preload(steps)
+            sys.stdout.flush()
+            sys.stderr.flush()
+            pool = stack.enter_context(concurrent.futures.ProcessPoolExecutor(max_workers=jobs))
+        for level in levels:
+            runnable: List[int] = []
+            for index in level:
+                reason = cache.check(index)
+                if reason is None:
+                    skipped += 1
+                    if explain:
+                        print(f"skip: {commands[index]} (inputs unchanged)")
+                    continue
+                if explain:
+                    print(f"run: {commands[index]} ({reason})")
+                runnable.append(index)
+            statuses = _run_level([steps[index] for index in runnable], artifact_dir, scripts, pool)
+            _forget_outputs(context, [steps[index] for index in level], artifact_dir)
+            failed = [(index, status) for index, status in zip(runnable, statuses) if status != 0]
+            for index, status in zip(runnable, statuses):
+                if status == 0:
+                    cache.record(index)
+                else:
+                    cache.forget(index)
+            if failed:
+                cache.save()
+                index, status = failed[0]
+                print(f"::error::bundle step failed with status {status}: {commands[index]}", file=sys.stderr)
+                return status
+    cache.save()
+    if skipped:
+        print(f"Reused {skipped} unchanged step(s); pass --force to rebuild everything.")
+    print(f"Wrote CI diagnostics to {artifact_dir.as_posix()}")
+    return 0
+
+
+def _positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError("must be at least 1")
+    return number
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        description="Build the CI diagnostics artifact bundle in a single interpreter."
+    )
+    parser.add_argument(
+        "--artifact-dir",
+        type=Path,
+        default=DEFAULT_ARTIFACT_DIR,
+        help=f"Directory for generated artifacts. Default: {DEFAULT_ARTIFACT_DIR}",
+    )
+    parser.add_argument(
+        "--print-commands",
+        action="store_true",
+        help="Print the equivalent serial shell commands instead of running the bundle.",
+    )
+    parser.add_argument(
+        "--print-schedule",
+        action="store_true",
+        help="Print the dependency levels that run concurrently instead of running the bundle.",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=_positive_int,
+        default=os.cpu_count() or 1,
+        help="Worker processes for independent steps; 1 runs every step in this process. Default: CPU count",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Run every step even when its inputs are unchanged since the previous run, and re-run the doctor checks.",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=DEFAULT_CACHE_DIR,
+        help=f"Directory for step fingerprints and cached outputs, kept out of the bundle. Default: {DEFAULT_CACHE_DIR}",
+    )
+    parser.add_argument(
+        "--explain",
+        action="store_true",
+        help="Print why each step ran or was skipped.",
+    )
+    parser.add_argument(
+        "--with-import-budget",
+        action="store_true",
+        help="Also measure the cold import time of every CLI module (one interpreter per module).",
+    )
+    parser.add_argument(
+        "--with-catalog",
+        action="store_true",
+        help="Also index the final manifest in artifact-catalog.sqlite.",
+    )
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    steps = bundle_plan(args.with_import_budget, args.with_catalog)
+    if args.print_commands:
+        sys.stdout.write(render_shell_script(steps))
+        return 0
+    if args.print_schedule:
+        sys.stdout.write(render_schedule(schedule(steps)))
+        return 0
+    return run_bundle(
+        args.artifact_dir,
+        steps,
+        jobs=args.jobs,
+        force=args.force,
+        explain=args.explain,
+        cache_dir=args.cache_dir,
+    )
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,393 @@
+"""Export a diagnostic artifact bundle as one compressed, deduplicated archive.
+
+The archive is a ZIP file with two kinds of member:
+
+- ``objects/<sha256>.gz``: one gzip stream per distinct artifact content, so
+  files with the same SHA-256 digest are stored once.
+- ``index.json``: the artifact manifest plus the archive format and
+  deduplication totals. Consumers look a path up in the manifest and read only
+  that digest's object, so extracting one file never unpacks the rest.
+
+Digests come from the artifact manifest scan, which reuses
+``artifact-manifest-hashes.json``, so unchanged files are not hashed before
+packing. Objects are compressed by a bounded thread pool (``zlib`` releases the
+GIL while compressing) and the content is rehashed as it is compressed, so an
+artifact that changed after it was scanned fails the export instead of being
+archived under a stale digest. ``zipfile`` cannot accept data that is already
+compressed, so objects are gzip streams held in stored members; every object
+can also be read with ``unzip -p`` and ``gunzip``. Member timestamps are fixed,
+so the same bundle produces the same object bytes.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import shutil
+import sys
+import tempfile
+import zipfile
+import zlib
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path, PurePosixPath
+from typing import IO, Any, Deque, Dict, List, Mapping, Sequence, Tuple
+
+from app.cli.artifact_manifest import DEFAULT_ARTIFACT_DIR, DEFAULT_JOBS, HASH_WINDOW_PER_JOB
+from app.cli.artifact_manifest import build_manifest, load_hash_cache
+
+ARCHIVE_FORMAT = "bundle-archive-v1"
+INDEX_NAME = "index.json"
+OBJECT_TEMPLATE = "objects/{sha256}.gz"
+DEFAULT_LEVEL = 6
+READ_CHUNK_BYTES = 1024 * 1024
+# Compressed objects larger than this wait on disk rather than in memory.
+SPOOL_MAX_BYTES = 1024 * 1024
+# Fixed member timestamp (the earliest ZIP allows) keeps archives reproducible.
+MEMBER_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+
+
+class ArchiveError(ValueError):
+    """Raised when an archive cannot be written or read consistently."""
+
+
+def default_archive_path(artifact_dir: Path) -> Path:
+    """Return ``<artifact-dir>.zip`` beside the artifact directory."""
+
+    directory = artifact_dir if artifact_dir.name else artifact_dir.resolve()
+    return directory.parent / f"{directory.name}.zip"
+
+
+def object_name(sha256: str) -> str:
+    """Return the archive member that holds the content with digest ``sha256``."""
+
+    return OBJECT_TEMPLATE.format(sha256=sha256)
+
+
+def _compress_object(path: Path, sha256: str, level: int) -> Tuple[IO[bytes], int]:
+    """Gzip ``path`` into a spool file, checking its content against ``sha256``."""
+
+    spool: IO[bytes] = tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_BYTES)
+    try:
+        digest = hashlib.sha256()
+        # wbits 16 + MAX_WBITS emits a gzip header with a zero mtime.
+        compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+        with path.open("rb") as handle:
+            for chunk in iter(lambda: handle.read(READ_CHUNK_BYTES), b""):
+                digest.update(chunk)
+                spool.write(compressor.compress(chunk))
+        spool.write(compressor.flush())
+        if digest.hexdigest() != sha256:
+            raise ArchiveError(f"{path} changed after it was scanned; rerun the export.")
+        size = spool.tell()
+        spool.seek(0)
+        return spool, size
+    except BaseException:
+        spool.close()
+        raise
+
+
+def _member_info(name: str) -> zipfile.ZipInfo:
+    info = zipfile.ZipInfo(name, date_time=MEMBER_DATE_TIME)
+    info.compress_type = zipfile.ZIP_STORED
+    info.external_attr = 0o644 << 16
+    return info
+
+
+def _unique_objects(manifest: Mapping[str, Any]) -> List[Tuple[str, str]]:
+    """Return ``(sha256, first path)`` for each distinct digest, in manifest order."""
+
+    first_paths: Dict[str, str] = {}
+    for entry in manifest.get("files", []):
+        first_paths.setdefault(str(entry["sha256"]), str(entry["path"]))
+    return list(first_paths.items())
+
+
+def _write_objects(
+    archive: zipfile.ZipFile,
+    artifact_dir: Path,
+    objects: Sequence[Tuple[str, str]],
+    jobs: int,
+    level: int,
+) -> int:
+    """Compress ``objects`` up to ``jobs`` at a time and write them in order; return stored bytes.
+
+    At most ``jobs * HASH_WINDOW_PER_JOB`` compressed objects wait to be
+    written, so memory stays bounded on very large bundles.
+    """
+
+    stored = 0
+    window: Deque[Tuple[str, "Future[Tuple[IO[bytes], int]]"]] = deque()
+
+    def write_next() -> None:
+        nonlocal stored
+        sha256, future = window.popleft()
+        spool, size = future.result()
+        with spool, archive.open(_member_info(object_name(sha256)), "w", force_zip64=size >= zipfile.ZIP64_LIMIT) as member:
+            shutil.copyfileobj(spool, member, READ_CHUNK_BYTES)
+        stored += size
+
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        try:
+            for sha256, path in objects:
+                window.append((sha256, pool.submit(_compress_object, artifact_dir / path, sha256, level)))
+                if len(window) >= jobs * HASH_WINDOW_PER_JOB:
+                    write_next()
+            while window:
+                write_next()
+        finally:
+            for _, future in window:
+                future.cancel()
+            for _, future in window:
+                if not future.cancelled() and future.exception() is None:
+                    future.result()[0].close()
+    return stored
+
+
+def _archive_summary(manifest: Mapping[str, Any], objects: Sequence[Tuple[str, str]], stored: int) -> Dict[str, Any]:
+    sizes = {str(entry["sha256"]): int(entry["size_bytes"]) for entry in manifest["files"]}
+    total = sum(int(entry["size_bytes"]) for entry in manifest["files"])
+    unique = sum(sizes[sha256] for sha256, _ in objects)
+    return {
+        "format": ARCHIVE_FORMAT,
+        "compression": "gzip",
+        "object_template": OBJECT_TEMPLATE,
+        "file_count": len(manifest["files"]),
+        "object_count": len(objects),
+        "duplicate_file_count": len(manifest["files"]) - len(objects),
+        "total_size_bytes": total,
+        "deduplicated_bytes": total - unique,
+        "stored_size_bytes": stored,
+    }
+
+
+def export_archive(
+    artifact_dir: Path = DEFAULT_ARTIFACT_DIR,
+    archive_path: Path | None = None,
+    jobs: int = DEFAULT_JOBS,
+    level: int = DEFAULT_LEVEL,
+    manifest: Dict[str, Any] | None = None,
+    use_hash_cache: bool = True,
+) -> Dict[str, Any]:
+    """Write ``artifact_dir`` to a deduplicated archive and return the archive summary.
+
+    ``manifest`` skips the scan when the caller already holds a current one;
+    otherwise the directory is scanned, reusing its hash cache unless
+    ``use_hash_cache`` is false. The archive is written to a temporary file and
+    renamed into place, so a failed export leaves any previous archive intact.
+    """
+
+    archive_path = archive_path or default_archive_path(artifact_dir)
+    if manifest is None:
+        hash_cache = load_hash_cache(artifact_dir) if use_hash_cache else None
+        manifest = build_manifest(artifact_dir, hash_cache, jobs)
+        if hash_cache is not None and artifact_dir.is_dir():
+            hash_cache.save()
+    objects = _unique_objects(manifest)
+    archive_path.parent.mkdir(parents=True, exist_ok=True)
+    temporary = archive_path.with_name(f".{archive_path.name}.tmp")
+    try:
+        with zipfile.ZipFile(temporary, "w", zipfile.ZIP_STORED, allowZip64=True) as archive:
+            stored = _write_objects(archive, artifact_dir, objects, jobs, level)
+            summary = _archive_summary(manifest, objects, stored)
+            # Compact separators let the C encoder handle 100k-entry manifests quickly.
+            index = json.dumps({**summary, "manifest": manifest}, separators=(",", ":"), sort_keys=True) + "\n"
+            archive.writestr(_member_info(INDEX_NAME), index.encode("utf-8"))
+        os.replace(temporary, archive_path)
+    finally:
+        temporary.unlink(missing_ok=True)
+    return {**summary, "archive_path": archive_path.as_posix(), "archive_size_bytes": archive_path.stat().st_size}
+
+
+def _safe_relative_path(path: str) -> PurePosixPath:
+    relative = PurePosixPath(path)
+    if relative.is_absolute() or not relative.parts or ".." in relative.parts:
+        raise ArchiveError(f"Refusing to extract unsafe archive path {path!r}.")
+    return relative
+
+
+class BundleArchive:
+    """Read single artifacts from an archive written by :func:`export_archive`."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._zip = zipfile.ZipFile(path)
+        try:
+            self.index: Dict[str, Any] = json.loads(self._zip.read(INDEX_NAME).decode("utf-8"))
+        except (KeyError, ValueError) as exc:
+            self._zip.close()
+            raise ArchiveError(f"{path} has no readable {INDEX_NAME}.") from exc
+        if self.index.get("format") != ARCHIVE_FORMAT:
+            self._zip.close()
+            raise ArchiveError(f"{path} uses unsupported archive format {self.index.get('format')!r}.")
+        self.manifest: Dict[str, Any] = self.index["manifest"]
+        self._entries = {str(entry["path"]): entry for entry in self.manifest.get("files", [])}
+
+    def __enter__(self) -> "BundleArchive":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the underlying ZIP file."""
+
+        self._zip.close()
+
+    def entries(self) -> List[Dict[str, Any]]:
+        """Return the embedded manifest entries in manifest order."""
+
+        return list(self._entries.values())
+
+    def entry(self, path: str) -> Dict[str, Any] | None:
+        """Return the manifest entry for ``path``, or ``None`` when it is not archived."""
+
+        return self._entries.get(path)
+
+    def _copy(self, path: str, destination: IO[bytes]) -> None:
+        entry = self._entries.get(path)
+        if entry is None:
+            raise KeyError(path)
+        digest = hashlib.sha256()
+        with self._zip.open(object_name(entry["sha256"])) as member, gzip.GzipFile(fileobj=member) as content:
+            for chunk in iter(lambda: content.read(READ_CHUNK_BYTES), b""):
+                digest.update(chunk)
+                destination.write(chunk)
+        if digest.hexdigest() != entry["sha256"]:
+            raise ArchiveError(f"{path} does not match its manifest digest in {self.path}.")
+
+    def read(self, path: str) -> bytes:
+        """Return the content of one archived artifact, checked against its digest."""
+
+        with tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_BYTES) as buffer:
+            self._copy(path, buffer)
+            buffer.seek(0)
+            return buffer.read()
+
+    def extract(self, path: str, destination: Path) -> Path:
+        """Write one artifact under ``destination`` at its relative path and return the file written."""
+
+        target = destination.joinpath(*_safe_relative_path(path).parts)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        temporary = target.with_name(f".{target.name}.tmp")
+        try:
+            with temporary.open("wb") as handle:
+                self._copy(path, handle)
+            os.replace(temporary, target)
+        finally:
+            temporary.unlink(missing_ok=True)
+        return target
+
+    def extract_all(self, destination: Path) -> List[Path]:
+        """Extract every archived artifact under ``destination``."""
+
+        return [self.extract(path, destination) for path in self._entries]
+
+
+def _positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError("must be at least 1")
+    return number
+
+
+def _level(value: str) -> int:
+    number = int(value)
+    if not 1 <= number <= 9:
+        raise argparse.ArgumentTypeError("must be between 1 and 9")
+    return number
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Create the command-line parser."""
+
+    parser = argparse.ArgumentParser(description="Export a diagnostic artifact bundle as one compressed, deduplicated archive.")
+    parser.add_argument(
+        "--artifact-dir",
+        type=Path,
+        default=DEFAULT_ARTIFACT_DIR,
+        help=f"Directory containing generated artifacts. Default: {DEFAULT_ARTIFACT_DIR}",
+    )
+    parser.add_argument(
+        "--archive",
+        type=Path,
+        default=None,
+        help="Archive to write, or to read with --list/--extract. Default: <artifact-dir>.zip beside the artifact directory.",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=_positive_int,
+        default=DEFAULT_JOBS,
+        help="Number of threads compressing artifacts concurrently. Default: CPU count + 4, at most 32.",
+    )
+    parser.add_argument("--level", type=_level, default=DEFAULT_LEVEL, help=f"gzip compression level, 1-9. Default: {DEFAULT_LEVEL}")
+    parser.add_argument(
+        "--no-hash-cache",
+        action="store_true",
+        help="Rehash every file while scanning instead of reusing <artifact-dir>/artifact-manifest-hashes.json.",
+    )
+    parser.add_argument("--list", action="store_true", help="List the archived artifacts instead of exporting.")
+    parser.add_argument(
+        "--extract",
+        action="append",
+        default=[],
+        metavar="PATH",
+        help="Extract one artifact by its manifest path instead of exporting. Repeatable.",
+    )
+    parser.add_argument("--extract-all", action="store_true", help="Extract every archived artifact instead of exporting.")
+    parser.add_argument(
+        "--destination",
+        type=Path,
+        default=Path("."),
+        help="Directory that extracted artifacts are written under. Default: current directory",
+    )
+    return parser
+
+
+def _read_archive(args: argparse.Namespace, archive_path: Path) -> int:
+    try:
+        with BundleArchive(archive_path) as archive:
+            if args.list:
+                for entry in archive.entries():
+                    print(f"{entry['size_bytes']:>12}  {entry['sha256'][:12]}  {entry['path']}")
+            paths = [entry["path"] for entry in archive.entries()] if args.extract_all else args.extract
+            for path in paths:
+                if archive.entry(path) is None:
+                    print(f"{path}: not in {archive_path}", file=sys.stderr)
+                    return 1
+                print(f"Extracted {archive.extract(path, args.destination)}")
+    except (OSError, zipfile.BadZipFile, ArchiveError) as exc:
+        print(f"Cannot read archive {archive_path}: {exc}", file=sys.stderr)
+        return 1
+    return 0
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """CLI entry point."""
+
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    archive_path = args.archive or default_archive_path(args.artifact_dir)
+    if args.list or args.extract or args.extract_all:
+        return _read_archive(args, archive_path)
+    if archive_path.resolve().is_relative_to(args.artifact_dir.resolve()):
+        parser.error("--archive must be outside --artifact-dir, or the next export would include it.")
+    try:
+        summary = export_archive(args.artifact_dir, archive_path, args.jobs, args.level, use_hash_cache=not args.no_hash_cache)
+    except (OSError, ArchiveError) as exc:
+        print(f"Archive export failed: {exc}", file=sys.stderr)
+        return 1
+    print(f"Wrote bundle archive to {summary['archive_path']}")
+    print(
+        f"Bundle archive: {summary['file_count']} files in {summary['object_count']} objects "
+        f"({summary['duplicate_file_count']} duplicates, {summary['deduplicated_bytes']} bytes deduplicated); "
+        f"{summary['total_size_bytes']} bytes stored as {summary['archive_size_bytes']}."
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
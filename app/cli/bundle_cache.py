@@ -0,0 +1,401 @@
+"""Fingerprint cache that lets the diagnostics bundle skip unchanged steps.
+
+Each planned bundle step records what it consumed and produced in
+``bundle-state.json`` inside the cache directory (``.bundle-cache/`` by
+default, outside the artifact directory so the state never ships with a
+bundle): the rendered command, the source of the generator and every ``app``
+module it imports, the interpreter and installed distributions, declared
+repository files and environment variables, and the digests of the artifacts
+it read. A later run skips the step when all of those match.
+
+Several artifacts are written more than once per bundle (the manifest, the
+provenance ledger, and the operator passes). Every version of such an artifact
+is copied into ``objects/`` in the cache directory by SHA-256 digest so a
+skipped step can restore its own version before later steps read it;
+artifacts with a single writer are checked in place.
+"""
+
+from __future__ import annotations
+
+import ast
+import hashlib
+import json
+import os
+import shutil
+import sys
+from importlib import metadata
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, FrozenSet, Iterable, List, Mapping, Sequence, Set
+
+from app.cli.artifact_manifest import BOOKKEEPING_NAMES, BUNDLE_STATE_NAME
+
+if TYPE_CHECKING:
+    from app.cli.bundle import BundleStep
+
+ANY_ARTIFACT = "*"
+STATE_VERSION = 2
+DEFAULT_CACHE_DIR = Path(".bundle-cache")
+OBJECT_DIR_NAME = "objects"
+REPOSITORY_ROOT = Path(__file__).resolve().parents[2]
+MISSING = "missing"
+
+
+def file_digest(path: Path) -> str:
+    """Return the SHA-256 hex digest of ``path``."""
+
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        for chunk in iter(lambda: handle.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _text_digest(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def matches(name: str, patterns: Iterable[str]) -> bool:
+    """Return whether artifact ``name`` is one of ``patterns``; ``dir/`` covers a subtree."""
+
+    return any(name == pattern or (pattern.endswith("/") and name.startswith(pattern)) for pattern in patterns)
+
+
+def _module_path(name: str) -> Path | None:
+    base = REPOSITORY_ROOT.joinpath(*name.split("."))
+    for candidate in (base.with_suffix(".py"), base / "__init__.py"):
+        if candidate.is_file():
+            return candidate
+    return None
+
+
+def _package_of(path: Path) -> str:
+    return ".".join(path.relative_to(REPOSITORY_ROOT).parent.parts)
+
+
+def _imported_modules(path: Path) -> Set[str]:
+    """Return ``app`` module names imported by ``path``, including ``from app.x import y`` submodules."""
+
+    tree = ast.parse(path.read_text(encoding="utf-8"), filename=str(path))
+    names: Set[str] = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            base = node.module or ""
+            if node.level:
+                package = _package_of(path).split(".")
+                anchor = package[: len(package) - node.level + 1]
+                base = ".".join([*anchor, base] if base else anchor)
+            names.add(base)
+            names.update(f"{base}.{alias.name}" for alias in node.names)
+    return {name for name in names if name == "app" or name.startswith("app.")}
+
+
+def _imported_paths(path: Path) -> Set[Path]:
+    paths: Set[Path] = set()
+    for name in _imported_modules(path):
+        parts = name.split(".")
+        for depth in range(1, len(parts) + 1):
+            module = _module_path(".".join(parts[:depth]))
+            if module is not None:
+                paths.add(module)
+    return paths
+
+
+def source_files(entry: Path, imports: Dict[Path, Set[Path]] | None = None) -> List[Path]:
+    """Return ``entry`` and every repository ``app`` module it imports, transitively.
+
+    ``imports`` memoizes each file's resolved imports across calls.
+    """
+
+    imports = {} if imports is None else imports
+    seen: Dict[Path, None] = {}
+    pending = [entry]
+    while pending:
+        path = pending.pop()
+        if path in seen:
+            continue
+        seen[path] = None
+        if path not in imports:
+            imports[path] = _imported_paths(path)
+        pending.extend(module for module in imports[path] if module not in seen)
+    return sorted(seen)
+
+
+def environment_digest() -> str:
+    """Return a digest of the interpreter and installed distribution versions."""
+
+    distributions = sorted(
+        f"{dist.metadata['Name']}=={dist.version}" for dist in metadata.distributions() if dist.metadata["Name"]
+    )
+    return _text_digest("\n".join([sys.version, sys.executable, *distributions]))
+
+
+def variables_digest(names: Iterable[str]) -> str:
+    """Return a digest of environment variables ``names``; values are never stored."""
+
+    values = {name: os.environ.get(name) for name in sorted(names)}
+    return _text_digest(json.dumps(values, sort_keys=True))
+
+
+class BundleCache:
+    """Decide which planned steps can be skipped and record the ones that ran."""
+
+    def __init__(
+        self,
+        artifact_dir: Path,
+        steps: Sequence["BundleStep"],
+        commands: Sequence[str],
+        force: bool = False,
+        cache_dir: Path = DEFAULT_CACHE_DIR,
+    ) -> None:
+        self.artifact_dir = artifact_dir
+        self.steps = steps
+        self.commands = commands
+        self.force = force
+        self.cache_dir = cache_dir
+        self.state_path = cache_dir / BUNDLE_STATE_NAME
+        self.object_dir = cache_dir / OBJECT_DIR_NAME
+        self.previous = self._load_records()
+        self.records: Dict[str, Dict[str, Any]] = dict(self.previous)
+        self._pending: Dict[int, Dict[str, Any]] = {}
+        self._sources: Dict[str, str] = {}
+        self._imports: Dict[Path, Set[Path]] = {}
+        self._digests: Dict[Path, str] = {}
+        self._listing: List[str] | None = None
+        self._environment: str | None = None
+
+    def _load_records(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            state = json.loads(self.state_path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, json.JSONDecodeError, OSError):
+            return {}
+        if not isinstance(state, Mapping) or state.get("version") != STATE_VERSION:
+            return {}
+        if state.get("artifact_dir") != os.path.abspath(self.artifact_dir):
+            # The records describe another artifact directory's files.
+            return {}
+        steps = state.get("steps", {})
+        return dict(steps) if isinstance(steps, Mapping) else {}
+
+    def _source_digest(self, step: "BundleStep") -> str:
+        if step.kind in {"pip", "interpreter", "summary"}:
+            key = step.kind
+            if key not in self._sources:
+                self._sources[key] = _text_digest(Path(__file__).with_name("bundle.py").read_text(encoding="utf-8"))
+            return self._sources[key]
+        if step.kind == "script":
+            entries = [REPOSITORY_ROOT / step.target]
+        else:
+            entries = [_module_path(step.target) or REPOSITORY_ROOT / step.target]
+        if step.kind == "help":
+            # Help text also depends on how the exporter formats it.
+            entries.append(Path(__file__).with_name("help_export.py"))
+        key = "\n".join(entry.as_posix() for entry in entries)
+        if key not in self._sources:
+            digest = hashlib.sha256()
+            for entry in entries:
+                for path in source_files(entry, self._imports):
+                    digest.update(path.relative_to(REPOSITORY_ROOT).as_posix().encode("utf-8"))
+                    digest.update(self._digest(path).encode("ascii"))
+            self._sources[key] = digest.hexdigest()
+        return self._sources[key]
+
+    def _digest(self, path: Path) -> str:
+        """Return ``file_digest(path)``, memoized until the next step writes or restores files."""
+
+        if path not in self._digests:
+            self._digests[path] = file_digest(path)
+        return self._digests[path]
+
+    def _invalidate(self) -> None:
+        self._listing = None
+        self._digests = {key: value for key, value in self._digests.items() if not key.is_relative_to(self.artifact_dir)}
+
+    def _environment_digest(self) -> str:
+        if self._environment is None:
+            self._environment = environment_digest()
+        return self._environment
+
+    def _repository_inputs(self, step: "BundleStep") -> Dict[str, str]:
+        inputs: Dict[str, str] = {}
+        for pattern in step.sources:
+            paths = sorted(path for path in REPOSITORY_ROOT.glob(pattern) if path.is_file())
+            if not paths:
+                inputs[pattern] = MISSING
+            for path in paths:
+                inputs[path.relative_to(REPOSITORY_ROOT).as_posix()] = self._digest(path)
+        return inputs
+
+    def _artifact_files(self) -> List[str]:
+        """Return artifact names, reusing the listing until a step writes or restores files."""
+
+        if self._listing is None:
+            names = []
+            if self.artifact_dir.exists():
+                for path in self.artifact_dir.rglob("*"):
+                    relative = path.relative_to(self.artifact_dir)
+                    if relative.parts[0] in BOOKKEEPING_NAMES or not path.is_file():
+                        continue
+                    names.append(relative.as_posix())
+            self._listing = sorted(names)
+        return self._listing
+
+    def _artifact_inputs(self, index: int) -> Dict[str, str]:
+        """Return digests of the artifacts step ``index`` reads.
+
+        An artifact that only later steps write is whatever the previous run
+        left behind, which those steps are about to replace, so it is not an
+        input: the first operator pass would otherwise see a new gap report
+        timestamp on every run and never settle.
+        """
+
+        step = self.steps[index]
+        own = step.outputs
+        earlier = _outputs(self.steps[:index])
+        later = _outputs(self.steps[index + 1 :])
+        if ANY_ARTIFACT in step.reads:
+            names = [name for name in self._artifact_files() if not matches(name, own)]
+        else:
+            names = [name for name in self._artifact_files() if matches(name, step.reads) and not matches(name, own)]
+            names.extend(name for name in step.reads if not name.endswith("/") and name not in names)
+        inputs: Dict[str, str] = {}
+        for name in sorted(set(names)):
+            if matches(name, later) and not matches(name, earlier):
+                continue
+            path = self.artifact_dir / name
+            inputs[name] = self._digest(path) if path.is_file() else MISSING
+        return inputs
+
+    def _output_files(self, step: "BundleStep") -> List[str]:
+        names = [name for name in self._artifact_files() if matches(name, step.outputs)]
+        names.extend(name for name in step.outputs if not name.endswith("/") and name not in names)
+        return sorted(set(names))
+
+    def fingerprint(self, index: int) -> Dict[str, Any]:
+        """Return the current input fingerprint for planned step ``index``."""
+
+        step = self.steps[index]
+        return {
+            "command": self.commands[index],
+            "source": self._source_digest(step),
+            "environment": self._environment_digest(),
+            "environment_variables": variables_digest(step.env_vars),
+            "repository_inputs": self._repository_inputs(step),
+            "inputs": self._artifact_inputs(index),
+        }
+
+    def check(self, index: int) -> str | None:
+        """Return why step ``index`` must run, or ``None`` after restoring its cached outputs."""
+
+        step = self.steps[index]
+        if ANY_ARTIFACT in step.outputs:
+            return "outputs are not declared"
+        current = self.fingerprint(index)
+        self._pending[index] = current
+        if self.force:
+            return "forced"
+        record = self.previous.get(str(index))
+        if record is None:
+            return "no previous run recorded"
+        if record.get("command") != current["command"]:
+            return "command changed"
+        if record.get("source") != current["source"]:
+            return "generator source changed"
+        if record.get("environment") != current["environment"]:
+            return "interpreter or installed packages changed"
+        if record.get("environment_variables") != current["environment_variables"]:
+            return "environment variables changed"
+        for field, label in (("repository_inputs", "repository file"), ("inputs", "input")):
+            change = _first_change(record.get(field, {}), current[field])
+            if change:
+                return f"{label} {change}"
+        outputs = record.get("outputs", {})
+        if not isinstance(outputs, Mapping):
+            return "no previous run recorded"
+        for name, digest in sorted(outputs.items()):
+            if digest != MISSING and not (self.object_dir / digest).is_file():
+                path = self.artifact_dir / name
+                if not path.is_file() or self._digest(path) != digest:
+                    return f"output {name} changed and is not cached"
+        self._restore(outputs)
+        return None
+
+    def _restore(self, outputs: Mapping[str, str]) -> None:
+        for name, digest in sorted(outputs.items()):
+            path = self.artifact_dir / name
+            if digest == MISSING:
+                continue
+            if path.is_file() and self._digest(path) == digest:
+                continue
+            path.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(self.object_dir / digest, path)
+            self._invalidate()
+
+    def record(self, index: int) -> None:
+        """Store the fingerprint and outputs of step ``index`` after it ran successfully."""
+
+        step = self.steps[index]
+        self._invalidate()
+        fingerprint = self._pending.pop(index, None)
+        if fingerprint is None or ANY_ARTIFACT in step.outputs:
+            return
+        shared = _outputs([*self.steps[:index], *self.steps[index + 1 :]])
+        outputs: Dict[str, str] = {}
+        for name in self._output_files(step):
+            path = self.artifact_dir / name
+            if not path.is_file():
+                outputs[name] = MISSING
+                continue
+            digest = self._digest(path)
+            blob = self.object_dir / digest
+            if matches(name, shared) and not blob.is_file():
+                self.object_dir.mkdir(parents=True, exist_ok=True)
+                shutil.copyfile(path, blob)
+            outputs[name] = digest
+        self.records[str(index)] = {**fingerprint, "outputs": outputs}
+
+    def forget(self, index: int) -> None:
+        """Drop the record for a failed step so the next run retries it."""
+
+        self._invalidate()
+        self._pending.pop(index, None)
+        self.records.pop(str(index), None)
+
+    def save(self) -> None:
+        """Write ``bundle-state.json`` and prune cached outputs no step references."""
+
+        records = {key: value for key, value in self.records.items() if key.isdigit() and int(key) < len(self.steps)}
+        referenced = {
+            digest
+            for record in records.values()
+            for digest in record.get("outputs", {}).values()
+            if digest != MISSING
+        }
+        if self.object_dir.is_dir():
+            for blob in self.object_dir.iterdir():
+                if blob.name not in referenced:
+                    blob.unlink()
+        state = {"version": STATE_VERSION, "artifact_dir": os.path.abspath(self.artifact_dir), "steps": records}
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.state_path.write_text(json.dumps(state, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+
+
+def _outputs(steps: Sequence["BundleStep"]) -> FrozenSet[str]:
+    names: Set[str] = set()
+    for step in steps:
+        names.update(step.outputs)
+    return frozenset(names)
+
+
+def _first_change(previous: Any, current: Mapping[str, str]) -> str:
+    if not isinstance(previous, Mapping):
+        return "set changed"
+    for name in sorted(set(previous) | set(current)):
+        if name not in previous:
+            return f"{name} added"
+        if name not in current:
+            return f"{name} removed"
+        if previous[name] != current[name]:
+            return f"{name} changed"
+    return ""
@@ -0,0 +1,357 @@
+"""Compare two diagnostic artifact bundles by their manifest entries.
+
+Each side is an artifact directory, an ``artifact-manifest.json``, or an
+``artifact-manifest.jsonl`` sidecar. The entries are joined by path in one
+pass over a dictionary, and files whose path is unchanged are compared by
+SHA-256 digest only, never by content. Removed and added files that share a
+digest are then paired as renames, again through a dictionary, so the whole
+diff is linear in the number of entries. When both manifests carry Merkle
+directory digests, the report also lists the directories whose digest differs,
+found without visiting identical subtrees.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Sequence, Tuple
+
+from app.cli.artifact_manifest import DEFAULT_ARTIFACT_DIR, DEFAULT_JSON_NAME as MANIFEST_JSON_NAME
+from app.cli.artifact_manifest import build_manifest, load_hash_cache
+from app.cli.artifact_merkle import changed_directories
+
+DEFAULT_JSON_NAME = "bundle-diff.json"
+DEFAULT_MARKDOWN_NAME = "bundle-diff.md"
+DEFAULT_MAX_ROWS = 200
+
+
+def load_manifest(path: Path, rescan: bool = False) -> Tuple[Dict[str, Any], str]:
+    """Return the manifest for one side of the diff and a label describing where it came from.
+
+    A directory contributes its ``artifact-manifest.json``, or a fresh scan when
+    it has none or ``rescan`` is set. The scan reuses the directory's hash cache
+    read-only, so unchanged files are not rehashed and nothing is written.
+    """
+
+    if path.is_dir():
+        manifest_path = path / MANIFEST_JSON_NAME
+        if rescan or not manifest_path.is_file():
+            return build_manifest(path, load_hash_cache(path)), f"{path.as_posix()} (scanned)"
+        path = manifest_path
+    if path.suffix == ".jsonl":
+        with path.open(encoding="utf-8") as handle:
+            records = [json.loads(line) for line in handle if line.strip()]
+        summary = records[0] if records and records[0].get("record") == "summary" else {}
+        files = records[1:] if summary else records
+        return {**{key: value for key, value in summary.items() if key != "record"}, "files": files}, path.as_posix()
+    return json.loads(path.read_text(encoding="utf-8")), path.as_posix()
+
+
+def _file_entries(manifest: Mapping[str, Any]) -> List[Dict[str, Any]]:
+    # ``dict`` rather than ``Mapping``: ABC isinstance checks dominate a 100k-entry join.
+    return [entry for entry in manifest.get("files", []) if type(entry) is dict and type(entry.get("path")) is str]
+
+
+def _size(entry: Mapping[str, Any]) -> int:
+    return int(entry.get("size_bytes") or 0)
+
+
+def _brief(entry: Mapping[str, Any]) -> Dict[str, Any]:
+    return {"path": entry["path"], "size_bytes": _size(entry), "sha256": entry.get("sha256")}
+
+
+def _side_summary(manifest: Mapping[str, Any], source: str, file_count: int, total_size: int) -> Dict[str, Any]:
+    return {
+        "source": source,
+        "generated_at": manifest.get("generated_at"),
+        "file_count": file_count,
+        "total_size_bytes": total_size,
+    }
+
+
+def _changed_directories(base: Mapping[str, Any], head: Mapping[str, Any]) -> List[str] | None:
+    # Only recorded trees are compared; rebuilding one would hash every entry again.
+    if not (isinstance(base.get("merkle"), Mapping) and isinstance(head.get("merkle"), Mapping)):
+        return None
+    if base["merkle"].get("algorithm") != head["merkle"].get("algorithm"):
+        return None
+    return changed_directories(base["merkle"], head["merkle"])
+
+
+def diff_manifests(
+    base: Mapping[str, Any],
+    head: Mapping[str, Any],
+    base_source: str = "base",
+    head_source: str = "head",
+) -> Dict[str, Any]:
+    """Return added, removed, renamed, and changed artifacts between two manifests."""
+
+    base_entries = _file_entries(base)
+    head_entries = _file_entries(head)
+    remaining = {entry["path"]: entry for entry in base_entries}
+    base_size = sum(map(_size, base_entries))
+    head_size = sum(map(_size, head_entries))
+
+    added: List[Dict[str, Any]] = []
+    changed: List[Dict[str, Any]] = []
+    unchanged = 0
+    pop = remaining.pop
+    for entry in head_entries:
+        previous = pop(entry["path"], None)
+        if previous is None:
+            added.append(entry)
+        elif previous.get("sha256") == entry.get("sha256") and previous.get("size_bytes") == entry.get("size_bytes"):
+            unchanged += 1
+        else:
+            changed.append(
+                {
+                    "path": entry["path"],
+                    "base_size_bytes": _size(previous),
+                    "head_size_bytes": _size(entry),
+                    "size_delta_bytes": _size(entry) - _size(previous),
+                    "base_sha256": previous.get("sha256"),
+                    "head_sha256": entry.get("sha256"),
+                }
+            )
+
+    # Pair leftovers with identical content as renames, first path to first path.
+    added_by_digest: Dict[str, List[Dict[str, Any]]] = {}
+    for entry in sorted(added, key=lambda item: item["path"], reverse=True):
+        if entry.get("sha256"):
+            added_by_digest.setdefault(entry["sha256"], []).append(entry)
+    renamed: List[Dict[str, Any]] = []
+    removed: List[Dict[str, Any]] = []
+    for path in sorted(remaining):
+        entry = remaining[path]
+        candidates = added_by_digest.get(entry.get("sha256") or "")
+        if candidates:
+            target = candidates.pop()
+            renamed.append({"from": path, "to": target["path"], "size_bytes": _size(entry), "sha256": entry["sha256"]})
+        else:
+            removed.append(_brief(entry))
+    renamed_to = {item["to"] for item in renamed}
+    added_entries = sorted((_brief(entry) for entry in added if entry["path"] not in renamed_to), key=lambda item: item["path"])
+    changed.sort(key=lambda item: item["path"])
+
+    base_missing = set(map(str, base.get("missing_expected", [])))
+    head_missing = set(map(str, head.get("missing_expected", [])))
+    status = "changed" if added_entries or removed or renamed or changed else "identical"
+    return {
+        "generated_at": datetime.now(timezone.utc).replace(microsecond=0).isoformat(),
+        "status": status,
+        "base": _side_summary(base, base_source, len(base_entries), base_size),
+        "head": _side_summary(head, head_source, len(head_entries), head_size),
+        "summary": {
+            "added": len(added_entries),
+            "removed": len(removed),
+            "renamed": len(renamed),
+            "changed": len(changed),
+            "unchanged": unchanged,
+            "size_delta_bytes": head_size - base_size,
+        },
+        "added": added_entries,
+        "removed": removed,
+        "renamed": renamed,
+        "changed": changed,
+        "changed_directories": _changed_directories(base, head),
+        "newly_missing_expected": sorted(head_missing - base_missing),
+        "resolved_missing_expected": sorted(base_missing - head_missing),
+    }
+
+
+def build_bundle_diff(base_path: Path, head_path: Path, rescan: bool = False) -> Dict[str, Any]:
+    """Load both sides and return their diff."""
+
+    base, base_source = load_manifest(base_path, rescan)
+    head, head_source = load_manifest(head_path, rescan)
+    return diff_manifests(base, head, base_source, head_source)
+
+
+def write_json(report: Mapping[str, Any], path: Path) -> None:
+    """Write the machine-readable bundle diff."""
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(report, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+
+
+def _signed(value: int) -> str:
+    return f"{value:+d}"
+
+
+def _overflow_line(rows: List[Any], max_rows: int) -> Iterable[str]:
+    if len(rows) > max_rows:
+        yield ""
+        yield f"... and {len(rows) - max_rows} more; see the JSON report for the full list."
+
+
+def _markdown_lines(report: Mapping[str, Any], max_rows: int) -> Iterable[str]:
+    summary = report["summary"]
+    yield "# Diagnostic bundle diff"
+    yield ""
+    yield f"Generated at: `{report['generated_at']}`"
+    yield f"Base: `{report['base']['source']}` ({report['base']['file_count']} files, {report['base']['total_size_bytes']} bytes)"
+    yield f"Head: `{report['head']['source']}` ({report['head']['file_count']} files, {report['head']['total_size_bytes']} bytes)"
+    yield f"Status: **{str(report['status']).upper()}**"
+    yield ""
+    yield "| Added | Removed | Renamed | Changed | Unchanged | Size delta |"
+    yield "| ---: | ---: | ---: | ---: | ---: | ---: |"
+    yield (
+        f"| {summary['added']} | {summary['removed']} | {summary['renamed']} | {summary['changed']} | "
+        f"{summary['unchanged']} | {_signed(summary['size_delta_bytes'])} bytes |"
+    )
+    yield ""
+
+    if report["changed"]:
+        yield "## Changed artifacts"
+        yield ""
+        yield "| Path | Base size | Head size | Delta |"
+        yield "| --- | ---: | ---: | ---: |"
+        for item in report["changed"][:max_rows]:
+            yield (
+                f"| `{item['path']}` | {item['base_size_bytes']} | {item['head_size_bytes']} | "
+                f"{_signed(item['size_delta_bytes'])} |"
+            )
+        yield from _overflow_line(report["changed"], max_rows)
+        yield ""
+
+    for key, title in (("added", "Added artifacts"), ("removed", "Removed artifacts")):
+        if report[key]:
+            yield f"## {title}"
+            yield ""
+            yield "| Path | Size |"
+            yield "| --- | ---: |"
+            for item in report[key][:max_rows]:
+                yield f"| `{item['path']}` | {item['size_bytes']} |"
+            yield from _overflow_line(report[key], max_rows)
+            yield ""
+
+    if report["renamed"]:
+        yield "## Renamed artifacts"
+        yield ""
+        yield "| From | To | Size |"
+        yield "| --- | --- | ---: |"
+        for item in report["renamed"][:max_rows]:
+            yield f"| `{item['from']}` | `{item['to']}` | {item['size_bytes']} |"
+        yield from _overflow_line(report["renamed"], max_rows)
+        yield ""
+
+    if report.get("changed_directories"):
+        yield "## Directories with a different Merkle digest"
+        yield ""
+        for path in report["changed_directories"][:max_rows]:
+            yield f"- `{path}`"
+        yield from _overflow_line(report["changed_directories"], max_rows)
+        yield ""
+
+    for key, title in (
+        ("newly_missing_expected", "Newly missing expected artifacts"),
+        ("resolved_missing_expected", "Expected artifacts no longer missing"),
+    ):
+        if report[key]:
+            yield f"## {title}"
+            yield ""
+            for path in report[key]:
+                yield f"- `{path}`"
+            yield ""
+
+    if report["status"] == "identical":
+        yield "Both bundles list the same artifacts with the same SHA-256 digests."
+
+
+def render_markdown(report: Mapping[str, Any], max_rows: int = DEFAULT_MAX_ROWS) -> str:
+    """Render the bundle diff as Markdown, listing at most ``max_rows`` rows per section."""
+
+    return "\n".join(_markdown_lines(report, max_rows)).rstrip() + "\n"
+
+
+def write_markdown(report: Mapping[str, Any], path: Path, max_rows: int = DEFAULT_MAX_ROWS) -> None:
+    """Write the human-readable bundle diff."""
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(render_markdown(report, max_rows), encoding="utf-8")
+
+
+def _non_negative_int(value: str) -> int:
+    number = int(value)
+    if number < 0:
+        raise argparse.ArgumentTypeError("must be at least 0")
+    return number
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Create the command-line parser."""
+
+    parser = argparse.ArgumentParser(description="Compare two diagnostic artifact bundles by their manifest entries.")
+    parser.add_argument(
+        "--base",
+        type=Path,
+        required=True,
+        help="Earlier bundle: an artifact directory, artifact-manifest.json, or artifact-manifest.jsonl.",
+    )
+    parser.add_argument(
+        "--head",
+        type=Path,
+        required=True,
+        help="Later bundle: an artifact directory, artifact-manifest.json, or artifact-manifest.jsonl.",
+    )
+    parser.add_argument(
+        "--rescan",
+        action="store_true",
+        help="Scan artifact directories instead of reading their artifact-manifest.json.",
+    )
+    parser.add_argument(
+        "--json-path",
+        type=Path,
+        default=DEFAULT_ARTIFACT_DIR / DEFAULT_JSON_NAME,
+        help=f"Path for JSON output. Default: {DEFAULT_ARTIFACT_DIR / DEFAULT_JSON_NAME}",
+    )
+    parser.add_argument(
+        "--markdown-path",
+        type=Path,
+        default=DEFAULT_ARTIFACT_DIR / DEFAULT_MARKDOWN_NAME,
+        help=f"Path for Markdown output. Default: {DEFAULT_ARTIFACT_DIR / DEFAULT_MARKDOWN_NAME}",
+    )
+    parser.add_argument("--no-json", action="store_true", help="Skip JSON output.")
+    parser.add_argument("--no-markdown", action="store_true", help="Skip Markdown output.")
+    parser.add_argument(
+        "--max-rows",
+        type=_non_negative_int,
+        default=DEFAULT_MAX_ROWS,
+        help=f"Rows listed per Markdown section; the JSON report is always complete. Default: {DEFAULT_MAX_ROWS}",
+    )
+    parser.add_argument(
+        "--fail-on-change",
+        action="store_true",
+        help="Exit with status 1 when the bundles differ.",
+    )
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """CLI entry point."""
+
+    args = build_parser().parse_args(argv)
+    report = build_bundle_diff(args.base, args.head, args.rescan)
+
+    if not args.no_json:
+        write_json(report, args.json_path)
+        print(f"Wrote bundle diff JSON to {args.json_path}")
+    if not args.no_markdown:
+        write_markdown(report, args.markdown_path, args.max_rows)
+        print(f"Wrote bundle diff Markdown to {args.markdown_path}")
+    if args.no_json and args.no_markdown:
+        print("No outputs requested; remove --no-json or --no-markdown to write reports.")
+    summary = report["summary"]
+    print(
+        f"Bundle diff: {summary['added']} added, {summary['removed']} removed, {summary['renamed']} renamed, "
+        f"{summary['changed']} changed, {summary['unchanged']} unchanged."
+    )
+    if args.fail_on_change and report["status"] != "identical":
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
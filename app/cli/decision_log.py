@@ -13,6 +13,8 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, Iterable, Mapping, Sequence
 
+from app.cli.artifact_context import ArtifactContext, resolve_context
+
 DEFAULT_ARTIFACT_DIR = Path("ci_artifacts")
 DEFAULT_MARKDOWN_NAME = "decision-log.md"
 DEFAULT_JSON_NAME = "decision-log.json"
@@ -56,9 +58,9 @@ INPUT_ARTIFACTS: Mapping[str, Mapping[str, str]] = {
 }
 
 
-def _load_json(path: Path) -> tuple[Mapping[str, Any], bool, str | None]:
+def _load_json(path: Path, context: ArtifactContext | None = None) -> tuple[Mapping[str, Any], bool, str | None]:
     try:
-        payload = json.loads(path.read_text(encoding="utf-8"))
+        payload = resolve_context(context).load_json(path)
     except FileNotFoundError:
         return {}, False, "missing"
     except json.JSONDecodeError as exc:
@@ -146,10 +148,15 @@ def _extract_summary(name: str, payload: Mapping[str, Any]) -> str:
     return "summary unavailable"
 
 
-def _artifact_row(artifact_dir: Path, name: str, definition: Mapping[str, str]) -> Dict[str, Any]:
+def _artifact_row(
+    artifact_dir: Path,
+    name: str,
+    definition: Mapping[str, str],
+    context: ArtifactContext | None = None,
+) -> Dict[str, Any]:
     rel_path = definition["path"]
     path = artifact_dir / rel_path
-    payload, present, error = _load_json(path)
+    payload, present, error = _load_json(path, context)
     status = _extract_status(payload, present=present, error=error)
     blockers = _count(payload, "blockers", "missing", "missing_expected", "failures", "errors")
     warnings = _count(payload, "warnings", "review_items", "needs_review", "advisories", "limitations")
@@ -189,12 +196,14 @@ def _next_action(decision: str) -> str:
 def build_decision_log(
     artifact_dir: Path = DEFAULT_ARTIFACT_DIR,
     generated_at: datetime | None = None,
+    context: ArtifactContext | None = None,
 ) -> Dict[str, Any]:
     """Build a deterministic, machine-readable decision log from diagnostics."""
 
     generated_at = generated_at or datetime.now(timezone.utc).replace(microsecond=0)
+    context = resolve_context(context)
     rows = [
-        _artifact_row(artifact_dir, name, definition)
+        _artifact_row(artifact_dir, name, definition, context)
         for name, definition in INPUT_ARTIFACTS.items()
     ]
     decision = _overall_decision(rows)
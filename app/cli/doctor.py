@@ -8,15 +8,17 @@ MongoDB connectivity without running detection or prediction.
 from __future__ import annotations
 
 import argparse
+import hashlib
 import importlib.util
 import json
 import os
-import socket
+import queue
 import sys
+import threading
+import time
 from dataclasses import asdict, dataclass
 from pathlib import Path
-from typing import Iterable, Sequence
-from urllib.parse import urlparse
+from typing import Callable, Sequence
 
 from app.config import settings
 
@@ -52,6 +54,16 @@ RECOMMENDED_ENV_VARS: tuple[str, ...] = (
     *SENTINEL_ENV_VARS,
 )
 
+DEFAULT_DEADLINE = 10.0
+DEFAULT_JOBS = 8
+SLOW_CHECK_MS = 100.0
+DEFAULT_CACHE_PATH = Path(".doctor-cache.json")
+DEFAULT_CACHE_TTL = 900.0
+# Probes of live state the environment fingerprint cannot see: a data
+# directory deleted or made read-only, or MongoDB going down, must show up on
+# the next run, so these are never written to or read from the cache.
+LIVE_CHECKS = frozenset({"data_dir", "mongo_socket"})
+
 
 @dataclass
 class CheckResult:
@@ -61,6 +73,8 @@ class CheckResult:
     status: str
     detail: str
     remediation: str = ""
+    duration_ms: float | None = None
+    cached: bool = False
 
     @property
     def ok(self) -> bool:
@@ -71,20 +85,15 @@ def _module_available(module_name: str) -> bool:
     return importlib.util.find_spec(module_name) is not None
 
 
-def _check_imports(imports: Iterable[tuple[str, str]], required: bool) -> list[CheckResult]:
-    results: list[CheckResult] = []
-    for module_name, purpose in imports:
-        available = _module_available(module_name)
-        if available:
-            results.append(CheckResult(f"import:{module_name}", "ok", purpose))
-        else:
-            severity = "fail" if required else "warn"
-            remediation = (
-                "Run `bash scripts/setup.sh` or install the missing package in "
-                "your virtual environment."
-            )
-            results.append(CheckResult(f"import:{module_name}", severity, purpose, remediation))
-    return results
+def _check_import(module_name: str, purpose: str, required: bool) -> CheckResult:
+    if _module_available(module_name):
+        return CheckResult(f"import:{module_name}", "ok", purpose)
+    severity = "fail" if required else "warn"
+    remediation = (
+        "Run `bash scripts/setup.sh` or install the missing package in "
+        "your virtual environment."
+    )
+    return CheckResult(f"import:{module_name}", severity, purpose, remediation)
 
 
 def _read_env_keys(path: Path) -> set[str]:
@@ -173,6 +182,8 @@ def _check_env() -> CheckResult:
 
 
 def _mongo_host_port() -> tuple[str, int]:
+    from urllib.parse import urlparse
+
     parsed = urlparse(settings.MONGO_URI)
     if parsed.scheme == "mongodb+srv":
         # SRV discovery is handled by pymongo. A raw socket probe cannot resolve
@@ -187,6 +198,9 @@ def _mongo_host_port() -> tuple[str, int]:
 
 
 def _check_mongo(timeout: float) -> CheckResult:
+    # Imported here so --skip-mongo and --help runs do not pay for socket setup.
+    import socket
+
     try:
         host, port = _mongo_host_port()
         with socket.create_connection((host, port), timeout=timeout):
@@ -203,26 +217,236 @@ def _check_mongo(timeout: float) -> CheckResult:
         )
 
 
+@dataclass(frozen=True)
+class _Check:
+    """One independent check scheduled by run_checks."""
+
+    name: str
+    run: Callable[[], CheckResult]
+    required: bool
+
+
+def _elapsed_ms(started: float) -> float:
+    return round((time.perf_counter() - started) * 1000, 1)
+
+
+def _unfinished(check: _Check, deadline: float, started: float) -> CheckResult:
+    return CheckResult(
+        check.name,
+        "fail" if check.required else "warn",
+        f"did not finish within the {deadline:g}s doctor deadline",
+        "Rerun with a larger --deadline, or skip the slow check (for example --skip-mongo).",
+        _elapsed_ms(started),
+    )
+
+
+def _run_concurrently(checks: Sequence[_Check], jobs: int, deadline: float | None) -> dict[int, CheckResult]:
+    """Run checks on worker threads and return the finished results by index.
+
+    Workers are daemon threads rather than a ThreadPoolExecutor, whose workers
+    are joined at interpreter exit: a probe that hangs past the deadline must
+    not keep the process alive after the report is printed.
+    """
+
+    pending: queue.SimpleQueue[tuple[int, _Check]] = queue.SimpleQueue()
+    for index, check in enumerate(checks):
+        pending.put((index, check))
+    finished: dict[int, CheckResult] = {}
+    changed = threading.Condition()
+
+    def worker() -> None:
+        while True:
+            try:
+                index, check = pending.get_nowait()
+            except queue.Empty:
+                return
+            check_started = time.perf_counter()
+            try:
+                result = check.run()
+            except Exception as exc:  # noqa: BLE001 - one broken check must not hide the others.
+                result = CheckResult(check.name, "fail" if check.required else "warn", f"check raised {exc!r}")
+            result.duration_ms = _elapsed_ms(check_started)
+            with changed:
+                finished[index] = result
+                changed.notify_all()
+
+    started = time.perf_counter()
+    for _ in range(max(1, min(jobs, len(checks)))):
+        threading.Thread(target=worker, name="doctor-check", daemon=True).start()
+    with changed:
+        while len(finished) < len(checks):
+            remaining = None if deadline is None else deadline - (time.perf_counter() - started)
+            if remaining is not None and remaining <= 0:
+                break
+            changed.wait(remaining)
+        return dict(finished)
+
+
+def _file_digest(path: Path) -> str:
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except OSError:
+        return "missing"
+
+
+def _installed_distributions() -> list[str]:
+    """Return the dist-info and egg-info names on sys.path, which carry versions."""
+
+    names: set[str] = set()
+    for entry in sys.path:
+        try:
+            with os.scandir(entry or ".") as listing:
+                names.update(item.name for item in listing if item.name.endswith((".dist-info", ".egg-info", ".egg-link")))
+        except OSError:
+            continue
+    return sorted(names)
+
+
+def environment_fingerprint(env_path: Path = Path(".env"), template_path: Path = Path(".env.example")) -> str:
+    """Return a digest of everything the checks' outcomes depend on.
+
+    That is the interpreter, the installed distributions, the env files, the
+    relevant environment variables, and ``DATA_DIR``. Only the digest is
+    stored, so secret values never reach the cache file.
+    """
+
+    data_dir = Path(settings.DATA_DIR)
+    parts = {
+        "interpreter": [sys.executable, sys.version],
+        "distributions": _installed_distributions(),
+        "env_file": _file_digest(env_path),
+        "env_template": _file_digest(template_path),
+        "environment": {name: os.getenv(name) for name in RECOMMENDED_ENV_VARS},
+        "mongo_uri": settings.MONGO_URI,
+        "data_dir": [str(data_dir.resolve()), data_dir.is_dir()],
+        "cwd": os.getcwd(),
+    }
+    return hashlib.sha256(json.dumps(parts, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def load_cached_results(path: Path, fingerprint: str, ttl: float, now: float | None = None) -> dict[str, CheckResult]:
+    """Return cached results recorded for ``fingerprint`` within the last ``ttl`` seconds."""
+
+    now = time.time() if now is None else now
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(payload, dict) or payload.get("fingerprint") != fingerprint:
+        return {}
+    cached: dict[str, CheckResult] = {}
+    for name, entry in payload.get("checks", {}).items():
+        if name in LIVE_CHECKS:
+            continue
+        try:
+            if now - float(entry["checked_at"]) > ttl:
+                continue
+            cached[name] = CheckResult(
+                name,
+                entry["status"],
+                entry["detail"],
+                entry.get("remediation", ""),
+                entry.get("duration_ms"),
+                cached=True,
+            )
+        except (KeyError, TypeError, ValueError):
+            continue
+    return cached
+
+
+def save_cached_results(
+    path: Path,
+    fingerprint: str,
+    results: Sequence[CheckResult],
+    ttl: float = DEFAULT_CACHE_TTL,
+    now: float | None = None,
+) -> None:
+    """Merge freshly run ``results`` into the cache at ``path``, replacing other fingerprints.
+
+    Results of :data:`LIVE_CHECKS` are skipped.
+    """
+
+    now = time.time() if now is None else now
+    checks: dict[str, dict[str, object]] = {}
+    try:
+        previous = json.loads(path.read_text(encoding="utf-8"))
+        if previous.get("fingerprint") == fingerprint:
+            checks = {
+                name: entry
+                for name, entry in previous.get("checks", {}).items()
+                if name not in LIVE_CHECKS and now - float(entry["checked_at"]) <= ttl
+            }
+    except (OSError, ValueError, AttributeError, KeyError, TypeError):
+        checks = {}
+    for result in results:
+        if result.name in LIVE_CHECKS:
+            continue
+        entry = asdict(result)
+        del entry["name"], entry["cached"]
+        checks[result.name] = {**entry, "checked_at": now}
+    temporary = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        temporary.write_text(json.dumps({"fingerprint": fingerprint, "checks": checks}, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+        os.replace(temporary, path)
+    except OSError:
+        # The cache only saves time; a read-only checkout still gets its report.
+        temporary.unlink(missing_ok=True)
+
+
 def run_checks(
     include_optional: bool = True,
     check_mongo: bool = True,
     check_env_files: bool = True,
     timeout: float = 2.0,
+    deadline: float | None = DEFAULT_DEADLINE,
+    jobs: int = DEFAULT_JOBS,
+    cache_path: Path | None = None,
+    cache_ttl: float = DEFAULT_CACHE_TTL,
+    fresh: bool = False,
 ) -> list[CheckResult]:
-    """Run project preflight checks and return structured results."""
+    """Run project preflight checks concurrently and return structured results.
+
+    Results keep a fixed order whatever order the checks finish in. A check
+    still running when ``deadline`` seconds have passed is reported as timed
+    out: a failure for core checks, a warning for optional ones.
 
-    results: list[CheckResult] = [CheckResult("python", "ok", sys.version.split()[0])]
+    With ``cache_path``, results cached there for the same environment
+    fingerprint within ``cache_ttl`` seconds are reused (``cached=True``)
+    instead of probed again, unless ``fresh`` is set. Checks that did run are
+    written back; timed-out checks are not. :data:`LIVE_CHECKS` always run.
+    """
+
+    checks: list[_Check] = [_Check("python", lambda: CheckResult("python", "ok", sys.version.split()[0]), True)]
     if check_env_files:
-        results.extend([_check_env_template(), _check_local_env()])
-    results.extend([
-        _check_data_dir(),
-        _check_env(),
-    ])
-    results.extend(_check_imports(REQUIRED_IMPORTS, required=True))
+        checks.append(_Check("env_template", _check_env_template, False))
+        checks.append(_Check("local_env", _check_local_env, False))
+    checks.append(_Check("data_dir", _check_data_dir, True))
+    checks.append(_Check("sentinel_env", _check_env, False))
+    imports = [(REQUIRED_IMPORTS, True)]
     if include_optional:
-        results.extend(_check_imports(OPTIONAL_IMPORTS, required=False))
+        imports.append((OPTIONAL_IMPORTS, False))
+    for group, required in imports:
+        for module_name, purpose in group:
+            run = lambda module_name=module_name, purpose=purpose, required=required: _check_import(  # noqa: E731
+                module_name, purpose, required
+            )
+            checks.append(_Check(f"import:{module_name}", run, required))
     if check_mongo:
-        results.append(_check_mongo(timeout))
+        checks.append(_Check("mongo_socket", lambda: _check_mongo(timeout), False))
+
+    fingerprint = environment_fingerprint() if cache_path is not None else ""
+    cached = {} if cache_path is None or fresh else load_cached_results(cache_path, fingerprint, cache_ttl)
+    stale = [check for check in checks if check.name not in cached]
+    started = time.perf_counter()
+    finished = _run_concurrently(stale, jobs, deadline) if stale else {}
+    ran = {stale[index].name: result for index, result in finished.items()}
+    if cache_path is not None and ran:
+        save_cached_results(cache_path, fingerprint, list(ran.values()), cache_ttl)
+
+    results = []
+    for check in checks:
+        result = cached.get(check.name) or ran.get(check.name)
+        results.append(result or _unfinished(check, deadline or 0.0, started))
     return results
 
 
@@ -237,15 +461,59 @@ def summarize(results: Sequence[CheckResult]) -> tuple[int, int, int]:
 
 def _print_text(results: Sequence[CheckResult]) -> None:
     ok, warn, fail = summarize(results)
-    print(f"Preflight summary: {ok} ok, {warn} warnings, {fail} failures")
+    reused = sum(1 for result in results if result.cached)
+    note = f" ({reused} cached results reused)" if reused else ""
+    print(f"Preflight summary: {ok} ok, {warn} warnings, {fail} failures{note}")
     for result in results:
         marker = {"ok": "OK", "warn": "WARN", "fail": "FAIL"}[result.status]
-        print(f"[{marker}] {result.name}: {result.detail}")
+        timing = f" ({result.duration_ms:.0f} ms)" if result.duration_ms and result.duration_ms >= SLOW_CHECK_MS else ""
+        print(f"[{marker}] {result.name}: {result.detail}{timing}")
         if result.remediation:
             print(f"      fix: {result.remediation}")
 
 
-def main(argv: Sequence[str] | None = None) -> int:
+def add_cache_arguments(parser: argparse.ArgumentParser, enabled_by_default: bool = True) -> None:
+    """Add the result-cache options shared by commands that run the checks.
+
+    Commands that cache by default get ``--no-cache``; the others get an
+    opt-in ``--cache``. Either way ``args.cache`` says whether to use it.
+    """
+
+    parser.add_argument(
+        "--fresh",
+        action="store_true",
+        help="re-run every check instead of reusing cached results (the cache is still updated)",
+    )
+    if enabled_by_default:
+        parser.add_argument(
+            "--no-cache",
+            dest="cache",
+            action="store_false",
+            help="neither read nor write the result cache",
+        )
+    else:
+        parser.add_argument(
+            "--cache",
+            action="store_true",
+            help="reuse and update the result cache (live probes always run)",
+        )
+    parser.add_argument(
+        "--cache-path",
+        type=Path,
+        default=DEFAULT_CACHE_PATH,
+        help=f"doctor result cache file (default: {DEFAULT_CACHE_PATH})",
+    )
+    parser.add_argument(
+        "--cache-ttl",
+        type=float,
+        default=DEFAULT_CACHE_TTL,
+        help=f"seconds a cached result stays reusable (default: {DEFAULT_CACHE_TTL:g})",
+    )
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Create the command-line parser."""
+
     parser = argparse.ArgumentParser(
         description="Check whether the local project setup is ready to run."
     )
@@ -271,13 +539,35 @@ def main(argv: Sequence[str] | None = None) -> int:
         default=2.0,
         help="socket timeout for external checks",
     )
-    args = parser.parse_args(argv)
+    parser.add_argument(
+        "--deadline",
+        type=float,
+        default=DEFAULT_DEADLINE,
+        help=f"overall seconds to wait for all checks (default: {DEFAULT_DEADLINE:g})",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=DEFAULT_JOBS,
+        help=f"checks to run at once (default: {DEFAULT_JOBS})",
+    )
+    add_cache_arguments(parser, enabled_by_default=False)
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
 
     results = run_checks(
         include_optional=not args.skip_optional,
         check_mongo=not args.skip_mongo,
         check_env_files=not args.skip_env_files,
         timeout=args.timeout,
+        deadline=args.deadline,
+        jobs=args.jobs,
+        cache_path=args.cache_path if args.cache else None,
+        cache_ttl=args.cache_ttl,
+        fresh=args.fresh,
     )
     if args.json:
         print(json.dumps([asdict(result) for result in results], indent=2))
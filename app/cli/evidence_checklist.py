@@ -15,6 +15,8 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Mapping, Sequence
 
+from app.cli.artifact_context import ArtifactContext, resolve_context
+
 DEFAULT_ARTIFACT_DIR = Path("ci_artifacts")
 DEFAULT_MARKDOWN_NAME = "evidence-checklist.md"
 DEFAULT_JSON_NAME = "evidence-checklist.json"
@@ -38,9 +40,9 @@ class EvidenceCheck:
     action: str
 
 
-def _load_json(path: Path, fallback: Any) -> Any:
+def _load_json(path: Path, fallback: Any, context: ArtifactContext | None = None) -> Any:
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
+        return resolve_context(context).load_json(path)
     except (FileNotFoundError, json.JSONDecodeError, OSError):
         return fallback
 
@@ -100,20 +102,22 @@ def build_evidence_checklist(
     handoff: Mapping[str, Any] | None = None,
     uncertainty: Mapping[str, Any] | None = None,
     integrity: Mapping[str, Any] | None = None,
+    context: ArtifactContext | None = None,
 ) -> Dict[str, Any]:
     """Build a machine-readable evidence checklist from local artifacts."""
 
     generated_at = generated_at or datetime.now(timezone.utc).replace(microsecond=0)
-    manifest = manifest if manifest is not None else _load_json(artifact_dir / "artifact-manifest.json", {})
+    context = resolve_context(context)
+    manifest = manifest if manifest is not None else _load_json(artifact_dir / "artifact-manifest.json", {}, context)
     provenance = provenance if provenance is not None else _load_json(
-        artifact_dir / "artifact-provenance-ledger.json", {}
+        artifact_dir / "artifact-provenance-ledger.json", {}, context
     )
-    triage = triage if triage is not None else _load_json(artifact_dir / "triage-summary.json", {})
-    handoff = handoff if handoff is not None else _load_json(artifact_dir / "reviewer-handoff.json", {})
+    triage = triage if triage is not None else _load_json(artifact_dir / "triage-summary.json", {}, context)
+    handoff = handoff if handoff is not None else _load_json(artifact_dir / "reviewer-handoff.json", {}, context)
     uncertainty = uncertainty if uncertainty is not None else _load_json(
-        artifact_dir / "uncertainty-review-packet.json", {}
+        artifact_dir / "uncertainty-review-packet.json", {}, context
     )
-    integrity = integrity if integrity is not None else _load_json(artifact_dir / "handoff-integrity-report.json", {})
+    integrity = integrity if integrity is not None else _load_json(artifact_dir / "handoff-integrity-report.json", {}, context)
 
     manifest_files = _manifest_files(manifest)
     missing_expected = [str(item) for item in manifest.get("missing_expected", []) if str(item)]
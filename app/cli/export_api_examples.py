@@ -5,7 +5,7 @@ from __future__ import annotations
 import argparse
 import json
 from pathlib import Path
-from typing import Any, Dict, Iterable
+from typing import Any, Dict, Iterable, Sequence
 
 from app.api.examples import sample_payload_bundle
 
@@ -75,10 +75,10 @@ def build_parser() -> argparse.ArgumentParser:
     return parser
 
 
-def main() -> int:
+def main(argv: Sequence[str] | None = None) -> int:
     """CLI entry point."""
 
-    args = build_parser().parse_args()
+    args = build_parser().parse_args(argv)
     payload = sample_payload_bundle()
 
     if not args.no_json:
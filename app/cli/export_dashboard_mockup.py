@@ -6,7 +6,7 @@ import argparse
 import html
 import json
 from pathlib import Path
-from typing import Any, Dict, Iterable, Mapping
+from typing import Any, Dict, Iterable, Mapping, Sequence
 
 from app.api.examples import sample_payload_bundle
 
@@ -203,10 +203,10 @@ def build_parser() -> argparse.ArgumentParser:
     return parser
 
 
-def main() -> int:
+def main(argv: Sequence[str] | None = None) -> int:
     """CLI entry point."""
 
-    args = build_parser().parse_args()
+    args = build_parser().parse_args(argv)
     payload = sample_payload_bundle()
     write_dashboard_html(payload, args.html_path)
     print(f"Wrote dashboard mockup to {args.html_path}")
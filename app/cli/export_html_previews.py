@@ -6,7 +6,7 @@ import argparse
 import html
 import re
 from pathlib import Path
-from typing import Dict, Iterable, List, Mapping
+from typing import Dict, Iterable, List, Mapping, Sequence
 
 from app.cli.artifact_manifest import DEFAULT_ARTIFACT_DIR
 
@@ -162,10 +162,10 @@ def build_parser() -> argparse.ArgumentParser:
     return parser
 
 
-def main() -> int:
+def main(argv: Sequence[str] | None = None) -> int:
     """CLI entry point."""
 
-    args = build_parser().parse_args()
+    args = build_parser().parse_args(argv)
     summaries = export_previews(args.artifact_dir, args.output_dir)
     markdown_path = args.markdown_path or args.artifact_dir / "html-previews.md"
     write_markdown(render_markdown(summaries), markdown_path)
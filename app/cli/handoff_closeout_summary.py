@@ -13,6 +13,8 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, Iterable, Mapping, Sequence
 
+from app.cli.artifact_context import ArtifactContext, resolve_context
+
 DEFAULT_ARTIFACT_DIR = Path("ci_artifacts")
 DEFAULT_MARKDOWN_NAME = "handoff-closeout-summary.md"
 DEFAULT_JSON_NAME = "handoff-closeout-summary.json"
@@ -36,9 +38,9 @@ REVIEW_WORDS = {"needs_review", "review", "warn", "warning", "partial", "unknown
 BLOCKED_WORDS = {"blocked", "fail", "failed", "invalid", "error", "missing"}
 
 
-def _load_json(path: Path) -> tuple[Mapping[str, Any], bool, str | None]:
+def _load_json(path: Path, context: ArtifactContext | None = None) -> tuple[Mapping[str, Any], bool, str | None]:
     try:
-        payload = json.loads(path.read_text(encoding="utf-8"))
+        payload = resolve_context(context).load_json(path)
     except FileNotFoundError:
         return {}, False, "missing"
     except json.JSONDecodeError as exc:
@@ -90,9 +92,14 @@ def _first_present(payload: Mapping[str, Any], *keys: str, default: Any = None)
     return default
 
 
-def _input_row(artifact_dir: Path, name: str, filename: str) -> Dict[str, Any]:
+def _input_row(
+    artifact_dir: Path,
+    name: str,
+    filename: str,
+    context: ArtifactContext | None = None,
+) -> Dict[str, Any]:
     path = artifact_dir / filename
-    payload, present, error = _load_json(path)
+    payload, present, error = _load_json(path, context)
     status = _status(payload, present=present, error=error)
     blockers = _as_list(_first_present(payload, "blockers", "errors", "failures", "missing", default=[]))
     warnings = _as_list(_first_present(payload, "warnings", "review_items", "limitations", "advisories", default=[]))
@@ -132,11 +139,13 @@ def _closeout_action(status: str) -> str:
 def build_closeout_summary(
     artifact_dir: Path = DEFAULT_ARTIFACT_DIR,
     generated_at: datetime | None = None,
+    context: ArtifactContext | None = None,
 ) -> Dict[str, Any]:
     """Build a deterministic closeout summary from generated handoff diagnostics."""
 
     generated_at = generated_at or datetime.now(timezone.utc).replace(microsecond=0)
-    rows = [_input_row(artifact_dir, name, filename) for name, filename in INPUTS.items()]
+    context = resolve_context(context)
+    rows = [_input_row(artifact_dir, name, filename, context) for name, filename in INPUTS.items()]
     status = _overall_status(rows)
     blockers = [f"{row['path']} is {row['status']}" for row in rows if _rank(str(row.get("status", ""))) >= 2]
     warnings = [f"{row['path']} needs review" for row in rows if _rank(str(row.get("status", ""))) == 1]
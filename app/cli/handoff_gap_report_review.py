@@ -14,6 +14,8 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, Iterable, Mapping, Sequence
 
+from app.cli.artifact_context import ArtifactContext, resolve_context
+
 DEFAULT_MARKDOWN_NAME = "handoff-gap-report-review.md"
 DEFAULT_JSON_NAME = "handoff-gap-report-review.json"
 SCHEMA_VERSION = "1.3"
@@ -36,11 +38,11 @@ def _utc_now() -> datetime:
     return datetime.now(timezone.utc).replace(microsecond=0)
 
 
-def _read_json(path: Path | None) -> Mapping[str, Any]:
+def _read_json(path: Path | None, context: ArtifactContext | None = None) -> Mapping[str, Any]:
     if path is None:
         return {}
     try:
-        loaded = json.loads(path.read_text(encoding="utf-8"))
+        loaded = resolve_context(context).load_json(path)
     except (OSError, json.JSONDecodeError):
         return {}
     return loaded if isinstance(loaded, Mapping) else {}
@@ -443,9 +445,10 @@ def build_parser() -> argparse.ArgumentParser:
 
 def main(argv: Sequence[str] | None = None) -> int:
     args = build_parser().parse_args(argv)
+    context = resolve_context()
     review = build_gap_report_review(
-        handoff=_read_json(args.handoff_json),
-        gap_report=_read_json(args.artifact_gap_report_json),
+        handoff=_read_json(args.handoff_json, context),
+        gap_report=_read_json(args.artifact_gap_report_json, context),
     )
     markdown_path = None if args.no_markdown else args.markdown_path
     json_path = None if args.no_json else args.json_path
@@ -14,6 +14,8 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Mapping, Sequence
 
+from app.cli.artifact_context import ArtifactContext, resolve_context
+
 DEFAULT_ARTIFACT_DIR = Path("ci_artifacts")
 DEFAULT_HEALTH_NAME = "release-health.json"
 DEFAULT_MANIFEST_NAME = "artifact-manifest.json"
@@ -34,9 +36,9 @@ SAFETY_NOTES: tuple[str, ...] = (
 )
 
 
-def _load_json(path: Path, fallback: Any) -> Any:
+def _load_json(path: Path, fallback: Any, context: ArtifactContext | None = None) -> Any:
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
+        return resolve_context(context).load_json(path)
     except (FileNotFoundError, json.JSONDecodeError, OSError):
         return fallback
 
@@ -295,6 +297,7 @@ def build_parser() -> argparse.ArgumentParser:
 
 def main(argv: Sequence[str] | None = None) -> int:
     args = build_parser().parse_args(argv)
+    context = resolve_context()
     artifact_dir = args.artifact_dir
     health_path = args.health_json or artifact_dir / DEFAULT_HEALTH_NAME
     manifest_path = args.manifest_json or artifact_dir / DEFAULT_MANIFEST_NAME
@@ -305,11 +308,11 @@ def main(argv: Sequence[str] | None = None) -> int:
     json_path = None if args.no_json else (args.json_path or artifact_dir / DEFAULT_JSON_NAME)
 
     report = build_handoff_integrity_report(
-        release_health_payload=_load_json(health_path, []),
-        manifest=_as_mapping(_load_json(manifest_path, {"file_count": 0, "files": [], "missing_expected": []})),
-        reviewer_handoff=_as_mapping(_load_json(handoff_path, {})),
-        operator_next_steps=_as_mapping(_load_json(next_steps_path, {"status": "unknown"})),
-        uncertainty_packet=_as_mapping(_load_json(uncertainty_path, {"status": "unknown"})),
+        release_health_payload=_load_json(health_path, [], context),
+        manifest=_as_mapping(_load_json(manifest_path, {"file_count": 0, "files": [], "missing_expected": []}, context)),
+        reviewer_handoff=_as_mapping(_load_json(handoff_path, {}, context)),
+        operator_next_steps=_as_mapping(_load_json(next_steps_path, {"status": "unknown"}, context)),
+        uncertainty_packet=_as_mapping(_load_json(uncertainty_path, {"status": "unknown"}, context)),
     )
     write_outputs(report, markdown_path, json_path)
 
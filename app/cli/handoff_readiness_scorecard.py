@@ -8,6 +8,8 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Mapping, Sequence
 
+from app.cli.artifact_context import ArtifactContext, resolve_context
+
 DEFAULT_ARTIFACT_DIR = Path("ci_artifacts")
 DEFAULT_MARKDOWN_NAME = "handoff-readiness-scorecard.md"
 DEFAULT_JSON_NAME = "handoff-readiness-scorecard.json"
@@ -50,9 +52,9 @@ CATEGORY_DEFINITIONS: Mapping[str, Mapping[str, Any]] = {
 }
 
 
-def _load_json(path: Path, fallback: Any) -> Any:
+def _load_json(path: Path, fallback: Any, context: ArtifactContext | None = None) -> Any:
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
+        return resolve_context(context).load_json(path)
     except (FileNotFoundError, json.JSONDecodeError, OSError):
         return fallback
 
@@ -127,19 +129,20 @@ def _load_category_payload(
     artifact_dir: Path,
     category: Mapping[str, Any],
     provided: Mapping[str, Mapping[str, Any]] | None,
+    context: ArtifactContext | None = None,
 ) -> tuple[Mapping[str, Any], str, bool]:
     artifact = str(category["artifact"])
     fallback = category.get("fallback")
     if provided and artifact in provided:
         return _as_mapping(provided[artifact]), artifact, True
-    primary = _load_json(artifact_dir / artifact, None)
+    primary = _load_json(artifact_dir / artifact, None, context)
     if isinstance(primary, Mapping):
         return primary, artifact, True
     if fallback:
         fallback_name = str(fallback)
         if provided and fallback_name in provided:
             return _as_mapping(provided[fallback_name]), fallback_name, True
-        fallback_payload = _load_json(artifact_dir / fallback_name, None)
+        fallback_payload = _load_json(artifact_dir / fallback_name, None, context)
         if isinstance(fallback_payload, Mapping):
             return fallback_payload, fallback_name, True
     return {}, artifact, False
@@ -189,13 +192,15 @@ def build_handoff_readiness_scorecard(
     artifact_dir: Path = DEFAULT_ARTIFACT_DIR,
     generated_at: datetime | None = None,
     payloads: Mapping[str, Mapping[str, Any]] | None = None,
+    context: ArtifactContext | None = None,
 ) -> Dict[str, Any]:
     """Build a weighted scorecard from existing generated diagnostics."""
 
     generated_at = generated_at or datetime.now(timezone.utc).replace(microsecond=0)
+    context = resolve_context(context)
     rows: List[Dict[str, Any]] = []
     for name, definition in CATEGORY_DEFINITIONS.items():
-        payload, source_artifact, present = _load_category_payload(artifact_dir, definition, payloads)
+        payload, source_artifact, present = _load_category_payload(artifact_dir, definition, payloads, context)
         rows.append(_category_row(name, definition, payload, source_artifact, present))
 
     total_score = sum(int(row["score"]) for row in rows)
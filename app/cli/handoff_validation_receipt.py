@@ -9,12 +9,14 @@ prediction, training, networking, database, or operational workflows.
 from __future__ import annotations
 
 import argparse
-import hashlib
 import json
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Mapping, Sequence
 
+from app.cli.artifact_context import ArtifactContext, resolve_context
+from app.cli.artifact_merkle import MERKLE_ALGORITHM, ROOT_DIRECTORY, merkle_tree, path_sort_key
+
 DEFAULT_ARTIFACT_DIR = Path("ci_artifacts")
 DEFAULT_MARKDOWN_NAME = "handoff-validation-receipt.md"
 DEFAULT_JSON_NAME = "handoff-validation-receipt.json"
@@ -43,9 +45,9 @@ RERUN_COMMANDS = (
 )
 
 
-def _load_json(path: Path, fallback: Any) -> Any:
+def _load_json(path: Path, fallback: Any, context: ArtifactContext | None = None) -> Any:
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
+        return resolve_context(context).load_json(path)
     except (FileNotFoundError, json.JSONDecodeError, OSError):
         return fallback
 
@@ -102,23 +104,36 @@ def _receipt_status(statuses: Mapping[str, str], missing_required: Sequence[str]
     return "ready"
 
 
-def _hash_manifest_entries(manifest: Mapping[str, Any]) -> str:
-    """Hash manifest path/sha/size tuples without reading generated artifacts again."""
+def _manifest_tree(manifest: Mapping[str, Any]) -> Dict[str, Any]:
+    """Return the Merkle tree computed from the manifest's path/sha/size entries.
 
-    relevant_entries = []
-    for entry in _manifest_files(manifest):
-        path = str(entry.get("path", "")).strip()
-        if not path:
-            continue
-        relevant_entries.append(
-            {
-                "path": path,
-                "sha256": str(entry.get("sha256", "")),
-                "size_bytes": int(entry.get("size_bytes", 0) or 0),
-            }
-        )
-    payload = json.dumps(sorted(relevant_entries, key=lambda item: item["path"]), sort_keys=True)
-    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    The tree a manifest records is never trusted: only the file entries are
+    hashed, without reading artifacts again.
+    """
+
+    files = manifest.get("files", [])
+    return merkle_tree(entry for entry in files if isinstance(entry, Mapping)) if isinstance(files, list) else merkle_tree([])
+
+
+def _directory_digests(tree: Mapping[str, Any]) -> Dict[str, str]:
+    return {path: str(node["digest"]) for path, node in tree["directories"].items()}
+
+
+def _recorded_digest_mismatches(manifest: Mapping[str, Any], digests: Mapping[str, str]) -> List[str]:
+    """Return directories whose recorded Merkle digest disagrees with the computed one."""
+
+    recorded = manifest.get("merkle")
+    if not isinstance(recorded, Mapping) or recorded.get("algorithm") != MERKLE_ALGORITHM:
+        return []
+    directories = recorded.get("directories", {})
+    recorded_digests = {
+        str(path): str(node.get("digest", ""))
+        for path, node in (directories.items() if isinstance(directories, Mapping) else [])
+        if isinstance(node, Mapping)
+    }
+    recorded_digests.setdefault(ROOT_DIRECTORY, str(recorded.get("root", "")))
+    mismatched = {path for path in {*recorded_digests, *digests} if recorded_digests.get(path) != digests.get(path)}
+    return sorted(mismatched, key=path_sort_key)
 
 
 def build_handoff_validation_receipt(
@@ -130,19 +145,21 @@ def build_handoff_validation_receipt(
     triage: Mapping[str, Any] | None = None,
     handoff: Mapping[str, Any] | None = None,
     uncertainty: Mapping[str, Any] | None = None,
+    context: ArtifactContext | None = None,
 ) -> Dict[str, Any]:
     """Build a deterministic validation receipt from generated local artifacts."""
 
+    context = resolve_context(context)
     generated_at = generated_at or datetime.now(timezone.utc).replace(microsecond=0)
-    manifest = _as_mapping(manifest if manifest is not None else _load_json(artifact_dir / "artifact-manifest.json", {}))
-    evidence = _as_mapping(evidence if evidence is not None else _load_json(artifact_dir / "evidence-checklist.json", {}))
+    manifest = _as_mapping(manifest if manifest is not None else _load_json(artifact_dir / "artifact-manifest.json", {}, context))
+    evidence = _as_mapping(evidence if evidence is not None else _load_json(artifact_dir / "evidence-checklist.json", {}, context))
     integrity = _as_mapping(
-        integrity if integrity is not None else _load_json(artifact_dir / "handoff-integrity-report.json", {})
+        integrity if integrity is not None else _load_json(artifact_dir / "handoff-integrity-report.json", {}, context)
     )
-    triage = _as_mapping(triage if triage is not None else _load_json(artifact_dir / "triage-summary.json", {}))
-    handoff = _as_mapping(handoff if handoff is not None else _load_json(artifact_dir / "reviewer-handoff.json", {}))
+    triage = _as_mapping(triage if triage is not None else _load_json(artifact_dir / "triage-summary.json", {}, context))
+    handoff = _as_mapping(handoff if handoff is not None else _load_json(artifact_dir / "reviewer-handoff.json", {}, context))
     uncertainty = _as_mapping(
-        uncertainty if uncertainty is not None else _load_json(artifact_dir / "uncertainty-review-packet.json", {})
+        uncertainty if uncertainty is not None else _load_json(artifact_dir / "uncertainty-review-packet.json", {}, context)
     )
 
     missing_required = [
@@ -160,6 +177,9 @@ def build_handoff_validation_receipt(
         "uncertainty_packet": str(uncertainty.get("status", "unknown")).lower(),
     }
     manifest_missing_expected = [str(item) for item in manifest.get("missing_expected", []) if str(item).strip()]
+    tree = _manifest_tree(manifest)
+    directory_digests = _directory_digests(tree)
+    digest_mismatches = _recorded_digest_mismatches(manifest, directory_digests)
     manifest_scan_warnings = [
         str(item.get("path", item)) if isinstance(item, Mapping) else str(item)
         for item in manifest.get("scan_warnings", [])
@@ -173,6 +193,8 @@ def build_handoff_validation_receipt(
         blockers.append(f"manifest reports missing expected artifacts: {len(manifest_missing_expected)}")
     if any(_status_rank(status) >= 2 for status in statuses.values()):
         blockers.append("one or more upstream handoff gates are blocked or failing")
+    if digest_mismatches:
+        blockers.append(f"manifest Merkle digests do not match its file entries: {', '.join(digest_mismatches)}")
 
     warnings: List[str] = []
     if manifest_scan_warnings:
@@ -182,7 +204,7 @@ def build_handoff_validation_receipt(
     if not evidence_summary:
         warnings.append("evidence checklist summary is unavailable")
 
-    status = _receipt_status(statuses, [*missing_required, *manifest_missing_expected])
+    status = _receipt_status(statuses, [*missing_required, *manifest_missing_expected, *digest_mismatches])
     if blockers:
         next_action = "Repair blocked validation gates, regenerate the diagnostic bundle, then re-export the receipt."
     elif warnings:
@@ -197,7 +219,9 @@ def build_handoff_validation_receipt(
         "artifact_dir": artifact_dir.as_posix(),
         "artifact_count": int(manifest.get("file_count", 0) or 0),
         "total_size_bytes": int(manifest.get("total_size_bytes", 0) or 0),
-        "bundle_manifest_digest": _hash_manifest_entries(manifest),
+        "bundle_manifest_digest": str(tree["root"]),
+        "bundle_directory_digests": directory_digests,
+        "manifest_digest_mismatches": digest_mismatches,
         "required_artifacts": list(REQUIRED_RECEIPT_ARTIFACTS),
         "missing_required_artifacts": missing_required,
         "upstream_statuses": statuses,
@@ -233,8 +257,19 @@ def _markdown_lines(receipt: Mapping[str, Any]) -> Iterable[str]:
     yield f"- Artifact directory: `{receipt['artifact_dir']}`"
     yield f"- Indexed artifacts: `{receipt['artifact_count']}`"
     yield f"- Total indexed size: `{receipt['total_size_bytes']}` bytes"
-    yield f"- Manifest entry digest: `{receipt['bundle_manifest_digest']}`"
+    yield f"- Manifest Merkle root: `{receipt['bundle_manifest_digest']}`"
     yield ""
+    top_level = [
+        (path, digest)
+        for path, digest in receipt.get("bundle_directory_digests", {}).items()
+        if path != ROOT_DIRECTORY and "/" not in path
+    ]
+    if top_level:
+        yield "| Subdirectory | Merkle digest |"
+        yield "| --- | --- |"
+        for path, digest in top_level:
+            yield f"| `{_escape_table(path)}/` | `{digest}` |"
+        yield ""
     yield "## Upstream validation gates"
     yield ""
     yield "| Gate | Status |"
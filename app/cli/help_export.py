@@ -0,0 +1,146 @@
+"""Export every CLI's ``--help`` text into the diagnostic artifact bundle.
+
+Each exported CLI exposes ``build_parser()``, so one interpreter can import
+them all and format the same help text ``python -m app.cli.<name> --help``
+would print when redirected to a file. Files whose content is unchanged are
+not rewritten, keeping their ``mtime`` stable for the manifest hash cache and
+incremental bundle runs.
+"""
+
+from __future__ import annotations
+
+import argparse
+import functools
+import importlib
+import os
+from pathlib import Path
+from typing import Dict, Sequence, Tuple
+
+DEFAULT_ARTIFACT_DIR = Path("ci_artifacts")
+
+# argparse wraps help at the terminal width; redirected output falls back to 80.
+HELP_COLUMNS = 80
+
+HELP_EXPORTS: Tuple[Tuple[str, str], ...] = (
+    ("quickstart", "quickstart-help.txt"),
+    ("doctor", "doctor-help.txt"),
+    ("release_health", "release-health-help.txt"),
+    ("release_notes", "release-notes-help.txt"),
+    ("reviewer_handoff", "reviewer-handoff-help.txt"),
+    ("operator_digest", "operator-digest-help.txt"),
+    ("operator_readiness", "operator-readiness-help.txt"),
+    ("operator_status_board", "operator-status-board-help.txt"),
+    ("operator_session_plan", "operator-session-plan-help.txt"),
+    ("operator_runbook_index", "operator-runbook-index-help.txt"),
+    ("operator_next_steps", "operator-next-steps-help.txt"),
+    ("uncertainty_review_packet", "uncertainty-review-packet-help.txt"),
+    ("handoff_integrity_report", "handoff-integrity-report-help.txt"),
+    ("evidence_checklist", "evidence-checklist-help.txt"),
+    ("implementation_acceptance_checklist", "implementation-acceptance-checklist-help.txt"),
+    ("implementation_acceptance_handoff", "implementation-acceptance-handoff-help.txt"),
+    ("decision_log", "decision-log-help.txt"),
+    ("operator_exception_register", "operator-exception-register-help.txt"),
+    ("handoff_validation_receipt", "handoff-validation-receipt-help.txt"),
+    ("workflow_gate_summary", "workflow-gate-summary-help.txt"),
+    ("provenance_validation_matrix", "provenance-validation-matrix-help.txt"),
+    ("automation_plan", "automation-plan-help.txt"),
+    ("triage_summary", "triage-summary-help.txt"),
+    ("artifact_gap_report", "artifact-gap-report-help.txt"),
+    ("handoff_gap_report_review", "handoff-gap-report-review-help.txt"),
+    ("artifact_provenance_ledger", "artifact-provenance-ledger-help.txt"),
+    ("artifact_scan", "artifact-scan-help.txt"),
+    ("artifact_catalog", "artifact-catalog-help.txt"),
+    ("bundle_diff", "bundle-diff-help.txt"),
+    ("bundle_archive", "bundle-archive-help.txt"),
+    ("artifact_store", "artifact-store-help.txt"),
+    ("synthetic_data_fixtures", "synthetic-data-fixtures-help.txt"),
+    ("next_increment_candidates", "next-increment-candidates-help.txt"),
+    ("export_openapi", "export-openapi-help.txt"),
+    ("export_api_examples", "export-api-examples-help.txt"),
+    ("export_dashboard_mockup", "export-dashboard-mockup-help.txt"),
+    ("release_bundle_index", "release-bundle-index-help.txt"),
+    ("artifact_manifest", "artifact-manifest-help.txt"),
+    ("export_html_previews", "export-html-previews-help.txt"),
+    ("import_budget", "import-budget-help.txt"),
+)
+
+
+def _help_columns() -> int:
+    try:
+        columns = int(os.environ.get("COLUMNS", ""))
+    except ValueError:
+        return HELP_COLUMNS
+    return columns if columns > 0 else HELP_COLUMNS
+
+
+def render_help(name: str) -> str:
+    """Return the redirected ``--help`` output for ``app.cli.<name>``."""
+
+    module = importlib.import_module(f"app.cli.{name}")
+    parser: argparse.ArgumentParser = module.build_parser()
+    parser.prog = Path(str(module.__file__)).name
+    parser.formatter_class = functools.partial(parser.formatter_class, width=_help_columns() - 2)
+    return parser.format_help()
+
+
+def write_help(name: str, path: Path) -> bool:
+    """Write help for ``app.cli.<name>`` to ``path``; return ``False`` when it was already current."""
+
+    text = render_help(name)
+    try:
+        if path.read_text(encoding="utf-8") == text:
+            return False
+    except (FileNotFoundError, UnicodeDecodeError):
+        pass
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+    return True
+
+
+def export_help(
+    artifact_dir: Path = DEFAULT_ARTIFACT_DIR,
+    exports: Sequence[Tuple[str, str]] = HELP_EXPORTS,
+) -> Dict[str, bool]:
+    """Write every help export into ``artifact_dir`` and map file names to whether they changed."""
+
+    return {output: write_help(name, artifact_dir / output) for name, output in exports}
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Create the command-line parser."""
+
+    parser = argparse.ArgumentParser(description="Export every diagnostics CLI's --help text in one process.")
+    parser.add_argument(
+        "--artifact-dir",
+        type=Path,
+        default=DEFAULT_ARTIFACT_DIR,
+        help=f"Directory for *-help.txt files. Default: {DEFAULT_ARTIFACT_DIR}",
+    )
+    parser.add_argument(
+        "--only",
+        action="append",
+        default=[],
+        metavar="NAME",
+        help="Export only this app.cli module's help; repeat for several.",
+    )
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """CLI entry point."""
+
+    args = build_parser().parse_args(argv)
+    known = dict(HELP_EXPORTS)
+    unknown = [name for name in args.only if name not in known]
+    if unknown:
+        print(f"Unknown help export(s): {', '.join(unknown)}")
+        return 2
+    exports = [(name, known[name]) for name in args.only] if args.only else HELP_EXPORTS
+    changed = export_help(args.artifact_dir, exports)
+    written = sum(changed.values())
+    print(f"Wrote {written} help file(s) to {args.artifact_dir}; {len(changed) - written} already current.")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
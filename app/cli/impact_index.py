@@ -0,0 +1,398 @@
+"""Select the tests and CLI smoke steps that a git diff affects, using a recorded test-impact index.
+
+The index maps each test module to the repository files it depends on. It is
+recorded by ``python scripts/parallel_tests.py --record-impact``, which runs
+every module in a fresh interpreter with an audit hook installed, and keeps:
+
+- ``files``: every repository source file imported while the module ran, and
+  every repository file it opened;
+- ``directories``: every repository directory it listed with ``os.scandir``
+  (``Path.glob``, ``os.walk``), so adding or removing a file there selects it;
+- ``spawns_processes``: whether it started a subprocess. The index cannot see
+  what the child loads or reads, so any change selects these modules.
+
+A test module is affected by a change when it is not in the index yet, when a
+changed path is one of its files or sits in one of its directories, or when
+the module starts subprocesses.
+
+CLI smoke steps are the ``smoke`` lines of ``scripts/test.sh``. A step is
+affected when a changed file is in the static import closure of the module or
+script it runs. Later steps read the outputs of earlier ones, so the smoke
+plan is "run every step up to the last affected one".
+
+The index records the commit it was built at. ``--changed`` runs fall back to
+the full suite, and rebuild the index, once it is older than
+``--max-index-age`` commits, which keeps it honest.
+"""
+
+from __future__ import annotations
+
+import argparse
+import ast
+import json
+import os
+import platform
+import re
+import subprocess
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Sequence, Set
+
+REPOSITORY_ROOT = Path(__file__).resolve().parents[2]
+DEFAULT_INDEX_PATH = REPOSITORY_ROOT / ".test-impact.json"
+DEFAULT_TESTS_DIR = REPOSITORY_ROOT / "tests"
+DEFAULT_PATTERN = "test_*.py"
+DEFAULT_SMOKE_SCRIPT = REPOSITORY_ROOT / "scripts" / "test.sh"
+DEFAULT_MAX_INDEX_AGE = 25
+INDEX_VERSION = 1
+
+# The import system lists package directories with os.listdir, so only
+# os.scandir counts as a test listing a directory.
+_SCAN_EVENTS = {"os.scandir"}
+_PROCESS_EVENTS = {"subprocess.Popen", "os.posix_spawn", "os.system", "os.exec", "os.spawn"}
+_IGNORED_PARTS = {".git", "__pycache__"}
+_SMOKE_LINE = re.compile(r"^\s*smoke\s+(.*)$")
+_SMOKE_MODULE = re.compile(r"\s-m\s+(app\.[\w.]+)")
+_SMOKE_SCRIPT = re.compile(r"\s(scripts/[\w./-]+\.py)\b")
+
+
+class ImpactError(ValueError):
+    """Raised when the changed files cannot be determined."""
+
+
+def discover_modules(tests_dir: Path = DEFAULT_TESTS_DIR, pattern: str = DEFAULT_PATTERN) -> List[str]:
+    """Return the dotted names of the test modules in ``tests_dir`` that match ``pattern``."""
+
+    package = tests_dir.resolve().relative_to(REPOSITORY_ROOT).as_posix().replace("/", ".")
+    return [f"{package}.{path.stem}" for path in sorted(tests_dir.glob(pattern)) if path.is_file()]
+
+
+def _relative(path: Any, root: Path = REPOSITORY_ROOT) -> str | None:
+    if isinstance(path, bytes):
+        path = os.fsdecode(path)
+    if not isinstance(path, (str, os.PathLike)):
+        return None
+    try:
+        relative = Path(os.path.abspath(path)).relative_to(root)
+    except ValueError:
+        return None
+    if not relative.parts or _IGNORED_PARTS.intersection(relative.parts):
+        return None
+    return relative.as_posix()
+
+
+class ImpactRecorder:
+    """An audit hook collecting the repository files, directories, and subprocesses a process touches."""
+
+    def __init__(self, root: Path = REPOSITORY_ROOT) -> None:
+        self.root = root
+        self.files: Set[str] = set()
+        self.directories: Set[str] = set()
+        self.spawns_processes = False
+        self._preloaded: Set[str] = set()
+
+    def __call__(self, event: str, args: tuple) -> None:
+        if event == "open":
+            relative = _relative(args[0], self.root)
+            if relative is not None:
+                self.files.add(relative)
+        elif event in _SCAN_EVENTS:
+            relative = _relative(args[0] if args[0] is not None else ".", self.root)
+            if relative is not None:
+                self.directories.add(relative)
+        elif event in _PROCESS_EVENTS:
+            self.spawns_processes = True
+
+    def install(self) -> "ImpactRecorder":
+        """Start recording; audit hooks stay for the life of the process, so use a fresh one."""
+
+        self._preloaded = set(sys.modules)
+        sys.addaudithook(self)
+        return self
+
+    def snapshot(self, sources: Iterable[Path] = ()) -> Dict[str, Any]:
+        """Return the recorded dependencies, with the repository modules imported since :meth:`install`.
+
+        Modules the recording process had already loaded, such as the test
+        runner itself, only count when they are in the static import closure
+        of one of ``sources``.
+        """
+
+        files = set(self.files)
+        for source in sources:
+            files.update(import_closure(source, self.root))
+        for name, module in list(sys.modules.items()):
+            if name in self._preloaded:
+                continue
+            relative = _relative(getattr(module, "__file__", None), self.root)
+            if relative is not None and relative.endswith(".py"):
+                files.add(relative)
+        return {
+            "files": sorted(files),
+            "directories": sorted(self.directories),
+            "spawns_processes": self.spawns_processes,
+        }
+
+
+def _git(args: Sequence[str], root: Path) -> str:
+    try:
+        result = subprocess.run(["git", *args], cwd=root, capture_output=True, text=True, check=False)
+    except OSError as error:
+        raise ImpactError(f"git is not available: {error}") from None
+    if result.returncode != 0:
+        raise ImpactError(f"git {' '.join(args)} failed: {result.stderr.strip()}")
+    return result.stdout
+
+
+def head_commit(root: Path = REPOSITORY_ROOT) -> str | None:
+    """Return the ``HEAD`` commit, or ``None`` outside a git checkout."""
+
+    try:
+        return _git(["rev-parse", "HEAD"], root).strip()
+    except ImpactError:
+        return None
+
+
+def changed_files(ref: str = "HEAD", root: Path = REPOSITORY_ROOT) -> List[str]:
+    """Return paths changed since ``ref`` in commits, the index, or the worktree, plus untracked files."""
+
+    diff = _git(["diff", "--name-only", "--no-renames", ref, "--"], root)
+    untracked = _git(["ls-files", "--others", "--exclude-standard"], root)
+    return sorted({line for line in (diff + untracked).splitlines() if line})
+
+
+def index_age(index: Mapping[str, Any], root: Path = REPOSITORY_ROOT) -> int | None:
+    """Return how many commits ``HEAD`` is ahead of the index's commit, or ``None`` when unknown."""
+
+    commit = index.get("commit")
+    if not commit:
+        return None
+    try:
+        return int(_git(["rev-list", "--count", f"{commit}..HEAD"], root).strip())
+    except (ImpactError, ValueError):
+        return None
+
+
+def load_index(path: Path = DEFAULT_INDEX_PATH) -> Dict[str, Any]:
+    """Return the impact index, or an empty one when ``path`` does not exist."""
+
+    if not path.exists():
+        return {"version": INDEX_VERSION, "modules": {}}
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def build_index(records: Mapping[str, Mapping[str, Any]], previous: Mapping[str, Any] | None = None) -> Dict[str, Any]:
+    """Return an index with ``records`` (test module -> snapshot) merged over ``previous``."""
+
+    modules = dict((previous or {}).get("modules", {}))
+    modules.update(records)
+    return {
+        "version": INDEX_VERSION,
+        "generated_at": datetime.now(timezone.utc).replace(microsecond=0).isoformat(),
+        "python_version": platform.python_version(),
+        "commit": head_commit(),
+        "modules": dict(sorted(modules.items())),
+    }
+
+
+def write_index(index: Mapping[str, Any], path: Path = DEFAULT_INDEX_PATH) -> None:
+    """Write the index as stable JSON."""
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(index, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+
+
+def impact_reason(entry: Mapping[str, Any] | None, changed: Iterable[str]) -> str | None:
+    """Return why a test module with index ``entry`` is affected by ``changed``, or ``None``."""
+
+    if entry is None:
+        return "not in the impact index"
+    files = set(entry.get("files", ()))
+    directories = set(entry.get("directories", ()))
+    for path in changed:
+        if path in files:
+            return f"depends on {path}"
+        parent = path.rpartition("/")[0] or "."
+        if parent in directories:
+            return f"lists {parent}/"
+        if entry.get("spawns_processes"):
+            # A child process may import or read any file, data and docs included.
+            return f"starts subprocesses and {path} changed"
+    return None
+
+
+def select_modules(index: Mapping[str, Any], modules: Sequence[str], changed: Sequence[str]) -> Dict[str, str]:
+    """Return the affected test modules among ``modules``, each with the reason it was selected."""
+
+    entries = index.get("modules", {})
+    selected = {}
+    for module in modules:
+        reason = impact_reason(entries.get(module), changed)
+        if reason is not None:
+            selected[module] = reason
+    return selected
+
+
+def source_path(module: str, root: Path = REPOSITORY_ROOT) -> Path | None:
+    """Return the source file of a repository module, or ``None`` when it is not one."""
+
+    base = root.joinpath(*module.split("."))
+    for candidate in (base.with_suffix(".py"), base / "__init__.py"):
+        if candidate.is_file():
+            return candidate
+    return None
+
+
+def _module_of(path: Path, root: Path) -> str:
+    parts = list(path.relative_to(root).with_suffix("").parts)
+    return ".".join(parts[:-1] if parts[-1] == "__init__" else parts)
+
+
+def _walk(tree: ast.AST) -> Iterable[ast.AST]:
+    # Like ast.walk, but skips ``__getattr__`` bodies: PEP 562 lazy exports
+    # only import when the attribute is requested.
+    pending = [tree]
+    while pending:
+        node = pending.pop()
+        yield node
+        pending.extend(
+            child
+            for child in ast.iter_child_nodes(node)
+            if not (isinstance(child, ast.FunctionDef) and child.name == "__getattr__")
+        )
+
+
+def _imported_names(tree: ast.AST, module: str, is_package: bool) -> Iterable[str]:
+    package = module if is_package else module.rpartition(".")[0]
+    for node in _walk(tree):
+        if isinstance(node, ast.Import):
+            yield from (alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            base = node.module or ""
+            if node.level:
+                anchor = package.split(".")[: len(package.split(".")) - (node.level - 1)] if package else []
+                base = ".".join([*anchor, base] if base else anchor)
+            yield base
+            yield from (f"{base}.{alias.name}" for alias in node.names)
+
+
+def import_closure(path: Path, root: Path = REPOSITORY_ROOT) -> Set[str]:
+    """Return the repository source files ``path`` imports, directly or not, including itself.
+
+    Imports anywhere in a file count, including ones inside functions, so the
+    closure errs on the side of including too much. Module ``__getattr__``
+    lazy exports are the exception.
+    """
+
+    closure: Set[str] = set()
+    pending = [path.resolve()]
+    while pending:
+        current = pending.pop()
+        relative = current.relative_to(root).as_posix()
+        if relative in closure:
+            continue
+        closure.add(relative)
+        tree = ast.parse(current.read_text(encoding="utf-8"), filename=str(current))
+        module = _module_of(current, root)
+        for name in _imported_names(tree, module, current.name == "__init__.py"):
+            parts = name.split(".")
+            for end in range(1, len(parts) + 1):
+                source = source_path(".".join(parts[:end]), root)
+                if source is not None:
+                    pending.append(source)
+    return closure
+
+
+def smoke_steps(script: Path = DEFAULT_SMOKE_SCRIPT, root: Path = REPOSITORY_ROOT) -> List[Dict[str, Any]]:
+    """Return the ``smoke`` steps of ``script`` in order, each with the source file it runs."""
+
+    steps = []
+    for line in script.read_text(encoding="utf-8").splitlines():
+        match = _SMOKE_LINE.match(line)
+        if not match:
+            continue
+        command = " " + match.group(1)
+        module = _SMOKE_MODULE.search(command)
+        target = _SMOKE_SCRIPT.search(command)
+        source = source_path(module.group(1), root) if module else root / target.group(1) if target else None
+        steps.append({"target": module.group(1) if module else target.group(1) if target else command.strip(), "source": source})
+    return steps
+
+
+def smoke_plan(steps: Sequence[Mapping[str, Any]], changed: Sequence[str], script: Path = DEFAULT_SMOKE_SCRIPT) -> int:
+    """Return how many leading smoke steps to run: every step up to the last affected one.
+
+    Everything runs when the script itself changes, when a step's source cannot
+    be found, or when a non-Python file under ``app/`` changes, since CLIs may
+    read such files at run time.
+    """
+
+    changed_set = set(changed)
+    if _relative(script) in changed_set or any(path.startswith("app/") and not path.endswith(".py") for path in changed_set):
+        return len(steps)
+    last = 0
+    for number, step in enumerate(steps, start=1):
+        source = step["source"]
+        if source is None or not Path(source).is_file() or changed_set & import_closure(Path(source)):
+            last = number
+    return last
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Create the command-line parser."""
+
+    parser = argparse.ArgumentParser(
+        description="Show the test modules and CLI smoke steps affected by changes since a git ref."
+    )
+    parser.add_argument("--changed", default="HEAD", metavar="REF", help="Compare with this git ref. Default: HEAD")
+    parser.add_argument(
+        "--index",
+        type=Path,
+        default=DEFAULT_INDEX_PATH,
+        help="Impact index recorded by scripts/parallel_tests.py --record-impact. Default: .test-impact.json",
+    )
+    parser.add_argument(
+        "--smoke-steps",
+        type=Path,
+        metavar="SCRIPT",
+        help="Only print how many leading smoke steps of SCRIPT to run (used by scripts/test.sh).",
+    )
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """CLI entry point."""
+
+    args = build_parser().parse_args(argv)
+    try:
+        changed = changed_files(args.changed)
+    except ImpactError as error:
+        print(error, file=sys.stderr)
+        return 1
+    if args.smoke_steps:
+        print(smoke_plan(smoke_steps(args.smoke_steps), changed, args.smoke_steps))
+        return 0
+
+    index = load_index(args.index)
+    modules = discover_modules()
+    selected = select_modules(index, modules, changed)
+    steps = smoke_steps()
+    planned = smoke_plan(steps, changed)
+    age = index_age(index)
+    print(f"{len(changed)} changed file(s) since {args.changed}")
+    if not index.get("modules"):
+        print(f"No impact index at {args.index}; record one with python scripts/parallel_tests.py --record-impact")
+    elif age is not None:
+        print(f"Impact index built {age} commit(s) ago")
+    print(f"Affected test modules: {len(selected)} of {len(modules)}")
+    for module, reason in selected.items():
+        print(f"  {module}: {reason}")
+    print(f"Smoke steps to run: {planned} of {len(steps)}")
+    for step in steps[:planned]:
+        print(f"  {step['target']}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
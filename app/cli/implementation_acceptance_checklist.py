@@ -15,6 +15,8 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, Iterable, Mapping, Sequence
 
+from app.cli.artifact_context import ArtifactContext, resolve_context
+
 DEFAULT_MARKDOWN_NAME = "implementation-acceptance-checklist.md"
 DEFAULT_JSON_NAME = "implementation-acceptance-checklist.json"
 SCHEMA_VERSION = "1.3"
@@ -112,11 +114,11 @@ def _utc_now() -> datetime:
     return datetime.now(timezone.utc).replace(microsecond=0)
 
 
-def _read_json(path: Path | None) -> Mapping[str, Any]:
+def _read_json(path: Path | None, context: ArtifactContext | None = None) -> Mapping[str, Any]:
     if path is None:
         return {}
     try:
-        loaded = json.loads(path.read_text(encoding="utf-8"))
+        loaded = resolve_context(context).load_json(path)
     except (OSError, json.JSONDecodeError):
         return {}
     return loaded if isinstance(loaded, Mapping) else {}
@@ -426,7 +428,8 @@ def build_parser() -> argparse.ArgumentParser:
 
 def main(argv: Sequence[str] | None = None) -> int:
     args = build_parser().parse_args(argv)
-    source = _read_json(args.decision_record_path)
+    context = resolve_context()
+    source = _read_json(args.decision_record_path, context)
     checklist = build_acceptance_checklist(source)
     markdown_path = None if args.no_markdown else args.markdown_path
     json_path = None if args.no_json else args.json_path
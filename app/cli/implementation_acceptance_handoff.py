@@ -17,6 +17,8 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, Iterable, Mapping, Sequence
 
+from app.cli.artifact_context import ArtifactContext, resolve_context
+
 DEFAULT_MARKDOWN_NAME = "implementation-acceptance-handoff.md"
 DEFAULT_JSON_NAME = "implementation-acceptance-handoff.json"
 SCHEMA_VERSION = "1.3"
@@ -34,11 +36,11 @@ def _utc_now() -> datetime:
     return datetime.now(timezone.utc).replace(microsecond=0)
 
 
-def _read_json(path: Path | None) -> Mapping[str, Any]:
+def _read_json(path: Path | None, context: ArtifactContext | None = None) -> Mapping[str, Any]:
     if path is None:
         return {}
     try:
-        loaded = json.loads(path.read_text(encoding="utf-8"))
+        loaded = resolve_context(context).load_json(path)
     except (OSError, json.JSONDecodeError):
         return {}
     return loaded if isinstance(loaded, Mapping) else {}
@@ -488,9 +490,10 @@ def build_parser() -> argparse.ArgumentParser:
 
 def main(argv: Sequence[str] | None = None) -> int:
     args = build_parser().parse_args(argv)
-    checklist = _read_json(args.checklist_json)
-    decision_record = _read_json(args.decision_record_json)
-    artifact_manifest = _read_json(args.artifact_manifest_json)
+    context = resolve_context()
+    checklist = _read_json(args.checklist_json, context)
+    decision_record = _read_json(args.decision_record_json, context)
+    artifact_manifest = _read_json(args.artifact_manifest_json, context)
     handoff = build_acceptance_handoff(
         checklist,
         decision_record=decision_record,
@@ -0,0 +1,415 @@
+"""Measure cold ``app.cli`` import times with ``-X importtime`` and gate them on a budget.
+
+The toolchain is started hundreds of times per CI run, so import cost is paid
+on every launch. Each module is imported in a fresh interpreter under
+``python -X importtime``. Its cold cost is the cumulative time of the top-level
+imports that ``import app.cli.<module>`` triggers, including the ``app`` and
+``app.cli`` packages and everything they pull in, such as ``app.config`` or
+FastAPI. The fastest of ``--repeat`` runs is compared with the per-module
+budget in a committed JSON baseline.
+
+Absolute milliseconds do not carry across machines, so every run also times a
+fixed set of standard library imports. Each budget is scaled by how that
+reference import compares with the one measured when the budget was recorded.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import re
+import subprocess
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Sequence, Tuple
+
+DEFAULT_ARTIFACT_DIR = Path("ci_artifacts")
+DEFAULT_JSON_NAME = "import-budget.json"
+DEFAULT_MARKDOWN_NAME = "import-budget.md"
+REPOSITORY_ROOT = Path(__file__).resolve().parents[2]
+DEFAULT_BASELINE_PATH = REPOSITORY_ROOT / "benchmarks" / "import_budget.json"
+DEFAULT_REPEAT = 3
+# A budget is the baseline scaled by (1 + headroom), and at least MIN_SLACK_MS
+# above it, so fast modules are not failed by scheduler noise.
+DEFAULT_HEADROOM = 1.0
+MIN_SLACK_MS = 25.0
+TOP_DEPENDENCIES = 5
+BASELINE_VERSION = 2
+
+# Pure standard library imports timed in every run to calibrate the budgets to
+# this machine; none of them is loaded during interpreter startup.
+REFERENCE_IMPORTS = (
+    "argparse",
+    "dataclasses",
+    "decimal",
+    "email.message",
+    "http.client",
+    "json",
+    "logging",
+    "typing",
+    "xml.etree.ElementTree",
+)
+
+# Third-party packages worth calling out when a CLI pulls them in at import time.
+HEAVY_PACKAGES = (
+    "PIL",
+    "cv2",
+    "fastapi",
+    "folium",
+    "matplotlib",
+    "numpy",
+    "pandas",
+    "pydantic",
+    "pymongo",
+    "sklearn",
+    "starlette",
+    "tensorflow",
+    "torch",
+    "uvicorn",
+)
+
+_MARKER = "-- app.cli import budget --"
+_IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \| ( *)(\S+)\s*$")
+
+
+def default_modules() -> List[str]:
+    """Return every module in the ``python -m app.cli`` command table."""
+
+    from app.cli.__main__ import COMMANDS, module_name
+
+    return [module_name(command) for command, _ in COMMANDS]
+
+
+def parse_importtime(stderr: str) -> List[Tuple[int, str, int, int]]:
+    """Return ``(depth, name, self_us, cumulative_us)`` rows printed after the start marker."""
+
+    _, found, tail = stderr.partition(_MARKER)
+    rows = []
+    for line in (tail if found else stderr).splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            rows.append((len(indent) // 2, name, int(self_us), int(cumulative_us)))
+    return rows
+
+
+def _summarize(module: str, rows: Sequence[Tuple[int, str, int, int]]) -> Dict[str, Any]:
+    # importtime prints children before their parent, so a depth-1 row belongs
+    # to the next depth-0 row that follows it.
+    children: List[Tuple[str, int]] = []
+    dependencies: List[Tuple[str, int]] = []
+    for depth, name, _, cumulative_us in rows:
+        if depth == 1:
+            children.append((name, cumulative_us))
+        elif depth == 0:
+            if name == module:
+                dependencies = children
+            children = []
+    dependencies.sort(key=lambda item: (-item[1], item[0]))
+    names = {name.split(".", 1)[0] for _, name, _, _ in rows}
+    return {
+        "cumulative_ms": round(sum(row[3] for row in rows if row[0] == 0) / 1000, 2),
+        "import_count": len(rows),
+        "heavy_imports": sorted(names.intersection(HEAVY_PACKAGES)),
+        "largest_dependencies": [
+            {"module": name, "cumulative_ms": round(cumulative_us / 1000, 2)}
+            for name, cumulative_us in dependencies[:TOP_DEPENDENCIES]
+        ],
+    }
+
+
+def measure_module(module: str, repeat: int = DEFAULT_REPEAT, python: str = sys.executable) -> Dict[str, Any]:
+    """Import ``module`` in ``repeat`` fresh interpreters and keep the fastest run."""
+
+    code = f"import sys; sys.stderr.write({_MARKER!r} + '\\n'); sys.stderr.flush(); import {module}"
+    best: Dict[str, Any] | None = None
+    for _ in range(max(1, repeat)):
+        result = subprocess.run(
+            [python, "-X", "importtime", "-c", code],
+            cwd=REPOSITORY_ROOT,
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+        if result.returncode != 0:
+            lines = [line for line in result.stderr.splitlines() if line and not line.startswith("import time:")]
+            return {"module": module, "error": lines[-1] if lines else f"exit status {result.returncode}"}
+        measured = _summarize(module, parse_importtime(result.stderr))
+        if best is None or measured["cumulative_ms"] < best["cumulative_ms"]:
+            best = measured
+    return {"module": module, **(best or {})}
+
+
+def measure_reference(repeat: int = DEFAULT_REPEAT, python: str = sys.executable) -> float | None:
+    """Return the fastest cold import time of :data:`REFERENCE_IMPORTS`, or ``None`` if it failed."""
+
+    measured = measure_module(", ".join(REFERENCE_IMPORTS), repeat=repeat, python=python)
+    return measured.get("cumulative_ms") or None
+
+
+def load_baseline(path: Path) -> Dict[str, Any]:
+    """Return the baseline document, or an empty one when ``path`` does not exist."""
+
+    if not path.exists():
+        return {"version": BASELINE_VERSION, "modules": {}}
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def budget_for(baseline_ms: float, headroom: float = DEFAULT_HEADROOM) -> float:
+    """Return the budget allowed for a module whose recorded cold import took ``baseline_ms``."""
+
+    return round(max(baseline_ms * (1 + headroom), baseline_ms + MIN_SLACK_MS), 2)
+
+
+def _scale(budget: Mapping[str, Any] | None, reference_ms: float | None) -> float | None:
+    """Return how much slower this run's reference import is than the one recorded with ``budget``."""
+
+    recorded = (budget or {}).get("reference_ms")
+    if not recorded or not reference_ms:
+        return None
+    return round(reference_ms / recorded, 3)
+
+
+def _status(entry: Mapping[str, Any]) -> str:
+    if "error" in entry:
+        return "error"
+    if entry["budget_ms"] is None:
+        return "unbudgeted"
+    return "over_budget" if entry["cumulative_ms"] > entry["budget_ms"] else "within_budget"
+
+
+def build_import_budget_report(
+    measurements: Sequence[Mapping[str, Any]],
+    baseline: Mapping[str, Any] | None = None,
+    repeat: int = DEFAULT_REPEAT,
+    reference_ms: float | None = None,
+) -> Dict[str, Any]:
+    """Compare each measured module with its budget in ``baseline``.
+
+    Budgets are multiplied by the ratio of ``reference_ms`` to the reference
+    import recorded with them. A budget without a recorded reference, or a run
+    without ``reference_ms``, cannot be calibrated and leaves the module
+    ``unbudgeted``.
+    """
+
+    budgets = (baseline or {}).get("modules", {})
+    entries = []
+    for measured in measurements:
+        entry = dict(measured)
+        budget = budgets.get(entry["module"])
+        scale = _scale(budget, reference_ms)
+        entry["baseline_ms"] = budget.get("baseline_ms") if budget else None
+        entry["scale"] = scale
+        entry["budget_ms"] = round(budget["budget_ms"] * scale, 2) if budget and scale else None
+        entry["status"] = _status(entry)
+        entries.append(entry)
+    entries.sort(key=lambda entry: (-entry.get("cumulative_ms", float("inf")), entry["module"]))
+    counts: Dict[str, int] = {}
+    for entry in entries:
+        counts[entry["status"]] = counts.get(entry["status"], 0) + 1
+    failing = counts.get("over_budget", 0) + counts.get("error", 0)
+    return {
+        "generated_at": datetime.now(timezone.utc).replace(microsecond=0).isoformat(),
+        "python_version": platform.python_version(),
+        "repeat": repeat,
+        "reference_ms": reference_ms,
+        "status": "fail" if failing else "pass",
+        "counts": dict(sorted(counts.items())),
+        "modules": entries,
+    }
+
+
+def build_baseline(
+    measurements: Sequence[Mapping[str, Any]],
+    headroom: float = DEFAULT_HEADROOM,
+    reference_ms: float | None = None,
+) -> Dict[str, Any]:
+    """Return a baseline that budgets every successfully imported module in ``measurements``.
+
+    Each entry keeps the ``reference_ms`` measured in the same run, so a
+    partial refresh with ``--module`` stays comparable with older entries.
+    """
+
+    return {
+        "version": BASELINE_VERSION,
+        "python_version": platform.python_version(),
+        "headroom": headroom,
+        "min_slack_ms": MIN_SLACK_MS,
+        "modules": {
+            entry["module"]: {
+                "baseline_ms": entry["cumulative_ms"],
+                "budget_ms": budget_for(entry["cumulative_ms"], headroom),
+                "reference_ms": reference_ms,
+            }
+            for entry in sorted(measurements, key=lambda entry: entry["module"])
+            if "error" not in entry
+        },
+    }
+
+
+def write_json(payload: Mapping[str, Any], path: Path) -> None:
+    """Write a report or baseline as stable JSON."""
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+
+
+def _format_ms(value: float | None) -> str:
+    return "n/a" if value is None else f"{value:.1f}"
+
+
+def _markdown_lines(report: Mapping[str, Any]) -> Iterable[str]:
+    yield "# CLI Import Budget"
+    yield ""
+    yield f"Generated: `{report['generated_at']}`"
+    yield ""
+    yield f"- Status: **{report['status']}**"
+    yield f"- Python: `{report['python_version']}`"
+    yield f"- Runs per module: {report['repeat']} (fastest kept)"
+    yield f"- Reference import: {_format_ms(report['reference_ms'])} ms (budgets are scaled by it)"
+    for status, count in report["counts"].items():
+        yield f"- {status.replace('_', ' ').capitalize()}: {count}"
+    yield ""
+    yield "Cold import time is the cumulative `-X importtime` cost of `import app.cli.<module>` in a fresh interpreter."
+    yield "Each budget is scaled by this run's standard library reference import over the one recorded with it."
+    yield ""
+    yield "| Module | Cold import (ms) | Budget (ms) | Status | Heavy imports | Largest dependency |"
+    yield "| --- | ---: | ---: | --- | --- | --- |"
+    for entry in report["modules"]:
+        if "error" in entry:
+            yield f"| `{entry['module']}` | n/a | {_format_ms(entry['budget_ms'])} | error | | {entry['error']} |"
+            continue
+        heavy = ", ".join(f"`{name}`" for name in entry["heavy_imports"])
+        largest = entry["largest_dependencies"][:1]
+        dependency = f"`{largest[0]['module']}` ({_format_ms(largest[0]['cumulative_ms'])})" if largest else ""
+        yield (
+            f"| `{entry['module']}` | {_format_ms(entry['cumulative_ms'])} | {_format_ms(entry['budget_ms'])} "
+            f"| {entry['status']} | {heavy} | {dependency} |"
+        )
+    yield ""
+    yield "Refresh budgets after an intentional change with `python -m app.cli.import_budget --update-baseline`."
+
+
+def render_markdown(report: Mapping[str, Any]) -> str:
+    """Render the import budget report as Markdown."""
+
+    return "\n".join(_markdown_lines(report)) + "\n"
+
+
+def write_markdown(report: Mapping[str, Any], path: Path) -> None:
+    """Write the Markdown report."""
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(render_markdown(report), encoding="utf-8")
+
+
+def _positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError("must be at least 1")
+    return number
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Create the command-line parser."""
+
+    parser = argparse.ArgumentParser(description="Measure cold app.cli import times and compare them with a budget baseline.")
+    parser.add_argument(
+        "--artifact-dir",
+        type=Path,
+        default=DEFAULT_ARTIFACT_DIR,
+        help=f"Directory for default outputs. Default: {DEFAULT_ARTIFACT_DIR}",
+    )
+    parser.add_argument(
+        "--json-path",
+        type=Path,
+        help=f"Path for JSON output. Default: <artifact-dir>/{DEFAULT_JSON_NAME}",
+    )
+    parser.add_argument(
+        "--markdown-path",
+        type=Path,
+        help=f"Path for Markdown output. Default: <artifact-dir>/{DEFAULT_MARKDOWN_NAME}",
+    )
+    parser.add_argument("--no-json", action="store_true", help="Skip JSON output.")
+    parser.add_argument("--no-markdown", action="store_true", help="Skip Markdown output.")
+    parser.add_argument(
+        "--baseline",
+        type=Path,
+        default=DEFAULT_BASELINE_PATH,
+        help="Baseline JSON with per-module budgets. Default: benchmarks/import_budget.json",
+    )
+    parser.add_argument(
+        "--module",
+        action="append",
+        default=[],
+        metavar="NAME",
+        help="Measure only this module (for example app.cli.doctor); repeat for several.",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=_positive_int,
+        default=DEFAULT_REPEAT,
+        help=f"Fresh interpreters per module; the fastest run is kept. Default: {DEFAULT_REPEAT}",
+    )
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="Rewrite the baseline from this run instead of gating on it.",
+    )
+    parser.add_argument(
+        "--headroom",
+        type=float,
+        default=DEFAULT_HEADROOM,
+        help=(
+            "Budget allowance over the measured time when updating the baseline, as a fraction. "
+            f"Default: {DEFAULT_HEADROOM} (budget = 2x baseline, at least {MIN_SLACK_MS:g} ms above it)"
+        ),
+    )
+    parser.add_argument(
+        "--fail-on-budget",
+        action="store_true",
+        help="Exit with status 1 when a module exceeds its budget or fails to import.",
+    )
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """CLI entry point."""
+
+    args = build_parser().parse_args(argv)
+    baseline = load_baseline(args.baseline)
+    reference_ms = measure_reference(repeat=args.repeat)
+    measurements = [measure_module(module, repeat=args.repeat) for module in args.module or default_modules()]
+    json_path = args.json_path or args.artifact_dir / DEFAULT_JSON_NAME
+    markdown_path = args.markdown_path or args.artifact_dir / DEFAULT_MARKDOWN_NAME
+
+    if args.update_baseline:
+        updated = build_baseline(measurements, args.headroom, reference_ms)
+        if args.module:
+            updated["modules"] = {**baseline.get("modules", {}), **updated["modules"]}
+        write_json(updated, args.baseline)
+        print(f"Wrote import budget baseline for {len(updated['modules'])} module(s) to {args.baseline}")
+        baseline = updated
+    report = build_import_budget_report(measurements, baseline, repeat=args.repeat, reference_ms=reference_ms)
+    if not args.no_json:
+        write_json(report, json_path)
+        print(f"Wrote import budget JSON to {json_path}")
+    if not args.no_markdown:
+        write_markdown(report, markdown_path)
+        print(f"Wrote import budget Markdown to {markdown_path}")
+    if args.no_json and args.no_markdown:
+        print("No outputs requested; remove --no-json or --no-markdown to write reports.")
+
+    if args.fail_on_budget and report["status"] == "fail":
+        for entry in report["modules"]:
+            if entry["status"] in {"over_budget", "error"}:
+                detail = entry.get("error") or f"{_format_ms(entry['cumulative_ms'])} ms > {_format_ms(entry['budget_ms'])} ms"
+                print(f"Import budget exceeded: {entry['module']}: {detail}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
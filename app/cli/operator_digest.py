@@ -13,6 +13,7 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, Iterable, Mapping
 
+from app.cli.artifact_context import ArtifactContext, resolve_context
 from app.cli.artifact_manifest import DEFAULT_ARTIFACT_DIR
 
 DEFAULT_MARKDOWN_NAME = "operator-digest.md"
@@ -29,9 +30,9 @@ STATUS_LABELS = {
 }
 
 
-def _load_json(path: Path) -> Dict[str, Any]:
+def _load_json(path: Path, context: ArtifactContext | None = None) -> Dict[str, Any]:
     try:
-        data = json.loads(path.read_text(encoding="utf-8"))
+        data = resolve_context(context).load_json(path)
     except (FileNotFoundError, json.JSONDecodeError, OSError):
         return {}
     return data if isinstance(data, dict) else {}
@@ -62,14 +63,16 @@ def _first_nonempty(*values: Any, default: str = "make verify") -> str:
 def build_operator_digest(
     artifact_dir: Path = DEFAULT_ARTIFACT_DIR,
     generated_at: datetime | None = None,
+    context: ArtifactContext | None = None,
 ) -> Dict[str, Any]:
     """Build deterministic operator-facing digest data from local artifacts."""
 
+    context = resolve_context(context)
     generated_at = generated_at or datetime.now(timezone.utc).replace(microsecond=0)
-    health = _load_json(artifact_dir / "release-health.json")
-    manifest = _load_json(artifact_dir / "artifact-manifest.json")
-    triage = _load_json(artifact_dir / "triage-summary.json")
-    handoff = _load_json(artifact_dir / "reviewer-handoff.json")
+    health = _load_json(artifact_dir / "release-health.json", context)
+    manifest = _load_json(artifact_dir / "artifact-manifest.json", context)
+    triage = _load_json(artifact_dir / "triage-summary.json", context)
+    handoff = _load_json(artifact_dir / "reviewer-handoff.json", context)
 
     health_status = str(health.get("status") or "unknown")
     review_status = str(handoff.get("review_status") or triage.get("status") or health_status)
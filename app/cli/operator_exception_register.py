@@ -14,6 +14,8 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, Iterable, Mapping, Sequence
 
+from app.cli.artifact_context import ArtifactContext, resolve_context
+
 DEFAULT_ARTIFACT_DIR = Path("ci_artifacts")
 DEFAULT_MARKDOWN_NAME = "operator-exception-register.md"
 DEFAULT_JSON_NAME = "operator-exception-register.json"
@@ -55,9 +57,9 @@ OWNER_HINTS: Sequence[tuple[str, str]] = (
 )
 
 
-def _load_json(path: Path) -> tuple[Mapping[str, Any], bool, str | None]:
+def _load_json(path: Path, context: ArtifactContext | None = None) -> tuple[Mapping[str, Any], bool, str | None]:
     try:
-        payload = json.loads(path.read_text(encoding="utf-8"))
+        payload = resolve_context(context).load_json(path)
     except FileNotFoundError:
         return {}, False, "missing"
     except json.JSONDecodeError as exc:
@@ -164,9 +166,14 @@ def _next_action(severity: str, kind: str, artifact_path: str) -> str:
     return "Record reviewer disposition and keep the item attached to the handoff bundle."
 
 
-def _collect_entries(source: str, filename: str, artifact_dir: Path) -> list[Dict[str, Any]]:
+def _collect_entries(
+    source: str,
+    filename: str,
+    artifact_dir: Path,
+    context: ArtifactContext | None = None,
+) -> list[Dict[str, Any]]:
     path = artifact_dir / filename
-    payload, present, error = _load_json(path)
+    payload, present, error = _load_json(path, context)
     status = _status(payload, present=present, error=error)
     entries: list[Dict[str, Any]] = []
     counter = 1
@@ -243,13 +250,15 @@ def _overall_status(entries: Sequence[Mapping[str, Any]]) -> str:
 def build_exception_register(
     artifact_dir: Path = DEFAULT_ARTIFACT_DIR,
     generated_at: datetime | None = None,
+    context: ArtifactContext | None = None,
 ) -> Dict[str, Any]:
     """Build a deterministic exception register from generated diagnostics."""
 
+    context = resolve_context(context)
     generated_at = generated_at or datetime.now(timezone.utc).replace(microsecond=0)
     entries: list[Dict[str, Any]] = []
     for source, filename in INPUTS.items():
-        entries.extend(_collect_entries(source, filename, artifact_dir))
+        entries.extend(_collect_entries(source, filename, artifact_dir, context))
     counts = _counts(entries)
     status = _overall_status(entries)
     return {
@@ -14,6 +14,8 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Mapping, Sequence
 
+from app.cli.artifact_context import ArtifactContext, resolve_context
+
 DEFAULT_ARTIFACT_DIR = Path("ci_artifacts")
 DEFAULT_HEALTH_NAME = "release-health.json"
 DEFAULT_MANIFEST_NAME = "artifact-manifest.json"
@@ -82,11 +84,11 @@ KNOWN_ARTIFACT_TARGETS: Dict[str, str] = {
 }
 
 
-def _load_json(path: Path, fallback: Any) -> Any:
+def _load_json(path: Path, fallback: Any, context: ArtifactContext | None = None) -> Any:
     if not path.exists():
         return fallback
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
+        return resolve_context(context).load_json(path)
     except json.JSONDecodeError:
         return fallback
 
@@ -301,6 +303,7 @@ def build_parser() -> argparse.ArgumentParser:
 
 def main(argv: Sequence[str] | None = None) -> int:
     args = build_parser().parse_args(argv)
+    context = resolve_context()
     artifact_dir = args.artifact_dir
     health_path = args.health_json or artifact_dir / DEFAULT_HEALTH_NAME
     manifest_path = args.manifest_json or artifact_dir / DEFAULT_MANIFEST_NAME
@@ -308,11 +311,11 @@ def main(argv: Sequence[str] | None = None) -> int:
     markdown_path = args.markdown_path or artifact_dir / DEFAULT_MARKDOWN_NAME
     json_path = None if args.no_json else (args.json_path or artifact_dir / DEFAULT_JSON_NAME)
 
-    health_results = _coerce_results(_load_json(health_path, []))
-    manifest = _load_json(manifest_path, {"file_count": 0, "missing_expected": []})
+    health_results = _coerce_results(_load_json(health_path, [], context))
+    manifest = _load_json(manifest_path, {"file_count": 0, "missing_expected": []}, context)
     if not isinstance(manifest, Mapping):
         manifest = {"file_count": 0, "missing_expected": []}
-    triage_summary = _load_json(triage_path, {"status": "unknown", "recommended_actions": []})
+    triage_summary = _load_json(triage_path, {"status": "unknown", "recommended_actions": []}, context)
     if not isinstance(triage_summary, Mapping):
         triage_summary = {"status": "unknown", "recommended_actions": []}
 
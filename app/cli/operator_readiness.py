@@ -14,6 +14,8 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Mapping, Sequence
 
+from app.cli.artifact_context import ArtifactContext, resolve_context
+
 DEFAULT_ARTIFACT_DIR = Path("ci_artifacts")
 DEFAULT_MARKDOWN_NAME = "operator-readiness.md"
 DEFAULT_JSON_NAME = "operator-readiness.json"
@@ -59,9 +61,9 @@ STATUS_WEIGHTS: Mapping[str, int] = {
 }
 
 
-def _load_json(path: Path, fallback: Any) -> Any:
+def _load_json(path: Path, fallback: Any, context: ArtifactContext | None = None) -> Any:
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
+        return resolve_context(context).load_json(path)
     except (FileNotFoundError, json.JSONDecodeError, OSError):
         return fallback
 
@@ -140,17 +142,19 @@ def build_readiness_brief(
     health_path: Path | None = None,
     manifest_path: Path | None = None,
     triage_path: Path | None = None,
+    context: ArtifactContext | None = None,
 ) -> Dict[str, Any]:
     """Build a deterministic operator readiness brief from generated artifacts."""
 
+    context = resolve_context(context)
     generated_at = generated_at or datetime.now(timezone.utc).replace(microsecond=0)
     health_path = health_path or artifact_dir / DEFAULT_HEALTH_NAME
     manifest_path = manifest_path or artifact_dir / DEFAULT_MANIFEST_NAME
     triage_path = triage_path or artifact_dir / DEFAULT_TRIAGE_NAME
 
-    health = _load_json(health_path, [])
-    manifest = _load_json(manifest_path, {"missing_expected": [], "file_count": 0})
-    triage = _load_json(triage_path, {})
+    health = _load_json(health_path, [], context)
+    manifest = _load_json(manifest_path, {"missing_expected": [], "file_count": 0}, context)
+    triage = _load_json(triage_path, {}, context)
 
     health_results = _health_results(health)
     health_counts = _status_counts(health_results)
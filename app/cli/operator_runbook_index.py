@@ -382,8 +382,8 @@ def build_parser() -> argparse.ArgumentParser:
     return parser
 
 
-def main() -> int:
-    args = build_parser().parse_args()
+def main(argv: Sequence[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
     index = build_runbook_index(args.artifact_dir)
     markdown_path = args.markdown_path or args.artifact_dir / DEFAULT_MARKDOWN_NAME
     json_path = args.json_path or args.artifact_dir / DEFAULT_JSON_NAME
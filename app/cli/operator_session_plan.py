@@ -13,6 +13,8 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Mapping, Sequence
 
+from app.cli.artifact_context import ArtifactContext, resolve_context
+
 DEFAULT_ARTIFACT_DIR = Path("ci_artifacts")
 DEFAULT_MARKDOWN_NAME = "operator-session-plan.md"
 DEFAULT_JSON_NAME = "operator-session-plan.json"
@@ -29,11 +31,11 @@ STATUS_PRIORITY = {
 }
 
 
-def _load_json(path: Path, fallback: Any) -> Any:
+def _load_json(path: Path, fallback: Any, context: ArtifactContext | None = None) -> Any:
     if not path.exists():
         return fallback
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
+        return resolve_context(context).load_json(path)
     except json.JSONDecodeError:
         return fallback
 
@@ -302,6 +304,7 @@ def build_parser() -> argparse.ArgumentParser:
 
 def main(argv: Sequence[str] | None = None) -> int:
     args = build_parser().parse_args(argv)
+    context = resolve_context()
     artifact_dir = args.artifact_dir
     triage_path = args.triage_json or artifact_dir / DEFAULT_TRIAGE_NAME
     release_notes_path = args.release_notes_json or artifact_dir / DEFAULT_RELEASE_NOTES_NAME
@@ -310,9 +313,9 @@ def main(argv: Sequence[str] | None = None) -> int:
     json_path = None if args.no_json else (args.json_path or artifact_dir / DEFAULT_JSON_NAME)
 
     plan = build_operator_session_plan(
-        triage_summary=_load_json(triage_path, {"status": "unknown", "health_summary": {}, "recommended_actions": []}),
-        release_notes=_load_json(release_notes_path, {}),
-        reviewer_handoff=_load_json(handoff_path, {}),
+        triage_summary=_load_json(triage_path, {"status": "unknown", "health_summary": {}, "recommended_actions": []}, context),
+        release_notes=_load_json(release_notes_path, {}, context),
+        reviewer_handoff=_load_json(handoff_path, {}, context),
         max_tasks=max(1, args.max_tasks),
     )
     write_outputs(plan, markdown_path, json_path)
@@ -6,8 +6,9 @@ import argparse
 import json
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Mapping
+from typing import Any, Dict, Iterable, List, Mapping, Sequence
 
+from app.cli.artifact_context import ArtifactContext, resolve_context
 from app.cli.artifact_manifest import DEFAULT_ARTIFACT_DIR
 
 DEFAULT_MARKDOWN_NAME = "operator-status-board.md"
@@ -26,9 +27,9 @@ WARNING_WORDS = {"warning", "warnings", "review_warnings", "needs_review"}
 BLOCKED_WORDS = {"blocked", "fail", "failed", "needs_attention", "error", "unhealthy"}
 
 
-def _load_json(path: Path) -> Dict[str, Any] | None:
+def _load_json(path: Path, context: ArtifactContext | None = None) -> Dict[str, Any] | None:
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
+        return resolve_context(context).load_json(path)
     except (FileNotFoundError, json.JSONDecodeError, OSError):
         return None
 
@@ -175,16 +176,18 @@ def build_status_board(
     triage_path: Path | None = None,
     readiness_path: Path | None = None,
     gap_report_path: Path | None = None,
+    context: ArtifactContext | None = None,
 ) -> Dict[str, Any]:
     """Build a concise operator status board from generated diagnostics."""
 
-    manifest = _load_json(manifest_path or artifact_dir / "artifact-manifest.json")
-    handoff = _load_json(handoff_path or artifact_dir / "reviewer-handoff.json")
-    health = _load_json(health_path or artifact_dir / "release-health.json")
-    triage = _load_json(triage_path or artifact_dir / "triage-summary.json")
-    readiness = _load_json(readiness_path or artifact_dir / "operator-readiness.json")
-    gap_report = _load_json(gap_report_path or artifact_dir / "artifact-gap-report.json")
-    automation_plan = _load_json(artifact_dir / "automation-plan.json")
+    context = resolve_context(context)
+    manifest = _load_json(manifest_path or artifact_dir / "artifact-manifest.json", context)
+    handoff = _load_json(handoff_path or artifact_dir / "reviewer-handoff.json", context)
+    health = _load_json(health_path or artifact_dir / "release-health.json", context)
+    triage = _load_json(triage_path or artifact_dir / "triage-summary.json", context)
+    readiness = _load_json(readiness_path or artifact_dir / "operator-readiness.json", context)
+    gap_report = _load_json(gap_report_path or artifact_dir / "artifact-gap-report.json", context)
+    automation_plan = _load_json(artifact_dir / "automation-plan.json", context)
 
     files_by_path = _manifest_files(manifest)
     key_paths = [
@@ -353,8 +356,8 @@ def build_parser() -> argparse.ArgumentParser:
     return parser
 
 
-def main() -> int:
-    args = build_parser().parse_args()
+def main(argv: Sequence[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
     board = build_status_board(
         args.artifact_dir,
         manifest_path=args.manifest_path,
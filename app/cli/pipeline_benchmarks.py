@@ -0,0 +1,528 @@
+"""Benchmark diagnostics builders on synthetic artifact directories of increasing size.
+
+Each size gets a generated artifact directory: the standard bundle files plus
+nested ``runs/`` shards of realistic JSON detection records, Markdown analyst
+notes, and text logs. Every builder is timed with ``time.perf_counter`` (the
+fastest of ``--repeat`` runs) and then run once more under ``tracemalloc`` for
+its peak allocation, so tracing overhead never skews the timings. Results are
+compared with a baseline whose entries carry per-benchmark regression
+thresholds. Peak memory is always gated; wall-clock time only when the baseline
+was recorded on the same machine, since timings do not carry across hardware.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import hashlib
+import json
+import os
+import platform
+import random
+import shutil
+import tempfile
+import time
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Sequence
+
+from app.cli.analytical_framing_audit import build_analytical_framing_audit
+from app.cli.artifact_gap_report import build_gap_report
+from app.cli.artifact_manifest import DEFAULT_JSON_NAME as MANIFEST_JSON_NAME
+from app.cli.artifact_manifest import DEFAULT_MARKDOWN_NAME as MANIFEST_MARKDOWN_NAME
+from app.cli.artifact_manifest import EXPECTED_ARTIFACTS, build_manifest, stream_manifest
+from app.cli.artifact_manifest import write_json as write_manifest_json
+from app.cli.artifact_manifest import write_markdown as write_manifest_markdown
+from app.cli.artifact_provenance_ledger import build_provenance_ledger
+from app.cli.artifact_scan import scan_artifacts
+from app.cli.bundle_archive import export_archive
+from app.cli.bundle_diff import build_bundle_diff
+from app.cli.operator_digest import build_operator_digest
+from app.cli.reviewer_handoff import build_handoff
+
+DEFAULT_ARTIFACT_DIR = Path("ci_artifacts")
+DEFAULT_JSON_NAME = "pipeline-benchmarks.json"
+DEFAULT_MARKDOWN_NAME = "pipeline-benchmarks.md"
+REPOSITORY_ROOT = Path(__file__).resolve().parents[2]
+DEFAULT_BASELINE_PATH = REPOSITORY_ROOT / "benchmarks" / "pipeline_benchmarks.json"
+DEFAULT_SIZES = (100, 10_000, 100_000)
+DEFAULT_REPEAT = 1
+DEFAULT_SEED = 7
+FILES_PER_SHARD = 500
+BASELINE_VERSION = 1
+
+# Default regression thresholds written for new baseline entries. A benchmark
+# regresses when it exceeds baseline * ratio plus the absolute slack, which
+# keeps millisecond-scale runs on small trees from failing on noise.
+DEFAULT_MAX_TIME_RATIO = 1.5
+DEFAULT_MAX_MEMORY_RATIO = 1.25
+TIME_SLACK_SECONDS = 0.05
+MEMORY_SLACK_BYTES = 1024 * 1024
+
+_REGIONS = ("north-sector", "river-crossing", "east-ridge", "coastal-road", "southern-plain")
+_LABELS = ("vehicle", "convoy", "encampment", "supply-point", "unknown")
+_NOTE_PHRASES = (
+    "Synthetic analytical estimate with stated uncertainty; not operational guidance.",
+    "Confidence is moderate and the estimate should be reviewed against imagery timestamps.",
+    "Safe offline diagnostic note generated for scaling benchmarks.",
+    "Reviewer comment: the model definitely needs more labeled examples for this region.",
+)
+
+
+@dataclass(frozen=True)
+class Benchmark:
+    """One timed builder; ``run`` receives a prepared artifact directory."""
+
+    name: str
+    run: Callable[[Path], Any]
+
+
+def _write_manifest(artifact_dir: Path) -> None:
+    manifest = build_manifest(artifact_dir)
+    write_manifest_json(manifest, artifact_dir / MANIFEST_JSON_NAME)
+    write_manifest_markdown(manifest, artifact_dir / MANIFEST_MARKDOWN_NAME)
+
+
+def _stream_manifest(artifact_dir: Path) -> None:
+    stream_manifest(artifact_dir, artifact_dir / MANIFEST_JSON_NAME, artifact_dir / MANIFEST_MARKDOWN_NAME)
+
+
+def _scan_artifacts(artifact_dir: Path) -> None:
+    scan = scan_artifacts(artifact_dir)
+    scan.gap_report
+    scan.provenance_ledger
+
+
+def _diff_bundles(artifact_dir: Path) -> None:
+    manifest_path = artifact_dir / MANIFEST_JSON_NAME
+    build_bundle_diff(manifest_path, manifest_path)
+
+
+def _export_archive(artifact_dir: Path) -> None:
+    export_archive(artifact_dir, artifact_dir.parent / f"{artifact_dir.name}.zip")
+
+
+# Order matters: ``write_manifest`` leaves the manifest the later builders read.
+BENCHMARKS: tuple[Benchmark, ...] = (
+    Benchmark("build_manifest", build_manifest),
+    Benchmark("write_manifest", _write_manifest),
+    Benchmark("stream_manifest", _stream_manifest),
+    Benchmark("scan_artifacts", _scan_artifacts),
+    Benchmark("build_gap_report", build_gap_report),
+    Benchmark("build_provenance_ledger", build_provenance_ledger),
+    Benchmark("diff_bundles", _diff_bundles),
+    Benchmark("export_archive", _export_archive),
+    Benchmark("build_handoff", build_handoff),
+    Benchmark("build_operator_digest", build_operator_digest),
+    Benchmark("build_analytical_framing_audit", build_analytical_framing_audit),
+)
+
+
+def _write_json(path: Path, payload: Any) -> None:
+    path.write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+
+
+def _detection_record(rng: random.Random, index: int) -> Dict[str, Any]:
+    return {
+        "record_id": f"synthetic-{index:07d}",
+        "region": rng.choice(_REGIONS),
+        "observed_at": f"2024-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}T{rng.randint(0, 23):02d}:00:00Z",
+        "detections": [
+            {
+                "label": rng.choice(_LABELS),
+                "confidence": round(rng.uniform(0.2, 0.95), 3),
+                "bbox": [rng.randint(0, 900), rng.randint(0, 900), rng.randint(10, 120), rng.randint(10, 120)],
+            }
+            for _ in range(rng.randint(1, 6))
+        ],
+        "estimate": {"troop_count": rng.randint(0, 400), "interval": [rng.randint(0, 50), rng.randint(50, 500)]},
+        "provenance": "synthetic",
+    }
+
+
+def _bundle_file(name: str) -> str:
+    if name == "release-health.json":
+        return json.dumps([{"detail": "synthetic", "name": "imports", "status": "pass"}], indent=2, sort_keys=True) + "\n"
+    if name.endswith(".json"):
+        return json.dumps({"status": "pass", "artifact": name, "provenance": "synthetic"}, indent=2, sort_keys=True) + "\n"
+    return f"# {name}\n\nSynthetic analytical estimate for benchmarking; uncertainty is stated and it is not operational.\n"
+
+
+def generate_artifact_tree(root: Path, file_count: int, seed: int = DEFAULT_SEED) -> None:
+    """Write a deterministic synthetic artifact directory with ``file_count`` files under ``root``."""
+
+    rng = random.Random(seed)
+    root.mkdir(parents=True, exist_ok=True)
+    bundle_names = [name for name in EXPECTED_ARTIFACTS if not name.startswith("artifact-manifest")][:file_count]
+    for name in bundle_names:
+        path = root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(_bundle_file(name), encoding="utf-8")
+    for index in range(file_count - len(bundle_names)):
+        shard = root / "runs" / f"shard-{index // FILES_PER_SHARD:04d}"
+        if index % FILES_PER_SHARD == 0:
+            shard.mkdir(parents=True, exist_ok=True)
+        kind = index % 10
+        if kind < 7:
+            _write_json(shard / f"record-{index:07d}.json", _detection_record(rng, index))
+        elif kind < 9:
+            lines = [f"# Analyst note {index}", ""] + [rng.choice(_NOTE_PHRASES) for _ in range(rng.randint(3, 12))]
+            (shard / f"note-{index:07d}.md").write_text("\n".join(lines) + "\n", encoding="utf-8")
+        else:
+            lines = [f"step {step}: processed {rng.randint(1, 999)} synthetic frames" for step in range(rng.randint(5, 30))]
+            (shard / f"log-{index:07d}.txt").write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+@contextlib.contextmanager
+def artifact_tree(file_count: int, work_dir: Path | None = None, seed: int = DEFAULT_SEED) -> Iterator[Path]:
+    """Yield a synthetic tree, reusing one under ``work_dir`` when its stamp matches."""
+
+    if work_dir is None:
+        with tempfile.TemporaryDirectory(prefix="pipeline-benchmarks-") as temp_dir:
+            root = Path(temp_dir) / f"files-{file_count}"
+            generate_artifact_tree(root, file_count, seed)
+            yield root
+        return
+    root = work_dir / f"files-{file_count}"
+    stamp_path = work_dir / f"files-{file_count}.json"
+    stamp = {"file_count": file_count, "seed": seed, "version": BASELINE_VERSION}
+    try:
+        current = json.loads(stamp_path.read_text(encoding="utf-8")) == stamp
+    except (OSError, ValueError):
+        current = False
+    if not current:
+        shutil.rmtree(root, ignore_errors=True)
+        generate_artifact_tree(root, file_count, seed)
+        work_dir.mkdir(parents=True, exist_ok=True)
+        _write_json(stamp_path, stamp)
+    yield root
+
+
+def measure(benchmark: Benchmark, artifact_dir: Path, repeat: int = DEFAULT_REPEAT) -> Dict[str, Any]:
+    """Return the fastest wall time of ``repeat`` runs and the peak traced allocation of one more."""
+
+    timings = []
+    for _ in range(max(1, repeat)):
+        started = time.perf_counter()
+        benchmark.run(artifact_dir)
+        timings.append(time.perf_counter() - started)
+    tracing = tracemalloc.is_tracing()
+    if not tracing:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    baseline_bytes = tracemalloc.get_traced_memory()[0]
+    try:
+        benchmark.run(artifact_dir)
+        peak_bytes = tracemalloc.get_traced_memory()[1] - baseline_bytes
+    finally:
+        if not tracing:
+            tracemalloc.stop()
+    return {"seconds": round(min(timings), 6), "peak_bytes": max(0, peak_bytes)}
+
+
+def benchmark_id(name: str, file_count: int) -> str:
+    """Return the stable report and baseline key for one builder at one tree size."""
+
+    return f"{name}[{file_count}]"
+
+
+def run_benchmarks(
+    sizes: Sequence[int] = DEFAULT_SIZES,
+    benchmarks: Sequence[Benchmark] = BENCHMARKS,
+    repeat: int = DEFAULT_REPEAT,
+    work_dir: Path | None = None,
+    seed: int = DEFAULT_SEED,
+) -> List[Dict[str, Any]]:
+    """Generate a tree per size and measure every benchmark on it, in order."""
+
+    results = []
+    for file_count in sizes:
+        with artifact_tree(file_count, work_dir, seed) as artifact_dir:
+            for benchmark in benchmarks:
+                results.append(
+                    {
+                        "id": benchmark_id(benchmark.name, file_count),
+                        "builder": benchmark.name,
+                        "file_count": file_count,
+                        **measure(benchmark, artifact_dir, repeat),
+                    }
+                )
+    return results
+
+
+def machine_fingerprint() -> str:
+    """Return a short digest of the host, CPU, and interpreter that timings depend on."""
+
+    parts = [
+        platform.node(),
+        platform.machine(),
+        platform.processor(),
+        str(os.cpu_count()),
+        platform.python_implementation(),
+        platform.python_version(),
+    ]
+    return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()[:16]
+
+
+def load_baseline(path: Path) -> Dict[str, Any]:
+    """Return the baseline document, or an empty one when ``path`` does not exist."""
+
+    if not path.exists():
+        return {"version": BASELINE_VERSION, "benchmarks": {}}
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def _compare(result: Mapping[str, Any], baseline: Mapping[str, Any] | None, gate_time: bool) -> Dict[str, Any]:
+    if not baseline:
+        return {"status": "new", "time_limit_seconds": None, "memory_limit_bytes": None}
+    time_limit = baseline["seconds"] * baseline.get("max_time_ratio", DEFAULT_MAX_TIME_RATIO) + TIME_SLACK_SECONDS
+    memory_limit = baseline["peak_bytes"] * baseline.get("max_memory_ratio", DEFAULT_MAX_MEMORY_RATIO) + MEMORY_SLACK_BYTES
+    regressions = []
+    if gate_time and result["seconds"] > time_limit:
+        regressions.append("time")
+    if result["peak_bytes"] > memory_limit:
+        regressions.append("memory")
+    return {
+        "status": "regressed" if regressions else "ok",
+        "regressions": regressions,
+        "time_ratio": round(result["seconds"] / baseline["seconds"], 3) if baseline["seconds"] else None,
+        "memory_ratio": round(result["peak_bytes"] / baseline["peak_bytes"], 3) if baseline["peak_bytes"] else None,
+        "time_limit_seconds": round(time_limit, 6) if gate_time else None,
+        "memory_limit_bytes": int(memory_limit),
+    }
+
+
+def build_benchmark_report(
+    results: Sequence[Mapping[str, Any]],
+    baseline: Mapping[str, Any] | None = None,
+    repeat: int = DEFAULT_REPEAT,
+) -> Dict[str, Any]:
+    """Compare measured results with their baseline entries and thresholds.
+
+    Time thresholds apply only when ``baseline`` records this machine's
+    :func:`machine_fingerprint`; memory thresholds always apply.
+    """
+
+    entries = (baseline or {}).get("benchmarks", {})
+    time_gated = (baseline or {}).get("machine") == machine_fingerprint()
+    benchmarks = [{**result, **_compare(result, entries.get(result["id"]), time_gated)} for result in results]
+    counts: Dict[str, int] = {}
+    for entry in benchmarks:
+        counts[entry["status"]] = counts.get(entry["status"], 0) + 1
+    return {
+        "generated_at": datetime.now(timezone.utc).replace(microsecond=0).isoformat(),
+        "python_version": platform.python_version(),
+        "platform": platform.platform(terse=True),
+        "repeat": repeat,
+        "time_gated": time_gated,
+        "status": "fail" if counts.get("regressed") else "pass",
+        "counts": dict(sorted(counts.items())),
+        "benchmarks": benchmarks,
+    }
+
+
+def build_baseline(
+    results: Sequence[Mapping[str, Any]],
+    previous: Mapping[str, Any] | None = None,
+    portable: bool = False,
+) -> Dict[str, Any]:
+    """Return a baseline from ``results`` that keeps hand-tuned thresholds from ``previous``.
+
+    A ``portable`` baseline omits the machine fingerprint, so it gates only memory.
+    """
+
+    entries = dict((previous or {}).get("benchmarks", {}))
+    for result in results:
+        old = entries.get(result["id"], {})
+        entries[result["id"]] = {
+            "seconds": result["seconds"],
+            "peak_bytes": result["peak_bytes"],
+            "max_time_ratio": old.get("max_time_ratio", DEFAULT_MAX_TIME_RATIO),
+            "max_memory_ratio": old.get("max_memory_ratio", DEFAULT_MAX_MEMORY_RATIO),
+        }
+    baseline: Dict[str, Any] = {"version": BASELINE_VERSION, "python_version": platform.python_version()}
+    if not portable:
+        baseline["machine"] = machine_fingerprint()
+    baseline["benchmarks"] = dict(sorted(entries.items()))
+    return baseline
+
+
+def write_json(payload: Mapping[str, Any], path: Path) -> None:
+    """Write a report or baseline as stable JSON."""
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    _write_json(path, payload)
+
+
+def _format_bytes(size: int | None) -> str:
+    if size is None:
+        return "n/a"
+    return f"{size / (1024 * 1024):.1f} MiB"
+
+
+def _format_ratio(value: float | None) -> str:
+    return "n/a" if value is None else f"{value:.2f}x"
+
+
+def _markdown_lines(report: Mapping[str, Any]) -> Iterable[str]:
+    yield "# Pipeline Benchmarks"
+    yield ""
+    yield f"Generated: `{report['generated_at']}`"
+    yield ""
+    yield f"- Status: **{report['status']}**"
+    yield f"- Python: `{report['python_version']}` on `{report['platform']}`"
+    yield f"- Timed runs per benchmark: {report['repeat']} (fastest kept), plus one `tracemalloc` run for peak memory"
+    if report["time_gated"]:
+        yield "- Gates: time and peak memory (baseline recorded on this machine)"
+    else:
+        yield "- Gates: peak memory only (baseline recorded on another machine; time ratios are informational)"
+    for status, count in report["counts"].items():
+        yield f"- {status.capitalize()}: {count}"
+    yield ""
+    yield "| Benchmark | Files | Seconds | vs baseline | Peak memory | vs baseline | Status |"
+    yield "| --- | ---: | ---: | ---: | ---: | ---: | --- |"
+    for entry in report["benchmarks"]:
+        status = entry["status"] if not entry.get("regressions") else f"regressed ({', '.join(entry['regressions'])})"
+        yield (
+            f"| `{entry['builder']}` | {entry['file_count']} | {entry['seconds']:.3f} | {_format_ratio(entry.get('time_ratio'))} "
+            f"| {_format_bytes(entry['peak_bytes'])} | {_format_ratio(entry.get('memory_ratio'))} | {status} |"
+        )
+    yield ""
+    yield "Record a same-machine baseline with `make benchmarks-baseline` to gate time as well (see `docs/pipeline_benchmarks.md`)."
+
+
+def render_markdown(report: Mapping[str, Any]) -> str:
+    """Render the benchmark report as Markdown."""
+
+    return "\n".join(_markdown_lines(report)) + "\n"
+
+
+def write_markdown(report: Mapping[str, Any], path: Path) -> None:
+    """Write the Markdown report."""
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(render_markdown(report), encoding="utf-8")
+
+
+def _positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError("must be at least 1")
+    return number
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Create the command-line parser."""
+
+    parser = argparse.ArgumentParser(
+        description="Time diagnostics builders and record peak memory on synthetic artifact directories."
+    )
+    parser.add_argument(
+        "--artifact-dir",
+        type=Path,
+        default=DEFAULT_ARTIFACT_DIR,
+        help=f"Directory for default outputs. Default: {DEFAULT_ARTIFACT_DIR}",
+    )
+    parser.add_argument(
+        "--json-path",
+        type=Path,
+        help=f"Path for JSON output. Default: <artifact-dir>/{DEFAULT_JSON_NAME}",
+    )
+    parser.add_argument(
+        "--markdown-path",
+        type=Path,
+        help=f"Path for Markdown output. Default: <artifact-dir>/{DEFAULT_MARKDOWN_NAME}",
+    )
+    parser.add_argument("--no-json", action="store_true", help="Skip JSON output.")
+    parser.add_argument("--no-markdown", action="store_true", help="Skip Markdown output.")
+    parser.add_argument(
+        "--size",
+        dest="sizes",
+        action="append",
+        type=_positive_int,
+        metavar="FILES",
+        help="Synthetic tree size in files; repeat for several. Default: 100, 10000, and 100000.",
+    )
+    parser.add_argument(
+        "--only",
+        action="append",
+        default=[],
+        metavar="BUILDER",
+        help="Run only this builder benchmark; repeat for several.",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=_positive_int,
+        default=DEFAULT_REPEAT,
+        help=f"Timed runs per benchmark; the fastest is kept. Default: {DEFAULT_REPEAT}",
+    )
+    parser.add_argument(
+        "--work-dir",
+        type=Path,
+        help="Keep generated trees here and reuse them across runs instead of a temporary directory.",
+    )
+    parser.add_argument(
+        "--baseline",
+        type=Path,
+        default=DEFAULT_BASELINE_PATH,
+        help="Baseline JSON with per-benchmark results and thresholds. Default: benchmarks/pipeline_benchmarks.json",
+    )
+    parser.add_argument(
+        "--update-baseline",
+        action="store_true",
+        help="Record this run in the baseline, keeping existing per-benchmark thresholds.",
+    )
+    parser.add_argument(
+        "--portable",
+        action="store_true",
+        help="With --update-baseline, omit the machine fingerprint so other machines gate only memory against it.",
+    )
+    parser.add_argument(
+        "--fail-on-regression",
+        action="store_true",
+        help="Exit with status 1 when a benchmark exceeds its baseline threshold (time only for a same-machine baseline).",
+    )
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """CLI entry point."""
+
+    args = build_parser().parse_args(argv)
+    known = {benchmark.name: benchmark for benchmark in BENCHMARKS}
+    unknown = [name for name in args.only if name not in known]
+    if unknown:
+        print(f"Unknown benchmark(s): {', '.join(unknown)}. Choose from: {', '.join(known)}")
+        return 2
+    benchmarks = [benchmark for benchmark in BENCHMARKS if not args.only or benchmark.name in args.only]
+    baseline = load_baseline(args.baseline)
+    results = run_benchmarks(args.sizes or DEFAULT_SIZES, benchmarks, args.repeat, args.work_dir)
+    json_path = args.json_path or args.artifact_dir / DEFAULT_JSON_NAME
+    markdown_path = args.markdown_path or args.artifact_dir / DEFAULT_MARKDOWN_NAME
+
+    if args.update_baseline:
+        baseline = build_baseline(results, baseline, portable=args.portable)
+        write_json(baseline, args.baseline)
+        print(f"Wrote benchmark baseline with {len(baseline['benchmarks'])} benchmark(s) to {args.baseline}")
+    report = build_benchmark_report(results, baseline, args.repeat)
+    if not args.no_json:
+        write_json(report, json_path)
+        print(f"Wrote pipeline benchmark JSON to {json_path}")
+    if not args.no_markdown:
+        write_markdown(report, markdown_path)
+        print(f"Wrote pipeline benchmark Markdown to {markdown_path}")
+    if args.no_json and args.no_markdown:
+        print("No outputs requested; remove --no-json or --no-markdown to write reports.")
+
+    if args.fail_on_regression and report["status"] == "fail":
+        for entry in report["benchmarks"]:
+            if entry["status"] == "regressed":
+                print(f"Benchmark regressed: {entry['id']} ({', '.join(entry['regressions'])})")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
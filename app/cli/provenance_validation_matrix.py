@@ -15,6 +15,8 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Mapping, Sequence
 
+from app.cli.artifact_context import ArtifactContext, resolve_context
+
 DEFAULT_ARTIFACT_DIR = Path("ci_artifacts")
 DEFAULT_MARKDOWN_NAME = "provenance-validation-matrix.md"
 DEFAULT_JSON_NAME = "provenance-validation-matrix.json"
@@ -59,9 +61,9 @@ REQUIRED_SIGNALS: Mapping[str, Mapping[str, str]] = {
 }
 
 
-def _load_json(path: Path, fallback: Any) -> Any:
+def _load_json(path: Path, fallback: Any, context: ArtifactContext | None = None) -> Any:
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
+        return resolve_context(context).load_json(path)
     except (FileNotFoundError, json.JSONDecodeError, OSError):
         return fallback
 
@@ -141,14 +143,16 @@ def build_provenance_validation_matrix(
     ledger: Mapping[str, Any] | None = None,
     evidence: Mapping[str, Any] | None = None,
     receipt: Mapping[str, Any] | None = None,
+    context: ArtifactContext | None = None,
 ) -> Dict[str, Any]:
     """Build a matrix that links required handoff signals to generated artifacts."""
 
+    context = resolve_context(context)
     generated_at = generated_at or datetime.now(timezone.utc).replace(microsecond=0)
-    manifest = _as_mapping(manifest if manifest is not None else _load_json(artifact_dir / "artifact-manifest.json", {}))
-    ledger = _as_mapping(ledger if ledger is not None else _load_json(artifact_dir / "artifact-provenance-ledger.json", {}))
-    evidence = _as_mapping(evidence if evidence is not None else _load_json(artifact_dir / "evidence-checklist.json", {}))
-    receipt = _as_mapping(receipt if receipt is not None else _load_json(artifact_dir / "handoff-validation-receipt.json", {}))
+    manifest = _as_mapping(manifest if manifest is not None else _load_json(artifact_dir / "artifact-manifest.json", {}, context))
+    ledger = _as_mapping(ledger if ledger is not None else _load_json(artifact_dir / "artifact-provenance-ledger.json", {}, context))
+    evidence = _as_mapping(evidence if evidence is not None else _load_json(artifact_dir / "evidence-checklist.json", {}, context))
+    receipt = _as_mapping(receipt if receipt is not None else _load_json(artifact_dir / "handoff-validation-receipt.json", {}, context))
 
     manifest_entries = _manifest_by_path(manifest)
     ledger_entries = _ledger_by_path(ledger)
@@ -8,6 +8,10 @@ optionally launch the API. It does not run detection or prediction by itself.
 from __future__ import annotations
 
 import argparse
+import hashlib
+import json
+import os
+import platform
 import subprocess
 import sys
 from dataclasses import dataclass
@@ -23,6 +27,10 @@ REQUIREMENTS_BY_PROFILE = {
     "full": Path("requirements-optional.txt"),
 }
 
+DEFAULT_STAMP_PATH = Path(".quickstart-stamp.json")
+WHEELHOUSE_STAMP_NAME = ".wheelhouse.json"
+_INCLUDE_OPTIONS = ("-r", "--requirement", "-c", "--constraint")
+
 
 @dataclass(frozen=True)
 class QuickstartOptions:
@@ -37,6 +45,12 @@ class QuickstartOptions:
     launch_api: bool = False
     host: str = "127.0.0.1"
     port: int = 8000
+    cache_path: Path | None = None
+    cache_ttl: float = doctor.DEFAULT_CACHE_TTL
+    fresh_checks: bool = False
+    stamp_path: Path | None = None
+    force_install: bool = False
+    wheelhouse: Path | None = None
 
 
 def _run_command(command: Sequence[str], label: str) -> None:
@@ -55,15 +69,140 @@ def _requirements_for_profile(profile: str) -> Path:
         raise ValueError(f"Unknown install profile {profile!r}; choose one of: {valid}") from exc
 
 
+def _included_requirements(path: Path) -> list[Path]:
+    """Return ``path`` and the files it pulls in with ``-r``/``-c``, depth first."""
+
+    files: list[Path] = []
+
+    def visit(current: Path) -> None:
+        if current in files:
+            return
+        files.append(current)
+        if not current.is_file():
+            return
+        for line in current.read_text(encoding="utf-8").splitlines():
+            option, _, target = line.strip().partition(" ")
+            if option in _INCLUDE_OPTIONS and target.strip():
+                visit(current.parent / target.strip())
+            elif option.startswith(("--requirement=", "--constraint=")):
+                visit(current.parent / option.partition("=")[2])
+
+    visit(path)
+    return files
+
+
+def requirements_digest(requirements: Path) -> str:
+    """Return a SHA-256 digest of a requirements file and every file it includes."""
+
+    digest = hashlib.sha256()
+    for path in _included_requirements(requirements):
+        digest.update(path.as_posix().encode("utf-8") + b"\0")
+        digest.update(path.read_bytes() if path.is_file() else b"missing")
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def install_key(requirements: Path) -> str:
+    """Return the stamp key for installing ``requirements`` into this interpreter."""
+
+    identity = f"{requirements_digest(requirements)}\n{sys.executable}\n{sys.prefix}\n{sys.version}"
+    return hashlib.sha256(identity.encode("utf-8")).hexdigest()
+
+
+def wheelhouse_key(requirements: Path) -> str:
+    """Return the key for wheels built from ``requirements``.
+
+    Wheels depend on the Python version and platform, not on the interpreter
+    path, so a fresh virtual environment can reuse them.
+    """
+
+    identity = f"{requirements_digest(requirements)}\n{sys.implementation.cache_tag}\n{platform.machine()}\n{sys.platform}"
+    return hashlib.sha256(identity.encode("utf-8")).hexdigest()
+
+
+def _read_json(path: Path) -> dict:
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return payload if isinstance(payload, dict) else {}
+
+
+def _write_json(payload: dict, path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    temporary.write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    os.replace(temporary, path)
+
+
+def install_is_current(stamp_path: Path, profile: str, key: str) -> bool:
+    """Return whether ``profile`` was installed with ``key`` and is still installed.
+
+    The distributions recorded at install time must still be present, so a
+    recreated virtual environment at the same path is not mistaken for the
+    old one.
+    """
+
+    entry = _read_json(stamp_path).get("profiles", {}).get(profile)
+    if not isinstance(entry, dict) or entry.get("key") != key:
+        return False
+    return set(entry.get("distributions", [])) <= set(doctor._installed_distributions())
+
+
+def record_install(stamp_path: Path, profile: str, key: str, requirements: Path) -> None:
+    """Record a successful install of ``profile`` in the stamp file."""
+
+    stamp = _read_json(stamp_path)
+    profiles = stamp.get("profiles") if isinstance(stamp.get("profiles"), dict) else {}
+    profiles[profile] = {
+        "key": key,
+        "requirements": requirements.as_posix(),
+        "python": sys.executable,
+        "distributions": doctor._installed_distributions(),
+    }
+    _write_json({"profiles": profiles}, stamp_path)
+
+
+def _install_dependencies(options: QuickstartOptions) -> None:
+    profile = options.install_profile
+    requirements = _requirements_for_profile(profile)
+    key = install_key(requirements)
+    if options.stamp_path is not None and not options.force_install:
+        if install_is_current(options.stamp_path, profile, key):
+            print(
+                f"\n==> Skipping {profile} dependency install: {requirements} is unchanged "
+                "since the last install with this interpreter (pass --force-install to reinstall)"
+            )
+            return
+
+    pip = [sys.executable, "-m", "pip"]
+    if options.wheelhouse is None:
+        _run_command([*pip, "install", "-r", str(requirements)], f"Install {profile} dependencies")
+    else:
+        wheelhouse = options.wheelhouse
+        built = _read_json(wheelhouse / WHEELHOUSE_STAMP_NAME)
+        wheels_key = wheelhouse_key(requirements)
+        if options.force_install or wheels_key not in built.get("builds", {}):
+            _run_command(
+                [*pip, "wheel", "-r", str(requirements), "--wheel-dir", str(wheelhouse)],
+                f"Build {profile} wheels into {wheelhouse}",
+            )
+            builds = built.get("builds") if isinstance(built.get("builds"), dict) else {}
+            builds[wheels_key] = {"requirements": requirements.as_posix(), "python": sys.implementation.cache_tag}
+            _write_json({"builds": builds}, wheelhouse / WHEELHOUSE_STAMP_NAME)
+        _run_command(
+            [*pip, "install", "--no-index", "--find-links", str(wheelhouse), "-r", str(requirements)],
+            f"Install {profile} dependencies from {wheelhouse}",
+        )
+    if options.stamp_path is not None:
+        record_install(options.stamp_path, profile, key, requirements)
+
+
 def run_quickstart(options: QuickstartOptions) -> int:
     """Run the quickstart flow and return a shell-friendly exit code."""
 
     if not options.skip_install:
-        requirements = _requirements_for_profile(options.install_profile)
-        _run_command(
-            [sys.executable, "-m", "pip", "install", "-r", str(requirements)],
-            f"Install {options.install_profile} dependencies",
-        )
+        _install_dependencies(options)
     else:
         print("\n==> Skipping dependency install")
 
@@ -78,6 +217,9 @@ def run_quickstart(options: QuickstartOptions) -> int:
     results = doctor.run_checks(
         include_optional=not options.skip_optional_checks,
         check_mongo=not options.skip_mongo,
+        cache_path=options.cache_path,
+        cache_ttl=options.cache_ttl,
+        fresh=options.fresh_checks,
     )
     doctor._print_text(results)
     _, _, failures = doctor.summarize(results)
@@ -116,6 +258,22 @@ def build_parser() -> argparse.ArgumentParser:
         help="dependency set to install before checks",
     )
     parser.add_argument("--skip-install", action="store_true", help="do not run pip install")
+    parser.add_argument(
+        "--force-install",
+        action="store_true",
+        help="run pip install even when the install stamp matches, and rebuild wheelhouse wheels",
+    )
+    parser.add_argument(
+        "--stamp-path",
+        type=Path,
+        default=DEFAULT_STAMP_PATH,
+        help=f"install stamp file that lets unchanged installs be skipped (default: {DEFAULT_STAMP_PATH})",
+    )
+    parser.add_argument(
+        "--wheelhouse",
+        type=Path,
+        help="build wheels into this directory once, then install from it without network access",
+    )
     parser.add_argument("--env-path", type=Path, default=Path(".env"), help="env file path to create")
     parser.add_argument("--overwrite-env", action="store_true", help="replace an existing env file")
     parser.add_argument(
@@ -131,6 +289,7 @@ def build_parser() -> argparse.ArgumentParser:
     parser.add_argument("--launch-api", action="store_true", help="launch FastAPI after successful checks")
     parser.add_argument("--host", default="127.0.0.1", help="API host when --launch-api is used")
     parser.add_argument("--port", type=int, default=8000, help="API port when --launch-api is used")
+    doctor.add_cache_arguments(parser)
     return parser
 
 
@@ -140,6 +299,9 @@ def main(argv: Sequence[str] | None = None) -> int:
         QuickstartOptions(
             install_profile=args.install_profile,
             skip_install=args.skip_install,
+            stamp_path=args.stamp_path,
+            force_install=args.force_install,
+            wheelhouse=args.wheelhouse,
             env_path=args.env_path,
             overwrite_env=args.overwrite_env,
             skip_optional_checks=not args.check_optional,
@@ -147,6 +309,9 @@ def main(argv: Sequence[str] | None = None) -> int:
             launch_api=args.launch_api,
             host=args.host,
             port=args.port,
+            cache_path=args.cache_path if args.cache else None,
+            cache_ttl=args.cache_ttl,
+            fresh_checks=args.fresh,
         )
     )
 
@@ -6,9 +6,10 @@ import argparse
 import html
 import json
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Mapping
+from typing import Any, Dict, Iterable, List, Mapping, Sequence
 
-from app.cli.artifact_manifest import DEFAULT_ARTIFACT_DIR, build_manifest
+from app.cli.artifact_context import ArtifactContext, resolve_context
+from app.cli.artifact_manifest import DEFAULT_ARTIFACT_DIR, build_manifest, load_hash_cache
 
 DEFAULT_HTML_NAME = "release-bundle-index.html"
 HIGHLIGHTED_ARTIFACTS: Mapping[str, str] = {
@@ -100,11 +101,11 @@ def _format_bytes(size_bytes: int) -> str:
     return f"{size_bytes / (1024 * 1024):.1f} MiB"
 
 
-def _load_json(path: Path) -> Any | None:
+def _load_json(path: Path, context: ArtifactContext | None = None) -> Any | None:
     """Best-effort JSON loader used for richer index summaries."""
 
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
+        return resolve_context(context).load_json(path)
     except (FileNotFoundError, json.JSONDecodeError, OSError):
         return None
 
@@ -345,15 +346,19 @@ def _reviewer_handoff_html(artifact_dir: Path, handoff: Mapping[str, Any] | None
     )
 
 
-def render_html(artifact_dir: Path = DEFAULT_ARTIFACT_DIR) -> str:
+def render_html(artifact_dir: Path = DEFAULT_ARTIFACT_DIR, context: ArtifactContext | None = None) -> str:
     """Render the release bundle index as standalone HTML."""
 
-    manifest = build_manifest(artifact_dir)
+    context = resolve_context(context)
+    hash_cache = load_hash_cache(artifact_dir)
+    manifest = build_manifest(artifact_dir, hash_cache)
+    if artifact_dir.is_dir():
+        hash_cache.save()
     entries_by_path = _artifact_lookup(manifest)
-    release_health_payload = _load_json(artifact_dir / "release-health.json")
+    release_health_payload = _load_json(artifact_dir / "release-health.json", context)
     release_health = _as_mapping(release_health_payload)
-    reviewer_handoff = _as_mapping(_load_json(artifact_dir / "reviewer-handoff.json")) or None
-    doctor_payload = _load_json(artifact_dir / "doctor-minimal.json")
+    reviewer_handoff = _as_mapping(_load_json(artifact_dir / "reviewer-handoff.json", context)) or None
+    doctor_payload = _load_json(artifact_dir / "doctor-minimal.json", context)
     summary_preview = _read_preview(artifact_dir / "summary.txt")
 
     status = _aggregate_status(release_health_payload)
@@ -496,10 +501,10 @@ def build_parser() -> argparse.ArgumentParser:
     return parser
 
 
-def main() -> int:
+def main(argv: Sequence[str] | None = None) -> int:
     """CLI entry point."""
 
-    args = build_parser().parse_args()
+    args = build_parser().parse_args(argv)
     html_text = render_html(args.artifact_dir)
     html_path = args.html_path or args.artifact_dir / DEFAULT_HTML_NAME
     write_html(html_text, html_path)
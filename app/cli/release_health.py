@@ -109,10 +109,22 @@ def write_reports(
     json_path: Path | None = DEFAULT_JSON_PATH,
     include_optional: bool = False,
     check_mongo: bool = False,
+    cache_path: Path | None = None,
+    cache_ttl: float = doctor.DEFAULT_CACHE_TTL,
+    fresh: bool = False,
 ) -> tuple[Path, Path | None, int]:
-    """Run release-safe checks and write Markdown plus optional JSON reports."""
+    """Run release-safe checks and write Markdown plus optional JSON reports.
 
-    results = doctor.run_checks(include_optional=include_optional, check_mongo=check_mongo)
+    With ``cache_path``, fresh doctor results cached there are reused.
+    """
+
+    results = doctor.run_checks(
+        include_optional=include_optional,
+        check_mongo=check_mongo,
+        cache_path=cache_path,
+        cache_ttl=cache_ttl,
+        fresh=fresh,
+    )
     markdown_path.parent.mkdir(parents=True, exist_ok=True)
     markdown_path.write_text(render_markdown(results), encoding="utf-8")
 
@@ -152,6 +164,7 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="include MongoDB socket connectivity checks",
     )
+    doctor.add_cache_arguments(parser)
     return parser
 
 
@@ -162,6 +175,9 @@ def main(argv: Sequence[str] | None = None) -> int:
         json_path=None if args.no_json else args.json_path,
         include_optional=args.check_optional,
         check_mongo=args.check_mongo,
+        cache_path=args.cache_path if args.cache else None,
+        cache_ttl=args.cache_ttl,
+        fresh=args.fresh,
     )
     print(f"Wrote release health report: {markdown_path}")
     if json_path is not None:
@@ -8,6 +8,8 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Iterable, Mapping, Sequence
 
+from app.cli.artifact_context import ArtifactContext, resolve_context
+
 DEFAULT_HEALTH_PATH = Path("ci_artifacts/release-health.json")
 DEFAULT_MANIFEST_PATH = Path("ci_artifacts/artifact-manifest.json")
 DEFAULT_MARKDOWN_PATH = Path("ci_artifacts/release-notes.md")
@@ -25,10 +27,10 @@ _IMPORTANT_ARTIFACTS = [
 ]
 
 
-def _load_json(path: Path, fallback: Any) -> Any:
+def _load_json(path: Path, fallback: Any, context: ArtifactContext | None = None) -> Any:
     if not path.exists():
         return fallback
-    return json.loads(path.read_text(encoding="utf-8"))
+    return resolve_context(context).load_json(path)
 
 
 def _normalize_health_results(health_payload: Any) -> list[Mapping[str, Any]]:
@@ -233,9 +235,10 @@ def build_parser() -> argparse.ArgumentParser:
 
 def main(argv: Sequence[str] | None = None) -> int:
     args = build_parser().parse_args(argv)
+    context = resolve_context()
     notes = build_release_notes(
-        health_results=_load_json(args.health_json, []),
-        manifest=_load_json(args.manifest_json, {"files": [], "missing_expected": []}),
+        health_results=_load_json(args.health_json, [], context),
+        manifest=_load_json(args.manifest_json, {"files": [], "missing_expected": []}, context),
     )
     markdown_path = None if args.no_markdown else args.markdown_path
     json_path = None if args.no_json else args.json_path
@@ -8,6 +8,7 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Mapping
 
+from app.cli.artifact_context import ArtifactContext, resolve_context
 from app.cli.artifact_manifest import DEFAULT_ARTIFACT_DIR
 from app.cli.release_bundle_index import REVIEW_ORDER_STEPS
 
@@ -30,9 +31,9 @@ WARN_STATUSES = {"warn", "warning", "degraded", "partial"}
 FAIL_STATUSES = {"fail", "failed", "blocked", "error", "missing"}
 
 
-def _load_json(path: Path) -> Any | None:
+def _load_json(path: Path, context: ArtifactContext | None = None) -> Any | None:
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
+        return resolve_context(context).load_json(path)
     except (FileNotFoundError, json.JSONDecodeError, OSError):
         return None
 
@@ -146,12 +147,13 @@ def _review_order(files_by_path: Mapping[str, Mapping[str, Any]]) -> List[Dict[s
     return steps
 
 
-def build_handoff(artifact_dir: Path = DEFAULT_ARTIFACT_DIR) -> Dict[str, Any]:
+def build_handoff(artifact_dir: Path = DEFAULT_ARTIFACT_DIR, context: ArtifactContext | None = None) -> Dict[str, Any]:
     """Build a deterministic reviewer handoff summary for a diagnostics bundle."""
 
-    manifest = _load_json(artifact_dir / "artifact-manifest.json") or {}
-    health = _load_json(artifact_dir / "release-health.json")
-    triage = _load_json(artifact_dir / "triage-summary.json")
+    context = resolve_context(context)
+    manifest = _load_json(artifact_dir / "artifact-manifest.json", context) or {}
+    health = _load_json(artifact_dir / "release-health.json", context)
+    triage = _load_json(artifact_dir / "triage-summary.json", context)
     files_by_path = _manifest_files(manifest)
     missing_expected = manifest.get("missing_expected", []) if isinstance(manifest, Mapping) else []
     if not isinstance(missing_expected, list):
@@ -154,10 +154,10 @@ def build_parser() -> argparse.ArgumentParser:
     return parser
 
 
-def main() -> int:
+def main(argv: Sequence[str] | None = None) -> int:
     """CLI entry point."""
 
-    args = build_parser().parse_args()
+    args = build_parser().parse_args(argv)
     bundle = build_fixture_bundle()
     written = write_fixture_bundle(bundle, args.output_dir)
     if args.json:
@@ -8,6 +8,8 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Mapping, Sequence
 
+from app.cli.artifact_context import ArtifactContext, resolve_context
+
 DEFAULT_ARTIFACT_DIR = Path("ci_artifacts")
 DEFAULT_MARKDOWN_NAME = "triage-summary.md"
 DEFAULT_JSON_NAME = "triage-summary.json"
@@ -46,11 +48,11 @@ ARTIFACT_TARGETS: Dict[str, str] = {
 }
 
 
-def _load_json(path: Path, fallback: Any) -> Any:
+def _load_json(path: Path, fallback: Any, context: ArtifactContext | None = None) -> Any:
     if not path.exists():
         return fallback
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
+        return resolve_context(context).load_json(path)
     except json.JSONDecodeError:
         return fallback
 
@@ -290,14 +292,15 @@ def build_parser() -> argparse.ArgumentParser:
 
 def main(argv: Sequence[str] | None = None) -> int:
     args = build_parser().parse_args(argv)
+    context = resolve_context()
     artifact_dir = args.artifact_dir
     health_path = args.health_json or artifact_dir / DEFAULT_HEALTH_NAME
     manifest_path = args.manifest_json or artifact_dir / DEFAULT_MANIFEST_NAME
     markdown_path = args.markdown_path or artifact_dir / DEFAULT_MARKDOWN_NAME
     json_path = None if args.no_json else (args.json_path or artifact_dir / DEFAULT_JSON_NAME)
 
-    health_results = _load_json(health_path, [])
-    manifest = _load_json(manifest_path, {"file_count": 0, "missing_expected": []})
+    health_results = _load_json(health_path, [], context)
+    manifest = _load_json(manifest_path, {"file_count": 0, "missing_expected": []}, context)
     summary = build_triage_summary(
         health_results,
         manifest,
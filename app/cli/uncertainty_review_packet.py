@@ -13,6 +13,8 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Mapping, Sequence
 
+from app.cli.artifact_context import ArtifactContext, resolve_context
+
 DEFAULT_ARTIFACT_DIR = Path("ci_artifacts")
 DEFAULT_PLAN_NAME = "operator-next-steps.json"
 DEFAULT_HEALTH_NAME = "release-health.json"
@@ -33,9 +35,9 @@ SAFETY_NOTES: tuple[str, ...] = (
 )
 
 
-def _load_json(path: Path, fallback: Any) -> Any:
+def _load_json(path: Path, fallback: Any, context: ArtifactContext | None = None) -> Any:
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
+        return resolve_context(context).load_json(path)
     except (FileNotFoundError, json.JSONDecodeError, OSError):
         return fallback
 
@@ -254,6 +256,7 @@ def build_parser() -> argparse.ArgumentParser:
 
 def main(argv: Sequence[str] | None = None) -> int:
     args = build_parser().parse_args(argv)
+    context = resolve_context()
     artifact_dir = args.artifact_dir
     plan_path = args.operator_plan_json or artifact_dir / DEFAULT_PLAN_NAME
     health_path = args.health_json or artifact_dir / DEFAULT_HEALTH_NAME
@@ -261,9 +264,9 @@ def main(argv: Sequence[str] | None = None) -> int:
     markdown_path = args.markdown_path or artifact_dir / DEFAULT_MARKDOWN_NAME
     json_path = None if args.no_json else (args.json_path or artifact_dir / DEFAULT_JSON_NAME)
 
-    operator_plan = _as_mapping(_load_json(plan_path, {"status": "unknown", "actions": []}))
-    release_health_payload = _load_json(health_path, [])
-    manifest = _as_mapping(_load_json(manifest_path, {"file_count": 0, "missing_expected": []}))
+    operator_plan = _as_mapping(_load_json(plan_path, {"status": "unknown", "actions": []}, context))
+    release_health_payload = _load_json(health_path, [], context)
+    manifest = _as_mapping(_load_json(manifest_path, {"file_count": 0, "missing_expected": []}, context))
 
     packet = build_uncertainty_review_packet(
         operator_plan=operator_plan,
@@ -0,0 +1,566 @@
+#!/usr/bin/env python3
+"""Run the unittest suite in parallel, balancing test modules by recorded durations.
+
+This is developer tooling, not a diagnostics CLI: ``scripts/test.sh`` (and so
+``make test``) runs it as ``python scripts/parallel_tests.py``.
+
+Each ``tests/test_*.py`` module is loaded with the standard unittest loader and
+run by a standard ``TextTestRunner`` in a worker process, so existing tests run
+unchanged: ``setUpModule``/``setUpClass`` fixtures, subtests, skips, and
+expected failures behave as they do under ``python -m unittest discover``.
+Output is buffered as with ``unittest -b`` and only shown for failing tests.
+
+Modules are handed to a process pool longest first, using the per-module
+durations recorded in ``benchmarks/test_durations.json``, so the slow modules
+start early and the short ones fill in behind them. ``--shard K/N`` runs one
+of ``N`` duration-balanced shards, for splitting the suite across CI machines.
+Module results are printed as they finish and merged into one JSON report and
+one JUnit XML report.
+
+``--record-impact`` runs each module in a fresh interpreter and records the
+repository files it depends on in the test-impact index, and ``--changed REF``
+runs only the modules that changes since ``REF`` affect (see
+:mod:`app.cli.impact_index`).
+"""
+
+from __future__ import annotations
+
+import argparse
+import heapq
+import io
+import json
+import multiprocessing
+import os
+import platform
+import statistics
+import sys
+import time
+import traceback
+import unittest
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Sequence, Tuple
+from xml.etree import ElementTree
+
+REPOSITORY_ROOT = Path(__file__).resolve().parents[1]
+# Launched by path, so the repository root is not on sys.path yet.
+if str(REPOSITORY_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPOSITORY_ROOT))
+
+from app.cli import impact_index  # noqa: E402
+
+DEFAULT_ARTIFACT_DIR = Path("ci_artifacts")
+DEFAULT_JSON_NAME = "test-results.json"
+DEFAULT_JUNIT_NAME = "test-results.xml"
+DEFAULT_DURATIONS_PATH = REPOSITORY_ROOT / "benchmarks" / "test_durations.json"
+DURATIONS_VERSION = 1
+# Estimate for a module with no recorded duration when nothing is recorded at all.
+DEFAULT_ESTIMATE_S = 1.0
+
+FAILING_OUTCOMES = {"failure", "error", "unexpected_success"}
+
+
+def load_durations(path: Path) -> Dict[str, Any]:
+    """Return the recorded durations document, or an empty one when ``path`` does not exist."""
+
+    if not path.exists():
+        return {"version": DURATIONS_VERSION, "modules": {}}
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def estimate_durations(modules: Sequence[str], recorded: Mapping[str, float]) -> Dict[str, float]:
+    """Return a duration for every module, estimating unrecorded ones as the median recorded duration."""
+
+    fallback = statistics.median(recorded.values()) if recorded else DEFAULT_ESTIMATE_S
+    return {module: float(recorded.get(module, fallback)) for module in modules}
+
+
+def schedule(modules: Sequence[str], durations: Mapping[str, float]) -> List[str]:
+    """Order modules longest first, so a pool of workers finishes close together."""
+
+    return sorted(modules, key=lambda module: (-durations[module], module))
+
+
+def plan_shards(modules: Sequence[str], durations: Mapping[str, float], count: int) -> List[List[str]]:
+    """Split modules into ``count`` shards with close estimated durations (longest processing time first)."""
+
+    shards: List[List[str]] = [[] for _ in range(count)]
+    heap = [(0.0, index) for index in range(count)]
+    for module in schedule(modules, durations):
+        total, index = heapq.heappop(heap)
+        shards[index].append(module)
+        heapq.heappush(heap, (total + durations[module], index))
+    return shards
+
+
+class _RecordingResult(unittest.TextTestResult):
+    """A text result that also records one serializable case per outcome."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.cases: List[Dict[str, Any]] = []
+        self._started: Dict[str, float] = {}
+
+    def startTest(self, test: unittest.TestCase) -> None:
+        self._started[test.id()] = time.perf_counter()
+        super().startTest(test)
+
+    def _record(self, test: Any, outcome: str, detail: str = "", timed: Any = None) -> None:
+        started = self._started.get((timed or test).id())
+        duration = time.perf_counter() - started if started is not None else 0.0
+        self.cases.append({"id": test.id(), "outcome": outcome, "duration_s": round(duration, 4), "detail": detail})
+
+    def addSuccess(self, test: unittest.TestCase) -> None:
+        super().addSuccess(test)
+        self._record(test, "success")
+
+    def addFailure(self, test: unittest.TestCase, err: Any) -> None:
+        super().addFailure(test, err)
+        self._record(test, "failure", self.failures[-1][1])
+
+    def addError(self, test: unittest.TestCase, err: Any) -> None:
+        super().addError(test, err)
+        self._record(test, "error", self.errors[-1][1])
+
+    def addSkip(self, test: unittest.TestCase, reason: str) -> None:
+        super().addSkip(test, reason)
+        self._record(test, "skipped", reason)
+
+    def addExpectedFailure(self, test: unittest.TestCase, err: Any) -> None:
+        super().addExpectedFailure(test, err)
+        self._record(test, "expected_failure", self.expectedFailures[-1][1])
+
+    def addUnexpectedSuccess(self, test: unittest.TestCase) -> None:
+        super().addUnexpectedSuccess(test)
+        self._record(test, "unexpected_success")
+
+    def addSubTest(self, test: unittest.TestCase, subtest: unittest.TestCase, err: Any) -> None:
+        super().addSubTest(test, subtest, err)
+        if err is not None:
+            # Passing subtests are not reported, as in unittest; failing ones become cases of their own.
+            outcome = "failure" if issubclass(err[0], test.failureException) else "error"
+            detail = (self.failures if outcome == "failure" else self.errors)[-1][1]
+            self._record(subtest, outcome, detail, timed=test)
+
+
+def run_module(module: str) -> Dict[str, Any]:
+    """Load and run one test module with the unittest runner and return its serializable result."""
+
+    started = time.perf_counter()
+    stream = io.StringIO()
+    try:
+        suite = unittest.defaultTestLoader.loadTestsFromName(module)
+        result = unittest.TextTestRunner(stream=stream, verbosity=0, buffer=True, resultclass=_RecordingResult).run(suite)
+        cases, tests_run = result.cases, result.testsRun
+    except Exception:  # noqa: BLE001 - a module that cannot even be loaded is reported as an error case.
+        cases = [{"id": module, "outcome": "error", "duration_s": 0.0, "detail": traceback.format_exc()}]
+        tests_run = 0
+    return {
+        "module": module,
+        "status": module_status(cases),
+        "tests_run": tests_run,
+        "duration_s": round(time.perf_counter() - started, 4),
+        "worker": os.getpid(),
+        "cases": cases,
+    }
+
+
+def module_status(cases: Iterable[Mapping[str, Any]]) -> str:
+    """Return ``error``, ``fail``, or ``pass`` for a module's cases."""
+
+    outcomes = {case["outcome"] for case in cases}
+    if "error" in outcomes:
+        return "error"
+    return "fail" if outcomes & FAILING_OUTCOMES else "pass"
+
+
+def _crashed_module(module: str, error: BaseException) -> Dict[str, Any]:
+    detail = f"The worker process running {module} exited before reporting a result: {error}"
+    case = {"id": module, "outcome": "error", "duration_s": 0.0, "detail": detail}
+    return {"module": module, "status": "error", "tests_run": 0, "duration_s": 0.0, "worker": None, "cases": [case]}
+
+
+def run_module_with_impact(module: str) -> Dict[str, Any]:
+    """Run one test module in a fresh process and attach the dependencies it touched as ``impact``."""
+
+    recorder = impact_index.ImpactRecorder().install()
+    result = run_module(module)
+    source = impact_index.source_path(module)
+    result["impact"] = recorder.snapshot([source] if source else [])
+    return result
+
+
+def run_modules(
+    modules: Sequence[str],
+    jobs: int,
+    on_result: Callable[[Mapping[str, Any]], None] | None = None,
+    record_impact: bool = False,
+) -> List[Dict[str, Any]]:
+    """Run ``modules`` in order on ``jobs`` worker processes, calling ``on_result`` as each finishes.
+
+    With one job the modules run in this process, one after another. With
+    ``record_impact`` every module runs in a freshly spawned interpreter, so
+    imports and caches left by earlier modules cannot hide its dependencies.
+    """
+
+    results: List[Dict[str, Any]] = []
+
+    def finish(result: Dict[str, Any]) -> None:
+        results.append(result)
+        if on_result is not None:
+            on_result(result)
+
+    if not modules:
+        return results
+    if not record_impact and (jobs <= 1 or len(modules) <= 1):
+        for module in modules:
+            finish(run_module(module))
+        return results
+    pool_options: Dict[str, Any] = {"max_workers": max(1, min(jobs, len(modules)))}
+    if record_impact:
+        pool_options.update(mp_context=multiprocessing.get_context("spawn"), max_tasks_per_child=1)
+    runner = run_module_with_impact if record_impact else run_module
+    with ProcessPoolExecutor(**pool_options) as executor:
+        futures = {executor.submit(runner, module): module for module in modules}
+        for future in as_completed(futures):
+            try:
+                finish(future.result())
+            except BrokenProcessPool as error:
+                finish(_crashed_module(futures[future], error))
+    return results
+
+
+def build_test_report(results: Sequence[Mapping[str, Any]], jobs: int, wall_s: float, shard: str | None = None) -> Dict[str, Any]:
+    """Merge module results into one report with unittest-style totals."""
+
+    modules = sorted(results, key=lambda result: result["module"])
+    outcomes: Dict[str, int] = {}
+    workers: Dict[str, Dict[str, Any]] = {}
+    for result in modules:
+        for case in result["cases"]:
+            outcomes[case["outcome"]] = outcomes.get(case["outcome"], 0) + 1
+        if result["worker"] is not None:
+            worker = workers.setdefault(str(result["worker"]), {"modules": 0, "busy_s": 0.0})
+            worker["modules"] += 1
+            worker["busy_s"] = round(worker["busy_s"] + result["duration_s"], 4)
+    serial_s = round(sum(result["duration_s"] for result in modules), 4)
+    failing = sum(outcomes.get(outcome, 0) for outcome in FAILING_OUTCOMES)
+    return {
+        "generated_at": datetime.now(timezone.utc).replace(microsecond=0).isoformat(),
+        "python_version": platform.python_version(),
+        "status": "fail" if failing else "pass",
+        "jobs": jobs,
+        "shard": shard,
+        "tests_run": sum(result["tests_run"] for result in modules),
+        "outcomes": dict(sorted(outcomes.items())),
+        "wall_s": round(wall_s, 4),
+        "serial_s": serial_s,
+        "speedup": round(serial_s / wall_s, 2) if wall_s > 0 else None,
+        "workers": [{"pid": pid, **workers[pid]} for pid in sorted(workers)],
+        "modules": modules,
+    }
+
+
+def write_json(payload: Mapping[str, Any], path: Path) -> None:
+    """Write a report or durations file as stable JSON."""
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+
+
+def _junit_case(parent: ElementTree.Element, case: Mapping[str, Any]) -> None:
+    classname, _, name = case["id"].partition(" ")[0].rpartition(".")
+    element = ElementTree.SubElement(
+        parent,
+        "testcase",
+        classname=classname,
+        name=case["id"][len(classname) + 1 :] if classname else case["id"],
+        time=f"{case['duration_s']:.4f}",
+    )
+    detail = case["detail"]
+    first_line = detail.strip().splitlines()[-1] if detail.strip() else case["outcome"]
+    if case["outcome"] in {"failure", "unexpected_success"}:
+        ElementTree.SubElement(element, "failure", message=first_line, type=case["outcome"]).text = detail
+    elif case["outcome"] == "error":
+        ElementTree.SubElement(element, "error", message=first_line, type="error").text = detail
+    elif case["outcome"] == "skipped":
+        ElementTree.SubElement(element, "skipped", message=detail)
+
+
+def render_junit(report: Mapping[str, Any]) -> str:
+    """Render the report as JUnit XML, one ``testsuite`` per test module."""
+
+    def counts(cases: Sequence[Mapping[str, Any]]) -> Dict[str, str]:
+        outcomes = [case["outcome"] for case in cases]
+        return {
+            "tests": str(len(outcomes)),
+            "failures": str(sum(outcome in {"failure", "unexpected_success"} for outcome in outcomes)),
+            "errors": str(outcomes.count("error")),
+            "skipped": str(outcomes.count("skipped")),
+        }
+
+    all_cases = [case for module in report["modules"] for case in module["cases"]]
+    root = ElementTree.Element("testsuites", name="unittest", time=f"{report['wall_s']:.4f}", **counts(all_cases))
+    for module in report["modules"]:
+        suite = ElementTree.SubElement(root, "testsuite", name=module["module"], time=f"{module['duration_s']:.4f}", **counts(module["cases"]))
+        for case in module["cases"]:
+            _junit_case(suite, case)
+    ElementTree.indent(root)
+    return '<?xml version="1.0" encoding="utf-8"?>\n' + ElementTree.tostring(root, encoding="unicode") + "\n"
+
+
+def write_junit(report: Mapping[str, Any], path: Path) -> None:
+    """Write the JUnit XML report."""
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(render_junit(report), encoding="utf-8")
+
+
+def build_durations(results: Sequence[Mapping[str, Any]], previous: Mapping[str, Any] | None = None) -> Dict[str, Any]:
+    """Return a durations document with this run's module durations merged over ``previous``."""
+
+    modules = dict((previous or {}).get("modules", {}))
+    modules.update({result["module"]: result["duration_s"] for result in results if result["worker"] is not None or result["tests_run"]})
+    return {
+        "version": DURATIONS_VERSION,
+        "python_version": platform.python_version(),
+        "modules": dict(sorted(modules.items())),
+    }
+
+
+def format_result_line(result: Mapping[str, Any], finished: int, total: int) -> str:
+    """Return the progress line printed when a module finishes."""
+
+    label = {"pass": "ok", "fail": "FAIL", "error": "ERROR"}[result["status"]]
+    width = len(str(total))
+    return f"[{finished:>{width}}/{total}] {label:<5} {result['module']} ({result['tests_run']} tests, {result['duration_s']:.2f}s)"
+
+
+def _failure_blocks(report: Mapping[str, Any]) -> Iterable[str]:
+    for module in report["modules"]:
+        for case in module["cases"]:
+            if case["outcome"] in FAILING_OUTCOMES:
+                yield "=" * 70
+                yield f"{case['outcome'].upper().replace('_', ' ')}: {case['id']}"
+                yield "-" * 70
+                yield case["detail"].rstrip() or "Unexpected success"
+
+
+def render_summary(report: Mapping[str, Any]) -> str:
+    """Return the closing unittest-style summary, failure details first."""
+
+    lines = list(_failure_blocks(report))
+    outcomes = report["outcomes"]
+    lines.append("-" * 70)
+    lines.append(
+        f"Ran {report['tests_run']} tests in {report['wall_s']:.3f}s on {report['jobs']} worker(s) "
+        f"({report['serial_s']:.3f}s of module time)"
+    )
+    details = [
+        f"{label}={outcomes[outcome]}"
+        for outcome, label in (
+            ("failure", "failures"),
+            ("error", "errors"),
+            ("skipped", "skipped"),
+            ("expected_failure", "expected failures"),
+            ("unexpected_success", "unexpected successes"),
+        )
+        if outcomes.get(outcome)
+    ]
+    verdict = "FAILED" if report["status"] == "fail" else "OK"
+    lines.append(f"{verdict} ({', '.join(details)})" if details else verdict)
+    return "\n".join(lines)
+
+
+def _positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError("must be at least 1")
+    return number
+
+
+def _shard(value: str) -> Tuple[int, int]:
+    index, _, count = value.partition("/")
+    try:
+        shard = (int(index), int(count))
+    except ValueError:
+        raise argparse.ArgumentTypeError("must look like K/N, for example 1/4") from None
+    if not 1 <= shard[0] <= shard[1]:
+        raise argparse.ArgumentTypeError("K must be between 1 and N")
+    return shard
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Create the command-line parser."""
+
+    parser = argparse.ArgumentParser(
+        description="Run the unittest suite in parallel worker processes, balanced by recorded module durations."
+    )
+    parser.add_argument(
+        "modules",
+        nargs="*",
+        metavar="MODULE",
+        help="Test modules to run (for example tests.test_doctor). Default: every tests/test_*.py module",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=_positive_int,
+        default=os.cpu_count() or 1,
+        help="Worker processes; 1 runs every module in this process. Default: CPU count",
+    )
+    parser.add_argument(
+        "--shard",
+        type=_shard,
+        metavar="K/N",
+        help="Run only shard K of N duration-balanced shards.",
+    )
+    parser.add_argument(
+        "--pattern",
+        default=impact_index.DEFAULT_PATTERN,
+        help=f"File pattern for discovered test modules. Default: {impact_index.DEFAULT_PATTERN}",
+    )
+    parser.add_argument(
+        "--durations",
+        type=Path,
+        default=DEFAULT_DURATIONS_PATH,
+        help="Recorded per-module durations used for balancing. Default: benchmarks/test_durations.json",
+    )
+    parser.add_argument(
+        "--update-durations",
+        action="store_true",
+        help="Record this run's module durations in the --durations file.",
+    )
+    parser.add_argument(
+        "--changed",
+        nargs="?",
+        const="HEAD",
+        metavar="REF",
+        help="Run only the modules affected by changes since the git REF (default HEAD), using the impact index.",
+    )
+    parser.add_argument(
+        "--record-impact",
+        action="store_true",
+        help="Run each module in a fresh interpreter and record its dependencies in the impact index.",
+    )
+    parser.add_argument(
+        "--impact-index",
+        type=Path,
+        default=impact_index.DEFAULT_INDEX_PATH,
+        help="Test-impact index for --changed and --record-impact. Default: .test-impact.json",
+    )
+    parser.add_argument(
+        "--max-index-age",
+        type=int,
+        default=impact_index.DEFAULT_MAX_INDEX_AGE,
+        help=(
+            "With --changed, run everything and rebuild the index when it is missing or more than this many "
+            f"commits old. Default: {impact_index.DEFAULT_MAX_INDEX_AGE}"
+        ),
+    )
+    parser.add_argument(
+        "--artifact-dir",
+        type=Path,
+        default=DEFAULT_ARTIFACT_DIR,
+        help=f"Directory for default outputs. Default: {DEFAULT_ARTIFACT_DIR}",
+    )
+    parser.add_argument(
+        "--json-path",
+        type=Path,
+        help=f"Path for the JSON report. Default: <artifact-dir>/{DEFAULT_JSON_NAME}",
+    )
+    parser.add_argument(
+        "--junit-path",
+        type=Path,
+        help=f"Path for the JUnit XML report. Default: <artifact-dir>/{DEFAULT_JUNIT_NAME}",
+    )
+    parser.add_argument("--no-json", action="store_true", help="Skip the JSON report.")
+    parser.add_argument("--no-junit", action="store_true", help="Skip the JUnit XML report.")
+    return parser
+
+
+def _select_changed(
+    modules: List[str],
+    impact: Mapping[str, Any],
+    ref: str,
+    max_index_age: int,
+    record_impact: bool,
+) -> Tuple[List[str], bool]:
+    """Return the modules to run for ``--changed REF`` and whether to rebuild the impact index."""
+
+    age = impact_index.index_age(impact)
+    if not impact.get("modules") or age is None or age > max_index_age:
+        staleness = "missing" if not impact.get("modules") else "out of date" if age is None else f"{age} commits old"
+        print(f"The test-impact index is {staleness}; running every module and rebuilding it.", flush=True)
+        return modules, True
+    try:
+        changed = impact_index.changed_files(ref)
+    except impact_index.ImpactError as error:
+        print(f"{error}; running every module.", flush=True)
+        return modules, record_impact
+    selected = impact_index.select_modules(impact, modules, changed)
+    print(
+        f"{len(changed)} file(s) changed since {ref}; {len(selected)} of {len(modules)} test modules are affected.",
+        flush=True,
+    )
+    return [module for module in modules if module in selected], record_impact
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """CLI entry point."""
+
+    args = build_parser().parse_args(argv)
+    modules = list(args.modules) or impact_index.discover_modules(pattern=args.pattern)
+    record_impact = args.record_impact
+    impact: Mapping[str, Any] = {}
+    if args.changed is not None or record_impact:
+        impact = impact_index.load_index(args.impact_index)
+    if args.changed is not None:
+        modules, record_impact = _select_changed(modules, impact, args.changed, args.max_index_age, record_impact)
+    durations_document = load_durations(args.durations)
+    durations = estimate_durations(modules, durations_document.get("modules", {}))
+    shard = None
+    if args.shard:
+        index, count = args.shard
+        modules = plan_shards(modules, durations, count)[index - 1]
+        shard = f"{index}/{count}"
+    ordered = schedule(modules, durations)
+    jobs = min(args.jobs, max(1, len(ordered)))
+    print(f"Running {len(ordered)} test modules on {jobs} worker(s)" + (f", shard {shard}" if shard else ""), flush=True)
+
+    finished = 0
+
+    def report_progress(result: Mapping[str, Any]) -> None:
+        nonlocal finished
+        finished += 1
+        print(format_result_line(result, finished, len(ordered)), flush=True)
+
+    started = time.perf_counter()
+    results = run_modules(ordered, jobs, on_result=report_progress, record_impact=record_impact)
+    records = {result["module"]: result.pop("impact") for result in results if "impact" in result}
+    report = build_test_report(results, jobs, time.perf_counter() - started, shard=shard)
+    print(render_summary(report))
+
+    if records:
+        # A run of every discovered module replaces the index, dropping deleted modules.
+        complete = not args.modules and set(records) == set(impact_index.discover_modules(pattern=args.pattern))
+        previous = None if complete else impact
+        impact_index.write_index(impact_index.build_index(records, previous), args.impact_index)
+        print(f"Wrote test-impact index for {len(records)} module(s) to {args.impact_index}")
+    if args.update_durations:
+        write_json(build_durations(results, durations_document), args.durations)
+        print(f"Wrote module durations to {args.durations}")
+    if not args.no_json:
+        json_path = args.json_path or args.artifact_dir / DEFAULT_JSON_NAME
+        write_json(report, json_path)
+        print(f"Wrote test results JSON to {json_path}")
+    if not args.no_junit:
+        junit_path = args.junit_path or args.artifact_dir / DEFAULT_JUNIT_NAME
+        write_junit(report, junit_path)
+        print(f"Wrote test results JUnit XML to {junit_path}")
+    return 0 if report["status"] == "pass" else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
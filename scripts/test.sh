@@ -3,24 +3,40 @@
 set -euo pipefail
 
 PYTHON_BIN=${PYTHON_BIN:-python3}
+# TEST_CHANGED=<git ref> runs only the smoke steps and test modules affected by
+# changes since that ref (see docs/test_impact.md).
+TEST_CHANGED=${TEST_CHANGED:-}
+
+SMOKE_STEPS=all
+if [[ -n "$TEST_CHANGED" ]]; then
+  SMOKE_STEPS=$("$PYTHON_BIN" -m app.cli.impact_index --changed "$TEST_CHANGED" --smoke-steps "$0")
+  printf 'Running %s smoke step(s) affected by changes since %s\n' "$SMOKE_STEPS" "$TEST_CHANGED"
+fi
+smoke_step=0
+smoke() {
+  smoke_step=$((smoke_step + 1))
+  if [[ "$SMOKE_STEPS" == all || "$smoke_step" -le "$SMOKE_STEPS" ]]; then
+    "$@"
+  fi
+}
 
 "$PYTHON_BIN" -m compileall app tests
-"$PYTHON_BIN" -m app.cli.doctor --skip-optional --skip-mongo --json
-"$PYTHON_BIN" -m app.cli.release_health --markdown-path /tmp/militarynntroopprediction-release-health.md --json-path /tmp/militarynntroopprediction-release-health.json
-"$PYTHON_BIN" -m app.cli.export_openapi --json-path /tmp/militarynntroopprediction-openapi.json --markdown-path /tmp/militarynntroopprediction-openapi.md
-"$PYTHON_BIN" -m app.cli.export_api_examples --json-path /tmp/militarynntroopprediction-api-response-examples.json --markdown-path /tmp/militarynntroopprediction-api-response-examples.md
-"$PYTHON_BIN" -m app.cli.export_dashboard_mockup --html-path /tmp/militarynntroopprediction-dashboard-mockup.html
-"$PYTHON_BIN" -m app.cli.synthetic_data_fixtures --output-dir /tmp/militarynntroopprediction-synthetic-fixtures --json
-"$PYTHON_BIN" -m app.cli.release_bundle_index --artifact-dir /tmp --html-path /tmp/militarynntroopprediction-release-bundle-index.html
-"$PYTHON_BIN" -m app.cli.export_html_previews --artifact-dir /tmp --output-dir /tmp/militarynntroopprediction-html-previews --markdown-path /tmp/militarynntroopprediction-html-previews.md
-"$PYTHON_BIN" -m app.cli.artifact_manifest --artifact-dir /tmp --json-path /tmp/militarynntroopprediction-artifact-manifest.json --markdown-path /tmp/militarynntroopprediction-artifact-manifest.md
-"$PYTHON_BIN" -m app.cli.artifact_provenance_ledger --artifact-dir /tmp --manifest-path /tmp/militarynntroopprediction-artifact-manifest.json --json-path /tmp/militarynntroopprediction-artifact-provenance-ledger.json --markdown-path /tmp/militarynntroopprediction-artifact-provenance-ledger.md
-"$PYTHON_BIN" -m app.cli.artifact_gap_report --artifact-dir /tmp --manifest-path /tmp/militarynntroopprediction-artifact-manifest.json --json-path /tmp/militarynntroopprediction-artifact-gap-report.json --markdown-path /tmp/militarynntroopprediction-artifact-gap-report.md
-"$PYTHON_BIN" -m app.cli.release_notes --health-json /tmp/militarynntroopprediction-release-health.json --manifest-json /tmp/militarynntroopprediction-artifact-manifest.json --markdown-path /tmp/militarynntroopprediction-release-notes.md --json-path /tmp/militarynntroopprediction-release-notes.json
-"$PYTHON_BIN" -m app.cli.triage_summary --artifact-dir /tmp --health-json /tmp/militarynntroopprediction-release-health.json --manifest-json /tmp/militarynntroopprediction-artifact-manifest.json --markdown-path /tmp/militarynntroopprediction-triage-summary.md --json-path /tmp/militarynntroopprediction-triage-summary.json
-"$PYTHON_BIN" -m app.cli.reviewer_handoff --artifact-dir /tmp --markdown-path /tmp/militarynntroopprediction-reviewer-handoff.md --json-path /tmp/militarynntroopprediction-reviewer-handoff.json
-"$PYTHON_BIN" -m app.cli.operator_readiness --artifact-dir /tmp --health-json /tmp/militarynntroopprediction-release-health.json --manifest-json /tmp/militarynntroopprediction-artifact-manifest.json --triage-json /tmp/militarynntroopprediction-triage-summary.json --markdown-path /tmp/militarynntroopprediction-operator-readiness.md --json-path /tmp/militarynntroopprediction-operator-readiness.json
-"$PYTHON_BIN" -m app.cli.operator_status_board --artifact-dir /tmp --manifest-path /tmp/militarynntroopprediction-artifact-manifest.json --handoff-path /tmp/militarynntroopprediction-reviewer-handoff.json --health-path /tmp/militarynntroopprediction-release-health.json --triage-path /tmp/militarynntroopprediction-triage-summary.json --readiness-path /tmp/militarynntroopprediction-operator-readiness.json --gap-report-path /tmp/militarynntroopprediction-artifact-gap-report.json --markdown-path /tmp/militarynntroopprediction-operator-status-board.md --json-path /tmp/militarynntroopprediction-operator-status-board.json
-"$PYTHON_BIN" -m app.cli.operator_runbook_index --artifact-dir /tmp --markdown-path /tmp/militarynntroopprediction-operator-runbook-index.md --json-path /tmp/militarynntroopprediction-operator-runbook-index.json
-"$PYTHON_BIN" scripts/validate_reviewer_handoff.py /tmp/militarynntroopprediction-reviewer-handoff.json --json
-"$PYTHON_BIN" -m unittest discover -s tests -p 'test_*.py'
+smoke "$PYTHON_BIN" -m app.cli.doctor --skip-optional --skip-mongo --json --cache
+smoke "$PYTHON_BIN" -m app.cli.release_health --markdown-path /tmp/militarynntroopprediction-release-health.md --json-path /tmp/militarynntroopprediction-release-health.json
+smoke "$PYTHON_BIN" -m app.cli.export_openapi --json-path /tmp/militarynntroopprediction-openapi.json --markdown-path /tmp/militarynntroopprediction-openapi.md
+smoke "$PYTHON_BIN" -m app.cli.export_api_examples --json-path /tmp/militarynntroopprediction-api-response-examples.json --markdown-path /tmp/militarynntroopprediction-api-response-examples.md
+smoke "$PYTHON_BIN" -m app.cli.export_dashboard_mockup --html-path /tmp/militarynntroopprediction-dashboard-mockup.html
+smoke "$PYTHON_BIN" -m app.cli.synthetic_data_fixtures --output-dir /tmp/militarynntroopprediction-synthetic-fixtures --json
+smoke "$PYTHON_BIN" -m app.cli.release_bundle_index --artifact-dir /tmp --html-path /tmp/militarynntroopprediction-release-bundle-index.html
+smoke "$PYTHON_BIN" -m app.cli.export_html_previews --artifact-dir /tmp --output-dir /tmp/militarynntroopprediction-html-previews --markdown-path /tmp/militarynntroopprediction-html-previews.md
+smoke "$PYTHON_BIN" -m app.cli.artifact_manifest --artifact-dir /tmp --json-path /tmp/militarynntroopprediction-artifact-manifest.json --markdown-path /tmp/militarynntroopprediction-artifact-manifest.md
+smoke "$PYTHON_BIN" -m app.cli.artifact_provenance_ledger --artifact-dir /tmp --manifest-path /tmp/militarynntroopprediction-artifact-manifest.json --json-path /tmp/militarynntroopprediction-artifact-provenance-ledger.json --markdown-path /tmp/militarynntroopprediction-artifact-provenance-ledger.md
+smoke "$PYTHON_BIN" -m app.cli.artifact_gap_report --artifact-dir /tmp --manifest-path /tmp/militarynntroopprediction-artifact-manifest.json --json-path /tmp/militarynntroopprediction-artifact-gap-report.json --markdown-path /tmp/militarynntroopprediction-artifact-gap-report.md
+smoke "$PYTHON_BIN" -m app.cli.release_notes --health-json /tmp/militarynntroopprediction-release-health.json --manifest-json /tmp/militarynntroopprediction-artifact-manifest.json --markdown-path /tmp/militarynntroopprediction-release-notes.md --json-path /tmp/militarynntroopprediction-release-notes.json
+smoke "$PYTHON_BIN" -m app.cli.triage_summary --artifact-dir /tmp --health-json /tmp/militarynntroopprediction-release-health.json --manifest-json /tmp/militarynntroopprediction-artifact-manifest.json --markdown-path /tmp/militarynntroopprediction-triage-summary.md --json-path /tmp/militarynntroopprediction-triage-summary.json
+smoke "$PYTHON_BIN" -m app.cli.reviewer_handoff --artifact-dir /tmp --markdown-path /tmp/militarynntroopprediction-reviewer-handoff.md --json-path /tmp/militarynntroopprediction-reviewer-handoff.json
+smoke "$PYTHON_BIN" -m app.cli.operator_readiness --artifact-dir /tmp --health-json /tmp/militarynntroopprediction-release-health.json --manifest-json /tmp/militarynntroopprediction-artifact-manifest.json --triage-json /tmp/militarynntroopprediction-triage-summary.json --markdown-path /tmp/militarynntroopprediction-operator-readiness.md --json-path /tmp/militarynntroopprediction-operator-readiness.json
+smoke "$PYTHON_BIN" -m app.cli.operator_status_board --artifact-dir /tmp --manifest-path /tmp/militarynntroopprediction-artifact-manifest.json --handoff-path /tmp/militarynntroopprediction-reviewer-handoff.json --health-path /tmp/militarynntroopprediction-release-health.json --triage-path /tmp/militarynntroopprediction-triage-summary.json --readiness-path /tmp/militarynntroopprediction-operator-readiness.json --gap-report-path /tmp/militarynntroopprediction-artifact-gap-report.json --markdown-path /tmp/militarynntroopprediction-operator-status-board.md --json-path /tmp/militarynntroopprediction-operator-status-board.json
+smoke "$PYTHON_BIN" -m app.cli.operator_runbook_index --artifact-dir /tmp --markdown-path /tmp/militarynntroopprediction-operator-runbook-index.md --json-path /tmp/militarynntroopprediction-operator-runbook-index.json
+smoke "$PYTHON_BIN" scripts/validate_reviewer_handoff.py /tmp/militarynntroopprediction-reviewer-handoff.json --json
+"$PYTHON_BIN" scripts/parallel_tests.py ${TEST_JOBS:+--jobs "$TEST_JOBS"} ${TEST_CHANGED:+--changed "$TEST_CHANGED"} --json-path /tmp/militarynntroopprediction-test-results.json --junit-path /tmp/militarynntroopprediction-test-results.xml
@@ -0,0 +1,188 @@
+"""Process-wide cache of the repository's Markdown documentation for the docs tests.
+
+Dozens of test modules assert against ``README.md``, ``CONTRIBUTING.md``,
+``CHANGELOG.md``, and ``docs/*.md``. :func:`load_doc` reads each file once per test
+process and splits it into headings, sections, and references, so tests can
+assert against those indexes instead of rescanning the full text each time.
+Lines inside fenced code blocks never count as headings or references.
+
+References are inline Markdown links and autolinks, plus code spans that name
+a repository path (``docs/ci_troubleshooting.md``), which is how these docs
+usually point at one another. Relative link targets are resolved against the
+linking document, so a ``[guide](ci_troubleshooting.md)`` link in ``docs/``
+and a ``docs/ci_troubleshooting.md`` code span in ``README.md`` index the same
+target.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import cached_property, lru_cache
+import posixpath
+from pathlib import Path
+import re
+from typing import Dict, FrozenSet, Iterator, List, Tuple
+
+ROOT = Path(__file__).resolve().parents[1]
+TOP_LEVEL_DOCS = ("README.md", "CONTRIBUTING.md", "CHANGELOG.md")
+
+_FENCE = re.compile(r"^\s{0,3}(```|~~~)")
+_HEADING = re.compile(r"^(#{1,6})\s+(.*?)\s*#*\s*$")
+_LINK = re.compile(r"!?\[([^\]]*)\]\(\s*<?([^)\s>]+)>?(?:\s+\"[^\"]*\")?\s*\)")
+_AUTOLINK = re.compile(r"<((?:https?|mailto):[^>\s]+)>")
+_CODE_SPAN = re.compile(r"`([^`\n]+)`")
+_PATH_SUFFIXES = (".md", ".json", ".jsonl", ".yml", ".yaml", ".txt", ".html", ".py", ".sh", ".svg", ".sqlite", ".zip")
+
+
+@dataclass(frozen=True)
+class Heading:
+    """One ATX heading: ``level`` is the number of ``#`` marks and ``line`` is 1-based."""
+
+    level: int
+    title: str
+    line: int
+
+
+@dataclass(frozen=True)
+class Reference:
+    """A link or path-like code span; ``path`` is the target resolved from the repository root."""
+
+    target: str
+    path: str
+    text: str
+    line: int
+    kind: str
+
+
+def _is_external(target: str) -> bool:
+    return "://" in target or target.startswith(("mailto:", "#"))
+
+
+def _resolve(target: str, relative_to: str) -> str:
+    target = target.split("#", 1)[0]
+    if not target or _is_external(target):
+        return target
+    return posixpath.normpath(posixpath.join(relative_to, target))
+
+
+def _looks_like_path(span: str) -> bool:
+    return not any(character.isspace() for character in span) and ("/" in span or span.endswith(_PATH_SUFFIXES))
+
+
+class MarkdownDoc:
+    """One parsed Markdown file: its text plus heading, section, and reference indexes."""
+
+    def __init__(self, path: Path, text: str) -> None:
+        self.path = path
+        self.text = text
+        try:
+            self.name = path.relative_to(ROOT).as_posix()
+        except ValueError:
+            self.name = path.as_posix()
+        headings: List[Heading] = []
+        references: List[Reference] = []
+        base = posixpath.dirname(self.name)
+        for number, line in self._prose_lines():
+            heading = _HEADING.match(line)
+            if heading:
+                headings.append(Heading(len(heading.group(1)), heading.group(2), number))
+            for text, target in _LINK.findall(line):
+                references.append(Reference(target, _resolve(target, base), text, number, "link"))
+            for target in _AUTOLINK.findall(line):
+                references.append(Reference(target, target, target, number, "link"))
+            for span in _CODE_SPAN.findall(line):
+                if _looks_like_path(span):
+                    references.append(Reference(span, span.split("#", 1)[0], span, number, "code"))
+        self.headings: Tuple[Heading, ...] = tuple(headings)
+        self.references: Tuple[Reference, ...] = tuple(references)
+
+    def _prose_lines(self) -> Iterator[Tuple[int, str]]:
+        fence: str | None = None
+        for number, line in enumerate(self.text.splitlines(), start=1):
+            marker = _FENCE.match(line)
+            if marker:
+                if fence is None:
+                    fence = marker.group(1)
+                elif marker.group(1) == fence:
+                    fence = None
+                continue
+            if fence is None:
+                yield number, line
+
+    @cached_property
+    def lower(self) -> str:
+        """The full text, lowercased once for case-insensitive phrase checks."""
+
+        return self.text.lower()
+
+    @cached_property
+    def lines(self) -> Tuple[str, ...]:
+        """The text split into lines; ``lines[n - 1]`` is line ``n``."""
+
+        return tuple(self.text.splitlines())
+
+    @cached_property
+    def heading_titles(self) -> FrozenSet[str]:
+        """Every heading title, without its ``#`` marks."""
+
+        return frozenset(heading.title for heading in self.headings)
+
+    @cached_property
+    def sections(self) -> Dict[str, str]:
+        """Each heading title mapped to its section text, for the first heading with that title.
+
+        A section runs from its heading line up to the next heading of the same
+        or a higher level, so it includes its subsections.
+        """
+
+        sections: Dict[str, str] = {}
+        for index, heading in enumerate(self.headings):
+            end = next(
+                (later.line - 1 for later in self.headings[index + 1 :] if later.level <= heading.level),
+                len(self.lines),
+            )
+            sections.setdefault(heading.title, "\n".join(self.lines[heading.line - 1 : end]))
+        return sections
+
+    def section(self, title: str) -> str:
+        """Return the section under heading ``title``, failing with the available titles."""
+
+        try:
+            return self.sections[title]
+        except KeyError:
+            raise KeyError(f"{self.name} has no heading {title!r}; headings: {sorted(self.sections)}") from None
+
+    def has_heading(self, title: str, level: int | None = None) -> bool:
+        """Return whether a heading titled ``title`` exists, optionally at ``level``."""
+
+        return any(heading.title == title and (level is None or heading.level == level) for heading in self.headings)
+
+    @cached_property
+    def reference_targets(self) -> FrozenSet[str]:
+        """Every referenced target, both as written and resolved from the repository root."""
+
+        return frozenset(target for reference in self.references for target in (reference.target, reference.path))
+
+    def references_to(self, target: str) -> bool:
+        """Return whether the document links to or names ``target``."""
+
+        return target in self.reference_targets
+
+
+@lru_cache(maxsize=None)
+def _load(path: Path) -> MarkdownDoc:
+    return MarkdownDoc(path, path.read_text(encoding="utf-8"))
+
+
+def load_doc(path: Path | str) -> MarkdownDoc:
+    """Return the cached parse of ``path``; relative paths are taken from the repository root."""
+
+    candidate = Path(path)
+    return _load((candidate if candidate.is_absolute() else ROOT / candidate).resolve())
+
+
+def corpus() -> Dict[str, MarkdownDoc]:
+    """Return the top-level docs and every ``docs/*.md`` file keyed by repository-relative path."""
+
+    paths = [ROOT / name for name in TOP_LEVEL_DOCS] + sorted((ROOT / "docs").glob("*.md"))
+    return {path.relative_to(ROOT).as_posix(): load_doc(path) for path in paths if path.is_file()}
@@ -2,15 +2,16 @@
 
 from __future__ import annotations
 
-from pathlib import Path
 import unittest
 
+from app.cli.bundle import render_shell_script
+
 
 class AcceptanceHandoffCiBundleTests(unittest.TestCase):
     """Keep acceptance handoff artifacts discoverable in CI diagnostics."""
 
     def setUp(self) -> None:
-        self.script = Path("scripts/ci_report.sh").read_text(encoding="utf-8")
+        self.script = render_shell_script()
 
     def test_ci_report_builds_checklist_before_handoff(self) -> None:
         checklist_command = "app.cli.implementation_acceptance_checklist"
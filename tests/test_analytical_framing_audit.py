@@ -2,17 +2,35 @@
 
 from __future__ import annotations
 
+import contextlib
+import io
 import json
+import os
 from datetime import datetime, timezone
 from pathlib import Path
 from tempfile import TemporaryDirectory
 import unittest
 
+from unittest import mock
+
+from app.cli import analytical_framing_audit
 from app.cli.analytical_framing_audit import (
+    DEFAULT_CACHE_NAME,
     build_analytical_framing_audit,
+    load_findings_cache,
+    main,
     render_markdown,
     write_outputs,
 )
+from app.cli.artifact_manifest import (
+    BOOKKEEPING_NAMES,
+    BUNDLE_CACHE_DIR_NAME,
+    DEFAULT_CATALOG_NAME,
+    build_manifest,
+    write_json,
+)
+
+PAST_NS = 1_600_000_000 * 1_000_000_000
 
 
 class AnalyticalFramingAuditTests(unittest.TestCase):
@@ -86,6 +104,102 @@ class AnalyticalFramingAuditTests(unittest.TestCase):
         self.assertEqual(report["scanned_files"], ["included.md"])
         self.assertTrue(all(finding["path"] == "included.md" for finding in report["findings"]))
 
+    def test_bookkeeping_files_are_not_scanned(self) -> None:
+        with TemporaryDirectory() as temp_dir:
+            artifact_dir = Path(temp_dir)
+            (artifact_dir / "notes.md").write_text("Analytical estimate.\n", encoding="utf-8")
+            for name in sorted(BOOKKEEPING_NAMES - {BUNDLE_CACHE_DIR_NAME}):
+                (artifact_dir / name).write_text("{\"status\": \"guaranteed\"}\n", encoding="utf-8")
+            (artifact_dir / BUNDLE_CACHE_DIR_NAME).mkdir()
+            (artifact_dir / BUNDLE_CACHE_DIR_NAME / "copy.md").write_text("Guaranteed.\n", encoding="utf-8")
+            (artifact_dir / DEFAULT_CATALOG_NAME).write_text("guaranteed\n", encoding="utf-8")
+            (artifact_dir / "runs").mkdir()
+            (artifact_dir / "runs" / "bundle-state.json").write_text("{}\n", encoding="utf-8")
+
+            report = build_analytical_framing_audit(
+                artifact_dir=artifact_dir,
+                generated_at=datetime(2026, 1, 1, tzinfo=timezone.utc),
+                include_patterns=("*.md", "*.json", "*.sqlite"),
+            )
+
+        self.assertEqual(report["scanned_files"], ["notes.md", "runs/bundle-state.json"])
+
+    def test_single_pass_scan_matches_whole_file_semantics(self) -> None:
+        with TemporaryDirectory() as temp_dir:
+            artifact_dir = Path(temp_dir)
+            (artifact_dir / "runs" / ".cache").mkdir(parents=True)
+            (artifact_dir / "runs" / ".cache" / "hidden.md").write_text("Guaranteed.\n", encoding="utf-8")
+            (artifact_dir / "runs" / "late-caveat.md").write_text(
+                "The forecast is stable.\n" * 40 + "Each estimate carries uncertainty.\n",
+                encoding="utf-8",
+            )
+            (artifact_dir / "runs" / "breaks.txt").write_bytes(
+                b"plain\r\nstatus\x0cline\rThis definitely proves the forecast.\n"
+            )
+            (artifact_dir / "notes.md").write_text("Plain status output.\n", encoding="utf-8")
+
+            with mock.patch.object(analytical_framing_audit, "READ_CHUNK_BYTES", 7):
+                report = build_analytical_framing_audit(
+                    artifact_dir=artifact_dir,
+                    generated_at=datetime(2026, 1, 1, tzinfo=timezone.utc),
+                )
+            with mock.patch.object(analytical_framing_audit, "SCAN_BATCH_BYTES", 1):
+                pooled = build_analytical_framing_audit(
+                    artifact_dir=artifact_dir,
+                    generated_at=datetime(2026, 1, 1, tzinfo=timezone.utc),
+                    jobs=2,
+                )
+
+        self.assertEqual(report["scanned_files"], ["notes.md", "runs/breaks.txt", "runs/late-caveat.md"])
+        self.assertEqual(
+            [(finding["path"], finding["line"], finding["rule"]) for finding in report["findings"]],
+            [
+                ("notes.md", 1, "missing_safe_scope_terms"),
+                ("runs/breaks.txt", 4, "certainty_language"),
+                ("runs/breaks.txt", 4, "missing_uncertainty_caveat"),
+                ("runs/breaks.txt", 1, "missing_safe_scope_terms"),
+            ],
+        )
+        self.assertEqual(pooled, report)
+
+    def test_findings_cache_skips_files_listed_unchanged_in_manifest(self) -> None:
+        with TemporaryDirectory() as temp_dir:
+            artifact_dir = Path(temp_dir) / "artifacts"
+            artifact_dir.mkdir()
+            (artifact_dir / "reviewer-handoff.md").write_text("The forecast is guaranteed.\n", encoding="utf-8")
+            (artifact_dir / "summary.txt").write_text("Analytical estimate with uncertainty.\n", encoding="utf-8")
+            write_json(build_manifest(artifact_dir), artifact_dir / "artifact-manifest.json")
+            os.utime(artifact_dir / "reviewer-handoff.md", ns=(PAST_NS, PAST_NS))
+            os.utime(artifact_dir / "summary.txt", ns=(PAST_NS, PAST_NS))
+            with contextlib.redirect_stdout(io.StringIO()):
+                main(["--artifact-dir", str(artifact_dir), "--no-markdown", "--json-path", f"{temp_dir}/cold.json"])
+            cold = json.loads(Path(temp_dir, "cold.json").read_text(encoding="utf-8"))
+            cache_written = (artifact_dir / DEFAULT_CACHE_NAME).is_file()
+
+            cache = load_findings_cache(artifact_dir)
+            with mock.patch.object(analytical_framing_audit, "_iter_blocks", side_effect=AssertionError("file was read")):
+                warm = build_analytical_framing_audit(artifact_dir, generated_at=datetime.fromisoformat(cold["generated_at"]), cache=cache)
+
+        self.assertTrue(cache_written)
+        self.assertEqual(cache.hits, 2)
+        self.assertEqual(json.loads(json.dumps(warm)), cold)
+
+    def test_findings_cache_invalidates_when_rules_change(self) -> None:
+        with TemporaryDirectory() as temp_dir:
+            artifact_dir = Path(temp_dir)
+            (artifact_dir / "summary.txt").write_text("Plain status output.\n", encoding="utf-8")
+            cache = load_findings_cache(artifact_dir)
+            build_analytical_framing_audit(artifact_dir, cache=cache)
+            cache.save()
+            reused = load_findings_cache(artifact_dir)
+            with mock.patch.object(analytical_framing_audit, "REQUIRED_SCOPE_TERMS", ("plain",)):
+                changed = load_findings_cache(artifact_dir)
+                report = build_analytical_framing_audit(artifact_dir, cache=changed)
+
+        self.assertEqual(len(reused.entries), 1)
+        self.assertEqual(changed.entries, {})
+        self.assertEqual(report["findings"], [])
+
     def test_writers_create_markdown_and_json(self) -> None:
         with TemporaryDirectory() as temp_dir:
             artifact_dir = Path(temp_dir) / "artifacts"
@@ -10,6 +10,8 @@ from __future__ import annotations
 from pathlib import Path
 import unittest
 
+from tests.doc_corpus import load_doc
+
 
 ROOT = Path(__file__).resolve().parents[1]
 WORKFLOW = ROOT / ".github" / "workflows" / "analytical-framing-audit.yml"
@@ -39,7 +41,7 @@ class AnalyticalFramingAuditWorkflowTests(unittest.TestCase):
         self.assertIn("framing-audit-seed", content)
 
     def test_workflow_documentation_covers_reproduction_and_rollback(self) -> None:
-        content = DOC.read_text(encoding="utf-8")
+        content = load_doc(DOC).text
 
         self.assertIn("Local reproduction", content)
         self.assertIn("Review guidance", content)
@@ -0,0 +1,96 @@
+"""Tests for the indexed SQLite artifact catalog."""
+
+from __future__ import annotations
+
+import contextlib
+import io
+import json
+import os
+from pathlib import Path
+from tempfile import TemporaryDirectory
+import unittest
+
+from app.cli import artifact_manifest
+from app.cli.artifact_catalog import ArtifactCatalog, main, open_catalog, write_catalog
+
+
+def _write_bundle(artifact_dir: Path) -> None:
+    (artifact_dir / "synthetic-fixtures").mkdir(parents=True)
+    (artifact_dir / "synthetic-fixtures" / "synthetic-detections.jsonl").write_text('{"id": 1}\n', encoding="utf-8")
+    (artifact_dir / "release-health.json").write_text("{}\n", encoding="utf-8")
+    (artifact_dir / "copy-of-health.json").write_text("{}\n", encoding="utf-8")
+
+
+class ArtifactCatalogTests(unittest.TestCase):
+    """Keep the catalog consistent with the manifest it indexes."""
+
+    def test_catalog_indexes_entries_categories_and_missing_expected(self) -> None:
+        with TemporaryDirectory() as temp_dir:
+            artifact_dir = Path(temp_dir)
+            _write_bundle(artifact_dir)
+            manifest = artifact_manifest.build_manifest(artifact_dir)
+            manifest_path = artifact_dir / artifact_manifest.DEFAULT_JSON_NAME
+            artifact_manifest.write_json(manifest, manifest_path)
+            write_catalog(manifest, artifact_dir / artifact_manifest.DEFAULT_CATALOG_NAME, manifest_path=manifest_path)
+
+            with open_catalog(artifact_dir) as catalog:
+                health = catalog.entry("release-health.json")
+                fixtures = catalog.entries(prefix="synthetic-fixtures/")
+                duplicates = catalog.paths_with_digest(health["sha256"])
+                missing = catalog.missing_expected()
+                summary = catalog.summary()
+                self.assertIn("copy-of-health.json", catalog)
+                self.assertIsNone(catalog.entry("absent.json"))
+
+        self.assertEqual(health["size_bytes"], 3)
+        self.assertTrue(health["expected"])
+        self.assertEqual(health["category"], "release_gate")
+        self.assertEqual([entry["category"] for entry in fixtures], ["synthetic_fixture"])
+        self.assertFalse(fixtures[0]["operational_claim"])
+        self.assertEqual(duplicates, ["copy-of-health.json", "release-health.json"])
+        self.assertEqual(missing, manifest["missing_expected"])
+        self.assertEqual(summary["file_count"], 3)
+
+    def test_rewritten_manifest_makes_catalog_stale(self) -> None:
+        with TemporaryDirectory() as temp_dir:
+            artifact_dir = Path(temp_dir)
+            _write_bundle(artifact_dir)
+            with contextlib.redirect_stdout(io.StringIO()):
+                artifact_manifest.main(["--artifact-dir", str(artifact_dir), "--catalog", "--jobs", "1"])
+            catalog = open_catalog(artifact_dir)
+            self.assertIsNotNone(catalog)
+            catalog.close()
+            manifest_path = artifact_dir / artifact_manifest.DEFAULT_JSON_NAME
+            stat = manifest_path.stat()
+            os.utime(manifest_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+            self.assertIsNone(open_catalog(artifact_dir))
+            manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+        self.assertNotIn(artifact_manifest.DEFAULT_CATALOG_NAME, {entry["path"] for entry in manifest["files"]})
+
+    def test_cli_builds_and_queries_read_only(self) -> None:
+        with TemporaryDirectory() as temp_dir:
+            artifact_dir = Path(temp_dir)
+            _write_bundle(artifact_dir)
+            artifact_manifest.write_json(
+                artifact_manifest.build_manifest(artifact_dir), artifact_dir / artifact_manifest.DEFAULT_JSON_NAME
+            )
+            output = io.StringIO()
+            errors = io.StringIO()
+            with contextlib.redirect_stdout(output), contextlib.redirect_stderr(errors):
+                built = main(["--artifact-dir", str(artifact_dir)])
+                queried = main(
+                    ["--artifact-dir", str(artifact_dir), "--query", "SELECT category, COUNT(*) AS n FROM artifacts GROUP BY category"]
+                )
+                refused = main(["--artifact-dir", str(artifact_dir), "--query", "DELETE FROM artifacts"])
+            with ArtifactCatalog.open(artifact_dir / artifact_manifest.DEFAULT_CATALOG_NAME) as catalog:
+                remaining = len(catalog.entries())
+
+        self.assertEqual((built, queried, refused), (0, 0, 1))
+        self.assertIn('{"category": "synthetic_fixture", "n": 1}', output.getvalue())
+        self.assertIn("readonly", errors.getvalue())
+        self.assertEqual(remaining, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -12,6 +12,8 @@ from pathlib import Path
 import re
 import unittest
 
+from tests.doc_corpus import load_doc
+
 
 ROOT = Path(__file__).resolve().parents[1]
 DOC = ROOT / "docs" / "artifact_consumer_compatibility.md"
@@ -45,7 +47,7 @@ class ArtifactConsumerCompatibilityDocsTests(unittest.TestCase):
     """Ensure downstream artifact consumer guidance stays complete and safe-scoped."""
 
     def test_safe_scope_and_analytical_limits_are_explicit(self) -> None:
-        content = DOC.read_text(encoding="utf-8")
+        content = load_doc(DOC).text
 
         for phrase in [
             "deterministic local/ci evidence",
@@ -65,7 +67,7 @@ class ArtifactConsumerCompatibilityDocsTests(unittest.TestCase):
                 assert_normalized_contains(self, phrase, content)
 
     def test_consumer_rules_preserve_additive_schema_compatibility(self) -> None:
-        content = DOC.read_text(encoding="utf-8")
+        content = load_doc(DOC).text
 
         for term in [
             "`schema_version`",
@@ -83,7 +85,7 @@ class ArtifactConsumerCompatibilityDocsTests(unittest.TestCase):
                 assert_normalized_contains(self, term, content)
 
     def test_recommended_parsing_order_mentions_core_handoff_artifacts(self) -> None:
-        content = DOC.read_text(encoding="utf-8")
+        content = load_doc(DOC).text
 
         for artifact in [
             "release-bundle-index.html",
@@ -106,7 +108,7 @@ class ArtifactConsumerCompatibilityDocsTests(unittest.TestCase):
                 self.assertIn(artifact, content)
 
     def test_merge_blockers_and_wrong_head_checks_are_documented(self) -> None:
-        content = DOC.read_text(encoding="utf-8")
+        content = load_doc(DOC).text
 
         for blocker in [
             "missing",
@@ -126,7 +128,7 @@ class ArtifactConsumerCompatibilityDocsTests(unittest.TestCase):
                 assert_normalized_contains(self, blocker, content)
 
     def test_related_docs_and_narrow_commands_remain_discoverable(self) -> None:
-        content = DOC.read_text(encoding="utf-8")
+        content = load_doc(DOC).text
 
         for term in [
             "docs/reviewer_handoff_navigation.md",
@@ -149,8 +151,8 @@ class ArtifactConsumerCompatibilityDocsTests(unittest.TestCase):
                 self.assertIn(term, content)
 
     def test_documents_compatibility_rollback_migration_and_changelog(self) -> None:
-        doc = DOC.read_text(encoding="utf-8")
-        changelog = CHANGELOG.read_text(encoding="utf-8")
+        doc = load_doc(DOC).text
+        changelog = load_doc(CHANGELOG).text
 
         self.assertIn("changes no runtime behavior", doc)
         self.assertIn("public API", doc)
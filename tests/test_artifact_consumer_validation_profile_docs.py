@@ -11,6 +11,8 @@ from pathlib import Path
 import re
 import unittest
 
+from tests.doc_corpus import load_doc
+
 
 ROOT = Path(__file__).resolve().parents[1]
 DOC = ROOT / "docs" / "artifact_consumer_validation_profile.md"
@@ -38,7 +40,7 @@ class ArtifactConsumerValidationProfileDocsTests(unittest.TestCase):
     """Ensure the consumer validation profile stays complete and safe-scoped."""
 
     def test_validation_levels_are_documented(self) -> None:
-        content = DOC.read_text(encoding="utf-8")
+        content = load_doc(DOC).text
 
         for term in [
             "`fail`",
@@ -54,7 +56,7 @@ class ArtifactConsumerValidationProfileDocsTests(unittest.TestCase):
                 assert_normalized_contains(self, term, content)
 
     def test_hard_fail_conditions_prioritize_required_evidence(self) -> None:
-        content = DOC.read_text(encoding="utf-8")
+        content = load_doc(DOC).text
 
         for term in [
             "required hosted check",
@@ -74,7 +76,7 @@ class ArtifactConsumerValidationProfileDocsTests(unittest.TestCase):
                 assert_normalized_contains(self, term, content)
 
     def test_warning_conditions_allow_additive_schema_evolution(self) -> None:
-        content = DOC.read_text(encoding="utf-8")
+        content = load_doc(DOC).text
 
         for term in [
             "optional artifacts",
@@ -93,7 +95,7 @@ class ArtifactConsumerValidationProfileDocsTests(unittest.TestCase):
                 assert_normalized_contains(self, term, content)
 
     def test_consumer_output_contract_keeps_blockers_visible(self) -> None:
-        content = DOC.read_text(encoding="utf-8")
+        content = load_doc(DOC).text
 
         for field in [
             "profile_name",
@@ -120,7 +122,7 @@ class ArtifactConsumerValidationProfileDocsTests(unittest.TestCase):
                 assert_normalized_contains(self, phrase, content)
 
     def test_safe_scope_and_related_docs_remain_discoverable(self) -> None:
-        content = DOC.read_text(encoding="utf-8")
+        content = load_doc(DOC).text
 
         for term in [
             "analytical estimates",
@@ -145,12 +147,12 @@ class ArtifactConsumerValidationProfileDocsTests(unittest.TestCase):
                 assert_normalized_contains(self, term, content)
 
     def test_changelog_references_profile(self) -> None:
-        changelog = CHANGELOG.read_text(encoding="utf-8")
+        changelog = load_doc(CHANGELOG).text
 
         assert_normalized_contains(self, "artifact consumer validation profile", changelog)
 
     def test_rollback_and_compatibility_are_narrow(self) -> None:
-        content = DOC.read_text(encoding="utf-8")
+        content = load_doc(DOC).text
 
         for phrase in [
             "documentation-only",
@@ -0,0 +1,85 @@
+"""Tests for the shared artifact document cache."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from tempfile import TemporaryDirectory
+import unittest
+
+from app.cli.artifact_context import ArtifactContext, resolve_context, shared_context
+from app.cli.operator_digest import build_operator_digest
+from app.cli.reviewer_handoff import build_handoff
+
+
+def _write_json(path: Path, payload: object) -> None:
+    path.write_text(json.dumps(payload, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+
+
+class ArtifactContextTests(unittest.TestCase):
+    """Parse each artifact once per file version and share it between builders."""
+
+    def test_load_json_memoizes_until_file_metadata_changes(self) -> None:
+        with TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "triage-summary.json"
+            _write_json(path, {"status": "pass"})
+            context = ArtifactContext()
+
+            first = context.load_json(path)
+            second = context.load_json(Path(temp_dir) / "." / "triage-summary.json")
+            _write_json(path, {"status": "fail", "extra": True})
+            os.utime(path, ns=(1, 1))
+            third = context.load_json(path)
+
+        self.assertIs(first, second)
+        self.assertEqual(third["status"], "fail")
+        self.assertEqual(context.parses, 2)
+
+    def test_load_json_raises_like_a_direct_read(self) -> None:
+        with TemporaryDirectory() as temp_dir:
+            broken = Path(temp_dir) / "broken.json"
+            broken.write_text("{", encoding="utf-8")
+            context = ArtifactContext()
+
+            with self.assertRaises(FileNotFoundError):
+                context.load_json(Path(temp_dir) / "missing.json")
+            with self.assertRaises(json.JSONDecodeError):
+                context.load_json(broken)
+
+    def test_forget_drops_files_and_directories(self) -> None:
+        with TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            (root / "synthetic-fixtures").mkdir()
+            nested = root / "synthetic-fixtures" / "synthetic-fixtures-summary.json"
+            sibling = root / "synthetic-fixtures-summary.json"
+            for path in (nested, sibling):
+                _write_json(path, {"rows": 1})
+            context = ArtifactContext()
+            context.load_json(nested)
+            context.load_json(sibling)
+
+            context.forget([root / "synthetic-fixtures"])
+            context.load_json(nested)
+            context.load_json(sibling)
+
+        self.assertEqual(context.parses, 3)
+
+    def test_builders_share_the_installed_context(self) -> None:
+        with TemporaryDirectory() as temp_dir:
+            artifact_dir = Path(temp_dir)
+            _write_json(artifact_dir / "release-health.json", [{"name": "imports", "status": "pass"}])
+            _write_json(artifact_dir / "artifact-manifest.json", {"files": [], "missing_expected": []})
+            _write_json(artifact_dir / "triage-summary.json", {"status": "pass"})
+            with shared_context() as context:
+                build_handoff(artifact_dir)
+                build_operator_digest(artifact_dir)
+                installed = resolve_context()
+
+        self.assertIs(installed, context)
+        self.assertEqual(context.parses, 3)
+        self.assertIsNot(resolve_context(), context)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,13 +2,35 @@
 
 from __future__ import annotations
 
+import contextlib
 import hashlib
+import io
 import json
+import os
 from pathlib import Path
 from tempfile import TemporaryDirectory
 import unittest
 
-from app.cli.artifact_manifest import EXPECTED_ARTIFACTS, build_manifest, write_json, write_markdown
+from app.cli.artifact_manifest import (
+    DEFAULT_HASH_CACHE_NAME,
+    EXPECTED_ARTIFACTS,
+    build_manifest,
+    load_hash_cache,
+    main,
+    stream_manifest,
+    write_json,
+    write_jsonl,
+    write_markdown,
+)
+
+PAST_NS = 1_600_000_000 * 1_000_000_000
+
+
+def _write_settled(path: Path, payload: bytes) -> None:
+    """Write ``payload`` with an old mtime so the hash cache may trust it."""
+
+    path.write_bytes(payload)
+    os.utime(path, ns=(PAST_NS, PAST_NS))
 
 
 class ArtifactManifestTests(unittest.TestCase):
@@ -42,6 +64,98 @@ class ArtifactManifestTests(unittest.TestCase):
         self.assertEqual(manifest["files"][0]["sha256"], hashlib.sha256(payload).hexdigest())
         self.assertEqual(manifest["scan_warnings"], [])
 
+    def test_parallel_hashing_keeps_sorted_path_order(self) -> None:
+        with TemporaryDirectory() as temp_dir:
+            artifact_dir = Path(temp_dir)
+            (artifact_dir / "synthetic-fixtures").mkdir()
+            for name in ("synthetic-fixtures/b.jsonl", "synthetic-fixtures/a.csv", "synthetic-fixtures-summary.json", "a.txt"):
+                (artifact_dir / name).write_text(f"{name}\n", encoding="utf-8")
+            (artifact_dir / "linked").symlink_to(artifact_dir / "synthetic-fixtures", target_is_directory=True)
+
+            serial = build_manifest(artifact_dir, jobs=1)
+            parallel = build_manifest(artifact_dir, jobs=4)
+
+        paths = [entry["path"] for entry in parallel["files"]]
+        self.assertEqual(
+            paths,
+            ["a.txt", "synthetic-fixtures/a.csv", "synthetic-fixtures/b.jsonl", "synthetic-fixtures-summary.json"],
+        )
+        self.assertEqual(serial["files"], parallel["files"])
+        self.assertEqual(
+            parallel["files"][0]["sha256"],
+            hashlib.sha256(b"a.txt\n").hexdigest(),
+        )
+
+    def test_manifest_skips_incremental_bundle_bookkeeping(self) -> None:
+        with TemporaryDirectory() as temp_dir:
+            artifact_dir = Path(temp_dir)
+            (artifact_dir / "summary.txt").write_text("summary\n", encoding="utf-8")
+            (artifact_dir / "bundle-state.json").write_text("{}\n", encoding="utf-8")
+            (artifact_dir / "bundle-cache").mkdir()
+            (artifact_dir / "bundle-cache" / ("0" * 64)).write_text("blob\n", encoding="utf-8")
+
+            manifest = build_manifest(artifact_dir)
+
+        self.assertEqual([entry["path"] for entry in manifest["files"]], ["summary.txt"])
+
+    def test_hash_cache_reuses_digests_until_metadata_changes(self) -> None:
+        with TemporaryDirectory() as temp_dir:
+            artifact_dir = Path(temp_dir)
+            _write_settled(artifact_dir / "summary.txt", b"summary\n")
+            _write_settled(artifact_dir / "pip-freeze.txt", b"fastapi==0.1\n")
+            first_cache = load_hash_cache(artifact_dir)
+            first = build_manifest(artifact_dir, first_cache)
+            first_cache.save()
+
+            second_cache = load_hash_cache(artifact_dir)
+            second = build_manifest(artifact_dir, second_cache)
+            second_cache.save()
+            _write_settled(artifact_dir / "summary.txt", b"summary with more text\n")
+            third_cache = load_hash_cache(artifact_dir)
+            third = build_manifest(artifact_dir, third_cache)
+
+        self.assertEqual(first_cache.hits, [])
+        self.assertEqual(first["files"], second["files"])
+        self.assertEqual(sorted(name for name, _ in second_cache.hits), ["pip-freeze.txt", "summary.txt"])
+        self.assertEqual([name for name, _ in third_cache.hits], ["pip-freeze.txt"])
+        self.assertEqual(
+            third["files"][1]["sha256"],
+            hashlib.sha256(b"summary with more text\n").hexdigest(),
+        )
+
+    def test_hash_cache_rehashes_files_from_the_same_timestamp_tick_as_the_cache(self) -> None:
+        with TemporaryDirectory() as temp_dir:
+            artifact_dir = Path(temp_dir)
+            _write_settled(artifact_dir / "summary.txt", b"summary\n")
+            cache = load_hash_cache(artifact_dir)
+            build_manifest(artifact_dir, cache)
+            cache.save()
+            os.utime(artifact_dir / DEFAULT_HASH_CACHE_NAME, ns=(PAST_NS, PAST_NS))
+
+            reloaded = load_hash_cache(artifact_dir)
+            build_manifest(artifact_dir, reloaded)
+
+        self.assertEqual(reloaded.hits, [])
+
+    def test_verify_cache_detects_stale_digest_and_rehashes(self) -> None:
+        with TemporaryDirectory() as temp_dir:
+            artifact_dir = Path(temp_dir)
+            _write_settled(artifact_dir / "summary.txt", b"summary\n")
+            with contextlib.redirect_stdout(io.StringIO()):
+                main(["--artifact-dir", str(artifact_dir)])
+            _write_settled(artifact_dir / "summary.txt", b"SUMMARY\n")
+            stderr = io.StringIO()
+            with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(stderr):
+                status = main(["--artifact-dir", str(artifact_dir), "--verify-cache"])
+            manifest = json.loads((artifact_dir / "artifact-manifest.json").read_text(encoding="utf-8"))
+            cache = json.loads((artifact_dir / DEFAULT_HASH_CACHE_NAME).read_text(encoding="utf-8"))
+
+        expected = hashlib.sha256(b"SUMMARY\n").hexdigest()
+        self.assertEqual(status, 0)
+        self.assertIn("stale digests for summary.txt", stderr.getvalue())
+        self.assertEqual(manifest["files"][0]["sha256"], expected)
+        self.assertEqual(cache["entries"]["summary.txt"]["sha256"], expected)
+
     def test_manifest_writers_create_json_and_markdown(self) -> None:
         with TemporaryDirectory() as temp_dir:
             artifact_dir = Path(temp_dir) / "artifacts"
@@ -61,6 +175,53 @@ class ArtifactManifestTests(unittest.TestCase):
         self.assertIn("summary.txt", markdown)
         self.assertIn("# Diagnostic artifact manifest", markdown)
 
+    def test_streamed_outputs_match_in_memory_writers(self) -> None:
+        for file_names in ((), ("summary.txt", "nested/a-b.json", "nested/a/b.txt", "python-version.txt")):
+            with self.subTest(files=len(file_names)), TemporaryDirectory() as temp_dir:
+                artifact_dir = Path(temp_dir) / "bundle"
+                for name in file_names:
+                    (artifact_dir / name).parent.mkdir(parents=True, exist_ok=True)
+                    (artifact_dir / name).write_text(f"{name}\n", encoding="utf-8")
+                artifact_dir.mkdir(exist_ok=True)
+                out_dir = Path(temp_dir) / "out"
+                manifest = build_manifest(artifact_dir, jobs=2)
+                write_json(manifest, out_dir / "memory.json")
+                write_markdown(manifest, out_dir / "memory.md")
+                write_jsonl(manifest, out_dir / "memory.jsonl")
+                summary = stream_manifest(
+                    artifact_dir,
+                    out_dir / "stream.json",
+                    out_dir / "stream.md",
+                    out_dir / "stream.jsonl",
+                    jobs=2,
+                )
+                outputs = {}
+                for suffix in ("json", "md", "jsonl"):
+                    for mode in ("memory", "stream"):
+                        text = (out_dir / f"{mode}.{suffix}").read_text(encoding="utf-8")
+                        outputs[mode, suffix] = text.replace(summary["generated_at"], "").replace(manifest["generated_at"], "")
+
+            for suffix in ("json", "md", "jsonl"):
+                self.assertEqual(outputs["stream", suffix], outputs["memory", suffix])
+            self.assertNotIn("files", summary)
+            self.assertEqual(summary["file_count"], len(file_names))
+
+    def test_jsonl_sidecar_starts_with_summary_and_is_not_indexed(self) -> None:
+        with TemporaryDirectory() as temp_dir:
+            artifact_dir = Path(temp_dir)
+            (artifact_dir / "summary.txt").write_text("bundle\n", encoding="utf-8")
+            with contextlib.redirect_stdout(io.StringIO()):
+                main(["--artifact-dir", temp_dir, "--stream", "--jsonl", "--no-hash-cache"])
+                main(["--artifact-dir", temp_dir, "--stream", "--jsonl", "--no-hash-cache"])
+            lines = (artifact_dir / "artifact-manifest.jsonl").read_text(encoding="utf-8").splitlines()
+            manifest = json.loads((artifact_dir / "artifact-manifest.json").read_text(encoding="utf-8"))
+
+        header = json.loads(lines[0])
+        self.assertEqual(header["record"], "summary")
+        self.assertEqual(header["file_count"], 1)
+        self.assertEqual([json.loads(line)["path"] for line in lines[1:]], ["summary.txt"])
+        self.assertEqual([entry["path"] for entry in manifest["files"]], ["summary.txt"])
+
     def test_operator_next_steps_artifacts_are_expected_outputs(self) -> None:
         self.assertIn("operator-next-steps.md", EXPECTED_ARTIFACTS)
         self.assertIn("operator-next-steps.json", EXPECTED_ARTIFACTS)
@@ -0,0 +1,91 @@
+"""Tests for Merkle directory digests over artifact manifests."""
+
+from __future__ import annotations
+
+import contextlib
+import io
+from pathlib import Path
+from tempfile import TemporaryDirectory
+import unittest
+from unittest import mock
+
+from app.cli import artifact_manifest
+from app.cli.artifact_merkle import MerkleBuilder, changed_directories, manifest_merkle, merkle_tree
+
+
+def _entry(path: str, digest: str = "a", size: int = 1) -> dict:
+    return {"path": path, "size_bytes": size, "sha256": digest * 64}
+
+
+ENTRIES = [
+    _entry("previews/a.svg"),
+    _entry("previews/nested/b.svg", "b"),
+    _entry("previews-index.html", "c"),
+    _entry("summary.txt", "d"),
+    _entry("synthetic-fixtures/one.jsonl", "e", 4),
+]
+
+
+class ArtifactMerkleTests(unittest.TestCase):
+    """Keep directory digests deterministic, local, and comparable."""
+
+    def test_directory_digest_matches_subtree_recomputed_alone(self) -> None:
+        tree = merkle_tree(ENTRIES)
+
+        self.assertEqual(list(tree["directories"]), [".", "previews", "previews/nested", "synthetic-fixtures"])
+        self.assertEqual(tree["directories"]["."]["file_count"], 5)
+        self.assertEqual(tree["directories"]["previews"]["total_size_bytes"], 2)
+        self.assertEqual(tree["root"], tree["directories"]["."]["digest"])
+        for directory in ("previews", "previews/nested", "synthetic-fixtures"):
+            self.assertEqual(merkle_tree(ENTRIES, directory)["root"], tree["directories"][directory]["digest"])
+        self.assertEqual(merkle_tree(reversed(ENTRIES)), tree)
+
+    def test_builder_rejects_out_of_order_paths(self) -> None:
+        builder = MerkleBuilder()
+        builder.add("b.txt", 1, "a" * 64)
+
+        with self.assertRaises(ValueError):
+            builder.add("a.txt", 1, "a" * 64)
+
+    def test_changed_directories_skips_identical_subtrees(self) -> None:
+        base = merkle_tree(ENTRIES)
+        head_entries = [dict(entry) for entry in ENTRIES]
+        head_entries[1]["sha256"] = "f" * 64
+        head_entries.append(_entry("logs/new.log"))
+        head = merkle_tree(head_entries)
+
+        self.assertEqual(changed_directories(base, head), [".", "logs", "previews", "previews/nested"])
+        self.assertEqual(changed_directories(base, base), [])
+
+    def test_manifest_records_tree_and_verifies_one_directory(self) -> None:
+        with TemporaryDirectory() as temp_dir:
+            artifact_dir = Path(temp_dir)
+            for entry in ENTRIES:
+                path = artifact_dir / entry["path"]
+                path.parent.mkdir(parents=True, exist_ok=True)
+                path.write_text(entry["path"], encoding="utf-8")
+            manifest = artifact_manifest.build_manifest(artifact_dir)
+            artifact_manifest.write_json(manifest, artifact_dir / artifact_manifest.DEFAULT_JSON_NAME)
+            (artifact_dir / "previews" / "a.svg").write_text("changed", encoding="utf-8")
+
+            with mock.patch.object(artifact_manifest, "_sha256", wraps=artifact_manifest._sha256) as hashed:
+                fixtures = artifact_manifest.verify_directory(artifact_dir, manifest, "synthetic-fixtures", jobs=1)
+            previews = artifact_manifest.verify_directory(artifact_dir, manifest, "previews/", jobs=1)
+            errors = io.StringIO()
+            with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(errors):
+                status = artifact_manifest.main(
+                    ["--artifact-dir", str(artifact_dir), "--verify-directory", "synthetic-fixtures", "--verify-directory", "."]
+                )
+
+        self.assertEqual(manifest["merkle"], merkle_tree(manifest["files"]))
+        self.assertEqual(manifest_merkle({"files": manifest["files"]}), manifest["merkle"])
+        self.assertTrue(fixtures["verified"])
+        self.assertEqual([call.args[0].name for call in hashed.call_args_list], ["one.jsonl"])
+        self.assertFalse(previews["verified"])
+        self.assertEqual(previews["mismatched_paths"], ["previews/a.svg"])
+        self.assertEqual(status, 1)
+        self.assertIn(".: Merkle digest mismatch; changed: previews/a.svg", errors.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
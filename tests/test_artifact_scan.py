@@ -0,0 +1,98 @@
+"""Tests for the fused artifact manifest, gap report, and provenance ledger scan."""
+
+from __future__ import annotations
+
+import contextlib
+import io
+import json
+from pathlib import Path
+from tempfile import TemporaryDirectory
+import unittest
+from unittest import mock
+
+from app.cli import artifact_manifest
+from app.cli.artifact_catalog import open_catalog
+from app.cli.artifact_gap_report import build_gap_report
+from app.cli.artifact_provenance_ledger import build_provenance_ledger
+from app.cli.artifact_scan import main, scan_artifacts, write_outputs
+
+
+def _without_timestamp(payload: dict) -> dict:
+    return {key: value for key, value in payload.items() if key != "generated_at"}
+
+
+def _write_bundle(artifact_dir: Path) -> None:
+    (artifact_dir / "synthetic-fixtures").mkdir(parents=True)
+    (artifact_dir / "synthetic-fixtures" / "synthetic-detections.jsonl").write_text('{"id": 1}\n', encoding="utf-8")
+    (artifact_dir / "reviewer-handoff.md").write_text("# Handoff\n", encoding="utf-8")
+    (artifact_dir / "release-health.json").write_text("{}\n", encoding="utf-8")
+    (artifact_dir / "empty.log").write_text("", encoding="utf-8")
+
+
+class ArtifactScanTests(unittest.TestCase):
+    """Keep the fused scan equivalent to the three standalone commands."""
+
+    def test_views_match_standalone_builders(self) -> None:
+        with TemporaryDirectory() as temp_dir:
+            artifact_dir = Path(temp_dir) / "artifacts"
+            _write_bundle(artifact_dir)
+            manifest_path = Path(temp_dir) / "out" / "artifact-manifest.json"
+
+            scan = scan_artifacts(artifact_dir, manifest_path=manifest_path)
+            fused = (scan.manifest, scan.gap_report, scan.provenance_ledger)
+
+            artifact_manifest.write_json(artifact_manifest.build_manifest(artifact_dir), manifest_path)
+            manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+            separate = (
+                manifest,
+                build_gap_report(artifact_dir, manifest_path),
+                build_provenance_ledger(artifact_dir, manifest_path=manifest_path),
+            )
+
+        for fused_view, separate_view in zip(fused, separate):
+            self.assertEqual(_without_timestamp(fused_view), _without_timestamp(separate_view))
+        self.assertIn("empty.log", scan.gap_report["empty_files"])
+        self.assertEqual(scan.provenance_ledger["category_counts"]["synthetic_fixture"], 1)
+
+    def test_directory_is_walked_once_for_all_outputs(self) -> None:
+        with TemporaryDirectory() as temp_dir:
+            artifact_dir = Path(temp_dir)
+            _write_bundle(artifact_dir)
+            with mock.patch.object(artifact_manifest, "_scan_files", wraps=artifact_manifest._scan_files) as walk:
+                scan = scan_artifacts(artifact_dir)
+                written = write_outputs(
+                    scan,
+                    artifact_dir / "artifact-manifest.md",
+                    artifact_dir / "artifact-provenance-ledger.json",
+                    artifact_dir / "artifact-provenance-ledger.md",
+                    artifact_dir / "artifact-gap-report.json",
+                    artifact_dir / "artifact-gap-report.md",
+                    artifact_dir / "artifact-catalog.sqlite",
+                )
+            ledger = json.loads((artifact_dir / "artifact-provenance-ledger.json").read_text(encoding="utf-8"))
+            with open_catalog(artifact_dir) as catalog:
+                catalog_categories = {entry["path"]: entry["category"] for entry in catalog.entries()}
+
+        self.assertEqual(walk.call_count, 1)
+        self.assertEqual(len(written), 7)
+        self.assertEqual(catalog_categories, {entry["path"]: entry["category"] for entry in ledger["entries"]})
+        self.assertNotIn("artifact-gap-report.json", {entry["path"] for entry in ledger["entries"]})
+
+    def test_cli_skips_views_and_fails_on_gap(self) -> None:
+        with TemporaryDirectory() as temp_dir:
+            artifact_dir = Path(temp_dir)
+            _write_bundle(artifact_dir)
+            output = io.StringIO()
+            with contextlib.redirect_stdout(output):
+                status = main(["--artifact-dir", str(artifact_dir), "--no-provenance-ledger", "--fail-on-gap", "--jobs", "1"])
+
+            self.assertEqual(status, 1)
+            self.assertTrue((artifact_dir / "artifact-manifest.json").exists())
+            self.assertTrue((artifact_dir / "artifact-gap-report.json").exists())
+            self.assertFalse((artifact_dir / "artifact-provenance-ledger.json").exists())
+            self.assertTrue((artifact_dir / artifact_manifest.DEFAULT_HASH_CACHE_NAME).exists())
+        self.assertIn("artifact-gap-report.md", output.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
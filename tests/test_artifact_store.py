@@ -0,0 +1,170 @@
+"""Tests for the content-addressed artifact store."""
+
+from __future__ import annotations
+
+import contextlib
+import errno
+import io
+import json
+from pathlib import Path
+from tempfile import TemporaryDirectory
+import unittest
+from unittest import mock
+
+from app.cli import artifact_manifest, artifact_store
+from app.cli.artifact_store import ArtifactStore, StoreError, main
+
+
+def _write_bundle(artifact_dir: Path, health: str) -> None:
+    (artifact_dir / "previews").mkdir(parents=True)
+    (artifact_dir / "previews" / "dashboard.svg").write_text("<svg/>\n", encoding="utf-8")
+    (artifact_dir / "doctor-help.txt").write_text("usage: doctor\n", encoding="utf-8")
+    (artifact_dir / "release-health.json").write_text(health, encoding="utf-8")
+
+
+def _digest(store: ArtifactStore, name: str, path: str) -> str:
+    return next(entry["sha256"] for entry in store.manifest(name)["files"] if entry["path"] == path)
+
+
+class ArtifactStoreTests(unittest.TestCase):
+    """Keep shared objects deduplicated, checkouts complete, and collection safe."""
+
+    def test_bundles_share_objects_and_check_out_by_requested_hardlink(self) -> None:
+        with TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            _write_bundle(root / "run-1", '{"status": "pass"}\n')
+            _write_bundle(root / "run-2", '{"status": "fail"}\n')
+            store = ArtifactStore(root / "store")
+
+            first = store.add(root / "run-1", "run-1", link_mode="copy")
+            second = store.add(root / "run-2", "run-2", link_mode="copy")
+            checkout = store.checkout("run-2", root / "restored", link_mode="hardlink")
+            restored = root / "restored" / "previews" / "dashboard.svg"
+            linked = restored.stat().st_ino == store.object_path(_digest(store, "run-2", "previews/dashboard.svg")).stat().st_ino
+            health = (root / "restored" / "release-health.json").read_text(encoding="utf-8")
+            restored_manifest = json.loads((root / "restored" / artifact_manifest.DEFAULT_JSON_NAME).read_text(encoding="utf-8"))
+            usage = store.usage()
+
+        self.assertEqual((first["new_objects"], second["new_objects"]), (3, 1))
+        self.assertEqual(second["reused_bytes"], len("<svg/>\n") + len("usage: doctor\n"))
+        self.assertEqual(checkout["link_modes"], {"hardlink": 3})
+        self.assertTrue(linked)
+        self.assertEqual(health, '{"status": "fail"}\n')
+        self.assertEqual(len(restored_manifest["files"]), 3)
+        self.assertEqual([bundle["name"] for bundle in usage["bundles"]], ["run-1", "run-2"])
+        self.assertEqual(usage["object_count"], 4)
+        self.assertEqual(usage["saved_bytes"], second["reused_bytes"])
+
+    def test_gc_keeps_only_objects_retained_manifests_reference(self) -> None:
+        with TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            _write_bundle(root / "run-1", '{"status": "pass"}\n')
+            _write_bundle(root / "run-2", '{"status": "fail"}\n')
+            store = ArtifactStore(root / "store")
+            store.add(root / "run-1", "run-1")
+            store.add(root / "run-2", "run-2")
+            store.drop("run-1")
+
+            dry_run = store.gc(dry_run=True)
+            collected = store.gc()
+            with self.assertRaises(StoreError):
+                store.checkout("run-1", root / "gone")
+            store.checkout("run-2", root / "kept")
+
+        self.assertEqual((dry_run["removed_objects"], collected["removed_objects"]), (1, 1))
+        self.assertEqual(collected["removed_bytes"], len('{"status": "pass"}\n'))
+        self.assertEqual(collected["kept_objects"], 3)
+
+    def test_changed_file_is_not_stored_and_manifest_is_not_published(self) -> None:
+        with TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            _write_bundle(root / "run", '{"status": "pass"}\n')
+            manifest = artifact_manifest.build_manifest(root / "run")
+            (root / "run" / "release-health.json").write_text('{"status": "edited"}\n', encoding="utf-8")
+            store = ArtifactStore(root / "store")
+
+            with self.assertRaises(StoreError):
+                store.add(root / "run", "run", manifest=manifest, link_mode="copy")
+            with self.assertRaises(StoreError):
+                store.add(root / "run", "../escape", manifest=manifest)
+
+            self.assertEqual(store.names(), [])
+            self.assertEqual(list(store.manifests_dir.iterdir()), [])
+            self.assertEqual(store.gc()["removed_objects"], 2)
+
+    def test_add_and_default_checkout_never_share_inodes_with_objects(self) -> None:
+        with TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            _write_bundle(root / "run", '{"status": "pass"}\n')
+            store = ArtifactStore(root / "store")
+            unsupported = OSError(errno.EOPNOTSUPP, "reflink unsupported")
+
+            with mock.patch.dict(artifact_store._PLACERS, {"reflink": mock.Mock(side_effect=unsupported)}):
+                added = store.add(root / "run", "run", link_mode="hardlink")
+                checkout = store.checkout("run", root / "restored")
+            live = (root / "run" / "doctor-help.txt").stat().st_ino
+            restored = (root / "restored" / "doctor-help.txt").stat().st_ino
+            stored = store.object_path(_digest(store, "run", "doctor-help.txt")).stat().st_ino
+
+        self.assertEqual(added["link_modes"], {"copy": 3})
+        self.assertEqual(checkout["link_modes"], {"copy": 3})
+        self.assertNotIn(stored, {live, restored})
+
+    def test_replace_swaps_files_for_reflinks_only(self) -> None:
+        with TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            _write_bundle(root / "run", '{"status": "pass"}\n')
+            _write_bundle(root / "old", '{"status": "pass"}\n')
+            store = ArtifactStore(root / "store")
+            unsupported = OSError(errno.EOPNOTSUPP, "reflink unsupported")
+            clone = mock.Mock(side_effect=artifact_store._copy)
+
+            with mock.patch.dict(artifact_store._PLACERS, {"reflink": mock.Mock(side_effect=unsupported)}):
+                skipped = store.add(root / "old", "old", replace=True)
+            with mock.patch.dict(artifact_store._PLACERS, {"reflink": clone}):
+                summary = store.add(root / "run", "run", replace=True)
+            health = root / "run" / "release-health.json"
+            health.write_text('{"status": "edited"}\n', encoding="utf-8")
+            stored = store.object_path(_digest(store, "run", "release-health.json"))
+            stored_health = stored.read_text(encoding="utf-8")
+            shared = health.stat().st_ino == stored.stat().st_ino
+
+        self.assertEqual((skipped["replaced_files"], skipped["reflink_unsupported"]), (0, True))
+        self.assertEqual((summary["replaced_files"], summary["reflink_unsupported"]), (3, False))
+        self.assertEqual(clone.call_count, 3)
+        self.assertFalse(shared)
+        self.assertEqual(stored_health, '{"status": "pass"}\n')
+
+    def test_checkout_rejects_a_corrupted_object(self) -> None:
+        with TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            _write_bundle(root / "run", '{"status": "pass"}\n')
+            store = ArtifactStore(root / "store")
+            store.add(root / "run", "run")
+            stored = store.object_path(_digest(store, "run", "release-health.json"))
+            stored.chmod(0o644)
+            stored.write_text('{"status": "tampered"}\n', encoding="utf-8")
+
+            with self.assertRaisesRegex(StoreError, "does not match its digest"):
+                store.checkout("run", root / "restored")
+
+    def test_cli_adds_lists_and_collects(self) -> None:
+        with TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            _write_bundle(root / "nightly", '{"status": "pass"}\n')
+            output = io.StringIO()
+            with contextlib.redirect_stdout(output):
+                added = main(["--store", str(root / "store"), "--artifact-dir", str(root / "nightly"), "--add", "--list"])
+                dropped = main(["--store", str(root / "store"), "--drop", "nightly", "--gc"])
+            errors = io.StringIO()
+            with contextlib.redirect_stderr(errors):
+                missing = main(["--store", str(root / "store"), "--checkout", "nightly", "--destination", str(root / "out")])
+
+        self.assertEqual((added, dropped, missing), (0, 0, 1))
+        self.assertIn("Added nightly: 3 files, 3 new objects", output.getvalue())
+        self.assertIn("Removed 3 unreferenced objects", output.getvalue())
+        self.assertIn("No bundle named 'nightly'", errors.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
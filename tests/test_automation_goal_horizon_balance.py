@@ -1,12 +1,14 @@
 from pathlib import Path
 
+from tests.doc_corpus import load_doc
+
 
 ROOT = Path(__file__).resolve().parents[1]
 GUIDE = ROOT / "docs" / "automation_goal_horizon_balance.md"
 
 
 def test_goal_horizon_balance_guide_defines_three_horizons() -> None:
-    guide = GUIDE.read_text(encoding="utf-8")
+    guide = load_doc(GUIDE).text
 
     assert "Near-term" in guide
     assert "Medium-term" in guide
@@ -15,7 +17,7 @@ def test_goal_horizon_balance_guide_defines_three_horizons() -> None:
 
 
 def test_goal_horizon_balance_guide_keeps_runs_mergeable_and_evidence_based() -> None:
-    guide = GUIDE.read_text(encoding="utf-8")
+    guide = load_doc(GUIDE).text
 
     assert "smallest repair" in guide
     assert "failing validation" in guide
@@ -25,7 +27,7 @@ def test_goal_horizon_balance_guide_keeps_runs_mergeable_and_evidence_based() ->
 
 
 def test_goal_horizon_balance_guide_records_next_run_follow_up() -> None:
-    guide = GUIDE.read_text(encoding="utf-8")
+    guide = load_doc(GUIDE).text
 
     assert "concrete next-step candidate" in guide
     assert "next automation run" in guide
@@ -1,6 +1,8 @@
 from pathlib import Path
 import unittest
 
+from tests.doc_corpus import load_doc
+
 
 ROOT = Path(__file__).resolve().parents[1]
 DOC_PATH = ROOT / "docs" / "automation_pr_evidence_template.md"
@@ -10,8 +12,8 @@ CHANGELOG_PATH = ROOT / "CHANGELOG.md"
 class AutomationPREvidenceTemplateDocsTests(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
-        cls.doc = DOC_PATH.read_text(encoding="utf-8")
-        cls.changelog = CHANGELOG_PATH.read_text(encoding="utf-8")
+        cls.doc = load_doc(DOC_PATH).text
+        cls.changelog = load_doc(CHANGELOG_PATH).text
 
     def test_template_contains_required_pr_body_sections(self):
         required_phrases = [
@@ -75,7 +77,7 @@ class AutomationPREvidenceTemplateDocsTests(unittest.TestCase):
         ]
         for doc_path in required_docs:
             with self.subTest(doc_path=doc_path):
-                self.assertIn(doc_path, self.doc)
+                self.assertTrue(load_doc(DOC_PATH).references_to(doc_path))
 
     def test_template_documents_narrow_reruns_and_rollback(self):
         required_phrases = [
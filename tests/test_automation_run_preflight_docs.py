@@ -11,6 +11,8 @@ from __future__ import annotations
 from pathlib import Path
 import unittest
 
+from tests.doc_corpus import load_doc
+
 
 ROOT = Path(__file__).resolve().parents[1]
 DOC = ROOT / "docs" / "automation_run_preflight.md"
@@ -21,7 +23,7 @@ class AutomationRunPreflightDocsTests(unittest.TestCase):
     """Ensure the automation preflight handbook stays complete and safe-scoped."""
 
     def test_preflight_covers_required_repo_inspection_order(self) -> None:
-        content = DOC.read_text(encoding="utf-8")
+        content = load_doc(DOC).text
 
         for term in [
             "default branch",
@@ -38,7 +40,7 @@ class AutomationRunPreflightDocsTests(unittest.TestCase):
                 self.assertIn(term, content)
 
     def test_required_hosted_checks_and_blockers_are_documented(self) -> None:
-        content = DOC.read_text(encoding="utf-8")
+        content = load_doc(DOC).text
         content_lower = content.lower()
 
         for check in [
@@ -64,7 +66,7 @@ class AutomationRunPreflightDocsTests(unittest.TestCase):
                 self.assertIn(blocker, content_lower)
 
     def test_routes_to_existing_runbooks_and_narrow_targets(self) -> None:
-        content = DOC.read_text(encoding="utf-8")
+        content = load_doc(DOC).text
 
         for term in [
             "docs/reviewer_workflow_status_index.md",
@@ -87,7 +89,7 @@ class AutomationRunPreflightDocsTests(unittest.TestCase):
                 self.assertIn(term, content)
 
     def test_preserves_additive_scope_and_safe_analytical_framing(self) -> None:
-        content = DOC.read_text(encoding="utf-8").lower()
+        content = load_doc(DOC).lower
 
         for phrase in [
             "does not fetch live data",
@@ -106,8 +108,8 @@ class AutomationRunPreflightDocsTests(unittest.TestCase):
                 self.assertIn(phrase, content)
 
     def test_documents_compatibility_rollback_and_changelog(self) -> None:
-        doc = DOC.read_text(encoding="utf-8")
-        changelog = CHANGELOG.read_text(encoding="utf-8").lower()
+        doc = load_doc(DOC).text
+        changelog = load_doc(CHANGELOG).lower
 
         self.assertIn("changes no runtime behavior", doc)
         self.assertIn("APIs", doc)
@@ -0,0 +1,379 @@
+"""Tests for the single-interpreter diagnostics bundle engine."""
+
+from __future__ import annotations
+
+import contextlib
+import io
+import json
+import os
+import re
+from pathlib import Path
+import sys
+from tempfile import TemporaryDirectory
+import unittest
+from unittest import mock
+
+from app.cli import bundle
+from app.cli.artifact_manifest import DOCTOR_CACHE_NAME, EXPECTED_ARTIFACTS
+from app.cli.doctor import RECOMMENDED_ENV_VARS
+from app.cli.bundle import (
+    ANY_ARTIFACT,
+    BUNDLE_PLAN,
+    BUNDLE_STEPS,
+    HELP_EXPORTS,
+    MANIFEST_REFRESH,
+    SUMMARY_TEXT,
+    BundleStep,
+    plan_steps,
+    render_shell_command,
+    run_bundle,
+    run_step,
+    schedule,
+)
+from app.cli.bundle_cache import BundleCache
+
+ROOT = Path(__file__).resolve().parents[1]
+
+# Audit hooks cannot be removed, so the hook is installed on first use only and
+# does nothing unless a test has pushed a set onto _RECORDED.
+_RECORDED: list = []
+_HOOK_INSTALLED: list = []
+
+
+def _record_access(event: str, args: tuple) -> None:
+    if _RECORDED and event in {"open", "os.scandir", "os.listdir"} and isinstance(args[0], (str, bytes, os.PathLike)):
+        _RECORDED[-1].add(os.fsdecode(args[0]))
+
+
+def _pending_write_target(name: str) -> str | None:
+    """Return the artifact an atomic ``<name>.<pid>.tmp`` write replaces."""
+
+    match = re.fullmatch(r"\.?(.+)\.\d+\.tmp", name)
+    return match.group(1) if match else None
+
+
+def _install_access_hook() -> None:
+    if not _HOOK_INSTALLED:
+        sys.addaudithook(_record_access)
+        _HOOK_INSTALLED.append(True)
+
+
+class BundleTests(unittest.TestCase):
+    """Keep the in-process bundle equivalent to the serial shell pipeline."""
+
+    def test_ci_report_delegates_to_bundle_engine(self) -> None:
+        script = (ROOT / "scripts" / "ci_report.sh").read_text(encoding="utf-8")
+
+        self.assertIn('-m app.cli.bundle --artifact-dir "${ARTIFACT_DIR}"', script)
+        self.assertNotIn("app.cli.artifact_manifest", script)
+
+    def test_steps_cover_every_expected_artifact_writer(self) -> None:
+        rendered = "\n".join(render_shell_command(step) for step in BUNDLE_PLAN)
+
+        for path in EXPECTED_ARTIFACTS:
+            if path.startswith(("synthetic-fixtures/", "previews/")):
+                continue
+            with self.subTest(path=path):
+                self.assertIn(path, rendered)
+
+    def test_help_exports_match_expected_artifact_names(self) -> None:
+        for _, output in HELP_EXPORTS:
+            with self.subTest(output=output):
+                self.assertTrue(output.endswith("-help.txt"))
+        self.assertEqual(len({output for _, output in HELP_EXPORTS}), len(HELP_EXPORTS))
+
+    def test_plan_refreshes_manifest_only_when_needed(self) -> None:
+        first = BundleStep("summary", stdout_name="a.txt", reads=(), writes=())
+        fresh = BundleStep(
+            "summary", stdout_name="b.txt", reads=("artifact-manifest.json",), writes=(), fresh_manifest=True
+        )
+        unread = BundleStep("summary", stdout_name="c.txt", reads=(), writes=(), fresh_manifest=True)
+
+        self.assertEqual(plan_steps((fresh,)), (fresh, *MANIFEST_REFRESH))
+        self.assertEqual(plan_steps((first, fresh)), (first, *MANIFEST_REFRESH, fresh, *MANIFEST_REFRESH))
+        self.assertEqual(plan_steps((first, unread)), (first, unread, *MANIFEST_REFRESH))
+        self.assertEqual(BUNDLE_PLAN.count(MANIFEST_REFRESH[0]), 4)
+        self.assertNotIn(MANIFEST_REFRESH[0], BUNDLE_STEPS)
+
+    def test_import_budget_step_is_opt_in(self) -> None:
+        with_budget = bundle.bundle_plan(with_import_budget=True)
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            bundle.main(["--print-commands", "--with-import-budget"])
+
+        self.assertNotIn(bundle.IMPORT_BUDGET_STEP, BUNDLE_PLAN)
+        self.assertEqual(bundle.bundle_plan(), BUNDLE_PLAN)
+        self.assertEqual(with_budget.count(bundle.IMPORT_BUDGET_STEP), 1)
+        self.assertEqual(with_budget.count(MANIFEST_REFRESH[0]), BUNDLE_PLAN.count(MANIFEST_REFRESH[0]))
+        self.assertIn("-m app.cli.import_budget --markdown-path", output.getvalue())
+        self.assertNotIn("-m app.cli.import_budget --markdown-path", bundle.render_shell_script())
+
+    def test_catalog_is_opt_in_and_written_by_the_final_refresh(self) -> None:
+        with_catalog = bundle.bundle_plan(with_catalog=True)
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            bundle.main(["--print-commands", "--with-catalog"])
+
+        self.assertNotIn("--catalog-path", bundle.render_shell_script())
+        self.assertEqual(with_catalog[:-1], BUNDLE_PLAN[:-1])
+        self.assertEqual(with_catalog[-1], bundle.CATALOG_REFRESH[0])
+        self.assertEqual(output.getvalue().count("--catalog-path"), 1)
+
+    def test_schedule_orders_conflicting_steps_and_groups_independent_ones(self) -> None:
+        writer = BundleStep("summary", stdout_name="a.txt", reads=(), writes=())
+        other = BundleStep("summary", stdout_name="b.txt", reads=(), writes=())
+        reader = BundleStep("script", "x.py", reads=("a.txt",), writes=("c.txt",))
+        scanner = BundleStep("script", "y.py", writes=("d.txt",))
+
+        self.assertEqual(schedule((writer, other, reader, scanner)), [[writer, other], [reader], [scanner]])
+
+    def test_bundle_schedule_only_groups_independent_steps(self) -> None:
+        levels = schedule()
+
+        self.assertEqual(sum(len(level) for level in levels), len(BUNDLE_PLAN))
+        self.assertGreater(len(levels[0]), len(HELP_EXPORTS))
+        for level in levels:
+            outputs = [name for step in level for name in step.outputs]
+            self.assertEqual(len(outputs), len(set(outputs)))
+            for step in level:
+                if len(level) > 1:
+                    self.assertNotIn(ANY_ARTIFACT, step.reads)
+                    self.assertNotIn(ANY_ARTIFACT, step.outputs)
+                others = [name for other in level if other is not step for name in other.outputs]
+                self.assertTrue(set(step.reads).isdisjoint(others))
+
+    def test_doctor_cache_lives_in_the_artifact_dir_and_orders_its_users(self) -> None:
+        users = [step for step in BUNDLE_PLAN if "--cache-path" in step.args]
+        levels = {step: index for index, level in enumerate(schedule()) for step in level}
+        cache_path = f"{bundle.ARTIFACT_DIR_TOKEN}/{DOCTOR_CACHE_NAME}"
+
+        self.assertEqual([step.target for step in users], ["app.cli.doctor", "app.cli.release_health"])
+        for step in users:
+            self.assertEqual(step.args[step.args.index("--cache-path") + 1], cache_path)
+        self.assertIn(DOCTOR_CACHE_NAME, users[0].writes)
+        self.assertIn(DOCTOR_CACHE_NAME, users[1].reads)
+        self.assertLess(levels[users[0]], levels[users[1]])
+
+    def test_generators_only_touch_declared_artifacts(self) -> None:
+        steps = [step for step in BUNDLE_STEPS if step.kind == "module" and ANY_ARTIFACT not in step.reads]
+        _install_access_hook()
+        for step in steps:
+            with self.subTest(step=step.target), TemporaryDirectory() as temp_dir:
+                artifact_dir = Path(os.path.realpath(temp_dir))
+                real_stat = os.stat
+                touched: set = set()
+
+                def recording_stat(path, *args, **kwargs):
+                    if isinstance(path, (str, bytes, os.PathLike)):
+                        touched.add(os.fsdecode(path))
+                    return real_stat(path, *args, **kwargs)
+
+                _RECORDED.append(touched)
+                try:
+                    with mock.patch("os.stat", recording_stat), contextlib.redirect_stdout(io.StringIO()):
+                        run_step(step, artifact_dir)
+                finally:
+                    _RECORDED.pop()
+                names = set()
+                for path in touched:
+                    resolved = Path(os.path.realpath(os.path.abspath(path)))
+                    if resolved == artifact_dir or artifact_dir in resolved.parents:
+                        names.add(resolved.relative_to(artifact_dir).as_posix())
+
+                declared = set(step.reads) | step.outputs | {"."}
+                folders = tuple(name for name in declared if name.endswith("/"))
+                undeclared = {
+                    name for name in names
+                    if name not in declared and f"{name}/" not in folders and not name.startswith(folders)
+                    and _pending_write_target(name) not in step.outputs
+                }
+                self.assertEqual(undeclared, set())
+
+    def test_help_step_matches_redirected_module_launch(self) -> None:
+        with TemporaryDirectory() as temp_dir:
+            artifact_dir = Path(temp_dir)
+            status = run_step(
+                BundleStep("module", "app.cli.artifact_manifest", ("--help",), "artifact-manifest-help.txt"),
+                artifact_dir,
+            )
+            help_text = (artifact_dir / "artifact-manifest-help.txt").read_text(encoding="utf-8")
+
+        self.assertEqual(status, 0)
+        self.assertTrue(help_text.startswith("usage: artifact_manifest.py "))
+        self.assertTrue(all(len(line) <= 80 for line in help_text.splitlines()))
+
+    def test_script_step_captures_validation_json(self) -> None:
+        with TemporaryDirectory() as temp_dir:
+            artifact_dir = Path(temp_dir)
+            step = BundleStep(
+                "script",
+                "scripts/validate_reviewer_handoff.py",
+                ("{artifact_dir}/reviewer-handoff.json", "--json"),
+                "reviewer-handoff-validation.json",
+            )
+            status = run_step(step, artifact_dir)
+            result = json.loads((artifact_dir / "reviewer-handoff-validation.json").read_text(encoding="utf-8"))
+
+        self.assertEqual(status, 1)
+        self.assertFalse(result["valid"])
+        self.assertIn("file not found", result["errors"][0])
+
+    def test_run_bundle_writes_outputs_and_stops_on_failure(self) -> None:
+        steps = (
+            BundleStep("summary", stdout_name="summary.txt"),
+            BundleStep(
+                "module",
+                "app.cli.artifact_manifest",
+                ("--artifact-dir", "{artifact_dir}"),
+            ),
+            BundleStep("module", "app.cli.artifact_gap_report", ("--artifact-dir", "{artifact_dir}", "--fail-on-gap")),
+            BundleStep("summary", stdout_name="never-written.txt"),
+        )
+        with TemporaryDirectory() as temp_dir:
+            artifact_dir = Path(temp_dir) / "bundle"
+            status = run_bundle(artifact_dir, steps, cache_dir=Path(temp_dir) / "cache")
+            summary = (artifact_dir / "summary.txt").read_text(encoding="utf-8")
+            manifest = json.loads((artifact_dir / "artifact-manifest.json").read_text(encoding="utf-8"))
+            skipped = (artifact_dir / "never-written.txt").exists()
+
+        self.assertEqual(status, 1)
+        self.assertEqual(summary, SUMMARY_TEXT)
+        self.assertEqual([entry["path"] for entry in manifest["files"]], ["summary.txt"])
+        self.assertFalse(skipped)
+
+    def test_forced_bundle_reruns_doctor_checks_fresh(self) -> None:
+        steps = tuple(step for step in BUNDLE_STEPS if step.target in {"app.cli.doctor", "app.cli.release_health"})
+        with TemporaryDirectory() as temp_dir, mock.patch.object(bundle, "run_step", return_value=0) as run:
+            with contextlib.redirect_stdout(io.StringIO()):
+                run_bundle(Path(temp_dir) / "bundle", steps, force=True, cache_dir=Path(temp_dir) / "cache")
+                forced = [call.args[0].args for call in run.call_args_list]
+                run.reset_mock()
+                run_bundle(Path(temp_dir) / "again", steps, cache_dir=Path(temp_dir) / "cache")
+                normal = [call.args[0].args for call in run.call_args_list]
+
+        self.assertEqual(forced[0][-1], "--fresh")
+        self.assertNotIn("--fresh", forced[1])
+        self.assertNotIn("--fresh", normal[0])
+
+    def test_parallel_levels_match_serial_outputs(self) -> None:
+        steps = (
+            BundleStep("summary", stdout_name="summary.txt", reads=(), writes=()),
+            BundleStep("interpreter", args=("--version",), stdout_name="python-version.txt", reads=(), writes=()),
+            *MANIFEST_REFRESH,
+        )
+        outputs = []
+        for jobs in (1, 2):
+            with TemporaryDirectory() as temp_dir:
+                artifact_dir = Path(temp_dir) / "bundle"
+                status = run_bundle(artifact_dir, steps, jobs=jobs, cache_dir=Path(temp_dir) / "cache")
+                manifest = json.loads((artifact_dir / "artifact-manifest.json").read_text(encoding="utf-8"))
+                outputs.append((status, [entry["path"] for entry in manifest["files"]]))
+
+        self.assertEqual(outputs[0], outputs[1])
+        self.assertEqual(outputs[0], (0, ["python-version.txt", "summary.txt"]))
+
+
+class IncrementalBundleTests(unittest.TestCase):
+    """Skip unchanged steps without changing the artifacts a full run produces."""
+
+    STEPS = plan_steps(
+        (
+            BundleStep("interpreter", args=("--version",), stdout_name="python-version.txt", reads=(), writes=()),
+            BundleStep("summary", stdout_name="summary.txt", reads=(), writes=(), fresh_manifest=True),
+        )
+    )
+
+    def _run(self, artifact_dir: Path, **options: bool) -> str:
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            status = run_bundle(
+                artifact_dir, self.STEPS, explain=True, cache_dir=artifact_dir.parent / "cache", **options
+            )
+        self.assertEqual(status, 0)
+        return output.getvalue()
+
+    def test_unchanged_rerun_skips_every_step_and_restores_rewritten_outputs(self) -> None:
+        with TemporaryDirectory() as temp_dir:
+            artifact_dir = Path(temp_dir) / "bundle"
+            first = self._run(artifact_dir)
+            final_manifest = (artifact_dir / "artifact-manifest.json").read_text(encoding="utf-8")
+            second = self._run(artifact_dir)
+            manifest_after_rerun = (artifact_dir / "artifact-manifest.json").read_text(encoding="utf-8")
+            state = json.loads((Path(temp_dir) / "cache" / "bundle-state.json").read_text(encoding="utf-8"))
+            bookkeeping = sorted(path.name for path in artifact_dir.iterdir() if path.name.startswith("bundle-"))
+            moved = self._run(Path(temp_dir) / "moved")
+
+        self.assertEqual(first.count("run: "), len(self.STEPS))
+        self.assertIn("(no previous run recorded)", first)
+        self.assertEqual(second.count("skip: "), len(self.STEPS))
+        self.assertIn(f"Reused {len(self.STEPS)} unchanged step(s)", second)
+        self.assertEqual(manifest_after_rerun, final_manifest)
+        self.assertEqual(sorted(state["steps"], key=int), [str(index) for index in range(len(self.STEPS))])
+        self.assertEqual(bookkeeping, [])
+        self.assertEqual(moved.count("(no previous run recorded)"), len(self.STEPS))
+
+    def test_changed_inputs_rerun_only_affected_steps(self) -> None:
+        with TemporaryDirectory() as temp_dir:
+            artifact_dir = Path(temp_dir) / "bundle"
+            self._run(artifact_dir)
+            (artifact_dir / "summary.txt").write_text("edited\n", encoding="utf-8")
+            repaired = self._run(artifact_dir)
+            summary = (artifact_dir / "summary.txt").read_text(encoding="utf-8")
+            (artifact_dir / "notes.txt").write_text("operator note\n", encoding="utf-8")
+            added = self._run(artifact_dir)
+            forced = self._run(artifact_dir, force=True)
+
+        self.assertIn("(output summary.txt changed and is not cached)", repaired)
+        self.assertEqual(repaired.count("run: "), 1)
+        self.assertEqual(summary, SUMMARY_TEXT)
+        self.assertIn("(input notes.txt added)", added)
+        self.assertTrue(added.startswith("skip: "))
+        self.assertEqual(forced.count("(forced)"), len(self.STEPS))
+
+    def test_changed_environment_variables_rerun_declaring_steps(self) -> None:
+        steps = (
+            BundleStep("summary", stdout_name="summary.txt", reads=(), writes=(), env_vars=("DATA_DIR",)),
+            BundleStep("interpreter", args=("--version",), stdout_name="python-version.txt", reads=(), writes=()),
+        )
+        with TemporaryDirectory() as temp_dir:
+            artifact_dir, cache_dir = Path(temp_dir) / "bundle", Path(temp_dir) / "cache"
+            with mock.patch.dict(os.environ, {"DATA_DIR": "data"}), contextlib.redirect_stdout(io.StringIO()):
+                run_bundle(artifact_dir, steps, explain=True, cache_dir=cache_dir)
+            output = io.StringIO()
+            with mock.patch.dict(os.environ, {"DATA_DIR": "elsewhere"}), contextlib.redirect_stdout(output):
+                run_bundle(artifact_dir, steps, explain=True, cache_dir=cache_dir)
+            state = (cache_dir / "bundle-state.json").read_text(encoding="utf-8")
+
+        self.assertIn("(environment variables changed)", output.getvalue())
+        self.assertEqual(output.getvalue().count("skip: "), 1)
+        self.assertNotIn("elsewhere", state)
+        self.assertIn(RECOMMENDED_ENV_VARS[0], next(s for s in BUNDLE_STEPS if s.target == "app.cli.doctor").env_vars)
+
+    def test_reads_written_only_by_later_steps_are_not_inputs(self) -> None:
+        steps = (
+            BundleStep("summary", stdout_name="summary.txt", reads=("late.txt", "early.txt"), writes=()),
+            BundleStep("interpreter", args=("--version",), stdout_name="late.txt", reads=(), writes=()),
+        )
+        with TemporaryDirectory() as temp_dir:
+            artifact_dir = Path(temp_dir) / "bundle"
+            artifact_dir.mkdir()
+            (artifact_dir / "early.txt").write_text("operator note\n", encoding="utf-8")
+            (artifact_dir / "late.txt").write_text("left by the previous run\n", encoding="utf-8")
+            cache = BundleCache(artifact_dir, steps, ["summary", "late"], cache_dir=Path(temp_dir) / "cache")
+            inputs = cache.fingerprint(0)["inputs"]
+
+        self.assertEqual(sorted(inputs), ["early.txt"])
+
+    def test_full_bundle_rerun_skips_every_step(self) -> None:
+        with TemporaryDirectory() as temp_dir:
+            artifact_dir, cache_dir = Path(temp_dir) / "bundle", Path(temp_dir) / "cache"
+            with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+                self.assertEqual(run_bundle(artifact_dir, BUNDLE_PLAN, cache_dir=cache_dir), 0)
+            output = io.StringIO()
+            with contextlib.redirect_stdout(output), contextlib.redirect_stderr(io.StringIO()):
+                run_bundle(artifact_dir, BUNDLE_PLAN, explain=True, cache_dir=cache_dir)
+
+        self.assertEqual([line for line in output.getvalue().splitlines() if line.startswith("run: ")], [])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,118 @@
+"""Tests for the compressed, deduplicated bundle archive."""
+
+from __future__ import annotations
+
+import contextlib
+import io
+import json
+from pathlib import Path
+from tempfile import TemporaryDirectory
+import unittest
+import zipfile
+
+from app.cli import artifact_manifest
+from app.cli.bundle_archive import INDEX_NAME, ArchiveError, BundleArchive, export_archive, main, object_name
+
+
+def _write_bundle(artifact_dir: Path) -> None:
+    (artifact_dir / "help").mkdir(parents=True)
+    for name in ("doctor-help.txt", "bundle-help.txt", "quickstart-help.txt"):
+        (artifact_dir / "help" / name).write_text("usage: shared help text\n" * 20, encoding="utf-8")
+    (artifact_dir / "release-health.json").write_text('{"status": "pass"}\n', encoding="utf-8")
+    (artifact_dir / "empty.log").write_text("", encoding="utf-8")
+
+
+class BundleArchiveTests(unittest.TestCase):
+    """Keep archives deduplicated, indexed, and extractable one file at a time."""
+
+    def test_export_stores_each_digest_once_and_round_trips(self) -> None:
+        with TemporaryDirectory() as temp_dir:
+            artifact_dir = Path(temp_dir) / "bundle"
+            _write_bundle(artifact_dir)
+            archive_path = Path(temp_dir) / "bundle.zip"
+
+            summary = export_archive(artifact_dir, archive_path, jobs=2)
+            with zipfile.ZipFile(archive_path) as raw:
+                members = sorted(raw.namelist())
+            with BundleArchive(archive_path) as archive:
+                single = archive.read("help/bundle-help.txt")
+                written = archive.extract_all(Path(temp_dir) / "restored")
+                restored = {path.relative_to(Path(temp_dir) / "restored").as_posix(): path.read_bytes() for path in written}
+                manifest_paths = [entry["path"] for entry in archive.entries()]
+
+        self.assertEqual(summary["file_count"], 5)
+        self.assertEqual(summary["object_count"], 3)
+        self.assertEqual(summary["duplicate_file_count"], 2)
+        self.assertEqual(summary["deduplicated_bytes"], 2 * len("usage: shared help text\n" * 20))
+        self.assertEqual(len(members), 4)
+        self.assertIn(INDEX_NAME, members)
+        self.assertEqual(single, b"usage: shared help text\n" * 20)
+        self.assertEqual(list(restored), manifest_paths)
+        self.assertEqual(restored["empty.log"], b"")
+        self.assertEqual(restored["release-health.json"], b'{"status": "pass"}\n')
+
+    def test_stale_manifest_digest_fails_without_replacing_archive(self) -> None:
+        with TemporaryDirectory() as temp_dir:
+            artifact_dir = Path(temp_dir) / "bundle"
+            _write_bundle(artifact_dir)
+            archive_path = Path(temp_dir) / "bundle.zip"
+            archive_path.write_bytes(b"previous archive")
+            manifest = artifact_manifest.build_manifest(artifact_dir)
+            (artifact_dir / "release-health.json").write_text('{"status": "fail"}\n', encoding="utf-8")
+
+            with self.assertRaises(ArchiveError):
+                export_archive(artifact_dir, archive_path, jobs=1, manifest=manifest)
+
+            self.assertEqual(archive_path.read_bytes(), b"previous archive")
+            self.assertEqual(sorted(path.name for path in Path(temp_dir).iterdir()), ["bundle", "bundle.zip"])
+
+    def test_reader_checks_digests_and_rejects_unsafe_paths(self) -> None:
+        with TemporaryDirectory() as temp_dir:
+            artifact_dir = Path(temp_dir) / "bundle"
+            _write_bundle(artifact_dir)
+            archive_path = Path(temp_dir) / "bundle.zip"
+            export_archive(artifact_dir, archive_path, jobs=1)
+            with zipfile.ZipFile(archive_path) as raw:
+                index = json.loads(raw.read(INDEX_NAME))
+                objects = {name: raw.read(name) for name in raw.namelist() if name != INDEX_NAME}
+            health = next(entry for entry in index["manifest"]["files"] if entry["path"] == "release-health.json")
+            empty = next(entry for entry in index["manifest"]["files"] if entry["path"] == "empty.log")
+            empty["path"] = "../escaped.log"
+            objects[object_name(health["sha256"])] = objects[object_name(empty["sha256"])]
+            tampered_path = Path(temp_dir) / "tampered.zip"
+            with zipfile.ZipFile(tampered_path, "w") as tampered:
+                tampered.writestr(INDEX_NAME, json.dumps(index))
+                for name, data in objects.items():
+                    tampered.writestr(name, data)
+
+            with BundleArchive(tampered_path) as archive:
+                with self.assertRaises(ArchiveError):
+                    archive.read("release-health.json")
+                with self.assertRaises(ArchiveError):
+                    archive.extract("../escaped.log", Path(temp_dir) / "out")
+            self.assertFalse((Path(temp_dir) / "escaped.log").exists())
+
+    def test_cli_exports_lists_and_extracts_one_file(self) -> None:
+        with TemporaryDirectory() as temp_dir:
+            artifact_dir = Path(temp_dir) / "bundle"
+            _write_bundle(artifact_dir)
+            destination = Path(temp_dir) / "out"
+            output = io.StringIO()
+            with contextlib.redirect_stdout(output):
+                exported = main(["--artifact-dir", str(artifact_dir), "--jobs", "1"])
+                extracted = main(
+                    ["--artifact-dir", str(artifact_dir), "--list", "--extract", "release-health.json", "--destination", str(destination)]
+                )
+            self.assertTrue((artifact_dir / artifact_manifest.DEFAULT_HASH_CACHE_NAME).exists())
+            self.assertTrue((Path(temp_dir) / "bundle.zip").exists())
+            self.assertEqual(sorted(path.name for path in destination.iterdir()), ["release-health.json"])
+            with contextlib.redirect_stderr(io.StringIO()), self.assertRaises(SystemExit):
+                main(["--artifact-dir", str(artifact_dir), "--archive", str(artifact_dir / "bundle.zip")])
+
+        self.assertEqual((exported, extracted), (0, 0))
+        self.assertIn("5 files in 3 objects (2 duplicates", output.getvalue())
+        self.assertIn("help/quickstart-help.txt", output.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
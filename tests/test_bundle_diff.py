@@ -0,0 +1,116 @@
+"""Tests for the manifest-based bundle diff."""
+
+from __future__ import annotations
+
+import contextlib
+import io
+import json
+from pathlib import Path
+from tempfile import TemporaryDirectory
+import unittest
+from unittest import mock
+
+from app.cli import artifact_manifest
+from app.cli.artifact_manifest import write_jsonl
+from app.cli.bundle_diff import build_bundle_diff, diff_manifests, main, render_markdown
+
+
+def _entry(path: str, size: int, digest: str) -> dict:
+    return {"path": path, "size_bytes": size, "sha256": digest * 64, "description": "artifact"}
+
+
+BASE = {
+    "generated_at": "2024-01-01T00:00:00+00:00",
+    "missing_expected": ["openapi.json"],
+    "files": [
+        _entry("kept.md", 10, "a"),
+        _entry("grown.json", 20, "b"),
+        _entry("old-name.txt", 5, "c"),
+        _entry("dropped.log", 7, "d"),
+    ],
+}
+HEAD = {
+    "generated_at": "2024-01-02T00:00:00+00:00",
+    "missing_expected": ["triage-summary.json"],
+    "files": [
+        _entry("grown.json", 25, "e"),
+        _entry("kept.md", 10, "a"),
+        _entry("new-name.txt", 5, "c"),
+        _entry("brand-new.html", 3, "f"),
+    ],
+}
+
+
+class BundleDiffTests(unittest.TestCase):
+    """Keep bundle diffs complete, hash-based, and readable."""
+
+    def test_diff_reports_added_removed_renamed_and_changed(self) -> None:
+        report = diff_manifests(BASE, HEAD)
+
+        self.assertEqual(report["status"], "changed")
+        self.assertEqual(
+            report["summary"],
+            {"added": 1, "removed": 1, "renamed": 1, "changed": 1, "unchanged": 1, "size_delta_bytes": 1},
+        )
+        self.assertEqual([item["path"] for item in report["added"]], ["brand-new.html"])
+        self.assertEqual([item["path"] for item in report["removed"]], ["dropped.log"])
+        self.assertEqual(report["renamed"][0]["from"], "old-name.txt")
+        self.assertEqual(report["renamed"][0]["to"], "new-name.txt")
+        self.assertEqual(report["changed"][0]["size_delta_bytes"], 5)
+        self.assertEqual(report["newly_missing_expected"], ["triage-summary.json"])
+        self.assertEqual(report["resolved_missing_expected"], ["openapi.json"])
+        self.assertIsNone(report["changed_directories"])
+
+        markdown = render_markdown(report, max_rows=0)
+        self.assertIn("| 1 | 1 | 1 | 1 | 1 | +1 bytes |", markdown)
+        self.assertIn("... and 1 more; see the JSON report for the full list.", markdown)
+
+    def test_identical_manifests_are_compared_by_hash_only(self) -> None:
+        with TemporaryDirectory() as temp_dir:
+            artifact_dir = Path(temp_dir) / "bundle"
+            artifact_dir.mkdir()
+            (artifact_dir / "release-health.json").write_text("{}\n", encoding="utf-8")
+            manifest = artifact_manifest.build_manifest(artifact_dir)
+            artifact_manifest.write_json(manifest, artifact_dir / artifact_manifest.DEFAULT_JSON_NAME)
+            jsonl_path = Path(temp_dir) / "head.jsonl"
+            write_jsonl(manifest, jsonl_path)
+
+            with mock.patch.object(artifact_manifest, "_sha256", side_effect=AssertionError("content hashed")):
+                report = build_bundle_diff(artifact_dir, jsonl_path)
+
+        self.assertEqual(report["status"], "identical")
+        self.assertEqual(report["summary"]["unchanged"], 1)
+        self.assertEqual(report["head"]["generated_at"], manifest["generated_at"])
+        self.assertIn("same SHA-256 digests", render_markdown(report))
+
+    def test_cli_rescans_directories_and_fails_on_change(self) -> None:
+        with TemporaryDirectory() as temp_dir:
+            base_dir = Path(temp_dir) / "base"
+            head_dir = Path(temp_dir) / "head"
+            for directory, text in ((base_dir, "one\n"), (head_dir, "two!\n")):
+                directory.mkdir()
+                (directory / "notes.md").write_text(text, encoding="utf-8")
+            json_path = Path(temp_dir) / "out" / "bundle-diff.json"
+            output = io.StringIO()
+            with contextlib.redirect_stdout(output):
+                status = main(
+                    [
+                        "--base", str(base_dir),
+                        "--head", str(head_dir),
+                        "--json-path", str(json_path),
+                        "--markdown-path", str(Path(temp_dir) / "out" / "bundle-diff.md"),
+                        "--fail-on-change",
+                    ]
+                )
+            report = json.loads(json_path.read_text(encoding="utf-8"))
+            self.assertFalse((base_dir / artifact_manifest.DEFAULT_HASH_CACHE_NAME).exists())
+
+        self.assertEqual(status, 1)
+        self.assertEqual(report["changed"][0]["path"], "notes.md")
+        self.assertEqual(report["changed_directories"], ["."])
+        self.assertTrue(report["base"]["source"].endswith("(scanned)"))
+        self.assertIn("1 changed", output.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
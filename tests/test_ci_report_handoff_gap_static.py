@@ -2,20 +2,25 @@
 
 from __future__ import annotations
 
-from pathlib import Path
 import unittest
 
+from app.cli.bundle import render_shell_script
+
 
 class CiReportHandoffGapStaticTests(unittest.TestCase):
     """Ensure ci_report publishes reviewer evidence after its inputs exist."""
 
     def test_ci_report_generates_review_after_required_inputs(self) -> None:
-        script = Path("scripts/ci_report.sh").read_text(encoding="utf-8")
+        script = render_shell_script()
 
         help_file = "handoff-gap-report-review-help.txt"
         gap_command = (
-            "-m app.cli.artifact_gap_report --artifact-dir \"${ARTIFACT_DIR}\" "
-            "--json-path \"${ARTIFACT_DIR}/artifact-gap-report.json\""
+            "-m app.cli.artifact_scan --artifact-dir \"${ARTIFACT_DIR}\" "
+            "--manifest-json-path \"${ARTIFACT_DIR}/artifact-manifest.json\" "
+            "--manifest-markdown-path \"${ARTIFACT_DIR}/artifact-manifest.md\" "
+            "--ledger-json-path \"${ARTIFACT_DIR}/artifact-provenance-ledger.json\" "
+            "--ledger-markdown-path \"${ARTIFACT_DIR}/artifact-provenance-ledger.md\" "
+            "--gap-json-path \"${ARTIFACT_DIR}/artifact-gap-report.json\""
         )
         enriched_handoff = "--artifact-manifest-json \"${ARTIFACT_DIR}/artifact-manifest.json\""
         review_command = (
@@ -32,7 +37,7 @@ class CiReportHandoffGapStaticTests(unittest.TestCase):
         self.assertIn(summary_token, script)
         self.assertLess(script.index(gap_command), script.index(review_command))
         self.assertLess(script.index(enriched_handoff), script.index(review_command))
-        self.assertLess(script.index(review_command), script.rfind("artifact_manifest --artifact-dir"))
+        self.assertLess(script.index(review_command), script.rfind("artifact_scan --artifact-dir"))
 
 
 if __name__ == "__main__":
@@ -1,5 +1,7 @@
 from pathlib import Path
 
+from tests.doc_corpus import load_doc
+
 
 MAKEFILE_PATH = Path("Makefile")
 README_PATH = Path("README.md")
@@ -21,8 +23,8 @@ def test_makefile_exposes_ci_triage_target():
 
 
 def test_ci_triage_docs_are_linked_from_user_facing_guides():
-    readme = README_PATH.read_text(encoding="utf-8")
-    common_tasks = COMMON_TASKS_PATH.read_text(encoding="utf-8")
+    readme = load_doc(README_PATH).text
+    common_tasks = load_doc(COMMON_TASKS_PATH).text
 
     for document in (readme, common_tasks):
         assert "make ci-triage" in document
@@ -30,7 +32,7 @@ def test_ci_triage_docs_are_linked_from_user_facing_guides():
 
 
 def test_ci_troubleshooting_guide_mentions_helper_target():
-    guide = CI_TROUBLESHOOTING_PATH.read_text(encoding="utf-8")
+    guide = load_doc(CI_TROUBLESHOOTING_PATH).text
 
     assert "make ci-triage" in guide
     assert "make verify ARTIFACT_DIR=ci_artifacts/local-ci" in guide
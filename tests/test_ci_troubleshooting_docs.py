@@ -9,6 +9,8 @@ from __future__ import annotations
 from pathlib import Path
 import unittest
 
+from tests.doc_corpus import load_doc
+
 
 ROOT = Path(__file__).resolve().parents[1]
 README = ROOT / "README.md"
@@ -22,7 +24,7 @@ class CITroubleshootingDocsTests(unittest.TestCase):
     """Keep CI failure recovery guidance aligned with contributor workflows."""
 
     def test_troubleshooting_guide_covers_reproducible_ci_path(self) -> None:
-        content = CI_TROUBLESHOOTING.read_text(encoding="utf-8")
+        content = load_doc(CI_TROUBLESHOOTING).text
 
         self.assertIn("make verify ARTIFACT_DIR=ci_artifacts/local-ci", content)
         self.assertIn("ci_artifacts/local-ci/release-bundle-index.html", content)
@@ -32,7 +34,7 @@ class CITroubleshootingDocsTests(unittest.TestCase):
 
     def test_workflow_and_docs_reference_same_validation_entrypoint(self) -> None:
         workflow = WORKFLOW.read_text(encoding="utf-8")
-        guide = CI_TROUBLESHOOTING.read_text(encoding="utf-8")
+        guide = load_doc(CI_TROUBLESHOOTING).text
 
         self.assertIn("python -m unittest discover -s tests -p 'test_*.py'", workflow)
         self.assertIn("make ci-report ARTIFACT_DIR=ci_artifacts", workflow)
@@ -41,8 +43,7 @@ class CITroubleshootingDocsTests(unittest.TestCase):
     def test_primary_contributor_docs_link_to_troubleshooting_guide(self) -> None:
         for path in (README, CONTRIBUTING, COMMON_TASKS):
             with self.subTest(path=path):
-                content = path.read_text(encoding="utf-8")
-                self.assertIn("docs/ci_troubleshooting.md", content)
+                self.assertTrue(load_doc(path).references_to("docs/ci_troubleshooting.md"))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,91 @@
+"""Tests for the lazy ``python -m app.cli`` dispatcher."""
+
+from __future__ import annotations
+
+import ast
+import contextlib
+import io
+import json
+from pathlib import Path
+import re
+import subprocess
+import sys
+import unittest
+
+from app.cli.__main__ import COMMANDS, main, module_name, render_help
+
+ROOT = Path(__file__).resolve().parents[1]
+CLI_DIR = ROOT / "app" / "cli"
+
+
+MODULES_AFTER_DISPATCH = """
+import json, runpy, sys
+sys.argv = ["app.cli", *sys.argv[1:]]
+try:
+    runpy.run_module("app.cli", run_name="__main__", alter_sys=True)
+except SystemExit:
+    pass
+sys.stderr.write(json.dumps(sorted(sys.modules)))
+"""
+
+
+def _imported_modules(*args: str) -> set[str]:
+    result = subprocess.run(
+        [sys.executable, "-c", MODULES_AFTER_DISPATCH, *args],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return set(json.loads(result.stderr))
+
+
+class CliDispatchTests(unittest.TestCase):
+    """Keep the static command table complete and the dispatcher lazy."""
+
+    def test_static_table_matches_cli_modules(self) -> None:
+        expected = {}
+        for path in sorted(CLI_DIR.glob("*.py")):
+            source = path.read_text(encoding="utf-8")
+            if not path.stem.startswith("__") and re.search(r"^def main\(argv", source, re.MULTILINE):
+                docstring = ast.get_docstring(ast.parse(source)) or ""
+                expected[path.stem.replace("_", "-")] = docstring.splitlines()[0].replace("``", "")
+
+        self.assertEqual(dict(COMMANDS), expected)
+        self.assertEqual([command for command, _ in COMMANDS], sorted(expected))
+        self.assertEqual(module_name("artifact-manifest"), "app.cli.artifact_manifest")
+
+    def test_listing_imports_no_commands(self) -> None:
+        modules = _imported_modules("--help")
+
+        self.assertEqual({name for name in modules if name.startswith("app.cli.")}, set())
+        self.assertIn("doctor", render_help())
+
+    def test_doctor_does_not_import_api_stack_or_other_generators(self) -> None:
+        modules = _imported_modules("doctor", "--help")
+
+        self.assertTrue({"fastapi", "pydantic"}.isdisjoint(modules))
+        self.assertEqual(
+            {name for name in modules if name.startswith("app.cli.")},
+            {"app.cli.doctor"},
+        )
+
+    def test_command_help_keeps_module_program_name(self) -> None:
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output), self.assertRaises(SystemExit) as raised:
+            main(["artifact_manifest", "--help"])
+
+        self.assertEqual(raised.exception.code, 0)
+        self.assertTrue(output.getvalue().startswith("usage: artifact_manifest.py "))
+
+    def test_unknown_command_suggests_close_match(self) -> None:
+        errors = io.StringIO()
+        with contextlib.redirect_stderr(errors):
+            status = main(["doctr"])
+
+        self.assertEqual(status, 2)
+        self.assertIn("Did you mean `doctor`?", errors.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
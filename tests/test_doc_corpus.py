@@ -0,0 +1,77 @@
+"""Tests for the shared Markdown corpus used by the docs tests."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from tempfile import TemporaryDirectory
+import unittest
+from unittest import mock
+
+from tests.doc_corpus import ROOT, MarkdownDoc, corpus, load_doc
+
+SAMPLE = """# Guide
+
+Intro pointing at `docs/ci_troubleshooting.md` and [the matrix](validation_matrix.md#rows).
+
+## Usage
+
+Run `make verify` and see <https://example.com/help>.
+
+```bash
+# not a heading
+cat docs/fenced.md
+```
+
+### Details
+
+Nested under Usage.
+
+## Safe scope
+
+Read-only.
+"""
+
+
+class DocCorpusTests(unittest.TestCase):
+    """Index headings, sections, and references once per file."""
+
+    def test_parses_headings_sections_and_references(self) -> None:
+        doc = MarkdownDoc(ROOT / "docs" / "sample.md", SAMPLE)
+
+        self.assertEqual([(heading.level, heading.title) for heading in doc.headings], [(1, "Guide"), (2, "Usage"), (3, "Details"), (2, "Safe scope")])
+        self.assertTrue(doc.has_heading("Usage", level=2))
+        self.assertFalse(doc.has_heading("not a heading"))
+        self.assertIn("Nested under Usage.", doc.section("Usage"))
+        self.assertNotIn("Read-only.", doc.section("Usage"))
+        with self.assertRaisesRegex(KeyError, "Safe scope"):
+            doc.section("Missing")
+        self.assertTrue(doc.references_to("docs/ci_troubleshooting.md"))
+        self.assertTrue(doc.references_to("docs/validation_matrix.md"))
+        self.assertTrue(doc.references_to("https://example.com/help"))
+        self.assertFalse(doc.references_to("docs/fenced.md"))
+        self.assertFalse(doc.references_to("make verify"))
+
+    def test_load_doc_reads_each_file_once(self) -> None:
+        with TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "note.md"
+            path.write_text("# Note\n", encoding="utf-8")
+            with mock.patch.object(Path, "read_text", autospec=True, side_effect=Path.read_text) as read_text:
+                first = load_doc(path)
+                second = load_doc(str(path))
+
+        self.assertIs(first, second)
+        self.assertEqual(read_text.call_count, 1)
+
+    def test_navigation_docs_reference_existing_files(self) -> None:
+        docs = corpus()
+        self.assertIn("docs/common_tasks.md", docs)
+
+        for name in ("README.md", "CONTRIBUTING.md", "docs/common_tasks.md"):
+            for reference in docs[name].references:
+                if reference.path.startswith("docs/") and reference.path.endswith(".md"):
+                    with self.subTest(doc=name, target=reference.target):
+                        self.assertTrue((ROOT / reference.path).is_file())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -7,7 +7,10 @@ project can validate first-run diagnostics in a minimal CI environment.
 from __future__ import annotations
 
 import json
+import os
 import tempfile
+import threading
+import time
 import unittest
 from pathlib import Path
 from unittest import mock
@@ -50,7 +53,94 @@ class DoctorSmokeTests(unittest.TestCase):
         printed = "\n".join(str(call.args[0]) for call in mocked_print.call_args_list)
         payload = json.loads(printed)
         self.assertIsInstance(payload, list)
-        self.assertTrue(all({"name", "status", "detail", "remediation"} <= set(item) for item in payload))
+        self.assertTrue(all({"name", "status", "detail", "remediation", "duration_ms"} <= set(item) for item in payload))
+        self.assertTrue(all(item["duration_ms"] >= 0 for item in payload))
+
+    def test_checks_run_concurrently_under_an_overall_deadline(self) -> None:
+        release = threading.Event()
+
+        def hanging_probe(timeout: float) -> doctor.CheckResult:
+            release.wait(5)
+            return doctor.CheckResult("mongo_socket", "ok", "late")
+
+        def slow_data_dir() -> doctor.CheckResult:
+            release.wait(5)
+            return doctor.CheckResult("data_dir", "ok", "late")
+
+        try:
+            with mock.patch.object(doctor, "_check_mongo", hanging_probe):
+                results = doctor.run_checks(include_optional=False, check_env_files=False, deadline=0.2)
+            with mock.patch.object(doctor, "_check_data_dir", slow_data_dir):
+                required = doctor.run_checks(include_optional=False, check_mongo=False, check_env_files=False, deadline=0.2)
+        finally:
+            release.set()
+
+        names = [result.name for result in results]
+        mongo = results[-1]
+        self.assertEqual(names[:3], ["python", "data_dir", "sentinel_env"])
+        self.assertEqual(names[3:-1], [f"import:{name}" for name, _ in doctor.REQUIRED_IMPORTS])
+        self.assertEqual((mongo.name, mongo.status), ("mongo_socket", "warn"))
+        self.assertIn("0.2s doctor deadline", mongo.detail)
+        self.assertGreaterEqual(mongo.duration_ms, 200)
+        self.assertTrue(all(result.duration_ms is not None for result in results))
+        data_dir = next(result for result in required if result.name == "data_dir")
+        self.assertEqual(data_dir.status, "fail")
+
+    def test_cached_results_are_reused_for_the_same_environment(self) -> None:
+        def changed_env() -> doctor.CheckResult:
+            return doctor.CheckResult("sentinel_env", "warn", "probed again")
+
+        def broken_data_dir() -> doctor.CheckResult:
+            return doctor.CheckResult("data_dir", "fail", "directory removed")
+
+        def mongo_down(timeout: float) -> doctor.CheckResult:
+            return doctor.CheckResult("mongo_socket", "warn", "connection refused")
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache_path = Path(tmpdir) / "doctor-cache.json"
+            options = {"include_optional": False, "check_env_files": False, "cache_path": cache_path}
+            with mock.patch.object(doctor.settings, "DATA_DIR", Path(tmpdir)), mock.patch.object(
+                doctor, "_check_mongo", lambda timeout: doctor.CheckResult("mongo_socket", "ok", "reachable")
+            ):
+                first = doctor.run_checks(**options)
+                with mock.patch.object(doctor, "_check_env", changed_env), mock.patch.object(
+                    doctor, "_check_data_dir", broken_data_dir
+                ), mock.patch.object(doctor, "_check_mongo", mongo_down):
+                    reused = doctor.run_checks(**options)
+                    forced = doctor.run_checks(**options, fresh=True)
+                    fingerprint = doctor.environment_fingerprint()
+                    expired = doctor.load_cached_results(cache_path, fingerprint, ttl=60, now=time.time() + 61)
+                    with mock.patch.dict(os.environ, {"SENTINEL_CLIENT_ID": "changed"}):
+                        refingerprinted = doctor.run_checks(**options)
+            stored = json.loads(cache_path.read_text(encoding="utf-8"))
+
+        by_name = {result.name: result for result in reused}
+        first_by_name = {result.name: result for result in first}
+        self.assertFalse(any(result.cached for result in first))
+        self.assertTrue(all(result.cached for result in reused if result.name not in doctor.LIVE_CHECKS))
+        self.assertEqual(by_name["sentinel_env"].detail, first_by_name["sentinel_env"].detail)
+        self.assertEqual(by_name["sentinel_env"].duration_ms, first_by_name["sentinel_env"].duration_ms)
+        self.assertEqual((by_name["data_dir"].status, by_name["data_dir"].cached), ("fail", False))
+        self.assertEqual((by_name["mongo_socket"].detail, by_name["mongo_socket"].cached), ("connection refused", False))
+        self.assertEqual(next(r for r in refingerprinted if r.name == "sentinel_env").detail, "probed again")
+        self.assertEqual(next(r for r in forced if r.name == "sentinel_env").detail, "probed again")
+        self.assertEqual(expired, {})
+        self.assertFalse(doctor.LIVE_CHECKS & set(stored["checks"]))
+        self.assertNotEqual(stored["fingerprint"], fingerprint)
+        self.assertNotIn("changed", json.dumps(stored))
+
+    def test_doctor_cli_only_caches_when_asked(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cache_path = Path(tmpdir) / "doctor-cache.json"
+            argv = ["--json", "--skip-optional", "--skip-mongo", "--skip-env-files", "--cache-path", str(cache_path)]
+            with mock.patch.object(doctor.settings, "DATA_DIR", Path(tmpdir)), mock.patch("builtins.print"):
+                doctor.main(argv)
+                written_by_default = cache_path.exists()
+                doctor.main([*argv, "--cache"])
+                written_on_request = cache_path.exists()
+
+        self.assertFalse(written_by_default)
+        self.assertTrue(written_on_request)
 
     def test_env_template_checker_detects_missing_template(self) -> None:
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -5,6 +5,8 @@ from __future__ import annotations
 from pathlib import Path
 import unittest
 
+from app.cli.bundle import render_shell_script
+
 
 ROOT = Path(__file__).resolve().parents[1]
 
@@ -21,7 +23,7 @@ class EvidenceChecklistCiIntegrationTests(unittest.TestCase):
         self.assertIn("evidence-checklist.json", makefile)
 
     def test_ci_report_generates_evidence_checklist_outputs(self) -> None:
-        ci_report = (ROOT / "scripts" / "ci_report.sh").read_text(encoding="utf-8")
+        ci_report = render_shell_script()
 
         self.assertIn("app.cli.evidence_checklist --help", ci_report)
         self.assertIn("app.cli.evidence_checklist --artifact-dir", ci_report)
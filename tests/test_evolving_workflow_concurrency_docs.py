@@ -11,6 +11,8 @@ from __future__ import annotations
 from pathlib import Path
 import unittest
 
+from tests.doc_corpus import load_doc
+
 
 ROOT = Path(__file__).resolve().parents[1]
 DOC = ROOT / "docs" / "evolving_workflow_concurrency.md"
@@ -23,7 +25,7 @@ class EvolvingWorkflowConcurrencyDocsTests(unittest.TestCase):
     """Ensure the evolving workflow concurrency policy remains low-risk."""
 
     def test_documents_conservative_pull_request_concurrency_policy(self) -> None:
-        content = DOC.read_text(encoding="utf-8")
+        content = load_doc(DOC).text
 
         for phrase in [
             "conservative GitHub Actions concurrency controls",
@@ -51,7 +53,7 @@ class EvolvingWorkflowConcurrencyDocsTests(unittest.TestCase):
                 self.assertIn("cancel-in-progress: ${{ github.event_name == 'pull_request' }}", content)
 
     def test_documents_covered_workflows(self) -> None:
-        content = DOC.read_text(encoding="utf-8")
+        content = load_doc(DOC).text
 
         for workflow_name in [
             "`CI`",
@@ -63,7 +65,7 @@ class EvolvingWorkflowConcurrencyDocsTests(unittest.TestCase):
                 self.assertIn(workflow_name, content)
 
     def test_documents_reviewer_evidence_and_merge_blockers(self) -> None:
-        content = DOC.read_text(encoding="utf-8")
+        content = load_doc(DOC).text
 
         for phrase in [
             "final head SHA",
@@ -77,7 +79,7 @@ class EvolvingWorkflowConcurrencyDocsTests(unittest.TestCase):
                 self.assertIn(phrase, content)
 
     def test_documents_compatibility_rollback_and_safe_scope(self) -> None:
-        content = DOC.read_text(encoding="utf-8")
+        content = load_doc(DOC).text
         lower = content.lower()
 
         for phrase in [
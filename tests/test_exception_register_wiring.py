@@ -6,6 +6,8 @@ from pathlib import Path
 import re
 import unittest
 
+from app.cli.bundle import render_shell_script
+
 
 ROOT = Path(__file__).resolve().parents[1]
 
@@ -25,7 +27,7 @@ class ExceptionRegisterWiringTests(unittest.TestCase):
         self.assertIn("$(ARTIFACT_DIR)/operator-exception-register.txt", content)
 
     def test_ci_report_includes_exception_register_outputs(self) -> None:
-        content = (ROOT / "scripts" / "ci_report.sh").read_text(encoding="utf-8")
+        content = render_shell_script()
 
         self.assertIn("app.cli.operator_exception_register --help", content)
         self.assertIn("operator-exception-register-help.txt", content)
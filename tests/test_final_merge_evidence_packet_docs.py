@@ -10,6 +10,8 @@ from __future__ import annotations
 from pathlib import Path
 import unittest
 
+from tests.doc_corpus import load_doc
+
 
 ROOT = Path(__file__).resolve().parents[1]
 DOC = ROOT / "docs" / "final_merge_evidence_packet.md"
@@ -19,7 +21,7 @@ class FinalMergeEvidencePacketDocsTests(unittest.TestCase):
     """Ensure final merge review guidance remains explicit and safe."""
 
     def test_packet_documents_required_final_evidence(self) -> None:
-        content = DOC.read_text(encoding="utf-8")
+        content = load_doc(DOC).text
 
         required_terms = [
             "Target branch",
@@ -38,7 +40,7 @@ class FinalMergeEvidencePacketDocsTests(unittest.TestCase):
                 self.assertIn(term, content)
 
     def test_packet_keeps_unavailable_validation_as_blocker(self) -> None:
-        content = DOC.read_text(encoding="utf-8")
+        content = load_doc(DOC).text
 
         self.assertIn("Missing validation is a blocker", content)
         self.assertIn("blocked_ci", content)
@@ -46,7 +48,7 @@ class FinalMergeEvidencePacketDocsTests(unittest.TestCase):
         self.assertIn("must not be bypassed", content)
 
     def test_packet_preserves_safe_analytical_scope(self) -> None:
-        content = DOC.read_text(encoding="utf-8").lower()
+        content = load_doc(DOC).lower
 
         self.assertIn("does not collect live osint", content)
         self.assertIn("operational targeting", content)
@@ -54,7 +56,7 @@ class FinalMergeEvidencePacketDocsTests(unittest.TestCase):
         self.assertIn("predictive outputs remain framed as estimates", content)
 
     def test_packet_defines_merge_decision_states_and_rollback(self) -> None:
-        content = DOC.read_text(encoding="utf-8")
+        content = load_doc(DOC).text
 
         for state in [
             "ready_to_merge",
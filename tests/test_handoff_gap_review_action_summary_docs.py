@@ -5,6 +5,8 @@ from __future__ import annotations
 from pathlib import Path
 import unittest
 
+from tests.doc_corpus import load_doc
+
 
 DOC_PATH = Path("docs/handoff_gap_review_action_summary.md")
 
@@ -14,7 +16,7 @@ class HandoffGapReviewActionSummaryDocTests(unittest.TestCase):
 
     @classmethod
     def setUpClass(cls) -> None:
-        cls.markdown = DOC_PATH.read_text(encoding="utf-8")
+        cls.markdown = load_doc(DOC_PATH).text
 
     def test_documents_action_priority_contract_and_blockers(self) -> None:
         self.assertIn("# Handoff Gap Review Action Summary", self.markdown)
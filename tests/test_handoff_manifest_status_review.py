@@ -5,6 +5,8 @@ from __future__ import annotations
 from pathlib import Path
 import unittest
 
+from tests.doc_corpus import load_doc
+
 
 DOC_PATH = Path("docs/handoff_manifest_status_review.md")
 CHANGELOG_PATH = Path("CHANGELOG.md")
@@ -15,8 +17,8 @@ class HandoffManifestStatusReviewDocTests(unittest.TestCase):
 
     @classmethod
     def setUpClass(cls) -> None:
-        cls.doc = DOC_PATH.read_text(encoding="utf-8")
-        cls.changelog = CHANGELOG_PATH.read_text(encoding="utf-8")
+        cls.doc = load_doc(DOC_PATH).text
+        cls.changelog = load_doc(CHANGELOG_PATH).text
 
     def test_document_defines_safe_default_statuses_and_inputs(self) -> None:
         required_tokens = [
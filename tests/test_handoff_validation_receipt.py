@@ -8,6 +8,7 @@ from pathlib import Path
 from tempfile import TemporaryDirectory
 import unittest
 
+from app.cli.artifact_merkle import merkle_tree
 from app.cli.handoff_validation_receipt import (
     build_handoff_validation_receipt,
     render_markdown,
@@ -51,10 +52,39 @@ class HandoffValidationReceiptTests(unittest.TestCase):
         self.assertEqual(report["status"], "ready")
         self.assertEqual(report["artifact_count"], 7)
         self.assertEqual(len(report["bundle_manifest_digest"]), 64)
+        self.assertEqual(report["bundle_directory_digests"], {".": report["bundle_manifest_digest"]})
         self.assertEqual(report["missing_required_artifacts"], [])
         self.assertIn("# Handoff Validation Receipt", markdown)
         self.assertIn("not operational targeting guidance", report["safe_scope"])
 
+    def test_digest_is_recomputed_from_entries_and_lists_subdirectories(self) -> None:
+        manifest = self._ready_manifest()
+        manifest["files"].append({"path": "previews/index.svg", "sha256": "2" * 64, "size_bytes": 17})
+        computed = build_handoff_validation_receipt(generated_at=datetime(2026, 1, 1, tzinfo=timezone.utc), manifest=manifest)
+        manifest["merkle"] = merkle_tree(manifest["files"])
+        consistent = build_handoff_validation_receipt(generated_at=datetime(2026, 1, 1, tzinfo=timezone.utc), manifest=manifest)
+        previews = computed["bundle_directory_digests"]["previews"]
+
+        self.assertEqual(set(computed["bundle_directory_digests"]), {".", "previews"})
+        self.assertEqual(consistent["bundle_manifest_digest"], computed["bundle_manifest_digest"])
+        self.assertEqual(consistent["manifest_digest_mismatches"], [])
+        self.assertIn(f"| `previews/` | `{previews}` |", render_markdown(consistent))
+
+    def test_recorded_merkle_tree_mismatch_blocks_receipt(self) -> None:
+        manifest = self._ready_manifest()
+        manifest["files"].append({"path": "previews/index.svg", "sha256": "2" * 64, "size_bytes": 17})
+        manifest["merkle"] = merkle_tree(manifest["files"])
+        computed_root = manifest["merkle"]["root"]
+        manifest["files"][-1]["sha256"] = "3" * 64
+
+        report = build_handoff_validation_receipt(generated_at=datetime(2026, 1, 1, tzinfo=timezone.utc), manifest=manifest)
+
+        self.assertNotEqual(report["bundle_manifest_digest"], computed_root)
+        self.assertEqual(report["bundle_manifest_digest"], merkle_tree(manifest["files"])["root"])
+        self.assertEqual(report["manifest_digest_mismatches"], [".", "previews"])
+        self.assertEqual(report["status"], "blocked")
+        self.assertTrue(any("do not match its file entries: ., previews" in blocker for blocker in report["blockers"]))
+
     def test_missing_required_artifact_blocks_receipt(self) -> None:
         manifest = self._ready_manifest()
         manifest["files"] = [entry for entry in manifest["files"] if entry["path"] != "evidence-checklist.json"]
@@ -2,18 +2,19 @@
 
 from __future__ import annotations
 
-from pathlib import Path
 import unittest
 
+from app.cli.bundle import render_shell_script
+
 
 class HandoffValidationReceiptCiWiringTests(unittest.TestCase):
     """Ensure the receipt is generated by the reusable CI diagnostics bundle."""
 
     def test_ci_report_generates_receipt_outputs_after_upstream_artifacts(self) -> None:
-        script = Path("scripts/ci_report.sh").read_text(encoding="utf-8")
+        script = render_shell_script()
 
         evidence_index = script.index("app.cli.evidence_checklist --artifact-dir")
-        manifest_index = script.index("app.cli.artifact_manifest --artifact-dir", evidence_index)
+        manifest_index = script.index("app.cli.artifact_scan --artifact-dir", evidence_index)
         receipt_index = script.index("app.cli.handoff_validation_receipt --artifact-dir")
 
         self.assertLess(evidence_index, receipt_index)
@@ -22,7 +23,7 @@ class HandoffValidationReceiptCiWiringTests(unittest.TestCase):
         self.assertIn("handoff-validation-receipt.json", script)
 
     def test_ci_report_captures_receipt_help_and_summary(self) -> None:
-        script = Path("scripts/ci_report.sh").read_text(encoding="utf-8")
+        script = render_shell_script()
 
         self.assertIn("handoff-validation-receipt-help.txt", script)
         self.assertIn("handoff validation receipt", script)
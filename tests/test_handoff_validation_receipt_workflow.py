@@ -10,6 +10,8 @@ from __future__ import annotations
 from pathlib import Path
 import unittest
 
+from tests.doc_corpus import load_doc
+
 
 ROOT = Path(__file__).resolve().parents[1]
 WORKFLOW = ROOT / ".github" / "workflows" / "handoff-validation-receipt.yml"
@@ -57,7 +59,7 @@ class HandoffValidationReceiptWorkflowTests(unittest.TestCase):
                 self.assertIn(phrase, content)
 
     def test_workflow_documentation_covers_reproduction_review_and_rollback(self) -> None:
-        content = DOC.read_text(encoding="utf-8")
+        content = load_doc(DOC).text
 
         self.assertIn("Local reproduction", content)
         self.assertIn("Review guidance", content)
@@ -67,7 +69,7 @@ class HandoffValidationReceiptWorkflowTests(unittest.TestCase):
         self.assertIn("does not run collection, live feeds, prediction", content)
 
     def test_workflow_documentation_covers_step_summary_limits(self) -> None:
-        content = DOC.read_text(encoding="utf-8")
+        content = load_doc(DOC).text
 
         for phrase in [
             "GitHub Actions step summary",
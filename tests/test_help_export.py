@@ -0,0 +1,72 @@
+"""Tests for the single-process CLI help exporter."""
+
+from __future__ import annotations
+
+import contextlib
+import io
+import os
+from pathlib import Path
+import subprocess
+import sys
+from tempfile import TemporaryDirectory
+import unittest
+
+from app.cli.artifact_manifest import EXPECTED_ARTIFACTS
+from app.cli.help_export import HELP_EXPORTS, export_help, main, render_help
+
+ROOT = Path(__file__).resolve().parents[1]
+PAST_NS = 1_600_000_000 * 1_000_000_000
+
+
+class HelpExportTests(unittest.TestCase):
+    """Keep exported help identical to redirected ``--help`` launches."""
+
+    def test_exports_cover_expected_help_artifacts(self) -> None:
+        outputs = {output for _, output in HELP_EXPORTS}
+
+        for name in EXPECTED_ARTIFACTS:
+            if name.endswith("-help.txt"):
+                with self.subTest(name=name):
+                    self.assertIn(name, outputs)
+
+    def test_render_matches_redirected_module_launch(self) -> None:
+        env = {key: value for key, value in os.environ.items() if key != "COLUMNS"}
+        launched = subprocess.run(
+            [sys.executable, "-m", "app.cli.doctor", "--help"],
+            cwd=ROOT,
+            env=env,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+        self.assertEqual(render_help("doctor"), launched.stdout)
+        self.assertTrue(render_help("artifact_manifest").startswith("usage: artifact_manifest.py "))
+
+    def test_unchanged_help_files_are_not_rewritten(self) -> None:
+        exports = [("doctor", "doctor-help.txt"), ("artifact_manifest", "artifact-manifest-help.txt")]
+        with TemporaryDirectory() as temp_dir:
+            artifact_dir = Path(temp_dir)
+            first = export_help(artifact_dir, exports)
+            os.utime(artifact_dir / "doctor-help.txt", ns=(PAST_NS, PAST_NS))
+            (artifact_dir / "artifact-manifest-help.txt").write_text("stale\n", encoding="utf-8")
+            second = export_help(artifact_dir, exports)
+            doctor_mtime = (artifact_dir / "doctor-help.txt").stat().st_mtime_ns
+            manifest_help = (artifact_dir / "artifact-manifest-help.txt").read_text(encoding="utf-8")
+
+        self.assertEqual(first, {"doctor-help.txt": True, "artifact-manifest-help.txt": True})
+        self.assertEqual(second, {"doctor-help.txt": False, "artifact-manifest-help.txt": True})
+        self.assertEqual(doctor_mtime, PAST_NS)
+        self.assertEqual(manifest_help, render_help("artifact_manifest"))
+
+    def test_cli_rejects_unknown_modules(self) -> None:
+        output = io.StringIO()
+        with TemporaryDirectory() as temp_dir, contextlib.redirect_stdout(output):
+            status = main(["--artifact-dir", temp_dir, "--only", "not_a_cli"])
+
+        self.assertEqual(status, 2)
+        self.assertIn("not_a_cli", output.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
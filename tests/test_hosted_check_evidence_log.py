@@ -5,12 +5,14 @@ from __future__ import annotations
 from pathlib import Path
 import unittest
 
+from tests.doc_corpus import load_doc
+
 
 class HostedCheckEvidenceLogDocsTests(unittest.TestCase):
     """Keep hosted validation evidence capture discoverable and merge-safe."""
 
     def setUp(self) -> None:
-        self.doc = Path("docs/hosted_check_evidence_log.md").read_text(encoding="utf-8")
+        self.doc = load_doc("docs/hosted_check_evidence_log.md").text
 
     def test_log_template_covers_required_hosted_checks(self) -> None:
         for check_name in (
@@ -54,7 +56,7 @@ class HostedCheckEvidenceLogDocsTests(unittest.TestCase):
                 self.assertIn(phrase, self.doc)
 
     def test_changelog_records_the_template(self) -> None:
-        changelog = Path("CHANGELOG.md").read_text(encoding="utf-8")
+        changelog = load_doc("CHANGELOG.md").text
 
         self.assertIn("docs/hosted_check_evidence_log.md", changelog)
         self.assertIn("hosted check evidence", changelog.lower())
@@ -0,0 +1,180 @@
+"""Tests for test-impact recording and selection."""
+
+from __future__ import annotations
+
+import contextlib
+import io
+import json
+from pathlib import Path
+import subprocess
+from tempfile import TemporaryDirectory
+import textwrap
+import unittest
+from unittest import mock
+
+from app.cli import impact_index
+from scripts import parallel_tests
+from app.cli.impact_index import ImpactRecorder, changed_files, import_closure, select_modules, smoke_plan, smoke_steps
+
+ROOT = impact_index.REPOSITORY_ROOT
+
+
+def _write(path: Path, text: str) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(textwrap.dedent(text), encoding="utf-8")
+    return path
+
+
+class ImpactIndexTests(unittest.TestCase):
+    """Record what tests touch and select only what a diff affects."""
+
+    def test_recorder_keeps_repository_paths_scans_and_subprocesses(self) -> None:
+        recorder = ImpactRecorder()
+        recorder("open", (str(ROOT / "README.md"), "r", 0))
+        recorder("open", (b"docs/bundle_diff.md", "r", 0))
+        recorder("open", ("/etc/hostname", "r", 0))
+        recorder("open", (3, "r", 0))
+        recorder("open", (str(ROOT / "app" / "__pycache__" / "x.pyc"), "rb", 0))
+        recorder("os.scandir", (str(ROOT / "docs"),))
+        recorder("os.listdir", (str(ROOT / "app" / "cli"),))
+        recorder("subprocess.Popen", ("git", ["git"], None, None))
+        snapshot = recorder.snapshot([ROOT / "tests" / "test_impact_index.py"])
+
+        self.assertIn("README.md", snapshot["files"])
+        self.assertIn("docs/bundle_diff.md", snapshot["files"])
+        self.assertIn("app/cli/impact_index.py", snapshot["files"])
+        self.assertFalse(any(path.startswith(("/", "app/__pycache__")) for path in snapshot["files"]))
+        self.assertEqual(snapshot["directories"], ["docs"])
+        self.assertTrue(snapshot["spawns_processes"])
+
+    def test_selection_reasons(self) -> None:
+        index = {
+            "modules": {
+                "tests.test_docs": {"files": ["README.md"], "directories": ["docs"], "spawns_processes": False},
+                "tests.test_cli": {"files": ["app/cli/doctor.py"], "directories": [], "spawns_processes": True},
+                "tests.test_other": {"files": ["app/cli/bundle.py"], "directories": [], "spawns_processes": False},
+            }
+        }
+        modules = ["tests.test_cli", "tests.test_docs", "tests.test_new", "tests.test_other"]
+
+        self.assertEqual(
+            select_modules(index, modules, ["docs/new_page.md"]),
+            {
+                "tests.test_cli": "starts subprocesses and docs/new_page.md changed",
+                "tests.test_docs": "lists docs/",
+                "tests.test_new": "not in the impact index",
+            },
+        )
+        self.assertEqual(
+            select_modules(index, ["tests.test_cli", "tests.test_other"], ["benchmarks/test_durations.json"]),
+            {"tests.test_cli": "starts subprocesses and benchmarks/test_durations.json changed"},
+        )
+        self.assertEqual(
+            select_modules(index, modules, ["app/cli/release_notes.py", "README.md"]),
+            {
+                "tests.test_cli": "starts subprocesses and app/cli/release_notes.py changed",
+                "tests.test_docs": "depends on README.md",
+                "tests.test_new": "not in the impact index",
+            },
+        )
+
+    def test_import_closure_follows_real_imports_but_not_lazy_exports(self) -> None:
+        with TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            _write(root / "pkg" / "__init__.py", "def __getattr__(name):\n    from .heavy import thing\n    return thing\n")
+            _write(root / "pkg" / "heavy.py", "thing = 1\n")
+            _write(root / "pkg" / "helpers.py", "import json\n")
+            _write(root / "pkg" / "lazy.py", "x = 1\n")
+            entry = _write(
+                root / "pkg" / "tool.py",
+                """
+                from . import helpers
+                from pkg.missing import nothing
+
+
+                def main():
+                    from pkg import lazy
+                """,
+            )
+            closure = import_closure(entry, root)
+
+        self.assertEqual(closure, {"pkg/__init__.py", "pkg/helpers.py", "pkg/lazy.py", "pkg/tool.py"})
+
+    def test_smoke_plan_runs_steps_up_to_the_last_affected_one(self) -> None:
+        script = ROOT / "scripts" / "test.sh"
+        steps = smoke_steps(script)
+        targets = [step["target"] for step in steps]
+        release_notes = targets.index("app.cli.release_notes") + 1
+
+        self.assertEqual(targets[0], "app.cli.doctor")
+        self.assertEqual(targets[-1], "scripts/validate_reviewer_handoff.py")
+        self.assertEqual(smoke_plan(steps, ["docs/bundle_diff.md", "tests/test_doctor.py"], script), 0)
+        self.assertEqual(smoke_plan(steps, ["app/cli/release_notes.py"], script), release_notes)
+        self.assertEqual(smoke_plan(steps, ["scripts/validate_reviewer_handoff.py"], script), len(steps))
+        self.assertEqual(smoke_plan(steps, ["scripts/test.sh"], script), len(steps))
+        self.assertEqual(smoke_plan(steps, ["app/api/openapi.json"], script), len(steps))
+
+    def test_changed_files_include_worktree_edits_and_untracked_files(self) -> None:
+        with TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            git = ["git", "-c", "user.name=test", "-c", "user.email=test@example.com"]
+            subprocess.run([*git, "init", "-q"], cwd=root, check=True)
+            _write(root / "a.md", "a\n")
+            _write(root / "b.md", "b\n")
+            subprocess.run([*git, "add", "."], cwd=root, check=True)
+            subprocess.run([*git, "commit", "-q", "-m", "base"], cwd=root, check=True)
+            _write(root / "a.md", "changed\n")
+            (root / "b.md").rename(root / "c.md")
+            _write(root / "docs" / "new.md", "new\n")
+
+            self.assertEqual(changed_files("HEAD", root), ["a.md", "b.md", "c.md", "docs/new.md"])
+            with self.assertRaises(impact_index.ImpactError):
+                changed_files("no-such-ref", root)
+
+    def test_changed_run_selects_modules_and_rebuilds_a_stale_index(self) -> None:
+        with TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            index_path = root / "impact.json"
+            entry = {"files": ["docs/parallel_tests.md"], "directories": [], "spawns_processes": False}
+            impact_index.write_index(
+                {"commit": "abc", "modules": {"tests.test_api_schemas": entry, "tests.test_doc_corpus": {**entry, "files": []}}},
+                index_path,
+            )
+            common = ["tests.test_api_schemas", "tests.test_doc_corpus", "--jobs", "1", "--no-json", "--no-junit", "--impact-index", str(index_path)]
+            output = io.StringIO()
+            with contextlib.redirect_stdout(output), mock.patch.object(impact_index, "changed_files", return_value=["docs/parallel_tests.md"]):
+                with mock.patch.object(impact_index, "index_age", return_value=2):
+                    fresh = parallel_tests.main([*common, "--changed"])
+                with mock.patch.object(impact_index, "index_age", return_value=None), mock.patch.object(
+                    parallel_tests, "run_modules", return_value=[]
+                ) as run_modules:
+                    stale = parallel_tests.main(["--changed", "origin/main", *common])
+
+        self.assertEqual((fresh, stale), (0, 0))
+        self.assertIn("1 of 2 test modules are affected", output.getvalue())
+        self.assertIn("ok    tests.test_api_schemas", output.getvalue())
+        self.assertNotIn("tests.test_doc_corpus (", output.getvalue())
+        self.assertIn("index is out of date; running every module", output.getvalue())
+        self.assertEqual(sorted(run_modules.call_args.args[0]), ["tests.test_api_schemas", "tests.test_doc_corpus"])
+        self.assertTrue(run_modules.call_args.kwargs["record_impact"])
+
+    def test_recorded_run_captures_module_dependencies(self) -> None:
+        with TemporaryDirectory() as temp_dir:
+            index_path = Path(temp_dir) / "impact.json"
+            with contextlib.redirect_stdout(io.StringIO()):
+                exit_code = parallel_tests.main(
+                    ["tests.test_doc_corpus", "--record-impact", "--impact-index", str(index_path), "--no-json", "--no-junit"]
+                )
+            index = json.loads(index_path.read_text(encoding="utf-8"))
+
+        recorded = index["modules"]["tests.test_doc_corpus"]
+        self.assertEqual(exit_code, 0)
+        self.assertIn("tests/doc_corpus.py", recorded["files"])
+        self.assertIn("docs/common_tasks.md", recorded["files"])
+        self.assertIn("docs", recorded["directories"])
+        self.assertNotIn("scripts/parallel_tests.py", recorded["files"])
+        self.assertFalse(recorded["spawns_processes"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -14,6 +14,7 @@ from app.cli.implementation_acceptance_checklist import (
     render_markdown,
     write_outputs,
 )
+from tests.doc_corpus import load_doc
 
 
 class ImplementationAcceptanceChecklistTests(unittest.TestCase):
@@ -118,8 +119,8 @@ class ImplementationAcceptanceChecklistTests(unittest.TestCase):
         self.assertIn("Ready for merge evidence review: False", markdown)
 
     def test_schema_documentation_covers_machine_readable_contract(self) -> None:
-        checklist_doc = Path("docs/implementation_acceptance_checklist.md").read_text(encoding="utf-8")
-        schema_doc = Path("docs/implementation_acceptance_schema.md").read_text(encoding="utf-8")
+        checklist_doc = load_doc("docs/implementation_acceptance_checklist.md").text
+        schema_doc = load_doc("docs/implementation_acceptance_schema.md").text
 
         self.assertIn("docs/implementation_acceptance_schema.md", checklist_doc)
         self.assertIn("schema_version` is currently `1.3`", schema_doc)
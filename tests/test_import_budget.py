@@ -0,0 +1,157 @@
+"""Tests for the CLI import-time budget gate."""
+
+from __future__ import annotations
+
+import contextlib
+import io
+import json
+from pathlib import Path
+from tempfile import TemporaryDirectory
+import unittest
+
+from app.cli.import_budget import (
+    DEFAULT_BASELINE_PATH,
+    MIN_SLACK_MS,
+    budget_for,
+    build_baseline,
+    build_import_budget_report,
+    default_modules,
+    load_baseline,
+    main,
+    measure_module,
+    measure_reference,
+    parse_importtime,
+    render_markdown,
+)
+
+IMPORTTIME_STDERR = """import time: self [us] | cumulative | imported package
+import time:       150 |        150 |   _io
+-- app.cli import budget --
+import time:       300 |        300 |       typing
+import time:       100 |        400 |     app
+import time:        50 |        450 |   app.cli
+import time:       800 |       1200 |     json.decoder
+import time:       200 |       1400 |   json
+import time:       500 |       2350 | app.cli.example
+"""
+
+
+def _measured(module: str, cumulative_ms: float) -> dict:
+    return {"module": module, "cumulative_ms": cumulative_ms, "import_count": 1, "heavy_imports": [], "largest_dependencies": []}
+
+
+class ImportBudgetTests(unittest.TestCase):
+    """Keep cold CLI import measurements and budget checks reproducible."""
+
+    def test_parse_importtime_reads_rows_after_marker(self) -> None:
+        rows = parse_importtime(IMPORTTIME_STDERR)
+
+        self.assertEqual(rows[0], (3, "typing", 300, 300))
+        self.assertEqual(rows[-1], (0, "app.cli.example", 500, 2350))
+        self.assertNotIn("_io", [name for _, name, _, _ in rows])
+
+    def test_report_flags_over_budget_unbudgeted_and_failed_modules(self) -> None:
+        baseline = {
+            "modules": {
+                "app.cli.fast": {"baseline_ms": 10.0, "budget_ms": 35.0, "reference_ms": 50.0},
+                "app.cli.slow": {"baseline_ms": 10.0, "budget_ms": 35.0, "reference_ms": 50.0},
+            }
+        }
+        measurements = [
+            _measured("app.cli.fast", 20.0),
+            _measured("app.cli.slow", 90.0),
+            _measured("app.cli.new", 40.0),
+            {"module": "app.cli.broken", "error": "ModuleNotFoundError: No module named 'missing'"},
+        ]
+
+        report = build_import_budget_report(measurements, baseline, repeat=1, reference_ms=50.0)
+        statuses = {entry["module"]: entry["status"] for entry in report["modules"]}
+
+        self.assertEqual(
+            statuses,
+            {"app.cli.fast": "within_budget", "app.cli.slow": "over_budget", "app.cli.new": "unbudgeted", "app.cli.broken": "error"},
+        )
+        self.assertEqual(report["status"], "fail")
+        self.assertEqual([entry["module"] for entry in report["modules"]][:2], ["app.cli.broken", "app.cli.slow"])
+        self.assertIn("| `app.cli.slow` | 90.0 | 35.0 | over_budget |", render_markdown(report))
+
+    def test_budgets_scale_with_the_reference_import(self) -> None:
+        baseline = {
+            "modules": {
+                "app.cli.slow": {"baseline_ms": 10.0, "budget_ms": 35.0, "reference_ms": 50.0},
+                "app.cli.legacy": {"baseline_ms": 10.0, "budget_ms": 35.0},
+            }
+        }
+        measurements = [_measured("app.cli.slow", 60.0), _measured("app.cli.legacy", 90.0)]
+
+        slower_machine = build_import_budget_report(measurements, baseline, reference_ms=100.0)
+        uncalibrated = build_import_budget_report(measurements, baseline)
+        slow = slower_machine["modules"][1]
+
+        self.assertEqual((slow["module"], slow["scale"], slow["budget_ms"], slow["status"]), ("app.cli.slow", 2.0, 70.0, "within_budget"))
+        self.assertEqual(slower_machine["modules"][0]["status"], "unbudgeted")
+        self.assertEqual({entry["status"] for entry in uncalibrated["modules"]}, {"unbudgeted"})
+        self.assertEqual(slower_machine["status"], "pass")
+
+    def test_baseline_budgets_keep_minimum_slack_and_skip_errors(self) -> None:
+        baseline = build_baseline(
+            [_measured("app.cli.fast", 5.0), _measured("app.cli.slow", 200.0), {"module": "app.cli.broken", "error": "boom"}],
+            reference_ms=60.0,
+        )
+
+        self.assertEqual(budget_for(5.0), 5.0 + MIN_SLACK_MS)
+        self.assertEqual(baseline["modules"]["app.cli.slow"], {"baseline_ms": 200.0, "budget_ms": 400.0, "reference_ms": 60.0})
+        self.assertNotIn("app.cli.broken", baseline["modules"])
+
+    def test_committed_baseline_covers_every_cli(self) -> None:
+        baseline = load_baseline(DEFAULT_BASELINE_PATH)
+
+        self.assertEqual(sorted(baseline["modules"]), sorted(default_modules()))
+        self.assertTrue(all(entry.get("reference_ms") for entry in baseline["modules"].values()))
+
+    def test_reference_import_is_measured(self) -> None:
+        self.assertGreater(measure_reference(repeat=1), 0)
+
+    def test_doctor_import_is_measured_without_heavy_packages(self) -> None:
+        measured = measure_module("app.cli.doctor", repeat=1)
+
+        self.assertGreater(measured["cumulative_ms"], 0)
+        self.assertEqual(measured["heavy_imports"], [])
+        self.assertIn("app.cli", [row["module"] for row in measured["largest_dependencies"]])
+
+    def test_gate_fails_when_module_exceeds_budget(self) -> None:
+        with TemporaryDirectory() as temp_dir:
+            baseline_path = Path(temp_dir) / "baseline.json"
+            baseline_path.write_text(
+                json.dumps(
+                    {
+                        "version": 2,
+                        "modules": {"app.cli.doctor": {"baseline_ms": 0.001, "budget_ms": 0.001, "reference_ms": 50.0}},
+                    }
+                ),
+                encoding="utf-8",
+            )
+            output = io.StringIO()
+            with contextlib.redirect_stdout(output):
+                status = main(
+                    [
+                        "--artifact-dir",
+                        temp_dir,
+                        "--baseline",
+                        str(baseline_path),
+                        "--module",
+                        "app.cli.doctor",
+                        "--repeat",
+                        "1",
+                        "--fail-on-budget",
+                    ]
+                )
+            report = json.loads((Path(temp_dir) / "import-budget.json").read_text(encoding="utf-8"))
+
+        self.assertEqual(status, 1)
+        self.assertEqual(report["modules"][0]["status"], "over_budget")
+        self.assertIn("Import budget exceeded: app.cli.doctor", output.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
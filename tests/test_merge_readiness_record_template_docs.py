@@ -10,6 +10,8 @@ from __future__ import annotations
 from pathlib import Path
 import unittest
 
+from tests.doc_corpus import load_doc
+
 
 ROOT = Path(__file__).resolve().parents[1]
 DOC = ROOT / "docs" / "merge_readiness_record_template.md"
@@ -19,7 +21,7 @@ class MergeReadinessRecordTemplateDocsTests(unittest.TestCase):
     """Ensure the copyable merge record stays complete and safety framed."""
 
     def test_template_captures_required_merge_evidence(self) -> None:
-        content = DOC.read_text(encoding="utf-8")
+        content = load_doc(DOC).text
 
         required_terms = [
             "Pull request",
@@ -42,7 +44,7 @@ class MergeReadinessRecordTemplateDocsTests(unittest.TestCase):
                 self.assertIn(term, content)
 
     def test_template_keeps_unavailable_validation_blocking(self) -> None:
-        content = DOC.read_text(encoding="utf-8")
+        content = load_doc(DOC).text
 
         self.assertIn("blocked_ci", content)
         self.assertIn("unavailable", content)
@@ -50,7 +52,7 @@ class MergeReadinessRecordTemplateDocsTests(unittest.TestCase):
         self.assertIn("replace required hosted checks", content)
 
     def test_template_preserves_safe_analytical_scope(self) -> None:
-        content = DOC.read_text(encoding="utf-8").lower()
+        content = load_doc(DOC).lower
 
         self.assertIn("does not collect live data", content)
         self.assertIn("perform targeting", content)
@@ -59,7 +61,7 @@ class MergeReadinessRecordTemplateDocsTests(unittest.TestCase):
         self.assertIn("operational targeting", content)
 
     def test_template_documents_all_decision_states_and_rollback(self) -> None:
-        content = DOC.read_text(encoding="utf-8")
+        content = load_doc(DOC).text
 
         for state in [
             "ready_to_merge",
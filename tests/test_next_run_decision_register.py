@@ -1,12 +1,14 @@
 from pathlib import Path
 
+from tests.doc_corpus import load_doc
+
 
 ROOT = Path(__file__).resolve().parents[1]
 REGISTER = ROOT / "docs" / "next_run_decision_register.md"
 
 
 def test_next_run_decision_register_prioritizes_blocker_repair_before_expansion() -> None:
-    register = REGISTER.read_text(encoding="utf-8")
+    register = load_doc(REGISTER).text
 
     assert "Protect the default branch first" in register
     assert "Repair blockers before expansion" in register
@@ -15,7 +17,7 @@ def test_next_run_decision_register_prioritizes_blocker_repair_before_expansion(
 
 
 def test_next_run_decision_register_discourages_duplicate_process_only_work() -> None:
-    register = REGISTER.read_text(encoding="utf-8")
+    register = load_doc(REGISTER).text
 
     assert "Prefer functional unlocks over more process text" in register
     assert "standalone guide" in register
@@ -24,7 +26,7 @@ def test_next_run_decision_register_discourages_duplicate_process_only_work() ->
 
 
 def test_next_run_decision_register_requires_handoff_and_safety_fields() -> None:
-    register = REGISTER.read_text(encoding="utf-8")
+    register = load_doc(REGISTER).text
 
     assert "Selected candidate and why it beat the alternatives" in register
     assert "Exact local validation commands and hosted checks reviewed" in register
@@ -0,0 +1,126 @@
+"""Tests for the parallel unittest runner."""
+
+from __future__ import annotations
+
+import contextlib
+import io
+import json
+from pathlib import Path
+import sys
+from tempfile import TemporaryDirectory
+import textwrap
+import unittest
+from unittest import mock
+from xml.etree import ElementTree
+
+from scripts import parallel_tests
+from scripts.parallel_tests import build_test_report, estimate_durations, main, plan_shards, render_junit, run_modules, schedule
+
+SAMPLE_MODULE = textwrap.dedent(
+    '''
+    import unittest
+
+
+    class SampleTests(unittest.TestCase):
+        def test_passes(self):
+            print("hidden unless the test fails")
+
+        def test_subtests(self):
+            for value in (1, 2, 3):
+                with self.subTest(value=value):
+                    self.assertNotEqual(value, 2)
+
+        @unittest.skip("not today")
+        def test_skipped(self):
+            pass
+
+        def test_errors(self):
+            print("shown with the traceback")
+            raise RuntimeError("boom")
+    '''
+)
+
+
+class ParallelTestsTests(unittest.TestCase):
+    """Balance modules by duration and keep unittest outcomes intact."""
+
+    def test_shards_are_balanced_longest_first(self) -> None:
+        durations = estimate_durations(["a", "b", "c", "d", "e"], {"a": 5.0, "b": 4.0, "c": 3.0, "d": 2.0})
+        shards = plan_shards(list(durations), durations, 2)
+
+        self.assertEqual(durations["e"], 3.5)
+        self.assertEqual(schedule(list(durations), durations), ["a", "b", "e", "c", "d"])
+        self.assertEqual(shards, [["a", "c"], ["b", "e", "d"]])
+        self.assertEqual(sorted(sum(shards, [])), ["a", "b", "c", "d", "e"])
+
+    def test_workers_report_every_unittest_outcome(self) -> None:
+        with TemporaryDirectory() as temp_dir:
+            Path(temp_dir, "parallel_sample_tests.py").write_text(SAMPLE_MODULE, encoding="utf-8")
+            streamed = []
+            with mock.patch.object(sys, "path", [temp_dir, *sys.path]):
+                results = run_modules(["parallel_sample_tests", "parallel_missing_tests"], jobs=2, on_result=streamed.append)
+            sys.modules.pop("parallel_sample_tests", None)
+
+        report = build_test_report(results, jobs=2, wall_s=1.0)
+        sample = next(result for result in report["modules"] if result["module"] == "parallel_sample_tests")
+        outcomes = {case["id"].rpartition(".")[2]: case["outcome"] for case in sample["cases"]}
+        errored = next(case for case in sample["cases"] if case["outcome"] == "error")
+
+        self.assertEqual(len(streamed), 2)
+        self.assertEqual(sample["status"], "error")
+        self.assertEqual(sample["tests_run"], 4)
+        self.assertEqual(
+            outcomes,
+            {"test_passes": "success", "test_subtests (value=2)": "failure", "test_skipped": "skipped", "test_errors": "error"},
+        )
+        self.assertIn("shown with the traceback", errored["detail"])
+        self.assertNotIn("hidden unless the test fails", json.dumps(report))
+        self.assertEqual(report["status"], "fail")
+        self.assertEqual(report["outcomes"], {"error": 2, "failure": 1, "skipped": 1, "success": 1})
+
+        junit = ElementTree.fromstring(render_junit(report))
+        self.assertEqual(
+            {key: junit.get(key) for key in ("tests", "failures", "errors", "skipped")},
+            {"tests": "5", "failures": "1", "errors": "2", "skipped": "1"},
+        )
+        self.assertEqual([suite.get("name") for suite in junit], ["parallel_missing_tests", "parallel_sample_tests"])
+
+    def test_cli_runs_a_shard_and_writes_reports(self) -> None:
+        with TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            durations = root / "durations.json"
+            durations.write_text(json.dumps({"modules": {"tests.test_api_schemas": 0.5, "tests.test_doc_corpus": 9.0}}), encoding="utf-8")
+            output = io.StringIO()
+            with contextlib.redirect_stdout(output):
+                exit_code = main(
+                    [
+                        "tests.test_doc_corpus",
+                        "tests.test_api_schemas",
+                        "--shard",
+                        "2/2",
+                        "--jobs",
+                        "1",
+                        "--durations",
+                        str(durations),
+                        "--update-durations",
+                        "--impact-index",
+                        str(root / "impact.json"),
+                        "--artifact-dir",
+                        str(root),
+                    ]
+                )
+            report = json.loads((root / parallel_tests.DEFAULT_JSON_NAME).read_text(encoding="utf-8"))
+            recorded = json.loads(durations.read_text(encoding="utf-8"))["modules"]
+            junit_written = (root / parallel_tests.DEFAULT_JUNIT_NAME).is_file()
+
+        self.assertEqual(exit_code, 0)
+        self.assertEqual([result["module"] for result in report["modules"]], ["tests.test_api_schemas"])
+        self.assertEqual(report["shard"], "2/2")
+        self.assertEqual(sorted(recorded), ["tests.test_api_schemas", "tests.test_doc_corpus"])
+        self.assertTrue(junit_written)
+        self.assertIn("ok    tests.test_api_schemas", output.getvalue())
+        self.assertIn("\nOK", output.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,139 @@
+"""Tests for the synthetic-bundle pipeline benchmark suite."""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import io
+import os
+from pathlib import Path
+from tempfile import TemporaryDirectory
+import unittest
+
+from app.cli.pipeline_benchmarks import (
+    BENCHMARKS,
+    DEFAULT_BASELINE_PATH,
+    DEFAULT_SIZES,
+    artifact_tree,
+    benchmark_id,
+    build_baseline,
+    build_benchmark_report,
+    generate_artifact_tree,
+    load_baseline,
+    machine_fingerprint,
+    main,
+    run_benchmarks,
+)
+
+
+def _tree_digest(root: Path) -> str:
+    digest = hashlib.sha256()
+    for path in sorted(root.rglob("*")):
+        if path.is_file():
+            digest.update(path.relative_to(root).as_posix().encode())
+            digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def _result(builder: str, seconds: float, peak_bytes: int, file_count: int = 100) -> dict:
+    return {"id": benchmark_id(builder, file_count), "builder": builder, "file_count": file_count, "seconds": seconds, "peak_bytes": peak_bytes}
+
+
+class PipelineBenchmarkTests(unittest.TestCase):
+    """Keep synthetic trees deterministic and regression thresholds honest."""
+
+    def test_generated_tree_is_deterministic_and_sized(self) -> None:
+        with TemporaryDirectory() as temp_dir:
+            first, second = Path(temp_dir) / "a", Path(temp_dir) / "b"
+            generate_artifact_tree(first, 250)
+            generate_artifact_tree(second, 250)
+            file_count = sum(1 for path in first.rglob("*") if path.is_file())
+            same = _tree_digest(first) == _tree_digest(second)
+            has_records = any(first.glob("runs/shard-0000/record-*.json"))
+
+        self.assertEqual(file_count, 250)
+        self.assertTrue(same)
+        self.assertTrue(has_records)
+
+    def test_work_dir_trees_are_reused_while_stamp_matches(self) -> None:
+        with TemporaryDirectory() as temp_dir:
+            work_dir = Path(temp_dir)
+            with artifact_tree(120, work_dir) as root:
+                marker = root / "release-health.json"
+                os.utime(marker, ns=(1, 1))
+            with artifact_tree(120, work_dir) as root:
+                reused_mtime = (root / "release-health.json").stat().st_mtime_ns
+
+        self.assertEqual(reused_mtime, 1)
+
+    def test_run_measures_every_builder_in_order(self) -> None:
+        results = run_benchmarks(sizes=(120,))
+
+        self.assertEqual([result["builder"] for result in results], [benchmark.name for benchmark in BENCHMARKS])
+        self.assertTrue(all(result["seconds"] >= 0 for result in results))
+        self.assertGreater(results[0]["peak_bytes"], 0)
+
+    def test_report_applies_per_benchmark_thresholds(self) -> None:
+        baseline = {
+            "machine": machine_fingerprint(),
+            "benchmarks": {
+                benchmark_id("build_manifest", 100): {"seconds": 1.0, "peak_bytes": 10_000_000, "max_time_ratio": 1.5, "max_memory_ratio": 1.25},
+                benchmark_id("build_handoff", 100): {"seconds": 1.0, "peak_bytes": 10_000_000, "max_time_ratio": 3.0, "max_memory_ratio": 1.25},
+            }
+        }
+        results = [
+            _result("build_manifest", 2.0, 20_000_000),
+            _result("build_handoff", 2.0, 10_000_000),
+            _result("build_gap_report", 0.1, 1000),
+        ]
+
+        report = build_benchmark_report(results, baseline)
+        by_builder = {entry["builder"]: entry for entry in report["benchmarks"]}
+
+        self.assertEqual(report["status"], "fail")
+        self.assertEqual(by_builder["build_manifest"]["regressions"], ["time", "memory"])
+        self.assertEqual(by_builder["build_handoff"]["status"], "ok")
+        self.assertEqual(by_builder["build_gap_report"]["status"], "new")
+
+    def test_time_is_gated_only_against_a_same_machine_baseline(self) -> None:
+        entries = {benchmark_id("build_manifest", 100): {"seconds": 1.0, "peak_bytes": 10_000_000}}
+        slower = [_result("build_manifest", 5.0, 10_000_000)]
+        hungrier = [_result("build_manifest", 1.0, 20_000_000)]
+
+        foreign = build_benchmark_report(slower, {"machine": "elsewhere", "benchmarks": entries})
+        unrecorded = build_benchmark_report(hungrier, {"benchmarks": entries})
+        local = build_benchmark_report(slower, build_baseline([_result("build_manifest", 1.0, 10_000_000)]))
+
+        self.assertEqual((foreign["status"], foreign["time_gated"]), ("pass", False))
+        self.assertEqual(foreign["benchmarks"][0]["time_ratio"], 5.0)
+        self.assertEqual(unrecorded["benchmarks"][0]["regressions"], ["memory"])
+        self.assertEqual((local["status"], local["time_gated"]), ("fail", True))
+        self.assertNotIn("machine", build_baseline(slower, portable=True))
+        self.assertNotIn("machine", load_baseline(DEFAULT_BASELINE_PATH))
+
+    def test_baseline_update_keeps_tuned_thresholds(self) -> None:
+        previous = {"benchmarks": {benchmark_id("build_manifest", 100): {"seconds": 9.0, "peak_bytes": 1, "max_time_ratio": 4.0, "max_memory_ratio": 2.0}}}
+
+        baseline = build_baseline([_result("build_manifest", 1.0, 2048)], previous)
+
+        self.assertEqual(
+            baseline["benchmarks"][benchmark_id("build_manifest", 100)],
+            {"seconds": 1.0, "peak_bytes": 2048, "max_time_ratio": 4.0, "max_memory_ratio": 2.0},
+        )
+
+    def test_committed_baseline_covers_default_suite(self) -> None:
+        expected = {benchmark_id(benchmark.name, size) for benchmark in BENCHMARKS for size in DEFAULT_SIZES}
+
+        self.assertEqual(set(load_baseline(DEFAULT_BASELINE_PATH)["benchmarks"]), expected)
+
+    def test_cli_rejects_unknown_builders(self) -> None:
+        output = io.StringIO()
+        with TemporaryDirectory() as temp_dir, contextlib.redirect_stdout(output):
+            status = main(["--artifact-dir", temp_dir, "--size", "10", "--only", "build_everything"])
+
+        self.assertEqual(status, 2)
+        self.assertIn("build_everything", output.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -5,13 +5,15 @@ from __future__ import annotations
 from pathlib import Path
 import unittest
 
+from tests.doc_corpus import load_doc
+
 
 class PostMergeVerificationReceiptDocsTests(unittest.TestCase):
     """Keep post-merge verification guidance discoverable and safe-scoped."""
 
     @classmethod
     def setUpClass(cls) -> None:
-        cls.receipt = Path("docs/post_merge_verification_receipt.md").read_text(encoding="utf-8")
+        cls.receipt = load_doc("docs/post_merge_verification_receipt.md").text
 
     def test_receipt_records_target_branch_and_merge_commit(self) -> None:
         for phrase in (
@@ -14,6 +14,7 @@ from app.cli.provenance_validation_matrix import (
     render_markdown,
     write_outputs,
 )
+from tests.doc_corpus import load_doc
 
 
 class ProvenanceValidationMatrixTests(unittest.TestCase):
@@ -115,7 +116,7 @@ class ProvenanceValidationMatrixTests(unittest.TestCase):
             evidence={"status": "ready"},
             receipt={"status": "ready"},
         )
-        schema_doc = Path("docs/provenance_validation_matrix_schema.md").read_text(encoding="utf-8")
+        schema_doc = load_doc("docs/provenance_validation_matrix_schema.md").text
 
         for field in (
             "schema_version",
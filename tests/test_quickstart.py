@@ -44,12 +44,57 @@ class QuickstartSmokeTests(unittest.TestCase):
             self.assertIn("DATA_DIR=data", written)
             self.assertIn("MONGO_URI=mongodb://localhost:27017", written)
 
+    def _install(self, requirements: Path, **options: object) -> list[list[str]]:
+        with mock.patch.dict(quickstart.REQUIREMENTS_BY_PROFILE, {"core": requirements}), mock.patch.object(
+            quickstart, "_run_command"
+        ) as run_command:
+            quickstart._install_dependencies(quickstart.QuickstartOptions(**options))
+        return [call.args[0][3:] for call in run_command.call_args_list]
+
+    def test_install_stamp_skips_unchanged_requirements(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            (root / "base.txt").write_text("fastapi\n", encoding="utf-8")
+            requirements = root / "requirements.txt"
+            requirements.write_text("-r base.txt\nuvicorn\n", encoding="utf-8")
+            stamp = root / "stamp.json"
+            with mock.patch("builtins.print"):
+                first = self._install(requirements, stamp_path=stamp)
+                repeated = self._install(requirements, stamp_path=stamp)
+                forced = self._install(requirements, stamp_path=stamp, force_install=True)
+                (root / "base.txt").write_text("fastapi\npymongo\n", encoding="utf-8")
+                included_changed = self._install(requirements, stamp_path=stamp)
+                with mock.patch.object(quickstart.doctor, "_installed_distributions", return_value=[]):
+                    recreated_venv = self._install(requirements, stamp_path=stamp)
+
+        self.assertEqual(first, [["install", "-r", str(requirements)]])
+        self.assertEqual(repeated, [])
+        self.assertEqual(forced, first)
+        self.assertEqual(included_changed, first)
+        self.assertEqual(recreated_venv, first)
+
+    def test_wheelhouse_builds_once_and_installs_offline(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            root = Path(tmpdir)
+            requirements = root / "requirements.txt"
+            requirements.write_text("fastapi\n", encoding="utf-8")
+            wheelhouse = root / "wheels"
+            with mock.patch("builtins.print"):
+                built = self._install(requirements, wheelhouse=wheelhouse)
+                fresh_venv = self._install(requirements, wheelhouse=wheelhouse)
+
+        offline = ["install", "--no-index", "--find-links", str(wheelhouse), "-r", str(requirements)]
+        self.assertEqual(built, [["wheel", "-r", str(requirements), "--wheel-dir", str(wheelhouse)], offline])
+        self.assertEqual(fresh_venv, [offline])
+
     def test_parser_defaults_to_safe_core_flow(self) -> None:
         args = quickstart.build_parser().parse_args([])
         self.assertEqual(args.install_profile, "core")
         self.assertFalse(args.check_optional)
         self.assertFalse(args.check_mongo)
         self.assertFalse(args.launch_api)
+        self.assertEqual(args.stamp_path, quickstart.DEFAULT_STAMP_PATH)
+        self.assertIsNone(args.wheelhouse)
 
 
 if __name__ == "__main__":
@@ -5,6 +5,8 @@ from __future__ import annotations
 from pathlib import Path
 import unittest
 
+from tests.doc_corpus import load_doc
+
 
 ROOT = Path(__file__).resolve().parents[1]
 README = ROOT / "README.md"
@@ -15,7 +17,7 @@ class ReadmePreflightNavigationTests(unittest.TestCase):
     """Ensure README keeps the automation preflight handbook discoverable."""
 
     def test_structure_lists_preflight_handbook_near_reviewer_guidance(self) -> None:
-        content = README.read_text(encoding="utf-8")
+        content = load_doc(README).text
 
         self.assertIn("docs/automation_run_preflight.md", content)
         self.assertIn("docs/reviewer_handoff_navigation.md", content)
@@ -37,10 +39,7 @@ class ReadmePreflightNavigationTests(unittest.TestCase):
                 self.assertIn(phrase, content)
 
     def test_fast_first_run_points_to_preflight_before_ci_troubleshooting(self) -> None:
-        content = README.read_text(encoding="utf-8")
-        fast_first_run = content.split("### Fast first run", 1)[1].split(
-            "### 1. Install dependencies", 1
-        )[0]
+        fast_first_run = load_doc(README).section("Fast first run")
 
         self.assertIn("before opening or merging recurring maintenance work", fast_first_run)
         self.assertLess(
@@ -49,7 +48,7 @@ class ReadmePreflightNavigationTests(unittest.TestCase):
         )
 
     def test_changelog_records_readme_navigation_update(self) -> None:
-        changelog = CHANGELOG.read_text(encoding="utf-8").lower()
+        changelog = load_doc(CHANGELOG).lower
 
         for phrase in [
             "readme navigation",
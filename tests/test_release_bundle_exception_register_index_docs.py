@@ -5,6 +5,8 @@ from __future__ import annotations
 from pathlib import Path
 import unittest
 
+from tests.doc_corpus import load_doc
+
 
 ROOT = Path(__file__).resolve().parents[1]
 DOC_PATH = ROOT / "docs" / "release_bundle_exception_register_index.md"
@@ -14,7 +16,7 @@ class ReleaseBundleExceptionRegisterIndexDocsTests(unittest.TestCase):
     """Keep the reviewer-facing index contract discoverable and safe-scoped."""
 
     def test_documentation_lists_exception_register_artifacts(self) -> None:
-        content = DOC_PATH.read_text(encoding="utf-8")
+        content = load_doc(DOC_PATH).text
 
         self.assertIn("operator-exception-register.md", content)
         self.assertIn("operator-exception-register.json", content)
@@ -24,7 +26,7 @@ class ReleaseBundleExceptionRegisterIndexDocsTests(unittest.TestCase):
         self.assertIn("Copyable operator exception summary", content)
 
     def test_documentation_keeps_exception_register_in_safe_review_scope(self) -> None:
-        content = DOC_PATH.read_text(encoding="utf-8")
+        content = load_doc(DOC_PATH).text
 
         self.assertIn("not an operational prediction", content)
         self.assertIn("not be described as live intelligence", content)
@@ -32,7 +34,7 @@ class ReleaseBundleExceptionRegisterIndexDocsTests(unittest.TestCase):
         self.assertIn("handoff metadata", content)
 
     def test_documentation_records_future_code_update_target(self) -> None:
-        content = DOC_PATH.read_text(encoding="utf-8")
+        content = load_doc(DOC_PATH).text
 
         self.assertIn("app/cli/release_bundle_index.py", content)
         self.assertIn("HIGHLIGHTED_ARTIFACTS", content)
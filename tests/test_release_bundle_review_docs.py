@@ -5,12 +5,14 @@ from __future__ import annotations
 from pathlib import Path
 import unittest
 
+from tests.doc_corpus import load_doc
+
 
 class ReleaseBundleReviewDocsTests(unittest.TestCase):
     """Keep the reviewer workflow aligned with generated artifacts."""
 
     def test_review_guide_links_triage_and_landing_page(self) -> None:
-        text = Path("docs/release_bundle_review.md").read_text(encoding="utf-8")
+        text = load_doc("docs/release_bundle_review.md").text
 
         self.assertIn("ci_artifacts/release-bundle-index.html", text)
         self.assertIn("triage-summary.md", text)
@@ -19,7 +21,7 @@ class ReleaseBundleReviewDocsTests(unittest.TestCase):
         self.assertIn("artifact-manifest.md", text)
 
     def test_review_guide_preserves_safe_scope(self) -> None:
-        text = Path("docs/release_bundle_review.md").read_text(encoding="utf-8")
+        text = load_doc("docs/release_bundle_review.md").text
 
         self.assertIn("defensive, analytical software validation", text)
         self.assertIn("does not run prediction models", text)
@@ -10,6 +10,8 @@ from __future__ import annotations
 from pathlib import Path
 import unittest
 
+from tests.doc_corpus import load_doc
+
 
 ROOT = Path(__file__).resolve().parents[1]
 README = ROOT / "README.md"
@@ -22,7 +24,7 @@ class ReleaseBundleReviewLinkTests(unittest.TestCase):
     """Keep generated bundle review guidance easy to find."""
 
     def test_review_guide_documents_primary_bundle_entrypoint(self) -> None:
-        content = RELEASE_REVIEW.read_text(encoding="utf-8")
+        content = load_doc(RELEASE_REVIEW).text
 
         self.assertIn("ci_artifacts/release-bundle-index.html", content)
         self.assertIn("triage-summary.md", content)
@@ -33,8 +35,7 @@ class ReleaseBundleReviewLinkTests(unittest.TestCase):
     def test_primary_onboarding_docs_link_to_review_guide(self) -> None:
         for path in (README, CONTRIBUTING, COMMON_TASKS):
             with self.subTest(path=path):
-                content = path.read_text(encoding="utf-8")
-                self.assertIn("docs/release_bundle_review.md", content)
+                self.assertTrue(load_doc(path).references_to("docs/release_bundle_review.md"))
 
 
 if __name__ == "__main__":
@@ -1,5 +1,7 @@
 from pathlib import Path
 
+from tests.doc_corpus import load_doc
+
 
 ROOT = Path(__file__).resolve().parents[1]
 PLAN = ROOT / "docs" / "repository_incremental_growth_plan.md"
@@ -7,7 +9,7 @@ CHANGELOG = ROOT / "CHANGELOG.md"
 
 
 def test_repository_growth_plan_has_goal_hierarchy() -> None:
-    plan = PLAN.read_text(encoding="utf-8")
+    plan = load_doc(PLAN).text
 
     assert "Near-term goals" in plan
     assert "Medium-term goals" in plan
@@ -16,7 +18,7 @@ def test_repository_growth_plan_has_goal_hierarchy() -> None:
 
 
 def test_repository_growth_plan_preserves_reviewable_additive_scope() -> None:
-    plan = PLAN.read_text(encoding="utf-8")
+    plan = load_doc(PLAN).text
 
     assert "meaningful, mergeable, testable" in plan
     assert "without replacing working components" in plan
@@ -25,7 +27,7 @@ def test_repository_growth_plan_preserves_reviewable_additive_scope() -> None:
 
 
 def test_repository_growth_plan_changelog_entry_is_present() -> None:
-    changelog = CHANGELOG.read_text(encoding="utf-8")
+    changelog = load_doc(CHANGELOG).text
 
     assert "docs/repository_incremental_growth_plan.md" in changelog
     assert "durable near-term, medium-term, and long-term repository goals" in changelog
@@ -10,6 +10,8 @@ from __future__ import annotations
 from pathlib import Path
 import unittest
 
+from tests.doc_corpus import load_doc
+
 
 ROOT = Path(__file__).resolve().parents[1]
 DOC = ROOT / "docs" / "review_blocker_decision_tree.md"
@@ -19,7 +21,7 @@ class ReviewBlockerDecisionTreeDocsTests(unittest.TestCase):
     """Ensure blocker triage guidance stays complete and safety framed."""
 
     def test_documents_all_merge_blocker_classes(self) -> None:
-        content = DOC.read_text(encoding="utf-8")
+        content = load_doc(DOC).text
 
         for state in [
             "blocked_ci",
@@ -32,7 +34,7 @@ class ReviewBlockerDecisionTreeDocsTests(unittest.TestCase):
                 self.assertIn(state, content)
 
     def test_includes_narrow_reproduction_commands(self) -> None:
-        content = DOC.read_text(encoding="utf-8")
+        content = load_doc(DOC).text
 
         for command in [
             "make doctor",
@@ -47,7 +49,7 @@ class ReviewBlockerDecisionTreeDocsTests(unittest.TestCase):
                 self.assertIn(command, content)
 
     def test_preserves_final_diff_and_handoff_evidence(self) -> None:
-        content = DOC.read_text(encoding="utf-8")
+        content = load_doc(DOC).text
 
         required_terms = [
             "final head SHA",
@@ -65,7 +67,7 @@ class ReviewBlockerDecisionTreeDocsTests(unittest.TestCase):
                 self.assertIn(term, content)
 
     def test_keeps_safe_analytical_scope(self) -> None:
-        content = DOC.read_text(encoding="utf-8").lower()
+        content = load_doc(DOC).lower
 
         self.assertIn("does not fetch live data", content)
         self.assertIn("perform targeting", content)
@@ -75,7 +77,7 @@ class ReviewBlockerDecisionTreeDocsTests(unittest.TestCase):
         self.assertIn("synthetic fixture", content)
 
     def test_documents_compatibility_and_rollback_limits(self) -> None:
-        content = DOC.read_text(encoding="utf-8")
+        content = load_doc(DOC).text
 
         self.assertIn("changes no runtime behavior", content)
         self.assertIn("APIs", content)
@@ -7,6 +7,7 @@ from pathlib import Path
 import unittest
 
 from app.cli.reviewer_handoff import build_handoff
+from tests.doc_corpus import load_doc
 
 ROOT = Path(__file__).resolve().parents[1]
 SCHEMA_PATH = ROOT / "docs" / "reviewer_handoff_schema.json"
@@ -52,7 +53,7 @@ class ReviewerHandoffContractTests(unittest.TestCase):
             self.assertIn(step["status"], schema["properties"]["review_order"]["items"]["properties"]["status"]["enum"])
 
     def test_contract_document_explains_consumer_routing(self) -> None:
-        text = CONTRACT_PATH.read_text(encoding="utf-8")
+        text = load_doc(CONTRACT_PATH).text
 
         self.assertIn("docs/reviewer_handoff_schema.json", text)
         self.assertIn("review_status", text)
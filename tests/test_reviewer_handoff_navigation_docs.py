@@ -11,6 +11,8 @@ from __future__ import annotations
 from pathlib import Path
 import unittest
 
+from tests.doc_corpus import load_doc
+
 
 ROOT = Path(__file__).resolve().parents[1]
 DOC = ROOT / "docs" / "reviewer_handoff_navigation.md"
@@ -22,7 +24,7 @@ class ReviewerHandoffNavigationDocsTests(unittest.TestCase):
     """Ensure the reviewer navigation guide remains complete and safe-scoped."""
 
     def test_routes_core_hosted_checks_and_review_guides(self) -> None:
-        content = DOC.read_text(encoding="utf-8")
+        content = load_doc(DOC).text
 
         for term in [
             "`CI`",
@@ -38,7 +40,7 @@ class ReviewerHandoffNavigationDocsTests(unittest.TestCase):
                 self.assertIn(term, content)
 
     def test_routes_artifact_contract_and_bundle_guidance(self) -> None:
-        content = DOC.read_text(encoding="utf-8")
+        content = load_doc(DOC).text
         content_lower = content.lower()
 
         for term in [
@@ -60,7 +62,7 @@ class ReviewerHandoffNavigationDocsTests(unittest.TestCase):
                 self.assertIn(phrase, content_lower)
 
     def test_prefers_narrow_local_reruns_before_broad_validation(self) -> None:
-        content = DOC.read_text(encoding="utf-8")
+        content = load_doc(DOC).text
 
         for command in [
             "make workflow-gate-summary",
@@ -78,7 +80,7 @@ class ReviewerHandoffNavigationDocsTests(unittest.TestCase):
                 self.assertIn(command, content)
 
     def test_preserves_merge_blocker_and_safe_framing_language(self) -> None:
-        content = DOC.read_text(encoding="utf-8").lower()
+        content = load_doc(DOC).lower
 
         for phrase in [
             "does not fetch live data",
@@ -94,9 +96,9 @@ class ReviewerHandoffNavigationDocsTests(unittest.TestCase):
                 self.assertIn(phrase, content)
 
     def test_documents_compatibility_and_links_from_handoff_surfaces(self) -> None:
-        doc = DOC.read_text(encoding="utf-8")
-        changelog = CHANGELOG.read_text(encoding="utf-8")
-        readme = README.read_text(encoding="utf-8")
+        doc = load_doc(DOC).text
+        changelog = load_doc(CHANGELOG).text
+        readme = load_doc(README).text
 
         self.assertIn("changes no runtime behavior", doc)
         self.assertIn("APIs", doc)
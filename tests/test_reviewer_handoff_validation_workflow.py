@@ -2,9 +2,11 @@
 
 from pathlib import Path
 
+from app.cli.bundle import render_shell_script
+from tests.doc_corpus import load_doc
+
 ROOT = Path(__file__).resolve().parents[1]
 MAKEFILE = ROOT / "Makefile"
-CI_REPORT = ROOT / "scripts" / "ci_report.sh"
 SMOKE_TEST = ROOT / "scripts" / "test.sh"
 COMMON_TASKS = ROOT / "docs" / "common_tasks.md"
 CI_TROUBLESHOOTING = ROOT / "docs" / "ci_troubleshooting.md"
@@ -20,7 +22,7 @@ def test_make_verify_runs_handoff_contract_validation():
 
 
 def test_ci_report_publishes_validation_artifacts():
-    text = CI_REPORT.read_text(encoding="utf-8")
+    text = render_shell_script()
 
     assert "reviewer-handoff-validation.txt" in text
     assert "reviewer-handoff-validation.json" in text
@@ -37,8 +39,8 @@ def test_smoke_script_validates_generated_handoff():
 
 
 def test_docs_explain_handoff_validation_command():
-    common_tasks = COMMON_TASKS.read_text(encoding="utf-8")
-    ci_troubleshooting = CI_TROUBLESHOOTING.read_text(encoding="utf-8")
+    common_tasks = load_doc(COMMON_TASKS).text
+    ci_troubleshooting = load_doc(CI_TROUBLESHOOTING).text
 
     for text in [common_tasks, ci_troubleshooting]:
         assert "make validate-handoff" in text
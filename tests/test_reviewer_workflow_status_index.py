@@ -10,6 +10,8 @@ from __future__ import annotations
 from pathlib import Path
 import unittest
 
+from tests.doc_corpus import load_doc
+
 
 ROOT = Path(__file__).resolve().parents[1]
 DOC = ROOT / "docs" / "reviewer_workflow_status_index.md"
@@ -20,7 +22,7 @@ class ReviewerWorkflowStatusIndexTests(unittest.TestCase):
     """Ensure the reviewer workflow status guide stays useful and safe-scoped."""
 
     def test_status_matrix_names_hosted_checks_and_local_reproduction(self) -> None:
-        content = DOC.read_text(encoding="utf-8")
+        content = load_doc(DOC).text
 
         self.assertIn("Status matrix", content)
         self.assertIn("`CI`", content)
@@ -31,7 +33,7 @@ class ReviewerWorkflowStatusIndexTests(unittest.TestCase):
         self.assertIn("make handoff-validation-receipt ARTIFACT_DIR=ci_artifacts", content)
 
     def test_status_index_preserves_scope_and_merge_blocker_language(self) -> None:
-        content = DOC.read_text(encoding="utf-8")
+        content = load_doc(DOC).text
 
         self.assertRegex(
             content,
@@ -43,7 +45,7 @@ class ReviewerWorkflowStatusIndexTests(unittest.TestCase):
         self.assertIn("merge blocker", content)
 
     def test_failure_triage_prefers_narrow_reproduction_without_bypassing_checks(self) -> None:
-        content = DOC.read_text(encoding="utf-8")
+        content = load_doc(DOC).text
 
         self.assertIn("Prefer the narrowest failing check first", content)
         self.assertIn("make ci-triage", content)
@@ -52,7 +54,7 @@ class ReviewerWorkflowStatusIndexTests(unittest.TestCase):
         self.assertIn("strictly validated", content)
 
     def test_changelog_links_the_status_index(self) -> None:
-        changelog = CHANGELOG.read_text(encoding="utf-8")
+        changelog = load_doc(CHANGELOG).text
 
         self.assertIn("reviewer workflow status index", changelog)
         self.assertIn("hosted check", changelog)
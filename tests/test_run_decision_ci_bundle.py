@@ -5,9 +5,10 @@ from __future__ import annotations
 from pathlib import Path
 import unittest
 
+from app.cli.bundle import render_shell_script
+
 
 REPOSITORY_ROOT = Path(__file__).resolve().parents[1]
-CI_REPORT = REPOSITORY_ROOT / "scripts" / "ci_report.sh"
 RUN_DECISION_DOC = REPOSITORY_ROOT / "docs" / "run_decision_ci_bundle.md"
 
 
@@ -15,7 +16,7 @@ class RunDecisionCiBundleTests(unittest.TestCase):
     """Ensure run-decision handoff artifacts stay in the diagnostics bundle."""
 
     def test_ci_report_exports_next_increment_and_decision_record_artifacts(self) -> None:
-        script = CI_REPORT.read_text(encoding="utf-8")
+        script = render_shell_script()
 
         self.assertIn("-m app.cli.next_increment_candidates", script)
         self.assertIn("next-increment-candidates.md", script)
@@ -29,7 +30,7 @@ class RunDecisionCiBundleTests(unittest.TestCase):
         )
 
     def test_summary_names_run_decision_artifacts_and_safe_scope(self) -> None:
-        script = CI_REPORT.read_text(encoding="utf-8")
+        script = render_shell_script()
 
         self.assertIn("offline roadmap/changelog candidate recipes", script)
         self.assertIn("merge evidence, validation, blocker, rollback, and follow-up fields", script)
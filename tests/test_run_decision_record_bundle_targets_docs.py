@@ -5,6 +5,8 @@ from __future__ import annotations
 from pathlib import Path
 import unittest
 
+from tests.doc_corpus import load_doc
+
 
 REPO_ROOT = Path(__file__).resolve().parents[1]
 DOC_PATH = REPO_ROOT / "docs" / "run_decision_record_bundle_targets.md"
@@ -16,8 +18,8 @@ class RunDecisionRecordBundleTargetsDocsTests(unittest.TestCase):
 
     @classmethod
     def setUpClass(cls) -> None:
-        cls.doc_text = DOC_PATH.read_text(encoding="utf-8")
-        cls.changelog_text = CHANGELOG_PATH.read_text(encoding="utf-8")
+        cls.doc_text = load_doc(DOC_PATH).text
+        cls.changelog_text = load_doc(CHANGELOG_PATH).text
 
     def test_primary_artifact_targets_are_documented(self) -> None:
         required_targets = (
@@ -3,15 +3,15 @@
 from pathlib import Path
 import unittest
 
+from tests.doc_corpus import load_doc
+
 
 ROOT = Path(__file__).resolve().parents[1]
 
 
 class RunDecisionRecordHandoffExamplesTests(unittest.TestCase):
     def test_examples_preserve_required_merge_evidence_fields(self) -> None:
-        guide = (ROOT / "docs" / "run_decision_record_handoff_examples.md").read_text(
-            encoding="utf-8"
-        )
+        guide = load_doc(ROOT / "docs" / "run_decision_record_handoff_examples.md").text
 
         for phrase in [
             "Selected candidate:",
@@ -27,9 +27,7 @@ class RunDecisionRecordHandoffExamplesTests(unittest.TestCase):
                 self.assertIn(phrase, guide)
 
     def test_examples_keep_blocked_handoff_and_repair_guidance_visible(self) -> None:
-        guide = (ROOT / "docs" / "run_decision_record_handoff_examples.md").read_text(
-            encoding="utf-8"
-        )
+        guide = load_doc(ROOT / "docs" / "run_decision_record_handoff_examples.md").text
 
         for phrase in [
             "Current blocker:",
@@ -43,9 +41,7 @@ class RunDecisionRecordHandoffExamplesTests(unittest.TestCase):
                 self.assertIn(phrase, guide)
 
     def test_examples_keep_additive_scope_and_safe_framing_visible(self) -> None:
-        guide = (ROOT / "docs" / "run_decision_record_handoff_examples.md").read_text(
-            encoding="utf-8"
-        )
+        guide = load_doc(ROOT / "docs" / "run_decision_record_handoff_examples.md").text
 
         for phrase in [
             "additive navigation only",
@@ -3,15 +3,15 @@
 from pathlib import Path
 import unittest
 
+from tests.doc_corpus import load_doc
+
 
 ROOT = Path(__file__).resolve().parents[1]
 
 
 class RunDecisionRecordNavigationTests(unittest.TestCase):
     def test_index_links_the_complete_decision_record_document_family(self) -> None:
-        guide = (ROOT / "docs" / "run_decision_record_navigation.md").read_text(
-            encoding="utf-8"
-        )
+        guide = load_doc(ROOT / "docs" / "run_decision_record_navigation.md")
 
         for path in [
             "docs/run_continuity_brief.md",
@@ -21,13 +21,11 @@ class RunDecisionRecordNavigationTests(unittest.TestCase):
             "docs/run_decision_record_handoff_examples.md",
         ]:
             with self.subTest(path=path):
-                self.assertIn(path, guide)
+                self.assertTrue(guide.references_to(path))
                 self.assertTrue((ROOT / path).exists())
 
     def test_index_preserves_merge_evidence_and_blocker_language(self) -> None:
-        guide = (ROOT / "docs" / "run_decision_record_navigation.md").read_text(
-            encoding="utf-8"
-        )
+        guide = load_doc(ROOT / "docs" / "run_decision_record_navigation.md").text
 
         for phrase in [
             "final head SHA",
@@ -43,9 +41,7 @@ class RunDecisionRecordNavigationTests(unittest.TestCase):
                 self.assertIn(phrase, guide)
 
     def test_index_keeps_additive_scope_and_safe_analytical_framing_visible(self) -> None:
-        guide = (ROOT / "docs" / "run_decision_record_navigation.md").read_text(
-            encoding="utf-8"
-        )
+        guide = load_doc(ROOT / "docs" / "run_decision_record_navigation.md").text
 
         for phrase in [
             "additive documentation",
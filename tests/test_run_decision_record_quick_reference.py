@@ -3,15 +3,15 @@
 from pathlib import Path
 import unittest
 
+from tests.doc_corpus import load_doc
+
 
 ROOT = Path(__file__).resolve().parents[1]
 
 
 class RunDecisionRecordQuickReferenceTests(unittest.TestCase):
     def test_quick_reference_links_primary_handoff_documents(self) -> None:
-        guide = (ROOT / "docs" / "run_decision_record_quick_reference.md").read_text(
-            encoding="utf-8"
-        )
+        guide = load_doc(ROOT / "docs" / "run_decision_record_quick_reference.md").text
 
         for phrase in [
             "docs/run_continuity_brief.md",
@@ -24,9 +24,7 @@ class RunDecisionRecordQuickReferenceTests(unittest.TestCase):
                 self.assertIn(phrase, guide)
 
     def test_quick_reference_preserves_merge_blocker_and_rollback_guidance(self) -> None:
-        guide = (ROOT / "docs" / "run_decision_record_quick_reference.md").read_text(
-            encoding="utf-8"
-        )
+        guide = load_doc(ROOT / "docs" / "run_decision_record_quick_reference.md").text
 
         for phrase in [
             "required_evidence_before_merge",
@@ -42,9 +40,7 @@ class RunDecisionRecordQuickReferenceTests(unittest.TestCase):
                 self.assertIn(phrase, guide)
 
     def test_quick_reference_keeps_safe_analytical_scope_visible(self) -> None:
-        guide = (ROOT / "docs" / "run_decision_record_quick_reference.md").read_text(
-            encoding="utf-8"
-        )
+        guide = load_doc(ROOT / "docs" / "run_decision_record_quick_reference.md").text
 
         for phrase in [
             "does not collect live data",
@@ -3,13 +3,15 @@
 from pathlib import Path
 import unittest
 
+from tests.doc_corpus import load_doc
+
 
 ROOT = Path(__file__).resolve().parents[1]
 
 
 class RunDecisionRecordSchemaDocumentationTests(unittest.TestCase):
     def test_schema_contract_documents_required_fields_and_producer(self) -> None:
-        schema_doc = (ROOT / "docs" / "run_decision_record_schema.md").read_text(encoding="utf-8")
+        schema_doc = load_doc(ROOT / "docs" / "run_decision_record_schema.md").text
 
         required_phrases = [
             "# Run Decision Record JSON Schema Contract",
@@ -32,7 +34,7 @@ class RunDecisionRecordSchemaDocumentationTests(unittest.TestCase):
                 self.assertIn(phrase, schema_doc)
 
     def test_schema_contract_preserves_merge_blocker_and_safety_framing(self) -> None:
-        schema_doc = (ROOT / "docs" / "run_decision_record_schema.md").read_text(encoding="utf-8")
+        schema_doc = load_doc(ROOT / "docs" / "run_decision_record_schema.md").text
 
         required_phrases = [
             "final_head_sha",
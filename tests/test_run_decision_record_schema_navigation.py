@@ -3,20 +3,22 @@
 from pathlib import Path
 import unittest
 
+from tests.doc_corpus import load_doc
+
 
 ROOT = Path(__file__).resolve().parents[1]
 
 
 class RunDecisionRecordSchemaNavigationTests(unittest.TestCase):
     def test_changelog_records_schema_navigation_increment(self) -> None:
-        changelog = (ROOT / "CHANGELOG.md").read_text(encoding="utf-8")
+        changelog = load_doc(ROOT / "CHANGELOG.md").text
         self.assertIn("run decision record schema contract", changelog)
         self.assertIn("merge-evidence expectations", changelog)
         self.assertIn("rollback path", changelog)
 
     def test_schema_contract_and_overview_remain_discoverable(self) -> None:
-        schema_doc = (ROOT / "docs" / "run_decision_record_schema.md").read_text(encoding="utf-8")
-        overview_doc = (ROOT / "docs" / "run_decision_record.md").read_text(encoding="utf-8")
+        schema_doc = load_doc(ROOT / "docs" / "run_decision_record_schema.md").text
+        overview_doc = load_doc(ROOT / "docs" / "run_decision_record.md").text
 
         for phrase in [
             "# Run Decision Record JSON Schema Contract",
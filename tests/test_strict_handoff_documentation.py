@@ -3,16 +3,19 @@
 from pathlib import Path
 import unittest
 
+from tests.doc_corpus import load_doc
+
 
 ROOT = Path(__file__).resolve().parents[1]
 
 
 class StrictHandoffDocumentationTests(unittest.TestCase):
     def test_schema_contract_documents_strict_mode(self) -> None:
-        schema_doc = (ROOT / "docs" / "implementation_acceptance_schema.md").read_text(encoding="utf-8")
+        schema_doc = load_doc(ROOT / "docs" / "implementation_acceptance_schema.md").text
+
+        self.assertTrue(load_doc(ROOT / "docs" / "implementation_acceptance_schema.md").has_heading("Strict handoff validation mode", level=2))
 
         required_phrases = [
-            "## Strict handoff validation mode",
             "python -m app.cli.implementation_acceptance_handoff",
             "--strict",
             "returns exit status `0` only when",
@@ -31,7 +34,7 @@ class StrictHandoffDocumentationTests(unittest.TestCase):
                 self.assertIn(phrase, schema_doc)
 
     def test_changelog_records_strict_mode_follow_up(self) -> None:
-        changelog = (ROOT / "CHANGELOG.md").read_text(encoding="utf-8")
+        changelog = load_doc(ROOT / "CHANGELOG.md").text
 
         self.assertIn("Documented strict `implementation_acceptance_handoff --strict` validation mode", changelog)
         self.assertIn("offline exit-code contract", changelog)
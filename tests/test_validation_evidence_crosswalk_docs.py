@@ -1,6 +1,8 @@
 from pathlib import Path
 import unittest
 
+from tests.doc_corpus import load_doc
+
 
 ROOT = Path(__file__).resolve().parents[1]
 DOC_PATH = ROOT / "docs" / "validation_evidence_crosswalk.md"
@@ -10,8 +12,8 @@ CHANGELOG_PATH = ROOT / "CHANGELOG.md"
 class ValidationEvidenceCrosswalkDocsTests(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
-        cls.doc = DOC_PATH.read_text(encoding="utf-8")
-        cls.changelog = CHANGELOG_PATH.read_text(encoding="utf-8")
+        cls.doc = load_doc(DOC_PATH).text
+        cls.changelog = load_doc(CHANGELOG_PATH).text
 
     def test_crosswalk_maps_reviewer_questions_to_evidence(self):
         required_phrases = [
@@ -1,6 +1,8 @@
 from pathlib import Path
 import unittest
 
+from tests.doc_corpus import load_doc
+
 
 ROOT = Path(__file__).resolve().parents[1]
 README_PATH = ROOT / "README.md"
@@ -10,8 +12,8 @@ CHANGELOG_PATH = ROOT / "CHANGELOG.md"
 class ValidationMatrixReadmeNavigationTests(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
-        cls.readme = README_PATH.read_text(encoding="utf-8")
-        cls.changelog = CHANGELOG_PATH.read_text(encoding="utf-8")
+        cls.readme = load_doc(README_PATH).text
+        cls.changelog = load_doc(CHANGELOG_PATH).text
 
     def test_structure_lists_validation_failure_matrix(self):
         self.assertIn("docs/validation_failure_reproduction_matrix.md", self.readme)
@@ -20,7 +22,7 @@ class ValidationMatrixReadmeNavigationTests(unittest.TestCase):
         self.assertIn("analytical-framing blockers", self.readme)
 
     def test_fast_first_run_routes_failed_validation_to_matrix(self):
-        fast_first_run_section = self.readme.split("### Fast first run", 1)[1].split(
+        fast_first_run_section = load_doc(README_PATH).section("Fast first run").split(
             "For a guided local setup path", 1
         )[0]
         required_phrases = [
@@ -5,6 +5,8 @@ from __future__ import annotations
 from pathlib import Path
 import unittest
 
+from tests.doc_corpus import load_doc
+
 
 ROOT = Path(__file__).resolve().parents[1]
 RUNBOOK = ROOT / "docs" / "workflow_gate_review_runbook.md"
@@ -14,7 +16,7 @@ class WorkflowGateReviewRunbookTests(unittest.TestCase):
     """Keep hosted validation gate handoff guidance safe and actionable."""
 
     def test_runbook_exists_and_names_required_gates(self) -> None:
-        content = RUNBOOK.read_text(encoding="utf-8")
+        content = load_doc(RUNBOOK).text
 
         self.assertIn("Workflow Gate Review Runbook", content)
         self.assertIn("`CI`", content)
@@ -22,7 +24,7 @@ class WorkflowGateReviewRunbookTests(unittest.TestCase):
         self.assertIn("`Handoff Validation Receipt`", content)
 
     def test_runbook_preserves_safe_analytical_scope(self) -> None:
-        content = RUNBOOK.read_text(encoding="utf-8").lower()
+        content = load_doc(RUNBOOK).lower
 
         self.assertIn("not validate model quality", content)
         self.assertIn("operational targeting", content)
@@ -30,7 +32,7 @@ class WorkflowGateReviewRunbookTests(unittest.TestCase):
         self.assertIn("not certainty", content)
 
     def test_runbook_requires_current_green_head_sha_before_merge(self) -> None:
-        content = RUNBOOK.read_text(encoding="utf-8")
+        content = load_doc(RUNBOOK).text
 
         self.assertIn("final PR head SHA", content)
         self.assertIn("complete, green", content)
@@ -38,7 +40,7 @@ class WorkflowGateReviewRunbookTests(unittest.TestCase):
         self.assertIn("repository policy permits it", content)
 
     def test_runbook_lists_local_reproduction_commands(self) -> None:
-        content = RUNBOOK.read_text(encoding="utf-8")
+        content = load_doc(RUNBOOK).text
 
         self.assertIn("make verify ARTIFACT_DIR=ci_artifacts/local-review", content)
         self.assertIn("python -m app.cli.analytical_framing_audit", content)
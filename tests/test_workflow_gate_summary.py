@@ -14,6 +14,7 @@ from app.cli.workflow_gate_summary import (
     render_markdown,
     write_outputs,
 )
+from tests.doc_corpus import load_doc
 
 
 class WorkflowGateSummaryTests(unittest.TestCase):
@@ -80,7 +81,7 @@ class WorkflowGateSummaryTests(unittest.TestCase):
 
     def test_schema_document_covers_exported_contract_fields(self) -> None:
         summary = build_workflow_gate_summary()
-        schema_doc = Path("docs/workflow_gate_summary_schema.md").read_text(encoding="utf-8")
+        schema_doc = load_doc("docs/workflow_gate_summary_schema.md").text
 
         for field in (
             "schema_version",